@@ -11,9 +11,12 @@ Implemented as FastAPI Depends() callables.
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import hmac
 import os
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 
 import jwt
@@ -102,6 +105,111 @@ else:
             "Clerk JWT signature verification."
         )
 
+# Signing keys by kid. A miss is first matched against PyJWKClient's cached
+# JWK set, which needs no network call. Only then is JWKS refreshed, with
+# blocking urllib in a worker thread and at most once per interval overall.
+# Any refresh, even one triggered by a forged kid, fills that cached set, so a
+# real kid rotated in is found there without waiting for its own refresh.
+# Kids Clerk doesn't know are remembered briefly in a bounded map.
+JWKS_KEY_TTL_SECONDS = 3600.0
+JWKS_UNKNOWN_KID_TTL_SECONDS = 60.0
+JWKS_UNKNOWN_KID_MAX = 256
+JWKS_MIN_REFRESH_INTERVAL_SECONDS = 10.0
+_clerk_signing_keys: dict[str, tuple[object, float]] = {}
+_clerk_unknown_kids: OrderedDict[str, float] = OrderedDict()
+_jwks_last_refresh = float("-inf")
+_jwks_stats = {
+    "hits": 0, "misses": 0, "unknown_kid": 0, "rate_limited": 0, "fetch_errors": 0, "fetch_ms": 0.0,
+}
+
+
+def _remember_unknown_kid(kid: str, now: float) -> None:
+    # Every entry has the same TTL, so insertion order is expiry order.
+    while _clerk_unknown_kids and next(iter(_clerk_unknown_kids.values())) <= now:
+        _clerk_unknown_kids.popitem(last=False)
+    _clerk_unknown_kids.pop(kid, None)
+    _clerk_unknown_kids[kid] = now + JWKS_UNKNOWN_KID_TTL_SECONDS
+    while len(_clerk_unknown_kids) > JWKS_UNKNOWN_KID_MAX:
+        _clerk_unknown_kids.popitem(last=False)
+
+
+def _match_kid(jwk_set: dict | None, kid: str):
+    """Signing key for ``kid`` in a raw JWK set dict, or None."""
+    if not jwk_set:
+        return None
+    try:
+        keys = jwt.PyJWKSet.from_dict(jwk_set).keys
+    except jwt.PyJWKSetError:
+        return None
+    for key in keys:
+        if key.key_id == kid and key.public_key_use in ("sig", None):
+            return key
+    return None
+
+
+def _cached_jwk_set() -> dict | None:
+    cache = getattr(_clerk_jwk_client, "jwk_set_cache", None)
+    return cache.get() if cache is not None else None
+
+
+async def _get_clerk_signing_key(token: str):
+    """Signing key for a Clerk token, from the local caches when possible."""
+    global _jwks_last_refresh
+    kid = jwt.get_unverified_header(token).get("kid") or ""
+    now = time.monotonic()
+    cached = _clerk_signing_keys.get(kid)
+    if cached is not None and cached[1] > now:
+        _jwks_stats["hits"] += 1
+        return cached[0]
+
+    signing_key = _match_kid(_cached_jwk_set(), kid)
+    if signing_key is not None:
+        _jwks_stats["hits"] += 1
+        _clerk_signing_keys[kid] = (signing_key.key, now + JWKS_KEY_TTL_SECONDS)
+        _clerk_unknown_kids.pop(kid, None)
+        return signing_key.key
+
+    if _clerk_unknown_kids.get(kid, 0.0) > now:
+        _jwks_stats["unknown_kid"] += 1
+        raise jwt.InvalidTokenError("Unknown signing key")
+    if now - _jwks_last_refresh < JWKS_MIN_REFRESH_INTERVAL_SECONDS:
+        _jwks_stats["rate_limited"] += 1
+        if cached is not None:
+            # A key we resolved before: keep using it until the next refresh.
+            return cached[0]
+        raise jwt.InvalidTokenError("Unknown signing key")
+    _jwks_last_refresh = now
+
+    _jwks_stats["misses"] += 1
+    start = time.monotonic()
+    try:
+        jwk_set = await asyncio.to_thread(_clerk_jwk_client.fetch_data)
+    except Exception:
+        _jwks_stats["fetch_errors"] += 1
+        raise
+    finally:
+        _jwks_stats["fetch_ms"] += (time.monotonic() - start) * 1000
+    signing_key = _match_kid(jwk_set, kid)
+    if signing_key is None:
+        _jwks_stats["unknown_kid"] += 1
+        _remember_unknown_kid(kid, now)
+        raise jwt.InvalidTokenError("Unknown signing key")
+    _clerk_signing_keys[kid] = (signing_key.key, now + JWKS_KEY_TTL_SECONDS)
+    _clerk_unknown_kids.pop(kid, None)
+    return signing_key.key
+
+
+def get_jwks_stats() -> dict:
+    lookups = _jwks_stats["hits"] + _jwks_stats["misses"]
+    return {
+        "configured": _clerk_jwk_client is not None,
+        "keys": len(_clerk_signing_keys),
+        "unknown_kids": len(_clerk_unknown_kids),
+        **_jwks_stats,
+        "fetch_ms": round(_jwks_stats["fetch_ms"], 1),
+        "hit_rate": round(_jwks_stats["hits"] / lookups, 4) if lookups else 0.0,
+    }
+
 
 @dataclass
 class AuthContext:
@@ -177,10 +285,10 @@ async def require_auth(request: Request) -> AuthContext:
             raise HTTPException(status_code=401, detail="Authentication required")
 
         try:
-            signing_key = _clerk_jwk_client.get_signing_key_from_jwt(clerk_token)
+            signing_key = await _get_clerk_signing_key(clerk_token)
             decoded = jwt.decode(
                 clerk_token,
-                signing_key.key,
+                signing_key,
                 algorithms=["RS256"],
                 options={
                     "verify_signature": True,
@@ -4,20 +4,99 @@ from __future__ import annotations
 
 import asyncio
 import time
+import weakref
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 from zoneinfo import ZoneInfo
 
 from loguru import logger
 
+from lib import histogram
+from lib.ttl_set import TTLSet
+
 # In-memory call metadata (shared with WebSocket handler).
 # call_id -> {senior, memory_context, conversation_id, reminder_prompt, ...}
 # When REDIS_URL is set, metadata is also persisted to Redis for multi-instance.
 call_metadata: dict[str, dict] = {}
-_metadata_lock = asyncio.Lock()
+# One lock per call, dropped once no coroutine holds or waits on it.
+_metadata_locks: weakref.WeakValueDictionary[str, asyncio.Lock] = weakref.WeakValueDictionary()
+
+
+# Metadata-ready notification. WebSocket handshakes wait on a per-waiter
+# event that is set when metadata for their call is written on this
+# instance, or announced by another instance over shared-state pub/sub.
+METADATA_READY_CHANNEL = "call_metadata_ready"
+WAIT_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2000)
+
+_metadata_waiters: dict[str, set[asyncio.Event]] = {}
+# Calls this instance has already announced; one message per call is enough
+# because waiters re-read shared state after every wake-up.
+_announced_calls = TTLSet(ttl_seconds=1800, bucket_seconds=60)
+_ready_listener: asyncio.Task | None = None
+_ready_listener_subscribed = False
+
+
+def _new_wait_stats() -> dict:
+    return {
+        "immediate": 0,
+        "waited": 0,
+        "timeout": 0,
+        "total_ms": 0.0,
+        "max_ms": 0.0,
+        "buckets": histogram.empty(WAIT_BUCKETS_MS),
+    }
+
+
+_wait_stats = _new_wait_stats()
+
+
+def _metadata_lock_for(call_id: str) -> asyncio.Lock:
+    """Lock serializing metadata read-modify-write for one call."""
+    lock = _metadata_locks.get(call_id)
+    if lock is None:
+        lock = _metadata_locks[call_id] = asyncio.Lock()
+    return lock
+
+
+@contextmanager
+def metadata_waiter(call_id: str):
+    """Register an event that is set whenever metadata for ``call_id`` is written."""
+    event = asyncio.Event()
+    _metadata_waiters.setdefault(call_id, set()).add(event)
+    try:
+        yield event
+    finally:
+        waiters = _metadata_waiters.get(call_id)
+        if waiters is not None:
+            waiters.discard(event)
+            if not waiters:
+                del _metadata_waiters[call_id]
+
+
+def _notify_metadata_ready(call_id: str) -> None:
+    for event in _metadata_waiters.get(call_id, ()):
+        event.set()
+
+
+def metadata_ready_is_pushed() -> bool:
+    """True when every metadata write that matters reaches local waiters.
+
+    Single-instance state only sees local writes; shared state needs the
+    pub/sub listener for writes made on other instances.
+    """
+    try:
+        from lib.redis_client import get_shared_state
+
+        if not getattr(get_shared_state(), "is_shared", False):
+            return True
+    except Exception:
+        return False
+    return _ready_listener_subscribed
 
 
 async def _persist_metadata(call_id: str, data: dict) -> None:
     """Write encrypted metadata to Redis if configured for multi-instance routing."""
+    _notify_metadata_ready(call_id)
     try:
         from lib.redis_client import get_shared_state
         from lib.shared_state_phi import encode_phi_payload
@@ -25,10 +104,87 @@ async def _persist_metadata(call_id: str, data: dict) -> None:
         state = get_shared_state()
         if getattr(state, "is_shared", False):
             await state.set(f"call_metadata:{call_id}", encode_phi_payload(data), ttl=1800)
+            if call_id not in _announced_calls and hasattr(state, "publish"):
+                await state.publish(METADATA_READY_CHANNEL, call_id)
+                _announced_calls.add(call_id)
     except Exception as exc:
         logger.warning("[{cs}] Redis metadata write failed: {err}", cs=call_id, err=str(exc))
 
 
+async def _listen_for_ready(state) -> None:
+    global _ready_listener_subscribed
+    while True:
+        try:
+            messages = await state.subscribe(METADATA_READY_CHANNEL)
+            _ready_listener_subscribed = True
+            async for call_id in messages:
+                if isinstance(call_id, str):
+                    _notify_metadata_ready(call_id)
+            raise ConnectionError("subscription ended")
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.warning("Metadata-ready subscription lost, retrying: {err}", err=str(exc))
+        finally:
+            _ready_listener_subscribed = False
+        await asyncio.sleep(5)
+
+
+def start_metadata_listener() -> None:
+    """Subscribe to metadata-ready announcements from other instances."""
+    global _ready_listener
+    from lib.redis_client import get_shared_state
+
+    state = get_shared_state()
+    if not hasattr(state, "subscribe"):
+        return
+    if _ready_listener is not None and not _ready_listener.done():
+        return
+    _ready_listener = asyncio.create_task(_listen_for_ready(state))
+
+
+async def stop_metadata_listener() -> None:
+    global _ready_listener
+    task, _ready_listener = _ready_listener, None
+    if task is None:
+        return
+    task.cancel()
+    try:
+        await task
+    except (asyncio.CancelledError, Exception):
+        pass
+
+
+def record_metadata_wait(elapsed_ms: float, outcome: str) -> None:
+    """Record one handshake metadata wait (outcome: immediate, waited, timeout)."""
+    _wait_stats[outcome] += 1
+    _wait_stats["total_ms"] += elapsed_ms
+    _wait_stats["max_ms"] = max(_wait_stats["max_ms"], elapsed_ms)
+    histogram.observe(_wait_stats["buckets"], WAIT_BUCKETS_MS, elapsed_ms)
+
+
+def get_metadata_wait_stats() -> dict:
+    """Handshake metadata wait counts and latency on this instance."""
+    waits = _wait_stats["immediate"] + _wait_stats["waited"] + _wait_stats["timeout"]
+    buckets = _wait_stats["buckets"]
+    return {
+        "waits": waits,
+        "immediate": _wait_stats["immediate"],
+        "waited": _wait_stats["waited"],
+        "timeout": _wait_stats["timeout"],
+        "avg_ms": round(_wait_stats["total_ms"] / waits, 1) if waits else 0.0,
+        "max_ms": round(_wait_stats["max_ms"], 1),
+        "p50_ms": histogram.percentile(WAIT_BUCKETS_MS, buckets, 0.5),
+        "p95_ms": histogram.percentile(WAIT_BUCKETS_MS, buckets, 0.95),
+        "histogram": histogram.labelled(WAIT_BUCKETS_MS, buckets),
+        "pushed": metadata_ready_is_pushed(),
+    }
+
+
+def reset_metadata_wait_stats() -> None:
+    _wait_stats.update(_new_wait_stats())
+
+
 async def get_call_metadata(call_id: str) -> dict | None:
     """Load call metadata from local memory, then Redis fallback."""
     metadata = call_metadata.get(call_id)
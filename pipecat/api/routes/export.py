@@ -1,18 +1,31 @@
 """Data export API route.
 
 HIPAA right-to-access — exports all stored data for a senior in a single JSON bundle.
+
+``?stream=true`` sends the same bundle as a chunked JSON document and
+``?format=ndjson`` as one JSON line per record. Both stream section by
+section from one read-only snapshot, pulling rows through a server-side
+cursor and decrypting them in bounded batches, so memory stays flat however
+long the senior's history is. The NDJSON stream ends with an ``end`` line
+carrying the record counts; a stream cut short has none.
 """
 
 from __future__ import annotations
 
+import asyncio
+import json
+import time
+from contextlib import aclosing
 from datetime import datetime, timezone
+from decimal import Decimal
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from loguru import logger
 
 from api.middleware.auth import require_auth, AuthContext
-from db.client import query_one, query_many
-from lib.encryption import decrypt, decrypt_json
+from db.client import iter_batches, query_one, query_many, read_snapshot
+from lib.encryption import decrypt_json_many_async, decrypt_many_async
 from lib.phi import decrypt_daily_context_phi, decrypt_reminder_phi, decrypt_senior_phi
 from services.audit import write_audit, auth_to_role
 
@@ -37,6 +50,8 @@ def _serialize(obj):
     """JSON-safe serialization for datetime, UUID, and other types."""
     if isinstance(obj, datetime):
         return obj.isoformat()
+    if isinstance(obj, Decimal):
+        return float(obj)
     if hasattr(obj, "hex"):  # UUID
         return str(obj)
     if isinstance(obj, bytes):
@@ -65,17 +80,26 @@ def _clean_rows(rows: list[dict]) -> list[dict]:
     return cleaned
 
 
-def _decrypt_conversations(rows: list[dict]) -> list[dict]:
+def _column(rows: list[dict], key: str) -> list:
+    return [row.get(key) or None for row in rows]
+
+
+async def _decrypt_conversations(rows: list[dict]) -> list[dict]:
     """Decrypt conversation PHI for authorized export responses."""
+    summaries, transcripts, texts = await asyncio.gather(
+        decrypt_many_async(_column(rows, "summary_encrypted")),
+        decrypt_json_many_async(_column(rows, "transcript_encrypted")),
+        decrypt_many_async(_column(rows, "transcript_text_encrypted")),
+    )
     exported = []
-    for row in rows:
+    for row, summary, transcript, text in zip(rows, summaries, transcripts, texts):
         clean = dict(row)
         if clean.get("summary_encrypted"):
-            clean["summary"] = decrypt(clean["summary_encrypted"])
+            clean["summary"] = summary
         if clean.get("transcript_encrypted"):
-            clean["transcript"] = decrypt_json(clean["transcript_encrypted"])
+            clean["transcript"] = transcript
         if clean.get("transcript_text_encrypted"):
-            clean["transcript_text"] = decrypt(clean["transcript_text_encrypted"])
+            clean["transcript_text"] = text
         clean.pop("summary_encrypted", None)
         clean.pop("transcript_encrypted", None)
         clean.pop("transcript_text_encrypted", None)
@@ -83,24 +107,26 @@ def _decrypt_conversations(rows: list[dict]) -> list[dict]:
     return exported
 
 
-def _decrypt_memories(rows: list[dict]) -> list[dict]:
+async def _decrypt_memories(rows: list[dict]) -> list[dict]:
     """Decrypt memory PHI for authorized export responses."""
+    contents = await decrypt_many_async(_column(rows, "content_encrypted"))
     exported = []
-    for row in rows:
+    for row, content in zip(rows, contents):
         clean = dict(row)
         if clean.get("content_encrypted"):
-            clean["content"] = decrypt(clean["content_encrypted"])
+            clean["content"] = content
         clean.pop("content_encrypted", None)
         exported.append(clean)
     return exported
 
 
-def _decrypt_call_analyses(rows: list[dict]) -> list[dict]:
+async def _decrypt_call_analyses(rows: list[dict]) -> list[dict]:
     """Decrypt call analysis details for authorized export responses."""
+    analyses = await decrypt_json_many_async(_column(rows, "analysis_encrypted"))
     exported = []
-    for row in rows:
+    for row, decrypted in zip(rows, analyses):
         clean = dict(row)
-        full = decrypt_json(clean["analysis_encrypted"]) if clean.get("analysis_encrypted") else {}
+        full = decrypted if clean.get("analysis_encrypted") else {}
         if isinstance(full, dict):
             clean["summary"] = clean.get("summary") or full.get("summary")
             clean["topics"] = clean.get("topics") or full.get("topics_discussed") or full.get("topics")
@@ -113,77 +139,176 @@ def _decrypt_call_analyses(rows: list[dict]) -> list[dict]:
     return exported
 
 
-@router.get("/api/seniors/{senior_id}/export")
-async def export_senior_data(
-    senior_id: str,
-    request: Request,
-    auth: AuthContext = Depends(require_auth),
-):
-    """Export all data for a senior (HIPAA right-to-access).
+async def _decrypt_reminders(rows: list[dict]) -> list[dict]:
+    return [decrypt_reminder_phi(row) for row in rows]
 
-    Returns a JSON bundle with: senior profile, conversations, memories,
-    reminders, call analyses, daily context, and caregiver links.
-    """
-    if not await _can_access_senior(auth, senior_id):
-        raise HTTPException(status_code=403, detail="Access denied to this senior")
 
-    # Verify senior exists
-    senior = await query_one("SELECT * FROM seniors WHERE id = $1", senior_id)
-    if not senior:
-        raise HTTPException(status_code=404, detail="Senior not found")
+async def _decrypt_daily_context(rows: list[dict]) -> list[dict]:
+    return [decrypt_daily_context_phi(row) for row in rows]
+
+
+async def _plain(rows: list[dict]) -> list[dict]:
+    return rows
 
-    # Fetch all data in parallel via individual queries
-    conversations = await query_many(
+
+# (section, SQL, batch decryptor, stream batch size). Conversations carry
+# whole transcripts, so they stream in smaller batches.
+_SECTIONS = (
+    (
+        "conversations",
         """SELECT id, senior_id, call_sid, started_at, ended_at,
                   duration_seconds, status, summary, summary_encrypted,
                   sentiment, concerns, transcript, transcript_encrypted,
                   transcript_text_encrypted, call_metrics
            FROM conversations WHERE senior_id = $1 ORDER BY started_at DESC""",
-        senior_id,
-    )
-
-    memories = await query_many(
+        _decrypt_conversations,
+        50,
+    ),
+    (
+        "memories",
         """SELECT id, senior_id, type, content, content_encrypted, source, importance, metadata,
                   created_at, last_accessed_at
            FROM memories WHERE senior_id = $1 ORDER BY created_at DESC""",
-        senior_id,
-    )
-
-    reminders = await query_many(
+        _decrypt_memories,
+        200,
+    ),
+    (
+        "reminders",
         """SELECT id, senior_id, type, title, title_encrypted,
                   description, description_encrypted, scheduled_time,
                   is_recurring, cron_expression, is_active, last_delivered_at, created_at
            FROM reminders WHERE senior_id = $1 ORDER BY created_at DESC""",
-        senior_id,
-    )
-
-    call_analyses = await query_many(
+        _decrypt_reminders,
+        200,
+    ),
+    (
+        "call_analyses",
         """SELECT id, conversation_id, senior_id, summary, topics,
                   engagement_score, concerns, positive_observations,
                   follow_up_suggestions, call_quality, analysis_encrypted, created_at
            FROM call_analyses WHERE senior_id = $1 ORDER BY created_at DESC""",
-        senior_id,
-    )
-
-    daily_context = await query_many(
+        _decrypt_call_analyses,
+        200,
+    ),
+    (
+        "daily_context",
         """SELECT id, senior_id, call_date, call_sid, topics_discussed,
                   reminders_delivered, advice_given, key_moments, summary,
                   context_encrypted, created_at
            FROM daily_call_context WHERE senior_id = $1 ORDER BY call_date DESC""",
-        senior_id,
-    )
-
-    caregiver_links = await query_many(
+        _decrypt_daily_context,
+        200,
+    ),
+    (
+        "caregiver_links",
         "SELECT id, clerk_user_id, senior_id, role, created_at FROM caregivers WHERE senior_id = $1",
-        senior_id,
+        _plain,
+        200,
+    ),
+)
+
+_AUDIT_COUNTS_SQL = """SELECT (SELECT COUNT(*) FROM conversations WHERE senior_id = $1) AS conversations,
+                              (SELECT COUNT(*) FROM memories WHERE senior_id = $1) AS memories,
+                              (SELECT COUNT(*) FROM reminders WHERE senior_id = $1) AS reminders"""
+
+
+def _clean_senior(senior: dict) -> dict | None:
+    # Strip embedding vectors from senior (if call_context_snapshot has any)
+    decrypted_senior = decrypt_senior_phi(senior) or senior
+    clean_senior = {k: v for k, v in decrypted_senior.items() if k != "embedding"}
+    return _clean_rows([clean_senior])[0] if clean_senior else None
+
+
+def _dumps(value) -> str:
+    return json.dumps(value, default=_serialize, separators=(",", ":"))
+
+
+async def _section_batches(senior_id: str):
+    """Yield ``(section, rows)`` from one snapshot, decrypted and cleaned.
+
+    ``rows`` is None once at the start of each section.
+    """
+    async with read_snapshot() as conn:
+        for section, sql, decrypt, batch_size in _SECTIONS:
+            yield section, None
+            async for rows in iter_batches(
+                conn, sql, senior_id, batch_size=batch_size, name=f"export.{section}"
+            ):
+                yield section, _clean_rows(await decrypt(rows))
+
+
+async def _stream_export(senior_id: str, senior: dict | None, fmt: str):
+    exported_at = datetime.now(timezone.utc).isoformat()
+    counts = {section: 0 for section, *_ in _SECTIONS}
+    started = time.monotonic()
+    if fmt == "ndjson":
+        yield _dumps({"section": "senior", "exported_at": exported_at, "data": senior}) + "\n"
+    else:
+        yield f'{{"exported_at":{_dumps(exported_at)},"senior":{_dumps(senior)}'
+    async with aclosing(_section_batches(senior_id)) as batches:
+        async for section, rows in batches:
+            if rows is None:
+                if fmt != "ndjson":
+                    yield ("" if section == _SECTIONS[0][0] else "]") + f",{_dumps(section)}:["
+                continue
+            if fmt == "ndjson":
+                yield "".join(_dumps({"section": section, "data": row}) + "\n" for row in rows)
+            else:
+                yield ("," if counts[section] else "") + ",".join(_dumps(row) for row in rows)
+            counts[section] += len(rows)
+    if fmt == "ndjson":
+        yield _dumps({"section": "end", "counts": counts}) + "\n"
+    else:
+        yield "]}"
+    logger.info(
+        "Streamed data export for senior {sid} in {ms:.0f}ms: {counts}",
+        sid=senior_id[:8],
+        ms=(time.monotonic() - started) * 1000,
+        counts=counts,
     )
 
+
+@router.get("/api/seniors/{senior_id}/export")
+async def export_senior_data(
+    senior_id: str,
+    request: Request,
+    auth: AuthContext = Depends(require_auth),
+    format: str = Query("json", pattern="^(json|ndjson)$"),
+    stream: bool = Query(False, description="Stream the JSON bundle section by section"),
+):
+    """Export all data for a senior (HIPAA right-to-access).
+
+    Returns a JSON bundle with: senior profile, conversations, memories,
+    reminders, call analyses, daily context, and caregiver links.
+    ``stream=true`` or ``format=ndjson`` streams it instead (see module docstring).
+    """
+    if not await _can_access_senior(auth, senior_id):
+        raise HTTPException(status_code=403, detail="Access denied to this senior")
+
+    # Verify senior exists
+    senior = await query_one("SELECT * FROM seniors WHERE id = $1", senior_id)
+    if not senior:
+        raise HTTPException(status_code=404, detail="Senior not found")
+
+    streaming = stream or format == "ndjson"
+    if streaming:
+        # Audit before the first byte goes out, with counts from a cheap
+        # COUNT query rather than the (not yet read) rows.
+        counts = await query_one(_AUDIT_COUNTS_SQL, senior_id, name="export.counts") or {}
+        sections = {}
+    else:
+        sections = {
+            section: await query_many(sql, senior_id, name=f"export.{section}")
+            for section, sql, _, _ in _SECTIONS
+        }
+        counts = {section: len(sections[section]) for section in ("conversations", "memories", "reminders")}
+
     logger.info(
         "Data export for senior {sid}: {c} conversations, {m} memories, {r} reminders",
         sid=senior_id[:8],
-        c=len(conversations),
-        m=len(memories),
-        r=len(reminders),
+        c=counts.get("conversations", 0),
+        m=counts.get("memories", 0),
+        r=counts.get("reminders", 0),
     )
 
     await write_audit(
@@ -195,24 +320,24 @@ async def export_senior_data(
         ip_address=request.client.host if request.client else None,
         user_agent=request.headers.get("user-agent"),
         metadata={
-            "conversations": len(conversations),
-            "memories": len(memories),
-            "reminders": len(reminders),
+            "conversations": int(counts.get("conversations") or 0),
+            "memories": int(counts.get("memories") or 0),
+            "reminders": int(counts.get("reminders") or 0),
             "surface": "pipecat_export",
         },
     )
 
-    # Strip embedding vectors from senior (if call_context_snapshot has any)
-    decrypted_senior = decrypt_senior_phi(senior) or senior
-    clean_senior = {k: v for k, v in decrypted_senior.items() if k != "embedding"}
+    clean_senior = _clean_senior(senior)
+    if streaming:
+        return StreamingResponse(
+            _stream_export(senior_id, clean_senior, format),
+            media_type="application/x-ndjson" if format == "ndjson" else "application/json",
+        )
 
-    return {
+    bundle = {
         "exported_at": datetime.now(timezone.utc).isoformat(),
-        "senior": _clean_rows([clean_senior])[0] if clean_senior else None,
-        "conversations": _clean_rows(_decrypt_conversations(conversations)),
-        "memories": _clean_rows(_decrypt_memories(memories)),
-        "reminders": _clean_rows([decrypt_reminder_phi(row) for row in reminders]),
-        "call_analyses": _clean_rows(_decrypt_call_analyses(call_analyses)),
-        "daily_context": _clean_rows([decrypt_daily_context_phi(row) for row in daily_context]),
-        "caregiver_links": _clean_rows(caregiver_links),
+        "senior": clean_senior,
     }
+    for section, _, decrypt, _ in _SECTIONS:
+        bundle[section] = _clean_rows(await decrypt(sections[section]))
+    return bundle
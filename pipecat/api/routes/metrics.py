@@ -1,6 +1,7 @@
 """Call metrics API routes for the observability dashboard.
 
-Queries the call_metrics table with time-range filtering and aggregation.
+Queries the call_metrics table with time-range filtering; the summary reads
+the hourly rollups in call_metrics_hourly.
 """
 
 from __future__ import annotations
@@ -13,9 +14,12 @@ from loguru import logger
 from api.middleware.auth import require_admin, AuthContext
 from db.client import query_many, query_one
 from services.audit import fire_and_forget_audit, auth_to_role
+from services.call_metrics_rollup import MAX_WINDOW_HOURS, get_summary
 
 router = APIRouter()
 
+RAW_SUMMARY_MAX_HOURS = 168
+
 
 @router.get("/api/metrics/calls")
 async def get_call_metrics(
@@ -54,9 +58,16 @@ async def get_call_metrics(
 async def get_metrics_summary(
     request: Request,
     auth: AuthContext = Depends(require_admin),
-    hours: int = Query(24, ge=1, le=168, description="Lookback window in hours"),
+    hours: int = Query(24, ge=1, le=MAX_WINDOW_HOURS, description="Lookback window in hours"),
 ):
-    """Get aggregated metrics summary for dashboard widgets."""
+    """Get aggregated metrics summary for dashboard widgets.
+
+    Read from the hourly rollups, so long windows cost one row per hour and
+    call type rather than a scan of raw call_metrics. The window is rounded
+    down to the start of the hour containing ``since``, so it can include up
+    to 59 extra minutes; ``window_start`` and ``window_granularity`` in the
+    response say which window was used.
+    """
     fire_and_forget_audit(
         user_id=auth.user_id,
         user_role=auth_to_role(auth),
@@ -67,6 +78,22 @@ async def get_metrics_summary(
         metadata={"hours": hours, "endpoint": "summary"},
     )
     since = datetime.now(timezone.utc) - timedelta(hours=hours)
+    try:
+        result = await get_summary(since)
+    except Exception as e:
+        if getattr(e, "sqlstate", None) != "42P01" or hours > RAW_SUMMARY_MAX_HOURS:
+            raise
+        # Rollup table not migrated yet.
+        logger.warning("call_metrics_hourly missing; summarizing raw call_metrics")
+        result = {
+            **await _raw_summary(since),
+            "window_start": since.isoformat(),
+            "window_granularity": "exact",
+        }
+    return {**result, "since": since.isoformat()}
+
+
+async def _raw_summary(since: datetime) -> dict:
     row = await query_one(
         """SELECT
              COUNT(*) AS total_calls,
@@ -92,5 +119,79 @@ async def get_metrics_summary(
     return {
         "summary": dict(row) if row else {},
         "end_reasons": [dict(r) for r in end_reasons],
-        "since": since.isoformat(),
     }
+
+
+@router.get("/api/metrics/caches")
+async def get_cache_metrics(
+    request: Request,
+    auth: AuthContext = Depends(require_admin),
+):
+    """Hit-rate counters for the in-process caches on this instance."""
+    from api.middleware.auth import get_jwks_stats
+    from services import context_cache, embedding_cache, memory_index, news, token_revocation
+
+    fire_and_forget_audit(
+        user_id=auth.user_id,
+        user_role=auth_to_role(auth),
+        action="read",
+        resource_type="call_metrics",
+        ip_address=request.client.host if request.client else None,
+        user_agent=request.headers.get("user-agent"),
+        metadata={"endpoint": "caches"},
+    )
+    return {
+        "embedding_cache": embedding_cache.get_stats(),
+        "memory_index": memory_index.get_stats(),
+        "context_cache": context_cache.get_stats(),
+        "news_cache": news.get_stats(),
+        "token_revocation": token_revocation.get_stats(),
+        "clerk_jwks": get_jwks_stats(),
+    }
+
+
+@router.get("/api/metrics/queries")
+async def get_query_metrics(
+    request: Request,
+    auth: AuthContext = Depends(require_admin),
+    top: int = Query(50, ge=1, le=256, description="Max queries to return"),
+):
+    """Per-query call counts, row counts and latency histograms on this instance."""
+    from db.client import get_pool_stats, get_query_stats
+
+    fire_and_forget_audit(
+        user_id=auth.user_id,
+        user_role=auth_to_role(auth),
+        action="read",
+        resource_type="call_metrics",
+        ip_address=request.client.host if request.client else None,
+        user_agent=request.headers.get("user-agent"),
+        metadata={"endpoint": "queries", "top": top},
+    )
+    try:
+        pool = await get_pool_stats()
+    except Exception as e:
+        logger.warning("Pool stats unavailable: {err}", err=str(e))
+        pool = {}
+    return {"pool": pool, "queries": get_query_stats(top=top)}
+
+
+@router.get("/api/metrics/telnyx")
+async def get_telnyx_metrics(
+    request: Request,
+    auth: AuthContext = Depends(require_admin),
+):
+    """Telnyx Call Control latency per action and WebSocket metadata waits on this instance."""
+    from api.routes.call_context import get_metadata_wait_stats
+    from lib.telnyx_http import get_stats
+
+    fire_and_forget_audit(
+        user_id=auth.user_id,
+        user_role=auth_to_role(auth),
+        action="read",
+        resource_type="call_metrics",
+        ip_address=request.client.host if request.client else None,
+        user_agent=request.headers.get("user-agent"),
+        metadata={"endpoint": "telnyx"},
+    )
+    return {"actions": get_stats(), "metadata_wait": get_metadata_wait_stats()}
@@ -29,14 +29,17 @@ from api.middleware.auth import require_service_api_key
 from api.routes.call_context import (
     _cleanup_metadata,
     _hydrate_senior_call_context,
-    _metadata_lock,
+    _metadata_lock_for,
     _persist_metadata,
     _senior_is_inactive,
     call_metadata,
 )
 from config import get_pipecat_public_url, get_settings, is_production_environment
+from lib import telnyx_http
+from lib.ttl_set import TTLSet
 from lib.sanitize import mask_phone
 from lib.telnyx_audio import DEFAULT_TELNYX_AUDIO_PROFILE, resolve_telnyx_audio_profile
+from lib.telnyx_http import command_id as _telnyx_command_id
 
 router = APIRouter()
 
@@ -64,8 +67,7 @@ _AMD_DISABLED_VALUES = {"", "0", "false", "no", "off", "none", "disabled", "disa
 _AMD_HUMAN_RESULTS = {"human", "human_residence", "human_business", "not_sure", "silence"}
 _AMD_MACHINE_RESULTS = {"machine", "beep_detected", "ended", "no_beep_detected"}
 _AMD_HANGUP_RESULTS = {"fax_detected"}
-_recent_telnyx_event_ids: dict[str, float] = {}
-_telnyx_event_lock = asyncio.Lock()
+_recent_telnyx_event_ids = TTLSet(TELNYX_EVENT_DEDUPE_TTL_SECONDS)
 
 
 class TelnyxOutboundCallRequest(BaseModel):
@@ -217,11 +219,11 @@ def _call_settings_from_senior(senior: dict) -> dict[str, Any]:
     }
 
 
-def _cached_senior_context_seed(senior: dict) -> tuple[dict[str, Any], bool]:
+async def _cached_senior_context_seed(senior: dict) -> tuple[dict[str, Any], bool]:
     try:
-        from services.context_cache import get_cache
+        from services.context_cache import get_cache_async
 
-        cached = get_cache(str(senior["id"]))
+        cached = await get_cache_async(str(senior["id"]))
     except Exception:
         return {}, False
 
@@ -327,10 +329,6 @@ def _validated_prewarmed_context(
     return prewarmed_context
 
 
-def _telnyx_command_id(call_control_id: str, action: str) -> str:
-    return str(uuid.uuid5(uuid.NAMESPACE_URL, f"telnyx:{call_control_id}:{action}"))
-
-
 def _summarize_telnyx_error(body_text: str) -> dict[str, Any]:
     try:
         payload = json.loads(body_text)
@@ -387,51 +385,56 @@ def _verify_telnyx_signature(raw_body: bytes, request: Request) -> None:
 
 
 async def _telnyx_post(endpoint: str, payload: dict[str, Any] | None = None) -> dict:
-    async with aiohttp.ClientSession() as session:
-        async with session.post(endpoint, headers=_telnyx_headers(), json=payload or {}) as response:
-            body_text = await response.text()
-            if response.status < 200 or response.status >= 300:
-                summary = _summarize_telnyx_error(body_text)
-                logger.error(
-                    "Telnyx API request failed status={status} code={code} title={title} detail_present={detail_present}",
-                    status=response.status,
-                    code=summary.get("error_code"),
-                    title=summary.get("error_title"),
-                    detail_present=summary.get("error_detail_present", False),
-                )
-                raise HTTPException(status_code=502, detail="Telnyx API request failed")
-            if not body_text:
-                return {}
-            return json.loads(body_text)
+    try:
+        response = await telnyx_http.post(endpoint, payload, headers=_telnyx_headers())
+    except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+        logger.error("Telnyx API request failed: {err}", err=str(exc) or type(exc).__name__)
+        raise HTTPException(status_code=502, detail="Telnyx API request failed") from exc
+    if not response.ok:
+        summary = _summarize_telnyx_error(response.body)
+        logger.error(
+            "Telnyx API request failed status={status} code={code} title={title} detail_present={detail_present}",
+            status=response.status,
+            code=summary.get("error_code"),
+            title=summary.get("error_title"),
+            detail_present=summary.get("error_detail_present", False),
+        )
+        raise HTTPException(status_code=502, detail="Telnyx API request failed")
+    return response.json()
 
 
 async def _mark_telnyx_event_seen(event_id: str) -> bool:
+    """Record a webhook event id. Returns True if it was already handled.
+
+    The local set catches redeliveries to this instance without a round trip;
+    a SET NX in shared state catches redeliveries to other instances.
+    """
     if not event_id:
         return False
+    if not _recent_telnyx_event_ids.add(event_id):
+        return True
 
-    now = time.monotonic()
-    async with _telnyx_event_lock:
-        expired = [
-            existing_id
-            for existing_id, seen_at in _recent_telnyx_event_ids.items()
-            if now - seen_at > TELNYX_EVENT_DEDUPE_TTL_SECONDS
-        ]
-        for existing_id in expired:
-            _recent_telnyx_event_ids.pop(existing_id, None)
-
-        if event_id in _recent_telnyx_event_ids:
-            return True
+    try:
+        from lib.redis_client import get_shared_state
 
-        _recent_telnyx_event_ids[event_id] = now
-        return False
+        state = get_shared_state()
+        if getattr(state, "is_shared", False):
+            claimed = await state.set_if_absent(
+                f"telnyx_event:{event_id}", 1, ttl=TELNYX_EVENT_DEDUPE_TTL_SECONDS
+            )
+            return not claimed
+    except Exception as exc:
+        logger.warning("Shared Telnyx event dedupe failed, using local only: {err}", err=str(exc))
+    return False
 
 
 async def _upsert_call_metadata(call_control_id: str, updates: dict[str, Any]) -> dict[str, Any]:
-    async with _metadata_lock:
+    # Persist under the lock so shared-state writes for a call land in order.
+    async with _metadata_lock_for(call_control_id):
         current = dict(call_metadata.get(call_control_id) or {})
         current.update(updates)
         call_metadata[call_control_id] = current
-    await _persist_metadata(call_control_id, current)
+        await _persist_metadata(call_control_id, current)
     return current
 
 
@@ -712,7 +715,7 @@ async def _speak_telnyx_voicemail(call_control_id: str) -> None:
 
 
 async def _leave_telnyx_voicemail_message(call_control_id: str, *, reason: str) -> bool:
-    async with _metadata_lock:
+    async with _metadata_lock_for(call_control_id):
         metadata = call_metadata.get(call_control_id)
         if not metadata:
             return False
@@ -726,9 +729,7 @@ async def _leave_telnyx_voicemail_message(call_control_id: str, *, reason: str)
                 "telnyx_voicemail_message_reason": reason,
             }
         )
-        snapshot = dict(metadata)
-
-    await _persist_metadata(call_control_id, snapshot)
+        await _persist_metadata(call_control_id, dict(metadata))
 
     try:
         await _speak_telnyx_voicemail(call_control_id)
@@ -867,7 +868,7 @@ async def _maybe_start_telnyx_stream(
     reason: str,
     log_if_pending: bool = True,
 ) -> bool:
-    async with _metadata_lock:
+    async with _metadata_lock_for(call_control_id):
         metadata = call_metadata.get(call_control_id)
         if not metadata or not metadata.get("telnyx_start_stream_after_answer"):
             return False
@@ -980,7 +981,7 @@ async def _handle_call_initiated(payload: dict[str, Any]) -> None:
 
 
 async def _handle_call_answered(call_control_id: str) -> None:
-    async with _metadata_lock:
+    async with _metadata_lock_for(call_control_id):
         metadata = call_metadata.get(call_control_id)
         if not metadata:
             logger.warning("[{cid}] Telnyx call answered before metadata was available", cid=call_control_id)
@@ -1085,7 +1086,7 @@ async def prewarm_telnyx_outbound_context(body: TelnyxOutboundCallRequest) -> di
     if not target_phone:
         raise HTTPException(status_code=400, detail="Senior phone is not callable")
 
-    context_seed, cache_hit = _cached_senior_context_seed(senior)
+    context_seed, cache_hit = await _cached_senior_context_seed(senior)
     hydrated_context = await _hydrate_senior_call_context(
         senior=senior,
         call_sid=f"prewarm:{body.senior_id}",
@@ -1314,7 +1315,7 @@ async def create_telnyx_outbound_call(body: TelnyxOutboundCallRequest) -> dict:
             age_ms=round((datetime.now(timezone.utc) - warmed_at).total_seconds() * 1000),
         )
     else:
-        context_seed, cache_hit = _cached_senior_context_seed(senior)
+        context_seed, cache_hit = await _cached_senior_context_seed(senior)
         context_seed_source = "context_cache" if cache_hit else "live_hydration"
 
     ws_token = secrets.token_urlsafe(32)
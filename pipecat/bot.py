@@ -56,6 +56,9 @@ class WebSocketAuthError(Exception):
 HANDSHAKE_TIMEOUT_SECONDS = settings.telephony_ws_handshake_timeout_seconds
 WS_METADATA_LOOKUP_TIMEOUT_SECONDS = 2.0
 WS_METADATA_LOOKUP_POLL_INTERVAL_SECONDS = 0.05
+# Re-check interval when metadata writes are pushed to this instance; only
+# covers a lost pub/sub message.
+WS_METADATA_LOOKUP_BACKSTOP_SECONDS = 0.5
 
 
 def _provider_call_id(call_data: dict, session_state: dict | None = None) -> str:
@@ -93,28 +96,53 @@ def _provider_ws_token(call_data: dict) -> str:
 
 
 async def _wait_for_call_metadata(call_sid: str) -> dict | None:
-    from api.routes.call_context import get_call_metadata
+    """Return call metadata, waiting briefly for the telephony route to store it.
 
-    deadline = time.monotonic() + WS_METADATA_LOOKUP_TIMEOUT_SECONDS
-    attempts = 0
-
-    while True:
-        attempts += 1
-        metadata = await get_call_metadata(call_sid)
-        if metadata:
-            if attempts > 1:
-                logger.info(
-                    "[{cs}] WebSocket metadata became available after {attempts} checks",
-                    cs=call_sid,
-                    attempts=attempts,
-                )
-            return metadata
+    Wakes as soon as metadata is written locally or announced by another
+    instance. Without a pub/sub listener it falls back to short polling.
+    """
+    from api.routes.call_context import (
+        get_call_metadata,
+        metadata_ready_is_pushed,
+        metadata_waiter,
+        record_metadata_wait,
+    )
 
-        remaining = deadline - time.monotonic()
-        if remaining <= 0:
-            return None
+    started = time.monotonic()
+    deadline = started + WS_METADATA_LOOKUP_TIMEOUT_SECONDS
+    attempts = 0
 
-        await asyncio.sleep(min(WS_METADATA_LOOKUP_POLL_INTERVAL_SECONDS, remaining))
+    with metadata_waiter(call_sid) as ready:
+        while True:
+            attempts += 1
+            ready.clear()
+            metadata = await get_call_metadata(call_sid)
+            elapsed_ms = (time.monotonic() - started) * 1000
+            if metadata:
+                record_metadata_wait(elapsed_ms, "immediate" if attempts == 1 else "waited")
+                if attempts > 1:
+                    logger.info(
+                        "[{cs}] WebSocket metadata became available after {ms}ms ({attempts} checks)",
+                        cs=call_sid,
+                        ms=round(elapsed_ms),
+                        attempts=attempts,
+                    )
+                return metadata
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                record_metadata_wait(elapsed_ms, "timeout")
+                return None
+
+            interval = (
+                WS_METADATA_LOOKUP_BACKSTOP_SECONDS
+                if metadata_ready_is_pushed()
+                else WS_METADATA_LOOKUP_POLL_INTERVAL_SECONDS
+            )
+            try:
+                await asyncio.wait_for(ready.wait(), timeout=min(interval, remaining))
+            except asyncio.TimeoutError:
+                pass
 
 
 async def authenticate_websocket_call(
@@ -347,8 +375,16 @@ def _create_telephony_serializer(
 
 
 async def _safe_post_call(session_state: dict, conversation_tracker, elapsed: int, call_sid: str):
-    """Run post-call in background with its own error boundary."""
+    """Queue post-call work, or run it here with its own error boundary.
+
+    With the durable queue enabled the call only pays for the enqueue write;
+    a worker runs the steps. Otherwise (or if the enqueue fails) post-call
+    runs inline in this process.
+    """
     try:
+        from services.post_call_queue import enqueue
+        if await enqueue(session_state, conversation_tracker, elapsed):
+            return
         await run_post_call(session_state, conversation_tracker, elapsed)
     except Exception as e:
         logger.error("[{cs}] Background post-call failed: {err}", cs=call_sid, err=str(e))
@@ -543,6 +579,15 @@ async def run_bot(websocket: WebSocket, session_state: dict, prepared_call: dict
     except Exception as e:
         logger.warning("[{cs}] Flag resolution failed — using defaults: {err}", cs=call_sid, err=str(e))
 
+    # Rebuild the senior's in-process memory index from the database (no-op
+    # when disabled) so edits made since the morning prefetch are picked up.
+    if session_state.get("senior_id"):
+        from services.memory_index import warm_index
+        task = asyncio.create_task(warm_index(session_state["senior_id"]))
+        tasks = session_state.setdefault("_memory_index_tasks", set())
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
     audio_profile = get_audio_profile(session_state)
     audio_in_sample_rate = int(audio_profile["audio_in_sample_rate"])
     audio_out_sample_rate = int(audio_profile["audio_out_sample_rate"])
@@ -127,6 +127,10 @@ class Settings:
     voice_backend: str = ""
     tts_provider: str = ""
     telephony_ws_handshake_timeout_seconds: float = 5.0
+    memory_index_enabled: bool = False  # In-process per-senior vector index for mid-call search
+    embedding_cache_shared: bool = False  # Back the embedding LRU with Redis/Upstash shared state
+    post_call_queue_enabled: bool = False  # Durable Postgres post-call queue; inline when off
+    post_call_workers: int = 2
 
     # ---- Data Retention (HIPAA) ----
     retention_conversations_days: int = 365
@@ -371,6 +375,10 @@ def _load_settings() -> Settings:
         telephony_ws_handshake_timeout_seconds=float(
             _env("TELEPHONY_WS_HANDSHAKE_TIMEOUT_SECONDS", _env("TWILIO_WS_HANDSHAKE_TIMEOUT_SECONDS", "5"))
         ),
+        memory_index_enabled=_truthy(_env("MEMORY_INDEX_ENABLED")),
+        embedding_cache_shared=_truthy(_env("EMBEDDING_CACHE_SHARED")),
+        post_call_queue_enabled=_truthy(_env("POST_CALL_QUEUE_ENABLED")),
+        post_call_workers=int(_env("POST_CALL_WORKERS", "2")),
         # Data Retention (HIPAA)
         retention_conversations_days=int(_env("RETENTION_CONVERSATIONS_DAYS", "365")),
         retention_conversation_metadata_days=int(_env("RETENTION_CONVERSATION_METADATA_DAYS", "1095")),
@@ -1,3 +1,3 @@
-from .client import get_pool, query_one, query_many, execute, close_pool, check_health, get_pool_stats
+from .client import get_pool, query_one, query_many, execute, read_snapshot, iter_batches, close_pool, check_health, get_pool_stats, get_query_stats
 
-__all__ = ["get_pool", "query_one", "query_many", "execute", "close_pool", "check_health", "get_pool_stats"]
+__all__ = ["get_pool", "query_one", "query_many", "execute", "read_snapshot", "iter_batches", "close_pool", "check_health", "get_pool_stats", "get_query_stats"]
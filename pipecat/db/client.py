@@ -2,6 +2,15 @@
 
 Provides a connection pool and helper functions for executing queries
 against the shared Neon PostgreSQL database.
+
+Every query is instrumented: call count, row count, error count, pool-acquire
+wait and an execution latency histogram. Hot queries pass ``name=`` to the
+helpers so they are reported under a stable name (e.g. ``memory.search``);
+other queries are grouped by a fingerprint of their SQL. Each query's SQL
+text is constant, so asyncpg's per-connection statement cache prepares it
+once per connection. ``get_query_stats()`` / ``get_pool_stats()`` expose
+the numbers. ``read_snapshot()`` + ``iter_batches()`` stream large results
+through a server-side cursor in bounded batches.
 """
 
 from __future__ import annotations
@@ -9,13 +18,127 @@ from __future__ import annotations
 import json
 import os
 import time
+from contextlib import asynccontextmanager
 
 import asyncpg
 from loguru import logger
 
+from lib import histogram
+
 _pool: asyncpg.Pool | None = None
 
 _SLOW_QUERY_THRESHOLD_MS = 100
+# asyncpg keeps an LRU of prepared statements per connection, keyed by SQL
+# text. Sized well above the number of distinct queries so hot statements are
+# never evicted by ad-hoc SQL and stay prepared for the connection's lifetime.
+_STATEMENT_CACHE_SIZE = 512
+
+# Upper bounds (ms) of the latency histogram buckets; a final bucket catches the rest.
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+_MAX_QUERY_LABELS = 256
+_OVERFLOW_LABEL = "other"
+
+_query_stats: dict[str, dict] = {}
+_named_queries: dict[str, str] = {}
+
+
+def _register(name: str, sql: str) -> None:
+    known = _named_queries.get(name)
+    if known is None:
+        _named_queries[name] = sql
+    elif known != sql:
+        logger.warning("Query name {name} reused for different SQL", name=name)
+
+
+def _fingerprint(sql: str) -> str:
+    return "sql:" + " ".join(sql.split())[:80]
+
+
+def _record(label: str, acquire_ms: float, exec_ms: float, rows: int, error: bool = False) -> None:
+    stats = _query_stats.get(label)
+    if stats is None:
+        if len(_query_stats) >= _MAX_QUERY_LABELS:
+            label = _OVERFLOW_LABEL
+            stats = _query_stats.get(label)
+        if stats is None:
+            stats = _query_stats[label] = {
+                "calls": 0,
+                "errors": 0,
+                "rows": 0,
+                "total_ms": 0.0,
+                "max_ms": 0.0,
+                "acquire_ms": 0.0,
+                "buckets": histogram.empty(LATENCY_BUCKETS_MS),
+            }
+    stats["calls"] += 1
+    stats["errors"] += int(error)
+    stats["rows"] += rows
+    stats["total_ms"] += exec_ms
+    stats["acquire_ms"] += acquire_ms
+    if exec_ms > stats["max_ms"]:
+        stats["max_ms"] = exec_ms
+    histogram.observe(stats["buckets"], LATENCY_BUCKETS_MS, exec_ms)
+
+
+def get_query_stats(top: int | None = None) -> dict[str, dict]:
+    """Per-query stats, ordered by total execution time (descending)."""
+    ordered = sorted(_query_stats.items(), key=lambda kv: kv[1]["total_ms"], reverse=True)
+    if top is not None:
+        ordered = ordered[:top]
+    out = {}
+    for label, stats in ordered:
+        calls = stats["calls"]
+        out[label] = {
+            "calls": calls,
+            "errors": stats["errors"],
+            "rows": stats["rows"],
+            "total_ms": round(stats["total_ms"], 1),
+            "avg_ms": round(stats["total_ms"] / calls, 2) if calls else 0.0,
+            "max_ms": round(stats["max_ms"], 1),
+            "acquire_ms": round(stats["acquire_ms"], 1),
+            "p50_ms": histogram.percentile(LATENCY_BUCKETS_MS, stats["buckets"], 0.5),
+            "p95_ms": histogram.percentile(LATENCY_BUCKETS_MS, stats["buckets"], 0.95),
+            "histogram": histogram.labelled(LATENCY_BUCKETS_MS, stats["buckets"]),
+        }
+    return out
+
+
+def reset_query_stats() -> None:
+    _query_stats.clear()
+
+
+def _row_count(method: str, result) -> int:
+    if method == "fetch":
+        return len(result)
+    if method == "fetchrow":
+        return 1 if result is not None else 0
+    # Status strings like "UPDATE 3" / "INSERT 0 1" end with the row count.
+    tail = str(result or "").rsplit(" ", 1)[-1]
+    return int(tail) if tail.isdigit() else 0
+
+
+async def _run(method: str, sql: str, args: tuple, name: str | None):
+    """Acquire a connection, run ``sql`` and record timings under its label."""
+    pool = await get_pool()
+    if name:
+        _register(name, sql)
+    label = name or _fingerprint(sql)
+    t0 = time.monotonic()
+    rows = 0
+    error = False
+    async with pool.acquire() as conn:
+        t1 = time.monotonic()
+        try:
+            result = await getattr(conn, method)(sql, *args)
+        except Exception:
+            error = True
+            raise
+        finally:
+            t2 = time.monotonic()
+            if not error:
+                rows = _row_count(method, result)
+            _record(label, (t1 - t0) * 1000, (t2 - t1) * 1000, rows, error)
+    return result, (t2 - t0) * 1000
 
 
 async def _init_connection(conn):
@@ -37,6 +160,7 @@ async def get_pool() -> asyncpg.Pool:
             min_size=int(os.getenv("DB_POOL_MIN", "5")),
             max_size=int(os.getenv("DB_POOL_MAX", "50")),
             init=_init_connection,
+            statement_cache_size=int(os.getenv("DB_STATEMENT_CACHE_SIZE", str(_STATEMENT_CACHE_SIZE))),
         )
         logger.info(
             "Database pool created (min={min}, max={max})",
@@ -46,66 +170,110 @@ async def get_pool() -> asyncpg.Pool:
     return _pool
 
 
-async def get_pool_stats() -> dict:
-    """Return current connection pool statistics."""
+async def get_pool_stats(include_queries: bool = False) -> dict:
+    """Return current connection pool statistics.
+
+    ``include_queries`` adds the top queries by total execution time.
+    """
     pool = await get_pool()
-    return {
+    stats = {
         "size": pool.get_size(),
         "idle": pool.get_idle_size(),
         "max": pool.get_max_size(),
         "min": pool.get_min_size(),
     }
+    if include_queries:
+        stats["queries"] = get_query_stats(top=20)
+    return stats
 
 
-async def query_one(sql: str, *args) -> dict | None:
-    """Execute a query and return a single row as a dict, or None."""
-    pool = await get_pool()
-    t0 = time.monotonic()
-    async with pool.acquire() as conn:
-        row = await conn.fetchrow(sql, *args)
-    elapsed_ms = (time.monotonic() - t0) * 1000
+async def query_one(sql: str, *args, name: str | None = None) -> dict | None:
+    """Execute a query and return a single row as a dict, or None.
+
+    Pass ``name`` for hot queries to report them under a stable label in
+    ``get_query_stats()``; it has no effect on statement preparation.
+    """
+    row, elapsed_ms = await _run("fetchrow", sql, args, name)
     if elapsed_ms > _SLOW_QUERY_THRESHOLD_MS:
         logger.warning(
             "Slow query ({ms:.0f}ms): {sql}",
             ms=elapsed_ms,
-            sql=sql[:120],
+            sql=name or sql[:120],
         )
     return dict(row) if row else None
 
 
-async def query_many(sql: str, *args) -> list[dict]:
+async def query_many(sql: str, *args, name: str | None = None) -> list[dict]:
     """Execute a query and return all rows as a list of dicts."""
-    pool = await get_pool()
-    t0 = time.monotonic()
-    async with pool.acquire() as conn:
-        rows = await conn.fetch(sql, *args)
-    elapsed_ms = (time.monotonic() - t0) * 1000
+    rows, elapsed_ms = await _run("fetch", sql, args, name)
     if elapsed_ms > _SLOW_QUERY_THRESHOLD_MS:
         logger.warning(
             "Slow query ({ms:.0f}ms, {n} rows): {sql}",
             ms=elapsed_ms,
             n=len(rows),
-            sql=sql[:120],
+            sql=name or sql[:120],
         )
     return [dict(r) for r in rows]
 
 
-async def execute(sql: str, *args) -> str:
+async def execute(sql: str, *args, name: str | None = None) -> str:
     """Execute a mutation query (INSERT, UPDATE, DELETE). Returns status string."""
-    pool = await get_pool()
-    t0 = time.monotonic()
-    async with pool.acquire() as conn:
-        result = await conn.execute(sql, *args)
-    elapsed_ms = (time.monotonic() - t0) * 1000
+    result, elapsed_ms = await _run("execute", sql, args, name)
     if elapsed_ms > _SLOW_QUERY_THRESHOLD_MS:
         logger.warning(
             "Slow mutation ({ms:.0f}ms): {sql}",
             ms=elapsed_ms,
-            sql=sql[:120],
+            sql=name or sql[:120],
         )
     return result
 
 
+@asynccontextmanager
+async def read_snapshot():
+    """Hold one connection in a read-only, repeatable-read transaction.
+
+    Every query run on the yielded connection sees the same snapshot, and
+    ``iter_batches`` needs the open transaction for its server-side cursor.
+    """
+    pool = await get_pool()
+    async with pool.acquire() as conn:
+        async with conn.transaction(isolation="repeatable_read", readonly=True):
+            yield conn
+
+
+async def iter_batches(conn, sql: str, *args, batch_size: int = 500, name: str | None = None):
+    """Yield the rows of ``sql`` as lists of at most ``batch_size`` dicts.
+
+    Rows are pulled through a server-side cursor, so memory stays bounded by
+    one batch however large the result. ``conn`` must be inside a transaction
+    (see ``read_snapshot``). Recorded as one call; time spent by the consumer
+    between batches is not counted.
+    """
+    if name:
+        _register(name, sql)
+    label = name or _fingerprint(sql)
+    rows = 0
+    exec_ms = 0.0
+    error = False
+    try:
+        t0 = time.monotonic()
+        cursor = await conn.cursor(sql, *args)
+        exec_ms += (time.monotonic() - t0) * 1000
+        while True:
+            t0 = time.monotonic()
+            batch = await cursor.fetch(batch_size)
+            exec_ms += (time.monotonic() - t0) * 1000
+            if not batch:
+                break
+            rows += len(batch)
+            yield [dict(r) for r in batch]
+    except Exception:
+        error = True
+        raise
+    finally:
+        _record(label, 0.0, exec_ms, rows, error)
+
+
 async def check_health() -> bool:
     """Check if the database is reachable."""
     try:
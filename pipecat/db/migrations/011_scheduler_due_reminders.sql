@@ -0,0 +1,16 @@
+-- Set-based due-reminder query (services/scheduler.DUE_REMINDERS_SQL).
+-- Run via psql; CONCURRENTLY prevents table locks.
+
+-- Recurring reminders are matched by minute-of-day against a window around
+-- "now" in each senior timezone; this index turns that into range scans
+-- instead of reading every active recurring reminder each tick.
+-- (scheduled_time is timestamp without time zone, so date_part is immutable.)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_reminders_recurring_minute
+  ON reminders ((date_part('hour', scheduled_time) * 60 + date_part('minute', scheduled_time)))
+  WHERE is_active = true AND is_recurring = true;
+
+-- The NOT EXISTS delivery exclusion probes this narrower partial index once
+-- per candidate instead of two point lookups per candidate from Python.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_deliveries_reminder_open
+  ON reminder_deliveries(reminder_id, scheduled_for)
+  WHERE status IN ('acknowledged', 'confirmed', 'max_attempts', 'delivered', 'retry_pending');
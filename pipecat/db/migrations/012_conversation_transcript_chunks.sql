@@ -0,0 +1,19 @@
+-- Append-only draft transcript storage for in-progress calls.
+-- Each row holds the turns added since the previous flush, encrypted as JSON
+-- (AES-256-GCM via lib.encryption). conversations.complete() writes the full
+-- encrypted transcript at call end and removes the call's chunks.
+-- Rows cascade with their conversation so hard deletes remove them too.
+
+CREATE TABLE IF NOT EXISTS conversation_transcript_chunks (
+  id BIGSERIAL PRIMARY KEY,
+  conversation_id UUID NOT NULL REFERENCES conversations(id) ON DELETE CASCADE,
+  call_sid TEXT NOT NULL,
+  first_turn INTEGER NOT NULL,
+  turn_count INTEGER NOT NULL,
+  turns_encrypted TEXT NOT NULL,
+  created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+  UNIQUE (call_sid, first_turn)
+);
+
+CREATE INDEX IF NOT EXISTS idx_transcript_chunks_conversation
+  ON conversation_transcript_chunks(conversation_id);
@@ -0,0 +1,33 @@
+-- Durable post-call job queue (services/post_call_queue.py).
+-- The call-end session snapshot is encrypted (AES-256-GCM via lib.encryption)
+-- because it carries the transcript. Workers claim rows with
+-- FOR UPDATE SKIP LOCKED; a running row whose lease has lapsed (instance
+-- killed mid-job) is claimable again. Completed jobs are deleted.
+-- senior_id (NULL for prospect calls) lets services/hard_delete.py remove a
+-- senior's jobs along with the rest of their data.
+
+CREATE TABLE IF NOT EXISTS post_call_jobs (
+  id BIGSERIAL PRIMARY KEY,
+  call_sid TEXT NOT NULL UNIQUE,
+  senior_id UUID,
+  status TEXT NOT NULL DEFAULT 'pending',  -- pending | running | failed
+  attempts INTEGER NOT NULL DEFAULT 0,
+  payload_encrypted TEXT NOT NULL,
+  run_after TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+  locked_at TIMESTAMPTZ,
+  locked_by TEXT,
+  last_error TEXT,
+  created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_post_call_jobs_claim
+  ON post_call_jobs(run_after)
+  WHERE status = 'pending';
+
+CREATE INDEX IF NOT EXISTS idx_post_call_jobs_running
+  ON post_call_jobs(locked_at)
+  WHERE status = 'running';
+
+CREATE INDEX IF NOT EXISTS idx_post_call_jobs_senior
+  ON post_call_jobs(senior_id)
+  WHERE senior_id IS NOT NULL;
@@ -0,0 +1,33 @@
+-- Hourly call-metrics rollups (services/call_metrics_rollup.py).
+-- One row per hour x call_type, upserted by post_call._persist_call_metrics
+-- after each call_metrics insert, so /api/metrics/summary reads a few rows
+-- per hour instead of aggregating raw call_metrics JSONB.
+--
+-- *_sum / *_calls hold per-call averages (the summary's avg_* fields are
+-- averages of per-call averages, as before). *_hist are per-turn latency
+-- histograms over call_metrics_rollup.LATENCY_BUCKETS_MS (last element is
+-- the overflow bucket); they add element-wise, so hours merge into p50/p95.
+--
+-- Existing history: scripts/backfill_call_metrics_rollups.py.
+
+CREATE TABLE IF NOT EXISTS call_metrics_hourly (
+  hour TIMESTAMPTZ NOT NULL,
+  call_type TEXT NOT NULL,
+  calls INTEGER NOT NULL DEFAULT 0,
+  successful_calls INTEGER NOT NULL DEFAULT 0,
+  duration_sum BIGINT NOT NULL DEFAULT 0,
+  duration_calls INTEGER NOT NULL DEFAULT 0,
+  turn_sum BIGINT NOT NULL DEFAULT 0,
+  llm_ttfb_sum BIGINT NOT NULL DEFAULT 0,
+  llm_ttfb_calls INTEGER NOT NULL DEFAULT 0,
+  tts_ttfb_sum BIGINT NOT NULL DEFAULT 0,
+  tts_ttfb_calls INTEGER NOT NULL DEFAULT 0,
+  turn_latency_sum BIGINT NOT NULL DEFAULT 0,
+  turn_latency_calls INTEGER NOT NULL DEFAULT 0,
+  end_reasons JSONB NOT NULL DEFAULT '{}'::jsonb,
+  llm_ttfb_hist INTEGER[] NOT NULL,
+  tts_ttfb_hist INTEGER[] NOT NULL,
+  turn_latency_hist INTEGER[] NOT NULL,
+  updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+  PRIMARY KEY (hour, call_type)
+);
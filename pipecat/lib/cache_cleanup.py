@@ -1,15 +1,16 @@
 """Background cache cleanup loop — prevents unbounded memory growth.
 
 Runs every 5 minutes and evicts stale entries from in-memory caches:
-- context_cache._cache: entries past their expires_at TTL
+- context_cache._cache: entries past their expires_at TTL (via cleanup_expired)
 - scheduler.pending_reminder_calls: entries older than 30 minutes
 - scheduler.prefetched_context_by_phone: entries older than 30 minutes
+- memory_index._indexes: per-senior vector indexes past their TTL
+- embedding_cache._entries: cached embeddings past their TTL
 """
 
 from __future__ import annotations
 
 import asyncio
-import time
 from datetime import datetime, timezone
 
 from loguru import logger
@@ -42,17 +43,13 @@ async def start_cleanup_loop() -> None:
 
 def _run_cleanup() -> int:
     """Evict stale entries from all in-memory caches. Returns count evicted."""
-    now = time.time()
     now_dt = datetime.now(timezone.utc)
     total = 0
 
     # 1. Context cache — has expires_at (unix timestamp)
     try:
-        from services.context_cache import _cache as context_cache
-        expired = [k for k, v in context_cache.items() if now > v.get("expires_at", 0)]
-        for k in expired:
-            del context_cache[k]
-        total += len(expired)
+        from services.context_cache import cleanup_expired as cleanup_context_cache
+        total += cleanup_context_cache()
     except Exception:
         pass
 
@@ -82,6 +79,20 @@ def _run_cleanup() -> int:
     except Exception:
         pass
 
+    # 4. Memory vector indexes — has built_at (unix timestamp)
+    try:
+        from services.memory_index import cleanup_expired
+        total += cleanup_expired()
+    except Exception:
+        pass
+
+    # 5. Embedding cache — has stored_at (unix timestamp)
+    try:
+        from services.embedding_cache import cleanup_expired as cleanup_embeddings
+        total += cleanup_embeddings()
+    except Exception:
+        pass
+
     return total
 
 
@@ -100,6 +111,16 @@ def get_cache_sizes() -> dict[str, int]:
     except Exception:
         sizes["pending_calls"] = -1
         sizes["prefetched_phones"] = -1
+    try:
+        from services.memory_index import _indexes
+        sizes["memory_index"] = len(_indexes)
+    except Exception:
+        sizes["memory_index"] = -1
+    try:
+        from services.embedding_cache import _entries
+        sizes["embedding_cache"] = len(_entries)
+    except Exception:
+        sizes["embedding_cache"] = -1
     return sizes
 
 
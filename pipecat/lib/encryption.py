@@ -13,9 +13,12 @@ as-is on decrypt.
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import json
 import os
+from collections import OrderedDict
+from typing import Iterable
 
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from loguru import logger
@@ -84,19 +87,7 @@ def encrypt(plaintext: str | None) -> str | None:
     return "enc:" + ":".join(parts)
 
 
-def decrypt(ciphertext: str | None) -> str | None:
-    """Decrypt a string value.
-
-    Handles both encrypted (``enc:`` prefix) and legacy unencrypted data.
-    """
-    if ciphertext is None:
-        return None
-    if not isinstance(ciphertext, str) or not ciphertext.startswith("enc:"):
-        return ciphertext  # legacy unencrypted data
-    aes = _get_aes()
-    if aes is None:
-        logger.warning("Cannot decrypt: FIELD_ENCRYPTION_KEY not set")
-        return "[encrypted]"
+def _decrypt_with(aes: AESGCM, ciphertext: str) -> str:
     parts = ciphertext[4:].split(":")
     if len(parts) != 3:
         return ciphertext  # not our format
@@ -111,6 +102,173 @@ def decrypt(ciphertext: str | None) -> str | None:
         return "[encrypted]"
 
 
+# Plaintext cache keyed by ciphertext. Every encrypt() uses a fresh nonce, so
+# a ciphertext always maps to one plaintext and entries never go stale; the
+# cache only trades memory for AES work on values read again and again
+# (memory content, senior profile fields, completed transcripts).
+PLAINTEXT_CACHE_MAX_ENTRIES = 8192
+PLAINTEXT_CACHE_MAX_BYTES = 32 * 1024 * 1024
+PLAINTEXT_CACHE_MAX_VALUE_BYTES = 256 * 1024
+# Batches at least this large are decrypted off the event loop.
+BULK_OFFLOAD_THRESHOLD = 200
+
+_plaintext_cache: OrderedDict[str, str] = OrderedDict()
+_plaintext_cache_bytes = 0
+_plaintext_cache_aes: AESGCM | None = None
+_cache_stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+
+def _cache_for(aes: AESGCM) -> OrderedDict[str, str]:
+    global _plaintext_cache_aes
+    if _plaintext_cache_aes is not aes:
+        # Key changed (rotation, tests): drop plaintexts from the old key.
+        clear_plaintext_cache()
+        _plaintext_cache_aes = aes
+    return _plaintext_cache
+
+
+def _cache_put(ciphertext: str, plaintext: str) -> None:
+    global _plaintext_cache_bytes
+    size = len(ciphertext) + len(plaintext)
+    if plaintext == "[encrypted]" or size > PLAINTEXT_CACHE_MAX_VALUE_BYTES:
+        return
+    _plaintext_cache[ciphertext] = plaintext
+    _plaintext_cache_bytes += size
+    while (
+        len(_plaintext_cache) > PLAINTEXT_CACHE_MAX_ENTRIES
+        or _plaintext_cache_bytes > PLAINTEXT_CACHE_MAX_BYTES
+    ):
+        old_ct, old_pt = _plaintext_cache.popitem(last=False)
+        _plaintext_cache_bytes -= len(old_ct) + len(old_pt)
+        _cache_stats["evictions"] += 1
+
+
+def _cached_decrypt(aes: AESGCM, ciphertext: str) -> str:
+    cache = _cache_for(aes)
+    plaintext = cache.get(ciphertext)
+    if plaintext is not None:
+        cache.move_to_end(ciphertext)
+        _cache_stats["hits"] += 1
+        return plaintext
+    _cache_stats["misses"] += 1
+    plaintext = _decrypt_with(aes, ciphertext)
+    _cache_put(ciphertext, plaintext)
+    return plaintext
+
+
+def decrypt(ciphertext: str | None, *, cache: bool = False) -> str | None:
+    """Decrypt a string value.
+
+    Handles both encrypted (``enc:`` prefix) and legacy unencrypted data.
+    ``cache=True`` serves repeat reads of the same ciphertext from the
+    in-process plaintext cache.
+    """
+    if ciphertext is None:
+        return None
+    if not isinstance(ciphertext, str) or not ciphertext.startswith("enc:"):
+        return ciphertext  # legacy unencrypted data
+    aes = _get_aes()
+    if aes is None:
+        logger.warning("Cannot decrypt: FIELD_ENCRYPTION_KEY not set")
+        return "[encrypted]"
+    if cache:
+        return _cached_decrypt(aes, ciphertext)
+    return _decrypt_with(aes, ciphertext)
+
+
+def decrypt_many(ciphertexts: Iterable, *, cache: bool = False) -> list:
+    """Decrypt a column of values, in order.
+
+    Same per-value semantics as ``decrypt`` (None, legacy plaintext and
+    foreign formats pass through); the key is resolved once per batch.
+    """
+    values = list(ciphertexts)
+    if not any(isinstance(v, str) and v.startswith("enc:") for v in values):
+        return values
+    aes = _get_aes()
+    if aes is None:
+        logger.warning("Cannot decrypt: FIELD_ENCRYPTION_KEY not set")
+        return [
+            "[encrypted]" if isinstance(v, str) and v.startswith("enc:") else v
+            for v in values
+        ]
+    one = _cached_decrypt if cache else _decrypt_with
+    return [
+        one(aes, v) if isinstance(v, str) and v.startswith("enc:") else v
+        for v in values
+    ]
+
+
+async def decrypt_many_async(
+    ciphertexts: Iterable,
+    *,
+    cache: bool = False,
+    offload_threshold: int = BULK_OFFLOAD_THRESHOLD,
+) -> list:
+    """``decrypt_many`` that runs large batches in a worker thread.
+
+    With ``cache=True`` hits are served on the loop and only the misses are
+    offloaded; the cache itself is only touched from the loop.
+    """
+    values = list(ciphertexts)
+    if len(values) < offload_threshold:
+        return decrypt_many(values, cache=cache)
+    if not cache:
+        return await asyncio.to_thread(decrypt_many, values)
+    aes = _get_aes()
+    if aes is None:
+        return decrypt_many(values)
+    plaintext_cache = _cache_for(aes)
+    misses = sorted({
+        v for v in values
+        if isinstance(v, str) and v.startswith("enc:") and v not in plaintext_cache
+    })
+    if len(misses) < offload_threshold:
+        return decrypt_many(values, cache=True)
+    decrypted = await asyncio.to_thread(lambda: [_decrypt_with(aes, v) for v in misses])
+    fresh = dict(zip(misses, decrypted))
+    _cache_stats["misses"] += len(fresh)
+    for ciphertext, plaintext in fresh.items():
+        _cache_put(ciphertext, plaintext)
+    result = []
+    for v in values:
+        if v in fresh:
+            result.append(fresh[v])
+        elif isinstance(v, str) and v.startswith("enc:"):
+            result.append(_cached_decrypt(aes, v))
+        else:
+            result.append(v)
+    return result
+
+
+async def decrypt_json_many_async(
+    ciphertexts: Iterable,
+    *,
+    offload_threshold: int = BULK_OFFLOAD_THRESHOLD,
+) -> list:
+    """``decrypt_json_many`` that runs large batches in a worker thread."""
+    values = list(ciphertexts)
+    if len(values) < offload_threshold:
+        return decrypt_json_many(values)
+    return await asyncio.to_thread(decrypt_json_many, values)
+
+
+def clear_plaintext_cache() -> None:
+    global _plaintext_cache_bytes
+    _plaintext_cache.clear()
+    _plaintext_cache_bytes = 0
+
+
+def get_cache_stats() -> dict:
+    lookups = _cache_stats["hits"] + _cache_stats["misses"]
+    return {
+        "entries": len(_plaintext_cache),
+        "bytes": _plaintext_cache_bytes,
+        **_cache_stats,
+        "hit_rate": round(_cache_stats["hits"] / lookups, 4) if lookups else 0.0,
+    }
+
+
 def encrypt_json(data: dict | list | None) -> str | None:
     """Encrypt a JSON-serializable object. Returns encrypted string."""
     if data is None:
@@ -118,7 +276,7 @@ def encrypt_json(data: dict | list | None) -> str | None:
     return encrypt(json.dumps(data, default=str))
 
 
-def decrypt_json(ciphertext) -> dict | list | None:
+def decrypt_json(ciphertext, *, cache: bool = False) -> dict | list | None:
     """Decrypt to a JSON object.
 
     Handles encrypted strings, legacy JSONB (already deserialized by asyncpg),
@@ -129,8 +287,11 @@ def decrypt_json(ciphertext) -> dict | list | None:
     # asyncpg's JSONB codec may have already deserialized this
     if isinstance(ciphertext, (dict, list)):
         return ciphertext
-    plaintext = decrypt(ciphertext)
-    if plaintext == "[encrypted]":
+    return _parse_json_plaintext(decrypt(ciphertext, cache=cache))
+
+
+def _parse_json_plaintext(plaintext) -> dict | list | None:
+    if plaintext is None or plaintext == "[encrypted]":
         return None
     if isinstance(plaintext, (dict, list)):
         return plaintext
@@ -140,6 +301,11 @@ def decrypt_json(ciphertext) -> dict | list | None:
         return plaintext
 
 
+def decrypt_json_many(ciphertexts: Iterable, *, cache: bool = False) -> list:
+    """``decrypt_json`` over a column of values, in order."""
+    return [_parse_json_plaintext(v) for v in decrypt_many(ciphertexts, cache=cache)]
+
+
 def generate_key() -> str:
     """Generate a new 32-byte base64url-encoded key.
 
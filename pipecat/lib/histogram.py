@@ -0,0 +1,48 @@
+"""Fixed-bucket latency histograms.
+
+A histogram is a list of counts over ascending upper bounds (ms) plus a final
+overflow bucket, so histograms over the same bounds add element-wise.
+Percentiles report the upper bound of the bucket that reaches the requested
+fraction. Samples in the overflow bucket report the last bound, a lower
+bound on the true value that stays JSON-safe (unlike ``inf``).
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Iterable, Sequence
+
+
+def empty(bounds: Sequence[float]) -> list[int]:
+    return [0] * (len(bounds) + 1)
+
+
+def observe(buckets: list[int], bounds: Sequence[float], value: float) -> None:
+    """Count one sample."""
+    buckets[bisect_left(bounds, value)] += 1
+
+
+def histogram(bounds: Sequence[float], values: Iterable[float]) -> list[int]:
+    buckets = empty(bounds)
+    for value in values:
+        observe(buckets, bounds, value)
+    return buckets
+
+
+def percentile(bounds: Sequence[float], buckets: Sequence[int], fraction: float) -> float | None:
+    """Upper bucket bound containing ``fraction`` of the samples; None when empty."""
+    total = sum(buckets)
+    if not total:
+        return None
+    target = total * fraction
+    seen = 0
+    for bound, count in zip(bounds, buckets):
+        seen += count
+        if seen >= target:
+            return float(bound)
+    return float(bounds[-1])
+
+
+def labelled(bounds: Sequence[float], buckets: Sequence[int]) -> dict[str, int]:
+    """Counts keyed by upper bound, with the overflow bucket under ``"inf"``."""
+    return dict(zip([*map(str, bounds), "inf"], buckets))
@@ -0,0 +1,128 @@
+"""Incremental JSON parsing for streamed LLM completions.
+
+``JSONStreamParser`` is fed text chunks as they arrive and reports each
+value as soon as its closing token has been seen, together with its path
+from the root object. Only values up to ``max_depth`` are decoded, so deep
+structures are parsed once, by the caller, when the response is complete.
+
+Text before the first ``{`` or ``[`` (markdown fences, stray prose) is
+ignored. The parser never raises on malformed input; it just stops
+reporting values it cannot decode.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+_SCALAR_END = ",}] \t\r\n"
+
+
+class _Frame:
+    __slots__ = ("is_object", "start", "key", "index", "expect_key")
+
+    def __init__(self, is_object: bool, start: int):
+        self.is_object = is_object
+        self.start = start
+        self.key: str | None = None
+        self.index = 0
+        self.expect_key = is_object
+
+
+class JSONStreamParser:
+    """Report completed values of a streaming JSON document.
+
+    ``feed()`` returns ``(path, value)`` pairs in completion order. ``path``
+    is a tuple of object keys and array indexes, e.g. ``("analysis",)`` or
+    ``("memory_queries", 0)``. The root itself is not reported.
+    """
+
+    def __init__(self, max_depth: int = 1):
+        self.max_depth = max_depth
+        self.done = False
+        self._text = ""
+        self._pos = 0
+        self._stack: list[_Frame] = []
+        self._in_string = False
+        self._escape = False
+        self._token_start = -1  # start of the current string or scalar
+        self._string_is_key = False
+
+    def feed(self, chunk: str) -> list[tuple[tuple, Any]]:
+        if self.done or not chunk:
+            return []
+        self._text += chunk
+        out: list[tuple[tuple, Any]] = []
+        text = self._text
+        i = self._pos
+        while i < len(text) and not self.done:
+            c = text[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif c == "\\":
+                    self._escape = True
+                elif c == '"':
+                    self._in_string = False
+                    self._end_string(i, out)
+                i += 1
+                continue
+
+            if not self._stack:
+                if c in "{[":
+                    self._stack.append(_Frame(c == "{", i))
+                i += 1
+                continue
+
+            if self._token_start >= 0:
+                if c not in _SCALAR_END:
+                    i += 1
+                    continue
+                self._complete(self._token_start, i, out)
+                self._token_start = -1
+
+            frame = self._stack[-1]
+            if c == '"':
+                self._in_string = True
+                self._token_start = i
+                self._string_is_key = frame.is_object and frame.expect_key
+            elif c in "{[":
+                self._stack.append(_Frame(c == "{", i))
+            elif c in "}]":
+                closed = self._stack.pop()
+                if self._stack:
+                    self._complete(closed.start, i + 1, out)
+                else:
+                    self.done = True
+            elif c == ":":
+                frame.expect_key = False
+            elif c == ",":
+                if frame.is_object:
+                    frame.expect_key = True
+                else:
+                    frame.index += 1
+            elif c not in " \t\r\n":
+                self._token_start = i
+            i += 1
+        self._pos = i
+        return out
+
+    def _end_string(self, end: int, out: list) -> None:
+        start, self._token_start = self._token_start, -1
+        if self._string_is_key:
+            try:
+                self._stack[-1].key = json.loads(self._text[start:end + 1])
+            except ValueError:
+                self._stack[-1].key = None
+            return
+        self._complete(start, end + 1, out)
+
+    def _complete(self, start: int, end: int, out: list) -> None:
+        if len(self._stack) > self.max_depth:
+            return
+        try:
+            value = json.loads(self._text[start:end])
+        except ValueError:
+            return
+        path = tuple(f.key if f.is_object else f.index for f in self._stack)
+        out.append((path, value))
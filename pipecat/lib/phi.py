@@ -9,15 +9,15 @@ from lib.encryption import decrypt, decrypt_json, encrypt, encrypt_json
 ENCRYPTED_PLACEHOLDER = "[encrypted]"
 
 
-def _prefer_text(row: dict, plain_key: str, encrypted_key: str):
+def _prefer_text(row: dict, plain_key: str, encrypted_key: str, cache: bool = False):
     if row.get(encrypted_key):
-        return decrypt(row.get(encrypted_key))
+        return decrypt(row.get(encrypted_key), cache=cache)
     return row.get(plain_key)
 
 
-def _prefer_json(row: dict, plain_key: str, encrypted_key: str):
+def _prefer_json(row: dict, plain_key: str, encrypted_key: str, cache: bool = False):
     if row.get(encrypted_key):
-        return decrypt_json(row.get(encrypted_key))
+        return decrypt_json(row.get(encrypted_key), cache=cache)
     return row.get(plain_key)
 
 
@@ -27,15 +27,20 @@ def _drop(row: dict, *keys: str) -> dict:
     return row
 
 
-def decrypt_senior_phi(row: dict | None) -> dict | None:
+def decrypt_senior_phi(row: dict | None, *, cache: bool = False) -> dict | None:
+    """Decrypt senior PHI columns.
+
+    ``cache=True`` uses the plaintext cache; callers that re-read the same
+    seniors every tick (the scheduler) should pass it.
+    """
     if row is None:
         return None
     clean = dict(row)
-    clean["family_info"] = _prefer_json(row, "family_info", "family_info_encrypted")
-    clean["medical_notes"] = _prefer_text(row, "medical_notes", "medical_notes_encrypted")
-    clean["preferred_call_times"] = _prefer_json(row, "preferred_call_times", "preferred_call_times_encrypted")
-    clean["additional_info"] = _prefer_text(row, "additional_info", "additional_info_encrypted")
-    clean["call_context_snapshot"] = _prefer_json(row, "call_context_snapshot", "call_context_snapshot_encrypted")
+    clean["family_info"] = _prefer_json(row, "family_info", "family_info_encrypted", cache)
+    clean["medical_notes"] = _prefer_text(row, "medical_notes", "medical_notes_encrypted", cache)
+    clean["preferred_call_times"] = _prefer_json(row, "preferred_call_times", "preferred_call_times_encrypted", cache)
+    clean["additional_info"] = _prefer_text(row, "additional_info", "additional_info_encrypted", cache)
+    clean["call_context_snapshot"] = _prefer_json(row, "call_context_snapshot", "call_context_snapshot_encrypted", cache)
     return _drop(
         clean,
         "family_info_encrypted",
@@ -63,14 +68,14 @@ def encrypt_senior_update(data: dict) -> dict:
     return values
 
 
-def decrypt_reminder_phi(row: dict | None) -> dict | None:
+def decrypt_reminder_phi(row: dict | None, *, cache: bool = False) -> dict | None:
     if row is None:
         return None
     clean = dict(row)
     if "title" in row or "title_encrypted" in row:
-        clean["title"] = _prefer_text(row, "title", "title_encrypted")
+        clean["title"] = _prefer_text(row, "title", "title_encrypted", cache)
     if "description" in row or "description_encrypted" in row:
-        clean["description"] = _prefer_text(row, "description", "description_encrypted")
+        clean["description"] = _prefer_text(row, "description", "description_encrypted", cache)
     return _drop(clean, "title_encrypted", "description_encrypted")
 
 
@@ -10,6 +10,8 @@ Usage:
     # Dict-like interface (works with or without Redis)
     await shared_state.set("call_metadata:CA123", {...}, ttl=1800)
     data = await shared_state.get("call_metadata:CA123")
+    first = await shared_state.set_if_absent("telnyx_event:abc", 1, ttl=600)
+    await shared_state.publish("call_metadata_ready", "CA123")  # Redis only
     await shared_state.delete("call_metadata:CA123")
 """
 
@@ -44,6 +46,13 @@ class InMemoryState:
             return None
         return self._data.get(key)
 
+    async def set_if_absent(self, key: str, value: Any, ttl: int | None = None) -> bool:
+        """Set ``key`` only if it is missing or expired. Returns True if set."""
+        if await self.get(key) is not None:
+            return False
+        await self.set(key, value, ttl)
+        return True
+
     async def delete(self, key: str) -> None:
         self._data.pop(key, None)
         self._expiry.pop(key, None)
@@ -133,6 +142,11 @@ class RedisState:
         except (json.JSONDecodeError, TypeError):
             return val
 
+    async def set_if_absent(self, key: str, value: Any, ttl: int | None = None) -> bool:
+        """Atomic SET NX. Returns True if this call set the key."""
+        r = await self._get_client()
+        return bool(await r.set(key, json.dumps(value, default=str), ex=ttl or None, nx=True))
+
     async def delete(self, key: str) -> None:
         r = await self._get_client()
         await r.delete(key)
@@ -160,6 +174,33 @@ class RedisState:
         r = await self._get_client()
         await r.hdel(key, field)
 
+    async def publish(self, channel: str, message: Any) -> None:
+        r = await self._get_client()
+        await r.publish(channel, json.dumps(message, default=str))
+
+    async def subscribe(self, channel: str):
+        """Subscribe to ``channel``; returns an async iterator of decoded messages.
+
+        Uses its own connection, closed when the iterator is closed.
+        """
+        r = await self._get_client()
+        pubsub = r.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(channel)
+        return self._messages(pubsub)
+
+    @staticmethod
+    async def _messages(pubsub):
+        try:
+            async for message in pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+                try:
+                    yield json.loads(message["data"])
+                except (json.JSONDecodeError, TypeError):
+                    yield message["data"]
+        finally:
+            await pubsub.aclose()
+
     async def cleanup(self) -> int:
         """Redis handles TTL expiry automatically. Returns 0."""
         return 0
@@ -237,6 +278,15 @@ class UpstashRestState:
         except (json.JSONDecodeError, TypeError):
             return val
 
+    async def set_if_absent(self, key: str, value: Any, ttl: int | None = None) -> bool:
+        """Atomic SET NX. Returns True if this call set the key."""
+        serialized = json.dumps(value, default=str)
+        if ttl:
+            result = await self._command("SET", key, serialized, "EX", ttl, "NX")
+        else:
+            result = await self._command("SET", key, serialized, "NX")
+        return result == "OK"
+
     async def delete(self, key: str) -> None:
         await self._command("DEL", key)
 
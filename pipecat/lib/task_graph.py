@@ -0,0 +1,113 @@
+"""Run named async steps as a dependency graph.
+
+Each step declares the steps it must run after. Every step starts as soon
+as its dependencies have finished, so independent steps overlap. A failed
+or timed-out dependency does not cancel its dependents; dependencies only
+order the work, and each step decides what to do with missing inputs.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+
+@dataclass(frozen=True)
+class Step:
+    """A named zero-arg coroutine function with ordering and a timeout."""
+
+    name: str
+    run: Callable[[], Awaitable[Any]]
+    after: tuple[str, ...] = ()
+    timeout: float | None = None
+
+
+@dataclass
+class StepResult:
+    name: str
+    status: str = "ok"  # ok | error | timeout
+    value: Any = None
+    error: BaseException | None = None
+    duration_ms: int = 0
+    started_ms: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return self.status == "ok"
+
+
+def _topological_order(steps: list[Step]) -> list[Step]:
+    by_name: dict[str, Step] = {}
+    for step in steps:
+        if step.name in by_name:
+            raise ValueError(f"Duplicate step name: {step.name}")
+        by_name[step.name] = step
+    for step in steps:
+        for dep in step.after:
+            if dep not in by_name:
+                raise ValueError(f"Step {step.name!r} depends on unknown step {dep!r}")
+
+    ordered: list[Step] = []
+    state: dict[str, int] = {}  # 1 = visiting, 2 = done
+
+    def visit(step: Step, path: tuple[str, ...]) -> None:
+        mark = state.get(step.name)
+        if mark == 2:
+            return
+        if mark == 1:
+            raise ValueError(f"Dependency cycle: {' -> '.join(path + (step.name,))}")
+        state[step.name] = 1
+        for dep in step.after:
+            visit(by_name[dep], path + (step.name,))
+        state[step.name] = 2
+        ordered.append(step)
+
+    for step in steps:
+        visit(step, ())
+    return ordered
+
+
+async def run_graph(steps: list[Step]) -> dict[str, StepResult]:
+    """Run ``steps`` concurrently, respecting ``after`` dependencies.
+
+    Returns one ``StepResult`` per step, keyed by name in declaration order.
+    Exceptions are captured, never raised; ``asyncio.CancelledError`` from
+    the caller still propagates and cancels every pending step.
+    """
+    ordered = _topological_order(steps)
+    results = {step.name: StepResult(step.name) for step in steps}
+    tasks: dict[str, asyncio.Task] = {}
+    graph_start = time.monotonic()
+
+    async def _run(step: Step) -> None:
+        if step.after:
+            await asyncio.gather(*(tasks[dep] for dep in step.after))
+        result = results[step.name]
+        start = time.monotonic()
+        result.started_ms = round((start - graph_start) * 1000)
+        try:
+            if step.timeout is None:
+                result.value = await step.run()
+            else:
+                result.value = await asyncio.wait_for(step.run(), timeout=step.timeout)
+        except asyncio.TimeoutError as e:
+            result.status = "timeout"
+            result.error = e
+        except Exception as e:
+            result.status = "error"
+            result.error = e
+        finally:
+            result.duration_ms = round((time.monotonic() - start) * 1000)
+
+    for step in ordered:
+        tasks[step.name] = asyncio.create_task(_run(step), name=f"step:{step.name}")
+    try:
+        await asyncio.gather(*tasks.values())
+    except BaseException:
+        for task in tasks.values():
+            task.cancel()
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+        raise
+    return results
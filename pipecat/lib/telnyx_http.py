@@ -0,0 +1,179 @@
+"""Shared, pooled HTTP client for Telnyx Call Control commands.
+
+One aiohttp session per event loop with keep-alive and a bounded connector,
+so answer -> streaming_start and hangups reuse warm TLS connections instead
+of paying a TCP+TLS handshake per command.
+
+Telnyx ignores repeats of a call action (``/calls/{id}/actions/...``) that
+carry the same ``command_id``, so those are retried on connection errors,
+timeouts, 429 and 5xx. Everything else is sent exactly once: the dedupe is
+per existing call, so a retried Dial could place a second call.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any
+
+import aiohttp
+from loguru import logger
+
+from lib import histogram
+
+TELNYX_API_BASE = "https://api.telnyx.com/v2"
+POOL_LIMIT = 32
+KEEPALIVE_SECONDS = 30.0
+CONNECT_TIMEOUT_SECONDS = 3.0
+TOTAL_TIMEOUT_SECONDS = 10.0
+MAX_RETRIES = 2
+RETRY_BACKOFF_SECONDS = 0.2
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+LATENCY_BUCKETS_MS = (25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+_session: aiohttp.ClientSession | None = None
+_session_loop: asyncio.AbstractEventLoop | None = None
+_stats: dict[str, dict] = {}
+
+
+def command_id(call_control_id: str, action: str) -> str:
+    """Deterministic Telnyx ``command_id`` for one action on one call."""
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, f"telnyx:{call_control_id}:{action}"))
+
+
+@dataclass(frozen=True)
+class TelnyxResponse:
+    status: int
+    body: str
+    attempts: int = 1
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300
+
+    def json(self) -> Any:
+        return json.loads(self.body) if self.body else {}
+
+
+def _get_session() -> aiohttp.ClientSession:
+    global _session, _session_loop
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        connector = aiohttp.TCPConnector(
+            limit=POOL_LIMIT,
+            keepalive_timeout=KEEPALIVE_SECONDS,
+            ttl_dns_cache=300,
+        )
+        _session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(
+                total=TOTAL_TIMEOUT_SECONDS, sock_connect=CONNECT_TIMEOUT_SECONDS
+            ),
+        )
+        _session_loop = loop
+    return _session
+
+
+def _action_for(url: str) -> str:
+    if "/actions/" in url:
+        return url.rsplit("/actions/", 1)[1].split("?", 1)[0]
+    return "dial" if url.rstrip("/").endswith("/calls") else "other"
+
+
+def _record(action: str, elapsed_ms: float, *, error: bool, retries: int) -> None:
+    stats = _stats.get(action)
+    if stats is None:
+        stats = _stats[action] = {
+            "calls": 0,
+            "errors": 0,
+            "retries": 0,
+            "total_ms": 0.0,
+            "max_ms": 0.0,
+            "buckets": histogram.empty(LATENCY_BUCKETS_MS),
+        }
+    stats["calls"] += 1
+    stats["errors"] += int(error)
+    stats["retries"] += retries
+    stats["total_ms"] += elapsed_ms
+    stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+    histogram.observe(stats["buckets"], LATENCY_BUCKETS_MS, elapsed_ms)
+
+
+async def post(
+    endpoint: str,
+    payload: dict[str, Any] | None = None,
+    *,
+    headers: dict[str, str],
+    action: str | None = None,
+) -> TelnyxResponse:
+    """POST a Call Control command through the shared session.
+
+    Returns the final response whatever its status; raises the last
+    ``aiohttp.ClientError`` / ``asyncio.TimeoutError`` if every attempt
+    failed to get one.
+    """
+    url = endpoint if "://" in endpoint else f"{TELNYX_API_BASE}{endpoint}"
+    action = action or _action_for(url)
+    retryable = "/actions/" in url and bool(payload and payload.get("command_id"))
+    attempts = 1 + (MAX_RETRIES if retryable else 0)
+    start = time.monotonic()
+    for attempt in range(1, attempts + 1):
+        try:
+            async with _get_session().post(url, headers=headers, json=payload or {}) as response:
+                status = response.status
+                body = await response.text()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+            if attempt >= attempts:
+                _record(action, (time.monotonic() - start) * 1000, error=True, retries=attempt - 1)
+                raise
+            logger.warning(
+                "Telnyx {action} attempt {n} failed, retrying: {err}",
+                action=action, n=attempt, err=str(exc) or type(exc).__name__,
+            )
+        else:
+            if status not in _RETRY_STATUSES or attempt >= attempts:
+                _record(
+                    action,
+                    (time.monotonic() - start) * 1000,
+                    error=not 200 <= status < 300,
+                    retries=attempt - 1,
+                )
+                return TelnyxResponse(status, body, attempt)
+            logger.warning(
+                "Telnyx {action} attempt {n} got status={status}, retrying",
+                action=action, n=attempt, status=status,
+            )
+        await asyncio.sleep(RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1))
+    raise AssertionError("unreachable")
+
+
+def get_stats() -> dict[str, dict]:
+    """Per-action call counts, errors, retries and latency on this instance."""
+    out = {}
+    for action, stats in sorted(_stats.items()):
+        calls = stats["calls"]
+        out[action] = {
+            "calls": calls,
+            "errors": stats["errors"],
+            "retries": stats["retries"],
+            "avg_ms": round(stats["total_ms"] / calls, 1) if calls else 0.0,
+            "max_ms": round(stats["max_ms"], 1),
+            "p50_ms": histogram.percentile(LATENCY_BUCKETS_MS, stats["buckets"], 0.5),
+            "p95_ms": histogram.percentile(LATENCY_BUCKETS_MS, stats["buckets"], 0.95),
+        }
+    return out
+
+
+def reset_stats() -> None:
+    _stats.clear()
+
+
+async def close() -> None:
+    """Close the shared session (server shutdown)."""
+    global _session, _session_loop
+    session, _session, _session_loop = _session, None, None
+    if session is not None and not session.closed:
+        await session.close()
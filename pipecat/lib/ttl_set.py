@@ -0,0 +1,59 @@
+"""Bounded set of recently seen keys with time-bucketed expiry.
+
+Keys are grouped into buckets of ``bucket_seconds``; whole buckets are
+dropped once they are older than ``ttl_seconds``. Each key is removed
+exactly once, so cleanup is O(1) amortized per ``add`` instead of a scan of
+every live key. A key expires between ``ttl_seconds`` and
+``ttl_seconds + bucket_seconds`` after it was added.
+
+Operations never await, so callers on one event loop need no lock.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+
+
+class TTLSet:
+    def __init__(self, ttl_seconds: float, bucket_seconds: float = 10.0, clock=time.monotonic):
+        self.ttl_seconds = ttl_seconds
+        self.bucket_seconds = bucket_seconds
+        self._clock = clock
+        self._buckets: deque[tuple[int, list[str]]] = deque()
+        self._members: dict[str, int] = {}
+
+    def _expire(self, now: float) -> None:
+        oldest_live = int((now - self.ttl_seconds) // self.bucket_seconds)
+        while self._buckets and self._buckets[0][0] < oldest_live:
+            bucket_id, keys = self._buckets.popleft()
+            for key in keys:
+                if self._members.get(key) == bucket_id:
+                    del self._members[key]
+
+    def add(self, key: str) -> bool:
+        """Add ``key``. Returns False if it was already present (a duplicate)."""
+        now = self._clock()
+        self._expire(now)
+        if key in self._members:
+            return False
+        bucket_id = int(now // self.bucket_seconds)
+        if not self._buckets or self._buckets[-1][0] != bucket_id:
+            self._buckets.append((bucket_id, []))
+        self._buckets[-1][1].append(key)
+        self._members[key] = bucket_id
+        return True
+
+    def discard(self, key: str) -> None:
+        self._members.pop(key, None)
+
+    def __contains__(self, key: str) -> bool:
+        self._expire(self._clock())
+        return key in self._members
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def clear(self) -> None:
+        self._buckets.clear()
+        self._members.clear()
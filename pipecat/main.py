@@ -188,6 +188,11 @@ async def health():
         pool_stats = await get_pool_stats()
     except Exception:
         pool_stats = {}
+    try:
+        from services.post_call_queue import get_queue_stats
+        post_call_queue = await get_queue_stats()
+    except Exception:
+        post_call_queue = {}
     breakers = get_breaker_states()
     caches = get_cache_sizes()
     any_breaker_open = any(s == "open" for s in breakers.values())
@@ -205,6 +210,7 @@ async def health():
         "pool": pool_stats,
         "circuit_breakers": breakers,
         "cache": caches,
+        "post_call_queue": post_call_queue,
     }
     return JSONResponse(content=body, status_code=status_code)
 
@@ -374,6 +380,13 @@ async def startup():
     except Exception as e:
         logger.warning("GrowthBook init failed — flags will use defaults: {err}", err=str(e))
 
+    # Wake WebSocket handshakes when another instance stores their call metadata
+    try:
+        from api.routes.call_context import start_metadata_listener
+        start_metadata_listener()
+    except Exception as e:
+        logger.warning("Metadata-ready listener init failed: {err}", err=str(e))
+
     # Start background cache cleanup loop
     from lib.cache_cleanup import start_cleanup_loop
     asyncio.create_task(start_cleanup_loop())
@@ -391,6 +404,11 @@ async def startup():
     else:
         logger.info("Pipecat data retention loop disabled; Node owns retention")
 
+    # Post-call queue workers (inline post-call when the queue is disabled)
+    if settings.post_call_queue_enabled:
+        from services.post_call_queue import start_workers
+        start_workers(settings.post_call_workers)
+
     # Start scheduler ONLY if explicitly enabled (prevents dual-scheduler conflict)
     scheduler_enabled = settings.scheduler_enabled
     base_url = settings.base_url
@@ -421,6 +439,24 @@ async def shutdown():
                 t.cancel()
             await asyncio.wait(pending, timeout=2.0)
 
+    # Hand in-flight post-call jobs back to the queue for another instance
+    if settings.post_call_queue_enabled:
+        from services.post_call_queue import stop_workers
+        await stop_workers()
+
+    try:
+        from api.routes.call_context import stop_metadata_listener
+        await stop_metadata_listener()
+    except Exception:
+        pass
+
+    # Close the pooled Telnyx HTTP session
+    try:
+        from lib.telnyx_http import close as close_telnyx_http
+        await close_telnyx_http()
+    except Exception:
+        pass
+
     # Close GrowthBook client
     try:
         from lib.growthbook import close_growthbook
@@ -8,6 +8,7 @@ __all__ = [
     "conversation_tracker",
     "goodbye_gate",
     "guidance_stripper",
+    "pattern_matcher",
     "patterns",
     "quick_observer",
 ]
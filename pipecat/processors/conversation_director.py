@@ -42,6 +42,7 @@ from services.director_llm import (
     analyze_turn_speculative,
     fast_provider_available,
     format_director_guidance,
+    get_cache_stats,
     get_default_direction,
     warmup_fast_providers,
 )
@@ -167,6 +168,8 @@ class ConversationDirectorProcessor(FrameProcessor):
 
     # Interim transcription debounce settings (for prefetch)
     INTERIM_DEBOUNCE_SECONDS = 1.0
+    # Max wait on a relevant in-flight prefetch before injecting memories
+    MEMORY_GATE_TIMEOUT_SECONDS = 0.5
 
     # Speculative pre-processing settings
     SILENCE_ONSET_SECONDS = 0.250  # 250ms gap triggers speculative analysis
@@ -219,6 +222,7 @@ class ConversationDirectorProcessor(FrameProcessor):
 
     MAX_CONCURRENT_SPECULATIVE = 3  # cap concurrent guidance analysis calls
     MAX_CONCURRENT_PREFETCH = 3     # cap concurrent query-only analysis calls
+    PREFETCH_SECTIONS = ("analysis", "direction", "reminder")  # read by extract_director_queries
 
     def set_pipeline_task(self, task):
         """Set pipeline task reference for direct actions (EndFrame, etc.)."""
@@ -241,6 +245,16 @@ class ConversationDirectorProcessor(FrameProcessor):
                     pct=round(self._speculative_hits / self._speculative_attempts * 100),
                     misses=self._speculative_misses,
                 )
+            cache_stats = get_cache_stats(self._session_state)
+            if cache_stats["hits"] + cache_stats["coalesced"] + cache_stats["misses"]:
+                logger.info(
+                    "[Director] Result cache: {hits} hits, {coalesced} coalesced, "
+                    "{misses} provider calls ({pct}% served from cache)",
+                    hits=cache_stats["hits"],
+                    coalesced=cache_stats["coalesced"],
+                    misses=cache_stats["misses"],
+                    pct=round(cache_stats["hit_rate"] * 100),
+                )
             await self.push_frame(frame, direction)
             return
 
@@ -502,11 +516,23 @@ class ConversationDirectorProcessor(FrameProcessor):
         """
         start = time.time()
         turn_sequence = self._turn_count + 1
+        streamed: set[str] = set()
+
+        def on_query(path, value):
+            # Each query starts its memory search as soon as it has streamed.
+            if len(path) == 2 and path[0] == "memory_queries" and isinstance(value, str):
+                streamed.add(value)
+                asyncio.create_task(
+                    self._run_director_prefetch({"prefetch": {"memory_queries": [value]}})
+                )
+
+        on_field, timing = self._stream_timer(start, on_query)
         try:
             result = await analyze_queries(
                 user_message,
                 self._session_state,
                 conversation_history=transcript,
+                on_field=on_field,
             )
             record_latency_event(
                 self._session_state,
@@ -520,11 +546,20 @@ class ConversationDirectorProcessor(FrameProcessor):
                 metadata={
                     "result": bool(result),
                     "query_count": len((result or {}).get("memory_queries") or []),
+                    **timing,
                 },
             )
-            if result:
-                direction_like = {"prefetch": result}
-                asyncio.create_task(self._run_director_prefetch(direction_like))
+            self._record_first_field("director.query", "director_query", timing, turn_sequence)
+            # Only queries that never streamed (e.g. a cached or non-streaming
+            # response) still need a search; the rest already started one.
+            remaining = [
+                q for q in (result or {}).get("memory_queries") or []
+                if isinstance(q, str) and q not in streamed
+            ]
+            if remaining:
+                asyncio.create_task(
+                    self._run_director_prefetch({"prefetch": {"memory_queries": remaining}})
+                )
             return result
         except asyncio.CancelledError:
             return None
@@ -556,11 +591,27 @@ class ConversationDirectorProcessor(FrameProcessor):
     async def _run_fallback_analysis(self, user_message: str, transcript: list[dict]):
         """Run full Director analysis outside the critical path for next-turn guidance."""
         start = time.time()
+        partial: dict = {}
+
+        def on_section(path, value):
+            # analysis/direction/reminder are all the 2nd-wave prefetch reads;
+            # start it without waiting for the guidance section.
+            if len(path) != 1 or not isinstance(value, dict) or "_prefetched" in partial:
+                return
+            partial[path[0]] = value
+            if all(k in partial for k in self.PREFETCH_SECTIONS):
+                partial["_prefetched"] = True
+                asyncio.create_task(self._run_director_prefetch(
+                    {k: partial[k] for k in self.PREFETCH_SECTIONS}
+                ))
+
+        on_field, timing = self._stream_timer(start, on_section)
         try:
             result = await analyze_turn(
                 user_message,
                 self._session_state,
                 conversation_history=transcript,
+                on_field=on_field,
             )
             record_latency_event(
                 self._session_state,
@@ -571,15 +622,18 @@ class ConversationDirectorProcessor(FrameProcessor):
                 provider="director_llm",
                 latency_ms=(time.time() - start) * 1000,
                 turn_sequence=self._turn_count,
-                metadata={"result": bool(result)},
+                metadata={"result": bool(result), **timing},
             )
+            self._record_first_field("director.fallback", "director_guidance", timing, self._turn_count)
             if result:
                 if self._wrapup_forced:
                     result.setdefault("analysis", {})["call_phase"] = "winding_down"
                     result.setdefault("direction", {})["pacing_note"] = "time_to_close"
                 self._last_result = result
                 self._last_result_age = 0
-                asyncio.create_task(self._run_director_prefetch(result))
+                if "_prefetched" not in partial:
+                    # Already prefetched from the streamed sections above.
+                    asyncio.create_task(self._run_director_prefetch(result))
             return result
         except asyncio.CancelledError:
             return None
@@ -602,11 +656,13 @@ class ConversationDirectorProcessor(FrameProcessor):
         """Run full guidance analysis. Result retrieved via _harvest_speculative()."""
         start = time.time()
         turn_sequence = self._turn_count + 1
+        on_field, timing = self._stream_timer(start)
         try:
             result = await analyze_turn_speculative(
                 user_message,
                 self._session_state,
                 conversation_history=transcript,
+                on_field=on_field,
             )
             record_latency_event(
                 self._session_state,
@@ -617,8 +673,9 @@ class ConversationDirectorProcessor(FrameProcessor):
                 provider="director_llm",
                 latency_ms=(time.time() - start) * 1000,
                 turn_sequence=turn_sequence,
-                metadata={"result": bool(result)},
+                metadata={"result": bool(result), **timing},
             )
+            self._record_first_field("director.speculative", "director_guidance", timing, turn_sequence)
             return result
         except asyncio.CancelledError:
             return None
@@ -637,6 +694,33 @@ class ConversationDirectorProcessor(FrameProcessor):
             logger.debug("[Director] Speculative analysis error: {err}", err=str(e))
             return None
 
+    @staticmethod
+    def _stream_timer(start: float, on_value=None):
+        """Build an ``on_field`` callback that timestamps the first streamed field."""
+        timing: dict = {}
+
+        def on_field(path, value):
+            timing.setdefault("first_field_ms", round((time.time() - start) * 1000))
+            if on_value is not None:
+                on_value(path, value)
+
+        return on_field, timing
+
+    def _record_first_field(self, stage: str, source: str, timing: dict, turn_sequence: int) -> None:
+        """Record time-to-first-field next to the stage's full-response latency."""
+        if "first_field_ms" not in timing:
+            return
+        record_latency_event(
+            self._session_state,
+            stage=f"{stage}.first_field",
+            source=source,
+            action="measured",
+            label="Director first streamed field",
+            provider="director_llm",
+            latency_ms=timing["first_field_ms"],
+            turn_sequence=turn_sequence,
+        )
+
     def _harvest_speculative(self, final_text: str) -> dict | None:
         """Check all completed speculative analyses for a usable result.
 
@@ -881,10 +965,11 @@ class ConversationDirectorProcessor(FrameProcessor):
         Checks the prefetch cache for memories relevant to the current user
         speech and injects them as context — eliminates ~4.3s tool call latency.
 
-        300ms gate: If no cache hit yet, waits up to 300ms for in-flight
-        prefetch to complete. Prefetch starts on interim transcriptions while
-        the user is still speaking, so most queries are cached before the final
-        arrives. The 300ms is a worst-case backstop.
+        Memory gate: If no cache hit yet, waits up to 500ms for a relevant
+        in-flight prefetch to land, waking as soon as it does. Prefetch starts
+        on interim transcriptions while the user is still speaking, so most
+        queries are cached before the final arrives. The 500ms is a worst-case
+        backstop.
         """
         cache = self._session_state.get("_prefetch_cache")
         if not cache:
@@ -897,14 +982,9 @@ class ConversationDirectorProcessor(FrameProcessor):
         # running, skipping the wait preserves the non-blocking Director path.
         if not cached and cache.has_relevant_inflight(user_text, threshold=0.3):
             gate_start = time.time()
-            for _ in range(10):  # 10 * 50ms = 500ms
-                await asyncio.sleep(0.05)
-                cached = cache.get(user_text, threshold=0.3)
-                if cached:
-                    logger.info("[Director] Memory gate hit after wait")
-                    break
-                if not cache.has_relevant_inflight(user_text, threshold=0.3):
-                    break
+            cached = await cache.wait_for_inflight(user_text, threshold=0.3, timeout=self.MEMORY_GATE_TIMEOUT_SECONDS)
+            if cached:
+                logger.info("[Director] Memory gate hit after wait")
             gate_elapsed_ms = round((time.time() - gate_start) * 1000)
             if gate_elapsed_ms > 0:
                 record_latency_event(
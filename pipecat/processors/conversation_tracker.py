@@ -56,6 +56,9 @@ _MAX_QUESTIONS = 8
 _MAX_ADVICE = 8
 _MAX_DIRECTOR_TRANSCRIPT_TURNS = 40
 
+# Draft transcript writes wait this long so back-to-back turns share one write.
+_TRANSCRIPT_FLUSH_DELAY_SECONDS = 0.5
+
 
 # ---------------------------------------------------------------------------
 # Extraction helpers (pure functions, usable standalone)
@@ -283,7 +286,11 @@ class ConversationTrackerProcessor(FrameProcessor):
         self._schedule_transcript_persistence()
 
     def _schedule_transcript_persistence(self) -> None:
-        """Persist a full transcript snapshot without blocking the audio path."""
+        """Append new turns to the draft transcript without blocking the audio path.
+
+        At most one flush task runs per call; turns recorded while it waits
+        or writes are picked up by the same task, so bursts coalesce.
+        """
         if self._session_state is None:
             return
         if not self._session_state.get("_transcript_persistence_enabled"):
@@ -293,41 +300,45 @@ class ConversationTrackerProcessor(FrameProcessor):
         if not call_sid or call_sid == "unknown":
             return
 
-        snapshot = list(self._session_state.get("_full_transcript") or [])
-        if not snapshot:
+        current = self._session_state.get("_transcript_flush_task")
+        if current is not None and not current.done():
             return
 
-        seq = int(self._session_state.get("_transcript_persist_seq") or 0) + 1
-        self._session_state["_transcript_persist_seq"] = seq
-
-        task = asyncio.create_task(self._persist_transcript_snapshot(call_sid, snapshot, seq))
+        task = asyncio.create_task(self._flush_transcript_turns(call_sid))
+        self._session_state["_transcript_flush_task"] = task
         tasks = self._session_state.setdefault("_transcript_persist_tasks", set())
         tasks.add(task)
         task.add_done_callback(tasks.discard)
 
-    async def _persist_transcript_snapshot(
-        self,
-        call_sid: str,
-        snapshot: list[dict],
-        seq: int,
-    ) -> None:
-        """Write the latest transcript snapshot if it has not been superseded."""
+    async def _flush_transcript_turns(self, call_sid: str) -> None:
+        """Write turns recorded since the last successful flush."""
         assert self._session_state is not None
+        await asyncio.sleep(_TRANSCRIPT_FLUSH_DELAY_SECONDS)
         lock = self._session_state.setdefault("_transcript_persist_lock", asyncio.Lock())
 
         async with lock:
-            if seq != self._session_state.get("_transcript_persist_seq"):
-                return
-
-            try:
-                from services.conversations import update_transcript
-                await update_transcript(call_sid, snapshot)
-            except Exception as e:
-                logger.warning(
-                    "[{cs}] Transcript draft persistence failed: {err}",
-                    cs=call_sid,
-                    err=str(e),
-                )
+            while True:
+                full_transcript = self._session_state.get("_full_transcript") or []
+                start = int(self._session_state.get("_transcript_persisted_turns") or 0)
+                pending = full_transcript[start:]
+                if not pending:
+                    return
+
+                try:
+                    from services.conversations import append_transcript_turns
+                    row = await append_transcript_turns(call_sid, pending, start)
+                except Exception as e:
+                    # Unflushed turns stay pending and are retried by the next flush.
+                    logger.warning(
+                        "[{cs}] Transcript draft persistence failed: {err}",
+                        cs=call_sid,
+                        err=str(e),
+                    )
+                    return
+                if row is None:
+                    # No conversation row yet; keep the turns for the next flush.
+                    return
+                self._session_state["_transcript_persisted_turns"] = start + len(pending)
 
     async def process_frame(self, frame, direction):
         await super().process_frame(frame, direction)
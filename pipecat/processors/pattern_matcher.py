@@ -0,0 +1,300 @@
+"""Compiled matcher engine for Quick Observer pattern tables.
+
+Running every ``Pattern`` in ``processors/patterns.py`` against every
+utterance costs ~268 independent ``re.search`` calls. Python's ``re`` has no
+multi-pattern automaton, and a combined alternation is slower than the
+individual searches, so this engine uses a literal prefilter instead:
+
+1. At build time each regex is parsed and the set of literal prefixes that
+   every match must start with is extracted (``\\b(fell|fall)`` → ``fell``,
+   ``fall``). Prefixes are indexed by their first two characters.
+2. At match time the lowercased utterance is reduced to its character
+   bigrams, and only patterns with a prefix that actually occurs in the text
+   are searched. Patterns whose prefix cannot be determined (``^.{1,10}$``)
+   always run.
+
+The prefilter only ever skips patterns that cannot match, so results are
+identical to scanning every pattern in order.
+
+``scan(text, previous)`` additionally supports growing interim transcripts.
+For patterns with a bounded match width and only ``\b`` anchors, a match is
+fully determined by the characters it spans plus one on either side, so:
+
+* a previous match ending before the unchanged prefix still holds, and
+* a new match must reach into the changed tail, so the search can start
+  ``max_width`` characters before the end of the unchanged prefix.
+
+Patterns with ``^``/``$`` anchors, lookarounds or unbounded width are always
+searched over the full text.
+"""
+
+import re
+import re._parser as sre_parse  # stdlib regex parser (private but stable since 3.11)
+from dataclasses import dataclass, field
+from re._constants import (
+    ANY, AT, AT_BOUNDARY, AT_NON_BOUNDARY, BRANCH, IN, LITERAL, MAX_REPEAT,
+    MIN_REPEAT, NOT_LITERAL, POSSESSIVE_REPEAT, SUBPATTERN,
+)
+
+from processors.patterns import Pattern
+
+# Cap on how many literal prefixes one pattern may expand into before we give
+# up and treat it as always-run (keeps pathological char classes bounded).
+_MAX_PREFIXES = 64
+_KEY_LEN = 2
+# Patterns that can match more than this many characters are always searched
+# over the full text instead of just the changed tail.
+_MAX_INCREMENTAL_WIDTH = 256
+
+
+def _seq_prefixes(items) -> set[str] | None:
+    """Literal prefixes every match of a parsed sequence must start with.
+
+    Returns ``None`` when no non-empty prefix can be guaranteed.
+    """
+    prefixes = {""}
+    for op, av in items:
+        if op is AT:
+            # Zero-width (\b, ^, $) — does not consume characters.
+            continue
+        if op is LITERAL:
+            prefixes = {p + chr(av).lower() for p in prefixes}
+            continue
+        if op is SUBPATTERN:
+            inner = _seq_prefixes(av[-1])
+        elif op is BRANCH:
+            inner = _branch_prefixes(av[1])
+        elif op is IN:
+            inner = _class_prefixes(av)
+        elif op in (MAX_REPEAT, MIN_REPEAT, POSSESSIVE_REPEAT) and av[0] >= 1:
+            inner = _seq_prefixes(av[2])
+            if inner is not None:
+                prefixes = {p + s for p in prefixes for s in inner}
+            break
+        else:
+            break
+        if inner is None:
+            break
+        prefixes = {p + s for p in prefixes for s in inner}
+        if len(prefixes) > _MAX_PREFIXES:
+            return None
+        # A group/branch/class may have consumed variable-length input, so
+        # only keep extending while every alternative is a plain literal.
+        if op is not IN:
+            break
+    if not prefixes or any(not p for p in prefixes):
+        return None
+    return prefixes
+
+
+def _branch_prefixes(branches) -> set[str] | None:
+    out: set[str] = set()
+    for branch in branches:
+        sub = _seq_prefixes(branch)
+        if sub is None:
+            return None
+        out |= sub
+        if len(out) > _MAX_PREFIXES:
+            return None
+    return out
+
+
+def _class_prefixes(items) -> set[str] | None:
+    out: set[str] = set()
+    for op, av in items:
+        if op is not LITERAL:
+            return None
+        out.add(chr(av).lower())
+    return out or None
+
+
+def literal_prefixes(pattern: re.Pattern) -> set[str] | None:
+    """Return the literal prefixes any match of ``pattern`` must begin with.
+
+    Prefixes are lowercased (all Quick Observer patterns are IGNORECASE).
+    ``None`` means the pattern cannot be prefiltered and must always run.
+    """
+    try:
+        parsed = sre_parse.parse(pattern.pattern, pattern.flags)
+    except Exception:
+        return None
+    return _seq_prefixes(list(parsed))
+
+
+def _tail_safe(items) -> bool:
+    """True if matching only looks at the matched span and its two neighbours."""
+    for op, av in items:
+        if op in (LITERAL, NOT_LITERAL, IN, ANY):
+            continue
+        if op is AT:
+            if av not in (AT_BOUNDARY, AT_NON_BOUNDARY):
+                return False
+        elif op is SUBPATTERN:
+            if not _tail_safe(av[-1]):
+                return False
+        elif op is BRANCH:
+            if not all(_tail_safe(branch) for branch in av[1]):
+                return False
+        elif op in (MAX_REPEAT, MIN_REPEAT, POSSESSIVE_REPEAT):
+            if not _tail_safe(av[2]):
+                return False
+        else:
+            return False
+    return True
+
+
+def max_match_width(pattern: re.Pattern) -> int | None:
+    """Upper bound on match length, or ``None`` if the pattern can't be tail-scanned."""
+    try:
+        parsed = sre_parse.parse(pattern.pattern, pattern.flags)
+    except Exception:
+        return None
+    if not _tail_safe(list(parsed)):
+        return None
+    width = parsed.getwidth()[1]
+    return width if width <= _MAX_INCREMENTAL_WIDTH else None
+
+
+def _common_prefix_len(a: str, b: str) -> int:
+    limit = min(len(a), len(b))
+    i = 0
+    while i < limit and a[i] == b[i]:
+        i += 1
+    return i
+
+
+@dataclass
+class MatchState:
+    """Result of one scan: the text and the end offset of a match per slot."""
+
+    text: str
+    ends: dict[int, int] = field(default_factory=dict)
+    searches: int = 0
+
+
+class CompiledMatcher:
+    """Single-pass matcher over an ordered mapping of pattern categories.
+
+    ``match(text)`` returns ``{category: [Pattern, ...]}`` with every pattern
+    whose regex matches ``text``, in table order — the same lists a naive
+    per-pattern ``search`` loop would produce.
+    """
+
+    def __init__(self, categories: dict[str, list[Pattern]]):
+        self.categories = {name: list(patterns) for name, patterns in categories.items()}
+        # Flat (category, index, Pattern) entries in table order.
+        self._entries: list[tuple[str, int, Pattern]] = []
+        self._always: set[int] = set()
+        self._index: dict[str, list[tuple[str, int]]] = {}
+        self._widths: list[int | None] = []
+        for name, patterns in self.categories.items():
+            for pattern in patterns:
+                slot = len(self._entries)
+                self._entries.append((name, slot, pattern))
+                self._widths.append(max_match_width(pattern.pattern))
+                prefixes = literal_prefixes(pattern.pattern)
+                if prefixes is None:
+                    self._always.add(slot)
+                    continue
+                for prefix in prefixes:
+                    self._index.setdefault(prefix[:_KEY_LEN], []).append((prefix, slot))
+
+        self._window = max((w for w in self._widths if w is not None), default=0)
+
+    @property
+    def pattern_count(self) -> int:
+        return len(self._entries)
+
+    @property
+    def prefiltered_count(self) -> int:
+        return len(self._entries) - len(self._always)
+
+    def candidates(self, text: str) -> set[int] | None:
+        """Slots of patterns that may match ``text``; ``None`` means all of them.
+
+        Non-ASCII input skips the prefilter: ``str.lower`` and ``re.IGNORECASE``
+        disagree on a few Unicode case folds (e.g. ``ſ`` vs ``s``).
+        """
+        if not text.isascii():
+            return None
+        lowered = text.lower()
+        keys = {lowered[i:i + _KEY_LEN] for i in range(len(lowered))}
+        keys.update(lowered)
+        found = set(self._always)
+        index = self._index
+        for key in keys:
+            bucket = index.get(key)
+            if not bucket:
+                continue
+            for prefix, slot in bucket:
+                if slot not in found and (len(prefix) <= _KEY_LEN or prefix in lowered):
+                    found.add(slot)
+        return found
+
+    def scan(self, text: str, previous: MatchState | None = None) -> MatchState:
+        """Find every matching pattern in ``text``.
+
+        When ``previous`` is the scan of an earlier version of the same
+        utterance (e.g. an interim transcript), work on the unchanged prefix
+        is reused instead of re-searching it.
+        """
+        if previous is not None and previous.text == text:
+            return previous
+        prefix_len = 0
+        if previous is not None and text.isascii() and previous.text.isascii():
+            prefix_len = _common_prefix_len(previous.text, text)
+        if prefix_len == 0:
+            return self._full_scan(text)
+
+        state = MatchState(text=text)
+        tail_start = max(0, prefix_len - self._window)
+        tail_candidates = self.candidates(text[tail_start:])
+        full_candidates: set[int] | None = None
+        full_checked = False
+        for _, slot, pattern in self._entries:
+            width = self._widths[slot]
+            prev_end = previous.ends.get(slot)
+            if width is not None and prev_end is None:
+                # Only a match reaching into the changed tail can be new.
+                if slot not in tail_candidates:
+                    continue
+                pos = max(0, prefix_len - width)
+            elif width is not None and prev_end < prefix_len:
+                # Match and its trailing \b lookahead lie in the unchanged prefix.
+                state.ends[slot] = prev_end
+                continue
+            else:
+                if not full_checked:
+                    full_candidates = self.candidates(text)
+                    full_checked = True
+                if full_candidates is not None and slot not in full_candidates:
+                    continue
+                pos = 0
+            state.searches += 1
+            m = pattern.pattern.search(text, pos)
+            if m:
+                state.ends[slot] = m.end()
+        return state
+
+    def _full_scan(self, text: str) -> MatchState:
+        state = MatchState(text=text)
+        candidates = self.candidates(text)
+        for _, slot, pattern in self._entries:
+            if candidates is not None and slot not in candidates:
+                continue
+            state.searches += 1
+            m = pattern.pattern.search(text)
+            if m:
+                state.ends[slot] = m.end()
+        return state
+
+    def group(self, state: MatchState) -> dict[str, list[Pattern]]:
+        """Matched patterns per category, in table order."""
+        matched: dict[str, list[Pattern]] = {name: [] for name in self.categories}
+        for name, slot, pattern in self._entries:
+            if slot in state.ends:
+                matched[name].append(pattern)
+        return matched
+
+    def match(self, text: str) -> dict[str, list[Pattern]]:
+        return self.group(self._full_scan(text))
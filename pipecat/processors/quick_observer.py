@@ -4,15 +4,23 @@ Runs synchronously on each TranscriptionFrame before the LLM processes it.
 Injects guidance via LLMMessagesAppendFrame for the current response.
 
 Pattern data lives in processors/patterns.py (268 patterns, 19 categories).
+Matching goes through the prefiltered engine in processors/pattern_matcher.py.
 This file contains only analysis logic and the FrameProcessor wrapper.
 """
 
 import asyncio
 from dataclasses import dataclass, field
 from loguru import logger
-from pipecat.frames.frames import EndFrame, Frame, TranscriptionFrame, LLMMessagesAppendFrame
+from pipecat.frames.frames import (
+    EndFrame,
+    Frame,
+    InterimTranscriptionFrame,
+    LLMMessagesAppendFrame,
+    TranscriptionFrame,
+)
 from pipecat.processors.frame_processor import FrameProcessor
 
+from processors.pattern_matcher import CompiledMatcher, MatchState
 from processors.patterns import (
     HEALTH_PATTERNS, FAMILY_PATTERNS, EMOTION_PATTERNS, SAFETY_PATTERNS,
     SOCIAL_PATTERNS, ACTIVITY_PATTERNS, TIME_PATTERNS, ENVIRONMENT_PATTERNS,
@@ -73,6 +81,36 @@ class AnalysisResult:
     needs_web_search: bool = False
 
 
+# =============================================================================
+# Compiled matcher — one prefiltered pass over every pattern table
+# =============================================================================
+
+# Category order matches the order quick_analyze consumes them in.
+PATTERN_CATEGORIES = {
+    "health": HEALTH_PATTERNS,
+    "family": FAMILY_PATTERNS,
+    "emotion": EMOTION_PATTERNS,
+    "safety": SAFETY_PATTERNS,
+    "social": SOCIAL_PATTERNS,
+    "activity": ACTIVITY_PATTERNS,
+    "time": TIME_PATTERNS,
+    "environment": ENVIRONMENT_PATTERNS,
+    "adl": ADL_PATTERNS,
+    "cognitive": COGNITIVE_PATTERNS,
+    "help_request": HELP_REQUEST_PATTERNS,
+    "end_of_life": END_OF_LIFE_PATTERNS,
+    "hydration": HYDRATION_PATTERNS,
+    "transport": TRANSPORTATION_PATTERNS,
+    "news": NEWS_PATTERNS,
+    "goodbye": GOODBYE_PATTERNS,
+    "question": QUESTION_PATTERNS,
+    "engagement": ENGAGEMENT_PATTERNS,
+    "reminder_ack": REMINDER_ACK_PATTERNS,
+}
+
+_MATCHER = CompiledMatcher(PATTERN_CATEGORIES)
+
+
 # =============================================================================
 # Core analysis function
 # =============================================================================
@@ -84,62 +122,84 @@ def quick_analyze(user_message: str, recent_history: list[dict] | None = None) -
         return result
 
     text = user_message.strip()
+    return _analyze_matches(text, _MATCHER.match(text), recent_history)
+
+
+def quick_analyze_incremental(
+    user_message: str,
+    recent_history: list[dict] | None = None,
+    previous: MatchState | None = None,
+) -> tuple[AnalysisResult, MatchState | None]:
+    """Like quick_analyze, but reuses the scan of an earlier interim transcript.
+
+    Returns the analysis plus the scan state to pass as ``previous`` when the
+    utterance grows. Results are identical to ``quick_analyze(user_message)``.
+    """
+    if not user_message:
+        return AnalysisResult(), None
+    text = user_message.strip()
+    state = _MATCHER.scan(text, previous)
+    return _analyze_matches(text, _MATCHER.group(state), recent_history), state
 
-    def _scan(patterns, target, *, keyed=False, sev=False, emo=False, strength_key=False):
-        for p in patterns:
-            if p.pattern.search(text):
-                if emo:
-                    target.append({"signal": p.signal, "valence": p.valence, "intensity": p.intensity})
-                elif sev:
-                    target.append({"signal": p.signal, "severity": p.severity})
-                elif strength_key:
-                    target.append({"signal": p.signal, "strength": p.strength})
-                else:
-                    target.append(p.signal)
-
-    _scan(HEALTH_PATTERNS, result.health_signals, sev=True)
-    _scan(FAMILY_PATTERNS, result.family_signals)
-    _scan(EMOTION_PATTERNS, result.emotion_signals, emo=True)
-    _scan(SAFETY_PATTERNS, result.safety_signals, sev=True)
-    _scan(SOCIAL_PATTERNS, result.social_signals)
-    _scan(ACTIVITY_PATTERNS, result.activity_signals)
-    _scan(TIME_PATTERNS, result.time_signals)
-    _scan(ENVIRONMENT_PATTERNS, result.environment_signals)
-    _scan(ADL_PATTERNS, result.adl_signals, sev=True)
-    _scan(COGNITIVE_PATTERNS, result.cognitive_signals, sev=True)
-    _scan(HELP_REQUEST_PATTERNS, result.help_request_signals)
-    _scan(END_OF_LIFE_PATTERNS, result.end_of_life_signals, sev=True)
-    _scan(HYDRATION_PATTERNS, result.hydration_signals, sev=True)
-    _scan(TRANSPORTATION_PATTERNS, result.transport_signals, sev=True)
+
+def _analyze_matches(
+    text: str,
+    matched: dict[str, list],
+    recent_history: list[dict] | None,
+) -> AnalysisResult:
+    result = AnalysisResult()
+
+    def _scan(category, target, *, keyed=False, sev=False, emo=False, strength_key=False):
+        for p in matched[category]:
+            if emo:
+                target.append({"signal": p.signal, "valence": p.valence, "intensity": p.intensity})
+            elif sev:
+                target.append({"signal": p.signal, "severity": p.severity})
+            elif strength_key:
+                target.append({"signal": p.signal, "strength": p.strength})
+            else:
+                target.append(p.signal)
+
+    _scan("health", result.health_signals, sev=True)
+    _scan("family", result.family_signals)
+    _scan("emotion", result.emotion_signals, emo=True)
+    _scan("safety", result.safety_signals, sev=True)
+    _scan("social", result.social_signals)
+    _scan("activity", result.activity_signals)
+    _scan("time", result.time_signals)
+    _scan("environment", result.environment_signals)
+    _scan("adl", result.adl_signals, sev=True)
+    _scan("cognitive", result.cognitive_signals, sev=True)
+    _scan("help_request", result.help_request_signals)
+    _scan("end_of_life", result.end_of_life_signals, sev=True)
+    _scan("hydration", result.hydration_signals, sev=True)
+    _scan("transport", result.transport_signals, sev=True)
 
     # News — also sets needs_web_search
-    for p in NEWS_PATTERNS:
-        if p.pattern.search(text):
-            result.news_signals.append(p.signal)
-            result.needs_web_search = True
+    for p in matched["news"]:
+        result.news_signals.append(p.signal)
+        result.needs_web_search = True
 
-    _scan(GOODBYE_PATTERNS, result.goodbye_signals, strength_key=True)
+    _scan("goodbye", result.goodbye_signals, strength_key=True)
     if result.goodbye_signals and _has_goodbye_continuation(text):
         for signal in result.goodbye_signals:
             if signal.get("strength") == "strong":
                 signal["strength"] = "weak"
 
     # Questions
-    for p in QUESTION_PATTERNS:
-        if p.pattern.search(text):
-            result.is_question = True
-            result.question_type = p.signal
-            break
+    for p in matched["question"]:
+        result.is_question = True
+        result.question_type = p.signal
+        break
 
     # Engagement
-    for p in ENGAGEMENT_PATTERNS:
-        if p.pattern.search(text):
-            if p.signal in ("minimal_response", "very_short", "uncertain_response"):
-                result.engagement_level = "low"
-            elif p.signal == "short" and result.engagement_level != "low":
-                result.engagement_level = "medium"
-            elif p.signal == "long_response":
-                result.engagement_level = "high"
+    for p in matched["engagement"]:
+        if p.signal in ("minimal_response", "very_short", "uncertain_response"):
+            result.engagement_level = "low"
+        elif p.signal == "short" and result.engagement_level != "low":
+            result.engagement_level = "medium"
+        elif p.signal == "long_response":
+            result.engagement_level = "high"
 
     # Consecutive short responses → low engagement
     if recent_history and len(recent_history) >= 2:
@@ -149,10 +209,9 @@ def quick_analyze(user_message: str, recent_history: list[dict] | None = None) -
 
     # Reminder acknowledgment
     best = None
-    for p in REMINDER_ACK_PATTERNS:
-        if p.pattern.search(text):
-            if best is None or p.confidence > best["confidence"]:
-                best = {"type": p.type, "confidence": p.confidence}
+    for p in matched["reminder_ack"]:
+        if best is None or p.confidence > best["confidence"]:
+            best = {"type": p.type, "confidence": p.confidence}
     result.reminder_response = best
 
     result.guidance = _build_guidance(result)
@@ -321,6 +380,10 @@ class QuickObserverProcessor(FrameProcessor):
 
     When a strong goodbye is detected, schedules a forced call end after a delay
     to ensure the call actually terminates (LLM tool calls are unreliable for this).
+
+    Interim transcriptions are analyzed incrementally while the senior is still
+    speaking, so when the final TranscriptionFrame matches the last interim the
+    analysis is already done and guidance is injected with no regex work.
     """
 
     # Seconds to wait after goodbye detection before forcing call end.
@@ -336,6 +399,13 @@ class QuickObserverProcessor(FrameProcessor):
         self._pipeline_task = None  # Set via set_pipeline_task() after pipeline creation
         self._goodbye_task: asyncio.Task | None = None
 
+        # Incremental interim analysis: (text, analysis) for the latest interim
+        # plus the matcher state to extend on the next interim.
+        self._interim_scan: MatchState | None = None
+        self._interim_analysis: tuple[str, AnalysisResult] | None = None
+        self._precompute_hits = 0
+        self._precompute_misses = 0
+
     def set_pipeline_task(self, task):
         """Set the pipeline task reference for programmatic call ending."""
         self._pipeline_task = task
@@ -368,13 +438,61 @@ class QuickObserverProcessor(FrameProcessor):
         except (TypeError, ValueError):
             return None
 
+    def _precompute_interim(self, text: str) -> None:
+        """Analyze a growing interim transcript, reusing the previous scan."""
+        analysis, scan = quick_analyze_incremental(text, self._recent_history, self._interim_scan)
+        self._interim_scan = scan
+        self._interim_analysis = (text.strip(), analysis)
+        if self._session_state is not None:
+            self._session_state["_interim_quick_analysis"] = analysis
+
+    def _final_analysis(self, text: str) -> AnalysisResult:
+        """Return the analysis for a final transcript, reusing interim work."""
+        precomputed = self._interim_analysis
+        previous_scan = self._interim_scan
+        self._interim_analysis = None
+        self._interim_scan = None
+        if self._session_state is not None:
+            self._session_state.pop("_interim_quick_analysis", None)
+
+        if precomputed is None:
+            return quick_analyze(text, self._recent_history)
+
+        if text and precomputed[0] == text.strip():
+            self._precompute_hits += 1
+            outcome = "hits"
+            analysis = precomputed[1]
+        else:
+            self._precompute_misses += 1
+            outcome = "misses"
+            analysis, _ = quick_analyze_incremental(text, self._recent_history, previous_scan)
+
+        if self._session_state is not None:
+            metrics = self._session_state.setdefault("_call_metrics", {})
+            stats = metrics.setdefault("quick_observer_precompute", {"hits": 0, "misses": 0})
+            stats[outcome] += 1
+        return analysis
+
     async def process_frame(self, frame: Frame, direction):
         await super().process_frame(frame, direction)
 
+        if isinstance(frame, EndFrame):
+            attempts = self._precompute_hits + self._precompute_misses
+            if attempts:
+                logger.info(
+                    "[QuickObserver] Call summary: {hits}/{attempts} finals matched interim precompute ({pct}%)",
+                    hits=self._precompute_hits,
+                    attempts=attempts,
+                    pct=round(self._precompute_hits / attempts * 100),
+                )
+
+        if isinstance(frame, InterimTranscriptionFrame) and frame.text:
+            self._precompute_interim(frame.text)
+
         if isinstance(frame, TranscriptionFrame):
             text = frame.text
             logger.debug("[QuickObserver] Transcription received chars={n}", n=len(text or ""))
-            analysis = quick_analyze(text, self._recent_history)
+            analysis = self._final_analysis(text)
             self.last_analysis = analysis
 
             # Expose analysis to session_state for prefetch engine
@@ -0,0 +1,34 @@
+"""Backfill call_metrics_hourly from raw call_metrics rows.
+
+Run once after applying migration 014. Hours that already have a rollup
+(written live by post-call) are skipped, so re-running is safe.
+
+Usage:
+    cd pipecat
+    DATABASE_URL=postgresql://... uv run python scripts/backfill_call_metrics_rollups.py [--days 90]
+"""
+import argparse
+import asyncio
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+
+async def main(days: int) -> None:
+    from db.client import close_pool
+    from services.call_metrics_rollup import backfill
+
+    since = datetime.now(timezone.utc) - timedelta(days=days)
+    try:
+        written = await backfill(since)
+    finally:
+        await close_pool()
+    print(f"Backfilled {written} hourly rollups since {since.isoformat()}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--days", type=int, default=90)
+    args = parser.parse_args()
+    asyncio.run(main(args.days))
@@ -0,0 +1,176 @@
+"""Benchmark: scheduler tick cost, legacy N+1 vs set-based due-reminder query.
+
+Seeds reminders into TEMP tables (session-scoped, they shadow the real
+tables on this connection only and are dropped on exit), then times one
+scheduler tick at increasing reminder counts.
+
+Usage:
+    cd pipecat
+    DATABASE_URL=postgresql://... uv run python scripts/bench_due_reminders.py [--sizes 1000,5000,20000]
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+TIMEZONES = ["America/New_York", "America/Chicago", "America/Denver", "America/Los_Angeles", "Pacific/Honolulu", None]
+
+SCHEMA = """
+CREATE TEMP TABLE seniors (
+    id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+    name text, phone text, timezone text, interests text[],
+    family_info jsonb, family_info_encrypted text,
+    medical_notes text, medical_notes_encrypted text,
+    preferred_call_times jsonb, preferred_call_times_encrypted text,
+    additional_info text, additional_info_encrypted text,
+    call_context_snapshot jsonb, call_context_snapshot_encrypted text,
+    is_active boolean DEFAULT true
+);
+CREATE TEMP TABLE reminders (
+    id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+    senior_id uuid, type text, title text, title_encrypted text,
+    description text, description_encrypted text,
+    scheduled_time timestamp, is_recurring boolean DEFAULT false,
+    cron_expression text, is_active boolean DEFAULT true, last_delivered_at timestamp
+);
+CREATE TEMP TABLE reminder_deliveries (
+    id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+    reminder_id uuid, scheduled_for timestamp NOT NULL, delivered_at timestamp,
+    status text DEFAULT 'pending', attempt_count int DEFAULT 0, call_sid text
+);
+CREATE INDEX ON reminders(scheduled_time) WHERE is_active = true AND is_recurring = false;
+CREATE INDEX ON reminders(is_recurring) WHERE is_active = true;
+CREATE INDEX ON reminders ((date_part('hour', scheduled_time) * 60 + date_part('minute', scheduled_time)))
+  WHERE is_active = true AND is_recurring = true;
+CREATE INDEX ON reminder_deliveries(reminder_id, scheduled_for);
+CREATE INDEX ON reminder_deliveries(reminder_id, scheduled_for)
+  WHERE status IN ('acknowledged', 'confirmed', 'max_attempts', 'delivered', 'retry_pending');
+CREATE INDEX ON reminder_deliveries(status) WHERE status IN ('retry_pending', 'delivered');
+"""
+
+LEGACY_ONE_TIME = """SELECT {cols} FROM reminders r INNER JOIN seniors s ON r.senior_id = s.id
+    WHERE r.is_active = true AND r.is_recurring = false AND r.scheduled_time <= $1 AND s.is_active = true"""
+LEGACY_RECURRING = """SELECT {cols} FROM reminders r INNER JOIN seniors s ON r.senior_id = s.id
+    WHERE r.is_active = true AND r.is_recurring = true AND s.is_active = true"""
+LEGACY_DELIVERY = """SELECT id FROM reminder_deliveries
+    WHERE reminder_id = $1 AND scheduled_for BETWEEN $2 AND $3 AND status IN ({statuses}) LIMIT 1"""
+
+
+async def _seed(conn, count: int, now: datetime) -> None:
+    rng = random.Random(count)
+    seniors = max(1, count // 3)
+    await conn.execute("TRUNCATE seniors, reminders, reminder_deliveries")
+    await conn.executemany(
+        "INSERT INTO seniors (name, phone, timezone) VALUES ($1, $2, $3)",
+        [(f"Senior {i}", f"555{i:07d}", rng.choice(TIMEZONES)) for i in range(seniors)],
+    )
+    senior_ids = [r["id"] for r in await conn.fetch("SELECT id FROM seniors")]
+    naive_now = now.replace(tzinfo=None)
+    reminders = []
+    for i in range(count):
+        recurring = rng.random() < 0.7
+        active = True
+        if recurring:
+            scheduled = naive_now.replace(hour=rng.randrange(24), minute=rng.randrange(60), second=0, microsecond=0)
+        else:
+            scheduled = naive_now + timedelta(minutes=rng.randint(-60 * 24 * 7, 60 * 24 * 7))
+            # Past one-time reminders are normally deactivated once handled.
+            active = scheduled > naive_now or rng.random() < 0.03
+        reminders.append((rng.choice(senior_ids), "medication", f"Reminder {i}", scheduled, recurring, active))
+    await conn.executemany(
+        """INSERT INTO reminders (senior_id, type, title, scheduled_time, is_recurring, is_active)
+           VALUES ($1, $2, $3, $4, $5, $6)""",
+        reminders,
+    )
+    rows = await conn.fetch("SELECT id, scheduled_time FROM reminders")
+    deliveries = []
+    for row in rows:
+        if rng.random() < 0.5:
+            status = rng.choice(["delivered", "acknowledged", "retry_pending", "pending"])
+            deliveries.append((row["id"], row["scheduled_time"], naive_now - timedelta(hours=1), status))
+    await conn.executemany(
+        "INSERT INTO reminder_deliveries (reminder_id, scheduled_for, delivered_at, status) VALUES ($1, $2, $3, $4)",
+        deliveries,
+    )
+    await conn.execute("ANALYZE seniors; ANALYZE reminders; ANALYZE reminder_deliveries")
+
+
+async def _legacy_tick(conn, now: datetime, cols: str) -> tuple[int, int]:
+    """Python-side filtering + two delivery lookups per candidate (pre-change logic)."""
+    from zoneinfo import ZoneInfo
+
+    naive_now = now.replace(tzinfo=None)
+    queries = 2
+    candidates = list(await conn.fetch(LEGACY_ONE_TIME.format(cols=cols), naive_now + timedelta(minutes=1)))
+    for row in await conn.fetch(LEGACY_RECURRING.format(cols=cols)):
+        st = row["scheduled_time"]
+        try:
+            local_now = now.astimezone(ZoneInfo(row["timezone"])) if row["timezone"] else now
+        except Exception:
+            local_now = now
+        diff = abs(st.hour * 60 + st.minute - (local_now.hour * 60 + local_now.minute))
+        if min(diff, 1440 - diff) <= 5:
+            candidates.append(row)
+    due = 0
+    for row in candidates:
+        st = row["scheduled_time"]
+        scheduled_for = naive_now.replace(hour=st.hour, minute=st.minute, second=0, microsecond=0) if row["is_recurring"] else st
+        window = (row["reminder_id"], scheduled_for - timedelta(minutes=5), scheduled_for + timedelta(minutes=5))
+        queries += 1
+        if await conn.fetchrow(LEGACY_DELIVERY.format(statuses="'acknowledged', 'confirmed', 'max_attempts'"), *window):
+            continue
+        queries += 1
+        if not await conn.fetchrow(LEGACY_DELIVERY.format(statuses="'delivered', 'retry_pending'"), *window):
+            due += 1
+    return due, queries
+
+
+async def _set_based_tick(conn, now: datetime) -> tuple[int, int]:
+    from services.scheduler import DUE_REMINDERS_SQL, known_timezones
+
+    return len(await conn.fetch(DUE_REMINDERS_SQL, now, known_timezones())), 1
+
+
+async def _time(fn, rounds: int) -> tuple[float, float, int, int]:
+    samples = []
+    result = (0, 0)
+    for _ in range(rounds):
+        start = time.perf_counter()
+        result = await fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), max(samples), *result
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="1000,5000,20000")
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    import asyncpg
+    from services.scheduler import _REMINDER_SENIOR_COLUMNS
+
+    conn = await asyncpg.connect(os.environ["DATABASE_URL"])
+    try:
+        await conn.execute(SCHEMA)
+        now = datetime.now(timezone.utc)
+        print(f"{'reminders':>10} {'impl':>10} {'p50 ms':>9} {'max ms':>9} {'due':>6} {'queries':>8}")
+        for size in (int(s) for s in args.sizes.split(",")):
+            await _seed(conn, size, now)
+            for label, fn in (
+                ("legacy", lambda: _legacy_tick(conn, now, _REMINDER_SENIOR_COLUMNS)),
+                ("set-based", lambda: _set_based_tick(conn, now)),
+            ):
+                p50, worst, due, queries = await _time(fn, args.rounds)
+                print(f"{size:>10} {label:>10} {p50:>9.1f} {worst:>9.1f} {due:>6} {queries:>8}")
+    finally:
+        await conn.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
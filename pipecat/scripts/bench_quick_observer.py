@@ -0,0 +1,62 @@
+"""Microbenchmark: Quick Observer per-utterance latency, naive vs compiled.
+
+Usage:
+    cd pipecat
+    uv run python scripts/bench_quick_observer.py [--rounds 200]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+
+def _measure(fn, corpus: list[str], rounds: int) -> list[float]:
+    samples = []
+    for _ in range(rounds):
+        for text in corpus:
+            start = time.perf_counter_ns()
+            fn(text)
+            samples.append((time.perf_counter_ns() - start) / 1000)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    from processors import quick_observer
+    from processors.quick_observer import PATTERN_CATEGORIES, quick_analyze
+    from tests.helpers.utterance_corpus import utterance_corpus
+
+    class _NaiveMatcher:
+        def match(self, text):
+            return {
+                name: [p for p in patterns if p.pattern.search(text)]
+                for name, patterns in PATTERN_CATEGORIES.items()
+            }
+
+    corpus = [t for t in utterance_corpus() if t.strip()]
+    compiled = quick_observer._MATCHER
+
+    quick_observer._MATCHER = _NaiveMatcher()
+    naive = _measure(quick_analyze, corpus, args.rounds)
+    quick_observer._MATCHER = compiled
+    fast = _measure(quick_analyze, corpus, args.rounds)
+
+    print(f"=== QUICK OBSERVER ({len(corpus)} utterances x {args.rounds} rounds) ===")
+    print(f"Patterns: {compiled.pattern_count} ({compiled.prefiltered_count} prefiltered)")
+    print(f"{'engine':<10} {'p50 us':>10} {'p99 us':>10} {'mean us':>10}")
+    for name, samples in (("naive", naive), ("compiled", fast)):
+        p99 = statistics.quantiles(samples, n=100)[98]
+        print(
+            f"{name:<10} {statistics.median(samples):>10.1f} "
+            f"{p99:>10.1f} {statistics.fmean(samples):>10.1f}"
+        )
+    print(f"Speedup (p50): {statistics.median(naive) / statistics.median(fast):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
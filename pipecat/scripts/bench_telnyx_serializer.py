@@ -0,0 +1,94 @@
+"""Microbenchmark: Telnyx serializer per-frame CPU cost, generic vs fast path.
+
+Each call moves 50 x 20ms frames per second in each direction (640-byte
+L16/16 kHz payloads). The generic path is the original implementation:
+json.dumps/json.loads around every frame plus an awaited resampler call
+even when rates match. The fast path is the current serializer.
+
+Usage:
+    cd pipecat
+    uv run python scripts/bench_telnyx_serializer.py [--frames 20000]
+"""
+import argparse
+import asyncio
+import base64
+import json
+import os
+import sys
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+FRAMES_PER_SECOND_PER_DIRECTION = 50
+
+
+def _inbound_message(pcm: bytes, seq: int) -> str:
+    # Shape of a Telnyx media event (compact JSON, as Telnyx sends it).
+    return json.dumps(
+        {
+            "event": "media",
+            "sequence_number": str(seq),
+            "media": {"track": "inbound", "chunk": str(seq), "timestamp": str(seq * 20),
+                      "payload": base64.b64encode(pcm).decode()},
+            "stream_id": "32de0dea-53cb-4b21-89a4-9610cb6e4bff",
+        },
+        separators=(",", ":"),
+    )
+
+
+async def _generic(serializer, frame, message: str) -> None:
+    resampled = await serializer._output_resampler.resample(frame.audio, frame.sample_rate, 16000)
+    json.dumps({"event": "media", "media": {"payload": base64.b64encode(resampled).decode("utf-8")}})
+    parsed = json.loads(message)
+    payload = base64.b64decode(parsed["media"]["payload"])
+    await serializer._input_resampler.resample(payload, 16000, serializer._sample_rate)
+
+
+async def _fast(serializer, frame, message: str) -> None:
+    await serializer.serialize(frame)
+    await serializer.deserialize(message)
+
+
+async def _run(fn, frames: int) -> float:
+    from pipecat.frames.frames import OutputAudioRawFrame, StartFrame
+    from serializers.telnyx import DonnaTelnyxFrameSerializer
+
+    serializer = DonnaTelnyxFrameSerializer(
+        stream_id="bench", call_control_id="v3:bench", outbound_encoding="L16",
+        inbound_encoding="L16", api_key=None,
+        params=DonnaTelnyxFrameSerializer.InputParams(auto_hang_up=False),
+    )
+    await serializer.setup(StartFrame(audio_in_sample_rate=16000, audio_out_sample_rate=16000))
+    pcm = os.urandom(640)
+    frame = OutputAudioRawFrame(audio=pcm, sample_rate=16000, num_channels=1)
+    message = _inbound_message(pcm, 1)
+    await fn(serializer, frame, message)  # warm up (first-frame logging)
+
+    start = time.process_time()
+    for _ in range(frames):
+        await fn(serializer, frame, message)
+    return time.process_time() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--frames", type=int, default=20000)
+    args = parser.parse_args()
+
+    from loguru import logger
+    logger.remove()
+
+    print(f"=== TELNYX SERIALIZER ({args.frames} frames, 20ms L16/16kHz, serialize + deserialize) ===")
+    print(f"{'path':<10} {'us/frame':>10} {'frames/s/core':>15} {'calls/core':>12}")
+    results = {}
+    for name, fn in (("generic", _generic), ("fast", _fast)):
+        cpu = asyncio.run(_run(fn, args.frames))
+        per_frame_us = cpu / args.frames * 1e6
+        # One "frame" here is one outbound + one inbound 20ms frame.
+        fps = args.frames / cpu
+        results[name] = per_frame_us
+        print(f"{name:<10} {per_frame_us:>10.2f} {fps:>15,.0f} {fps / FRAMES_PER_SECOND_PER_DIRECTION:>12,.0f}")
+    print(f"Speedup: {results['generic'] / results['fast']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Benchmark: draft transcript persistence, full snapshots vs append-only chunks.
+
+Simulates the per-turn encryption work for one call. The snapshot strategy
+re-encrypts the whole transcript (JSON + formatted text) on every turn; the
+append strategy encrypts only the turns added since the last flush.
+
+Usage:
+    cd pipecat
+    uv run python scripts/bench_transcript_persistence.py [--minutes 60] [--turns-per-minute 8]
+"""
+import argparse
+import base64
+import os
+import sys
+import time
+from datetime import datetime, timezone
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+# Encryption cost is the point of the benchmark; use a throwaway key if unset.
+os.environ.setdefault("FIELD_ENCRYPTION_KEY", base64.urlsafe_b64encode(os.urandom(32)).decode().rstrip("="))
+
+_USER = "Well my grandson Jake came by yesterday and we worked in the garden for a while, the tomatoes are finally coming in."
+_DONNA = (
+    "Oh, that sounds lovely! It must have been nice to spend the afternoon with Jake. "
+    "How many tomato plants do you have this year, and are you planning to make your sauce again?"
+)
+
+
+def _turns(count: int) -> list[dict]:
+    now = datetime.now(timezone.utc).isoformat()
+    return [
+        {
+            "role": "user" if i % 2 == 0 else "assistant",
+            "content": f"{_USER if i % 2 == 0 else _DONNA} ({i})",
+            "sequence": i,
+            "timestamp": now,
+            "timestamp_offset_ms": i * 7500,
+        }
+        for i in range(count)
+    ]
+
+
+def _snapshot(turns: list[dict], flush_every: int) -> tuple[int, int, float]:
+    from lib.encryption import encrypt, encrypt_json
+    from services.conversations import format_transcript_text
+
+    written = writes = 0
+    start = time.process_time()
+    for end in range(flush_every, len(turns) + 1, flush_every):
+        snapshot = turns[:end]
+        written += len(encrypt_json(snapshot)) + len(encrypt(format_transcript_text(snapshot)))
+        writes += 1
+    return writes, written, time.process_time() - start
+
+
+def _append(turns: list[dict], flush_every: int) -> tuple[int, int, float]:
+    from lib.encryption import encrypt_json
+
+    written = writes = 0
+    start = time.process_time()
+    for first in range(0, len(turns), flush_every):
+        written += len(encrypt_json(turns[first:first + flush_every]))
+        writes += 1
+    return writes, written, time.process_time() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--minutes", type=int, default=60)
+    parser.add_argument("--turns-per-minute", type=int, default=8)
+    parser.add_argument("--flush-every", type=int, default=1, help="turns coalesced per append flush")
+    args = parser.parse_args()
+
+    turns = _turns(args.minutes * args.turns_per_minute)
+    print(f"=== DRAFT TRANSCRIPT PERSISTENCE ({args.minutes} min call, {len(turns)} turns) ===")
+    print(f"{'strategy':<10} {'writes':>8} {'bytes written':>15} {'cpu ms':>10}")
+    results = {
+        "snapshot": _snapshot(turns, 1),
+        "append": _append(turns, args.flush_every),
+    }
+    for name, (writes, written, cpu) in results.items():
+        print(f"{name:<10} {writes:>8} {written:>15,} {cpu * 1000:>10.1f}")
+    snap, app = results["snapshot"], results["append"]
+    print(f"Bytes: {snap[1] / app[1]:.0f}x less, CPU: {snap[2] / max(app[2], 1e-9):.0f}x less")
+
+
+if __name__ == "__main__":
+    main()
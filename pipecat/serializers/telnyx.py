@@ -8,11 +8,10 @@ the provider edge.
 from __future__ import annotations
 
 import audioop
-import base64
+import binascii
 import json
 from typing import Optional
 
-import aiohttp
 from loguru import logger
 from pydantic import BaseModel
 
@@ -32,6 +31,38 @@ from pipecat.frames.frames import (
 )
 from pipecat.serializers.base_serializer import FrameSerializer
 
+from lib import telnyx_http
+
+
+# Outbound media envelope. Base64 output never needs JSON escaping, so the
+# message is assembled by concatenation instead of json.dumps per frame.
+_MEDIA_PREFIX = '{"event":"media","media":{"payload":"'
+_MEDIA_SUFFIX = '"}}'
+_CLEAR_MESSAGE = json.dumps({"event": "clear"})
+
+# Inbound media fast path: Telnyx sends compact JSON, so the payload can be
+# sliced out without parsing the envelope. Anything else goes through json.
+_INBOUND_MEDIA_MARKER = '"event":"media"'
+_INBOUND_PAYLOAD_KEY = '"payload":"'
+
+
+def _media_payload(data: str | bytes) -> str | bytes | None:
+    """Return the base64 payload of a compact Telnyx media message, else None."""
+    if isinstance(data, (bytes, bytearray)):
+        marker, key, quote = _INBOUND_MEDIA_MARKER.encode(), _INBOUND_PAYLOAD_KEY.encode(), b'"'
+    else:
+        marker, key, quote = _INBOUND_MEDIA_MARKER, _INBOUND_PAYLOAD_KEY, '"'
+    if marker not in data:
+        return None
+    start = data.find(key)
+    if start < 0:
+        return None
+    start += len(key)
+    end = data.find(quote, start)
+    if end < 0:
+        return None
+    return data[start:end]
+
 
 class DonnaTelnyxFrameSerializer(FrameSerializer):
     """Serialize Donna audio frames to Telnyx media-stream WebSocket messages."""
@@ -91,7 +122,7 @@ class DonnaTelnyxFrameSerializer(FrameSerializer):
             return None
 
         if isinstance(frame, InterruptionFrame):
-            return json.dumps({"event": "clear"})
+            return _CLEAR_MESSAGE
 
         if not isinstance(frame, AudioRawFrame):
             return None
@@ -116,22 +147,20 @@ class DonnaTelnyxFrameSerializer(FrameSerializer):
                 byte_order=self._params.l16_output_byte_order,
             )
 
-        return json.dumps(
-            {
-                "event": "media",
-                "media": {
-                    "payload": base64.b64encode(serialized_data).decode("utf-8"),
-                },
-            }
-        )
+        return _MEDIA_PREFIX + binascii.b2a_base64(serialized_data, newline=False).decode("ascii") + _MEDIA_SUFFIX
 
     async def deserialize(self, data: str | bytes) -> Frame | None:
-        message = json.loads(data)
-        event = message.get("event")
+        payload_base64 = _media_payload(data)
+        if payload_base64 is None:
+            message = json.loads(data)
+            event = message.get("event")
+            if event == "media":
+                payload_base64 = (message.get("media") or {}).get("payload", "")
+        else:
+            event = "media"
 
         if event == "media":
-            payload_base64 = (message.get("media") or {}).get("payload", "")
-            payload = base64.b64decode(payload_base64)
+            payload = binascii.a2b_base64(payload_base64)
             deserialized_data = await self._decode_audio(payload)
             if not deserialized_data:
                 return None
@@ -169,11 +198,14 @@ class DonnaTelnyxFrameSerializer(FrameSerializer):
     async def _encode_audio(self, pcm_bytes: bytes, in_rate: int) -> bytes | None:
         encoding = self._params.inbound_encoding
         if encoding == "L16":
-            resampled = await self._output_resampler.resample(
-                pcm_bytes,
-                in_rate,
-                self._telnyx_sample_rate,
-            )
+            if in_rate == self._telnyx_sample_rate:
+                resampled = pcm_bytes
+            else:
+                resampled = await self._output_resampler.resample(
+                    pcm_bytes,
+                    in_rate,
+                    self._telnyx_sample_rate,
+                )
             if self._params.l16_output_byte_order == "little":
                 return resampled
             # Telnyx media messages carry an RTP payload, not a full RTP packet.
@@ -190,6 +222,8 @@ class DonnaTelnyxFrameSerializer(FrameSerializer):
                 logger.warning("Dropping malformed L16 Telnyx payload with odd byte length")
                 return None
             pcm = payload if self._params.l16_input_byte_order == "little" else audioop.byteswap(payload, 2)
+            if self._sample_rate == self._telnyx_sample_rate:
+                return pcm
             return await self._input_resampler.resample(
                 pcm,
                 self._telnyx_sample_rate,
@@ -203,37 +237,39 @@ class DonnaTelnyxFrameSerializer(FrameSerializer):
             logger.warning("Cannot hang up Telnyx call: missing call_control_id or api_key")
             return
 
-        endpoint = f"https://api.telnyx.com/v2/calls/{self._call_control_id}/actions/hangup"
+        endpoint = f"/calls/{self._call_control_id}/actions/hangup"
         headers = {
             "Content-Type": "application/json",
             "Authorization": f"Bearer {self._api_key}",
         }
+        # Same command_id as the webhook-side hangup, so Telnyx applies it once
+        # and the shared client can safely retry it.
+        payload = {"command_id": telnyx_http.command_id(self._call_control_id, "hangup")}
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(endpoint, headers=headers) as response:
-                    if response.status == 200:
-                        logger.info("Successfully terminated Telnyx call {cid}", cid=self._call_control_id)
-                        return
-
-                    if response.status == 422:
-                        try:
-                            error_data = await response.json()
-                            if any(
-                                error.get("code") == "90018"
-                                for error in error_data.get("errors", [])
-                            ):
-                                logger.debug("Telnyx call {cid} already ended", cid=self._call_control_id)
-                                return
-                        except Exception:
-                            pass
-
-                    error_text = await response.text()
-                    logger.error(
-                        "Failed to terminate Telnyx call {cid}: status={status} response={response}",
-                        cid=self._call_control_id,
-                        status=response.status,
-                        response=error_text[:200],
-                    )
+            response = await telnyx_http.post(endpoint, payload, headers=headers)
         except Exception as exc:
             logger.error("Failed to hang up Telnyx call: {err}", err=str(exc))
+            return
+
+        if response.ok:
+            logger.info("Successfully terminated Telnyx call {cid}", cid=self._call_control_id)
+            return
+
+        if response.status == 422:
+            try:
+                if any(
+                    error.get("code") == "90018"
+                    for error in response.json().get("errors", [])
+                ):
+                    logger.debug("Telnyx call {cid} already ended", cid=self._call_control_id)
+                    return
+            except Exception:
+                pass
+
+        logger.error(
+            "Failed to terminate Telnyx call {cid}: status={status} response={response}",
+            cid=self._call_control_id,
+            status=response.status,
+            response=response.body[:200],
+        )
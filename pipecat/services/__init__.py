@@ -12,8 +12,10 @@ __all__ = [
     "conversations",
     "daily_context",
     "director_llm",
+    "embedding_cache",
     "greetings",
     "memory",
+    "memory_index",
     "news",
     "post_call",
     "reminder_delivery",
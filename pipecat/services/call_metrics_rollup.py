@@ -0,0 +1,275 @@
+"""Hourly call-metrics rollups for the observability dashboard.
+
+``record_call`` folds one finished call into its ``call_metrics_hourly``
+row (hour x call_type) with a single upsert; ``get_summary`` merges the rows
+of a window into the /api/metrics/summary payload. Latency percentiles come
+from fixed-bucket per-turn histograms, which add element-wise, so any window
+is answered from at most one row per hour and call type.
+
+Fields keep the raw-table semantics: averages are averages of each call's
+average, a call is successful only when ``error_count = 0`` (NULL is not),
+and NULL end reasons come back as ``None``. Two differences remain: the
+window starts at the top of the hour containing ``since``, and a NULL
+``turn_count`` (older backfilled rows only) counts as 0 turns.
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+
+from loguru import logger
+
+from db.client import execute, iter_batches, query_many, read_snapshot
+from lib import histogram as _histogram
+
+# Upper bounds (ms) of the latency histogram buckets; a final bucket catches the rest.
+LATENCY_BUCKETS_MS = (100, 200, 300, 400, 500, 600, 700, 800, 1000, 1200, 1500, 2000, 2500, 3000, 4000, 5000, 7500, 10000)
+METRICS = ("llm_ttfb", "tts_ttfb", "turn_latency")
+MAX_WINDOW_HOURS = 90 * 24
+# jsonb keys cannot be NULL; NULL end reasons are stored under this key.
+NULL_END_REASON = ""
+
+_INSERT_COLUMNS = """(hour, call_type, calls, successful_calls, duration_sum, duration_calls, turn_sum,
+                 llm_ttfb_sum, llm_ttfb_calls, tts_ttfb_sum, tts_ttfb_calls,
+                 turn_latency_sum, turn_latency_calls, end_reasons,
+                 llm_ttfb_hist, tts_ttfb_hist, turn_latency_hist)
+               VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17)"""
+
+UPSERT_SQL = f"""INSERT INTO call_metrics_hourly AS h
+               {_INSERT_COLUMNS}
+           ON CONFLICT (hour, call_type) DO UPDATE SET
+             calls = h.calls + EXCLUDED.calls,
+             successful_calls = h.successful_calls + EXCLUDED.successful_calls,
+             duration_sum = h.duration_sum + EXCLUDED.duration_sum,
+             duration_calls = h.duration_calls + EXCLUDED.duration_calls,
+             turn_sum = h.turn_sum + EXCLUDED.turn_sum,
+             llm_ttfb_sum = h.llm_ttfb_sum + EXCLUDED.llm_ttfb_sum,
+             llm_ttfb_calls = h.llm_ttfb_calls + EXCLUDED.llm_ttfb_calls,
+             tts_ttfb_sum = h.tts_ttfb_sum + EXCLUDED.tts_ttfb_sum,
+             tts_ttfb_calls = h.tts_ttfb_calls + EXCLUDED.tts_ttfb_calls,
+             turn_latency_sum = h.turn_latency_sum + EXCLUDED.turn_latency_sum,
+             turn_latency_calls = h.turn_latency_calls + EXCLUDED.turn_latency_calls,
+             end_reasons = (
+               SELECT COALESCE(jsonb_object_agg(reason, total), '{{}}'::jsonb)
+               FROM (
+                 SELECT reason, SUM(n::int) AS total
+                 FROM (SELECT * FROM jsonb_each_text(h.end_reasons)
+                       UNION ALL
+                       SELECT * FROM jsonb_each_text(EXCLUDED.end_reasons)) AS e(reason, n)
+                 GROUP BY reason
+               ) AS merged
+             ),
+             llm_ttfb_hist = ARRAY(
+               SELECT COALESCE(a, 0) + COALESCE(b, 0)
+               FROM unnest(h.llm_ttfb_hist, EXCLUDED.llm_ttfb_hist) WITH ORDINALITY AS t(a, b, i)
+               ORDER BY i),
+             tts_ttfb_hist = ARRAY(
+               SELECT COALESCE(a, 0) + COALESCE(b, 0)
+               FROM unnest(h.tts_ttfb_hist, EXCLUDED.tts_ttfb_hist) WITH ORDINALITY AS t(a, b, i)
+               ORDER BY i),
+             turn_latency_hist = ARRAY(
+               SELECT COALESCE(a, 0) + COALESCE(b, 0)
+               FROM unnest(h.turn_latency_hist, EXCLUDED.turn_latency_hist) WITH ORDINALITY AS t(a, b, i)
+               ORDER BY i),
+             updated_at = NOW()"""
+
+# Backfill never touches hours that already have live rollups.
+BACKFILL_SQL = f"""INSERT INTO call_metrics_hourly
+               {_INSERT_COLUMNS}
+           ON CONFLICT (hour, call_type) DO NOTHING"""
+
+_ROW_FIELDS = (
+    "calls", "successful_calls", "duration_sum", "duration_calls", "turn_sum",
+    "llm_ttfb_sum", "llm_ttfb_calls", "tts_ttfb_sum", "tts_ttfb_calls",
+    "turn_latency_sum", "turn_latency_calls",
+)
+
+
+def _hour(ts: datetime) -> datetime:
+    return ts.astimezone(timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+
+def histogram(values) -> list[int]:
+    """Bucket latency samples (ms) over ``LATENCY_BUCKETS_MS``."""
+    return _histogram.histogram(LATENCY_BUCKETS_MS, values)
+
+
+def percentile(buckets: list[int], fraction: float) -> float | None:
+    return _histogram.percentile(LATENCY_BUCKETS_MS, buckets, fraction)
+
+
+def new_row(hour: datetime, call_type: str) -> dict:
+    row = {"hour": hour, "call_type": call_type, "end_reasons": {}}
+    row.update(dict.fromkeys(_ROW_FIELDS, 0))
+    for metric in METRICS:
+        row[f"{metric}_hist"] = _histogram.empty(LATENCY_BUCKETS_MS)
+    return row
+
+
+def add_call(
+    row: dict,
+    *,
+    duration_seconds: int | None,
+    turn_count: int | None,
+    end_reason: str | None,
+    error_count: int | None,
+    samples: dict[str, list],
+) -> dict:
+    """Fold one call into a rollup row. ``samples`` maps metric -> latency values (ms)."""
+    row["calls"] += 1
+    row["successful_calls"] += int(error_count == 0)
+    if duration_seconds is not None:
+        row["duration_sum"] += int(duration_seconds)
+        row["duration_calls"] += 1
+    row["turn_sum"] += int(turn_count or 0)
+    reason = NULL_END_REASON if end_reason is None else end_reason
+    row["end_reasons"][reason] = row["end_reasons"].get(reason, 0) + 1
+    for metric in METRICS:
+        values = [v for v in samples.get(metric) or [] if v is not None]
+        if not values:
+            continue
+        row[f"{metric}_sum"] += round(sum(values) / len(values))
+        row[f"{metric}_calls"] += 1
+        hist = row[f"{metric}_hist"]
+        for i, count in enumerate(histogram(values)):
+            hist[i] += count
+    return row
+
+
+def _args(row: dict) -> list:
+    return [
+        row["hour"], row["call_type"],
+        *(row[field] for field in _ROW_FIELDS),
+        row["end_reasons"],
+        *(row[f"{metric}_hist"] for metric in METRICS),
+    ]
+
+
+async def record_call(
+    *,
+    call_type: str | None,
+    duration_seconds: int | None,
+    turn_count: int | None,
+    end_reason: str | None,
+    error_count: int | None,
+    samples: dict[str, list],
+) -> None:
+    """Add one finished call to the current hour's rollup."""
+    row = add_call(
+        new_row(_hour(datetime.now(timezone.utc)), call_type or "check-in"),
+        duration_seconds=duration_seconds,
+        turn_count=turn_count,
+        end_reason=end_reason,
+        error_count=error_count,
+        samples=samples,
+    )
+    await execute(UPSERT_SQL, *_args(row), name="call_metrics_hourly.upsert")
+
+
+def _avg(total: int, count: int) -> int | None:
+    return round(total / count) if count else None
+
+
+def summarize(rows: list[dict]) -> dict:
+    """Merge rollup rows into the /api/metrics/summary payload."""
+    totals = dict.fromkeys(_ROW_FIELDS, 0)
+    hists = {metric: _histogram.empty(LATENCY_BUCKETS_MS) for metric in METRICS}
+    end_reasons: dict[str, int] = {}
+    call_types: dict[str, int] = {}
+    for row in rows:
+        for field in _ROW_FIELDS:
+            totals[field] += int(row.get(field) or 0)
+        for metric in METRICS:
+            for i, count in enumerate(row.get(f"{metric}_hist") or []):
+                if i < len(hists[metric]):
+                    hists[metric][i] += count
+        for reason, count in (row.get("end_reasons") or {}).items():
+            end_reasons[reason] = end_reasons.get(reason, 0) + int(count)
+        call_types[row["call_type"]] = call_types.get(row["call_type"], 0) + int(row.get("calls") or 0)
+
+    summary = {
+        "total_calls": totals["calls"],
+        "successful_calls": totals["successful_calls"],
+        "avg_duration_seconds": _avg(totals["duration_sum"], totals["duration_calls"]),
+        "avg_turn_count": _avg(totals["turn_sum"], totals["calls"]),
+        "avg_llm_ttfb_ms": _avg(totals["llm_ttfb_sum"], totals["llm_ttfb_calls"]),
+        "avg_tts_ttfb_ms": _avg(totals["tts_ttfb_sum"], totals["tts_ttfb_calls"]),
+        "avg_turn_latency_ms": _avg(totals["turn_latency_sum"], totals["turn_latency_calls"]),
+    }
+    for metric in METRICS:
+        summary[f"{metric}_p50_ms"] = percentile(hists[metric], 0.5)
+        summary[f"{metric}_p95_ms"] = percentile(hists[metric], 0.95)
+    return {
+        "summary": summary,
+        "end_reasons": [
+            {"end_reason": None if reason == NULL_END_REASON else reason, "count": count}
+            for reason, count in sorted(end_reasons.items(), key=lambda kv: kv[1], reverse=True)
+        ],
+        "call_types": call_types,
+    }
+
+
+async def get_summary(since: datetime) -> dict:
+    """Summary over every rollup hour that overlaps ``since`` .. now.
+
+    ``window_start`` in the result is ``since`` rounded down to the hour.
+    """
+    window_start = _hour(since)
+    rows = await query_many(
+        """SELECT call_type, calls, successful_calls, duration_sum, duration_calls, turn_sum,
+                  llm_ttfb_sum, llm_ttfb_calls, tts_ttfb_sum, tts_ttfb_calls,
+                  turn_latency_sum, turn_latency_calls, end_reasons,
+                  llm_ttfb_hist, tts_ttfb_hist, turn_latency_hist
+           FROM call_metrics_hourly
+           WHERE hour >= $1""",
+        window_start,
+        name="call_metrics_hourly.window",
+    )
+    return {**summarize(rows), "window_start": window_start.isoformat(), "window_granularity": "hour"}
+
+
+async def backfill(since: datetime) -> int:
+    """Build rollups for hours since ``since`` from raw call_metrics rows.
+
+    Raw rows only keep per-call averages, so those stand in for the per-turn
+    samples. Hours that already have a rollup are left alone. Returns the
+    number of rollup rows written.
+    """
+    rollups: dict[tuple, dict] = {}
+    async with read_snapshot() as conn:
+        async for rows in iter_batches(
+            conn,
+            """SELECT created_at, call_type, duration_seconds, turn_count,
+                      end_reason, error_count, latency
+               FROM call_metrics WHERE created_at >= $1""",
+            since,
+            batch_size=1000,
+            name="call_metrics_hourly.backfill_source",
+        ):
+            for raw in rows:
+                if raw["created_at"] is None:
+                    continue
+                key = (_hour(raw["created_at"]), raw["call_type"] or "check-in")
+                latency = raw["latency"]
+                if isinstance(latency, str):  # older rows stored a JSON-encoded string
+                    latency = json.loads(latency)
+                latency = latency if isinstance(latency, dict) else {}
+                add_call(
+                    rollups.setdefault(key, new_row(*key)),
+                    duration_seconds=raw["duration_seconds"],
+                    turn_count=raw["turn_count"],
+                    end_reason=raw["end_reason"],
+                    error_count=raw["error_count"],
+                    samples={
+                        "llm_ttfb": [latency.get("llm_ttfb_avg_ms")],
+                        "tts_ttfb": [latency.get("tts_ttfb_avg_ms")],
+                        "turn_latency": [latency.get("turn_avg_ms")],
+                    },
+                )
+    written = 0
+    for row in rollups.values():
+        status = await execute(BACKFILL_SQL, *_args(row), name="call_metrics_hourly.backfill")
+        written += int(status.rsplit(" ", 1)[-1]) if status else 0
+    logger.info("Call metrics rollup backfill: {n} of {t} hours written", n=written, t=len(rollups))
+    return written
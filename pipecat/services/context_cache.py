@@ -7,27 +7,46 @@ Port of services/context-cache.js (365 lines). Caches:
 - Important memories (with decay)
 - Pre-generated greeting (templated with rotation)
 
-In-memory cache with 24-hour TTL. Called by scheduler hourly + at call connect.
-News is also persisted to seniors.cached_news so calls never need live web search.
+Two tiers with a 24-hour TTL: an in-process LRU bounded by entry count and
+estimated bytes, backed by encrypted shared state (Redis/Upstash) so a call
+landing on any instance finds a warm context. Called by scheduler hourly +
+at call connect. News is also persisted to seniors.cached_news so calls never
+need live web search.
 """
 
 from __future__ import annotations
 
 import asyncio
+import json
 import random
 import time
+from collections import OrderedDict
 from datetime import datetime
-from zoneinfo import ZoneInfo
 from loguru import logger
 from db import execute
 from services.time_context import format_call_time_label
 
-# In-memory cache: senior_id -> cached context dict
-_cache: dict[str, dict] = {}
+# In-memory LRU: senior_id -> cached context dict (least recently used first)
+_cache: OrderedDict[str, dict] = OrderedDict()
+_sizes: dict[str, int] = {}
+_total_bytes = 0
+_stats = {"hits": 0, "shared_hits": 0, "misses": 0, "evictions": 0}
 
 CACHE_TTL_SECONDS = 24 * 60 * 60  # 24 hours
 MAX_CACHE_SIZE = 2000
+MAX_CACHE_BYTES = 64 * 1024 * 1024
+SHARED_KEY_PREFIX = "context_cache:"
+# Fields call setup reads; only these are written to shared state.
+SHARED_FIELDS = (
+    "senior_id", "summaries", "recent_turns", "memory_context", "news_context",
+    "interest_scores", "greeting", "last_greeting_index", "cached_at", "expires_at",
+)
 PREFETCH_HOUR = 5  # 5 AM local
+PREFETCH_CONCURRENCY = 8
+PREFETCH_TIMEOUT_SECONDS = 60
+PREFETCH_SPREAD_SECONDS = 30 * 60  # pace a bucket's starts over half the hour
+
+_last_prefetch: dict | None = None
 
 # Greeting templates — {name} and {interest} replaced dynamically
 GREETING_TEMPLATES = [
@@ -49,15 +68,6 @@ FALLBACK_TEMPLATES = [
 ]
 
 
-def _get_local_hour(tz_name: str | None) -> int:
-    """Get the current local hour for a timezone."""
-    try:
-        tz = ZoneInfo(tz_name or "America/New_York")
-        return datetime.now(tz).hour
-    except Exception:
-        return datetime.now(ZoneInfo("America/New_York")).hour
-
-
 def _select_interest(
     interests: list[str] | None,
     recent_memories: list[dict] | None,
@@ -167,7 +177,7 @@ async def _fetch_conversations_consolidated(
     # Build summaries text
     summary_lines = []
     for row in rows:
-        summary = decrypt(row.get("summary_encrypted")) if row.get("summary_encrypted") else row.get("summary")
+        summary = decrypt(row.get("summary_encrypted"), cache=True) if row.get("summary_encrypted") else row.get("summary")
         if summary and summary != "[encrypted]":
             time_ago = _time_label(row["started_at"])
             dur = f"({round(row['duration_seconds'] / 60)} min)" if row.get("duration_seconds") else ""
@@ -182,7 +192,7 @@ async def _fetch_conversations_consolidated(
     for row in rows:
         try:
             transcript = (
-                decrypt_json(row.get("transcript_encrypted"))
+                decrypt_json(row.get("transcript_encrypted"), cache=True)
                 if row.get("transcript_encrypted")
                 else row.get("transcript")
             )
@@ -232,22 +242,49 @@ async def _fetch_memories_consolidated(
     Consolidates get_critical + get_important + get_recent into a single DB query.
     """
     from db import query_many
-    from lib.encryption import decrypt
+    from lib.encryption import decrypt_many_async
+    from services import memory_index
     from services.memory import _calculate_effective_importance, format_memory_for_context
 
-    rows = await query_many(
-        """SELECT id, type, content, content_encrypted, importance, metadata, created_at, last_accessed_at
-           FROM memories
-           WHERE senior_id = $1
-           ORDER BY importance DESC, created_at DESC
-           LIMIT 30""",
-        senior_id,
-    )
+    # With the in-process memory index enabled, load every memory (plus its
+    # embedding) in this same query; the tiers below use the first 30 rows,
+    # which is exactly what the narrower LIMIT 30 query returns.
+    index_memories = memory_index.is_enabled()
+    if index_memories:
+        version = await memory_index.shared_version(senior_id)
+        rows = await query_many(
+            """SELECT id, type, content, content_encrypted, importance, metadata, created_at, last_accessed_at,
+                      embedding::text AS embedding
+               FROM memories
+               WHERE senior_id = $1
+               ORDER BY importance DESC, created_at DESC
+               LIMIT $2""",
+            senior_id,
+            memory_index.MAX_INDEX_ROWS + 1,
+        )
+    else:
+        rows = await query_many(
+            """SELECT id, type, content, content_encrypted, importance, metadata, created_at, last_accessed_at
+               FROM memories
+               WHERE senior_id = $1
+               ORDER BY importance DESC, created_at DESC
+               LIMIT 30""",
+            senior_id,
+        )
 
-    for row in rows:
+    contents = await decrypt_many_async([row.get("content_encrypted") for row in rows], cache=True)
+    for row, content in zip(rows, contents):
         if row.get("content_encrypted"):
-            row["content"] = decrypt(row["content_encrypted"])
+            row["content"] = content
         row.pop("content_encrypted", None)
+
+    if index_memories:
+        memory_index.build_index(senior_id, rows, version)
+        for row in rows:
+            row.pop("embedding", None)
+        rows = rows[:30]
+
+    for row in rows:
         row["content"] = format_memory_for_context(row, timezone_name)
 
     # Split into tiers
@@ -377,15 +414,8 @@ async def prefetch_and_cache(senior_id: str) -> dict | None:
             "expires_at": now + CACHE_TTL_SECONDS,
         }
 
-        # Evict oldest entries if cache exceeds max size
-        if len(_cache) >= MAX_CACHE_SIZE:
-            entries = sorted(_cache.items(), key=lambda kv: kv[1]["cached_at"])
-            evict_count = len(_cache) - MAX_CACHE_SIZE + 1
-            for key, _ in entries[:evict_count]:
-                del _cache[key]
-            logger.info("Evicted {n} oldest cache entries", n=evict_count)
-
-        _cache[senior_id] = cached
+        _put_local(senior_id, cached)
+        await _put_shared(senior_id, cached)
 
         elapsed = round((time.time() - start) * 1000)
         logger.info("Pre-cached context for senior_id={sid} in {ms}ms", sid=str(senior_id)[:8], ms=elapsed)
@@ -396,68 +426,259 @@ async def prefetch_and_cache(senior_id: str) -> dict | None:
         return None
 
 
-def get_cache(senior_id: str) -> dict | None:
-    """Get cached context for a senior. Returns None if not cached or expired."""
+def _entry_size(entry: dict) -> int:
+    """Approximate in-memory footprint of a cache entry, in bytes."""
+    try:
+        return len(json.dumps(entry, default=str))
+    except (TypeError, ValueError):
+        return 0
+
+
+def _remove_local(senior_id: str) -> None:
+    global _total_bytes
+    _cache.pop(senior_id, None)
+    _total_bytes -= _sizes.pop(senior_id, 0)
+
+
+def _put_local(senior_id: str, entry: dict) -> None:
+    """Insert into the LRU, evicting least recently used entries over budget."""
+    global _total_bytes
+    _remove_local(senior_id)
+    _cache[senior_id] = entry
+    _sizes[senior_id] = _entry_size(entry)
+    _total_bytes += _sizes[senior_id]
+    evicted = 0
+    while len(_cache) > 1 and (len(_cache) > MAX_CACHE_SIZE or _total_bytes > MAX_CACHE_BYTES):
+        key = next(iter(_cache))
+        _remove_local(key)
+        evicted += 1
+    if evicted:
+        _stats["evictions"] += evicted
+        logger.info("Evicted {n} least recently used cache entries", n=evicted)
+
+
+async def _put_shared(senior_id: str, entry: dict) -> None:
+    try:
+        from lib.redis_client import get_shared_state
+        from lib.shared_state_phi import encode_phi_payload
+
+        state = get_shared_state()
+        if not getattr(state, "is_shared", False):
+            return
+        ttl = int(entry["expires_at"] - time.time())
+        payload = encode_phi_payload({k: entry.get(k) for k in SHARED_FIELDS})
+        if ttl > 0 and payload is not None:
+            await state.set(SHARED_KEY_PREFIX + str(senior_id), payload, ttl=ttl)
+    except Exception as e:
+        logger.warning("Shared context cache write failed for {sid}: {err}", sid=str(senior_id)[:8], err=str(e))
+
+
+async def _get_shared(senior_id: str) -> dict | None:
+    try:
+        from lib.redis_client import get_shared_state
+        from lib.shared_state_phi import decode_phi_payload
+
+        state = get_shared_state()
+        if not getattr(state, "is_shared", False):
+            return None
+        return decode_phi_payload(
+            await state.get(SHARED_KEY_PREFIX + str(senior_id)),
+            label="context cache",
+        )
+    except Exception as e:
+        logger.warning("Shared context cache lookup failed for {sid}: {err}", sid=str(senior_id)[:8], err=str(e))
+        return None
+
+
+def _get_local(senior_id: str) -> dict | None:
     cached = _cache.get(senior_id)
     if not cached:
         return None
 
     if time.time() > cached["expires_at"]:
-        del _cache[senior_id]
+        _remove_local(senior_id)
         logger.info("Cache expired for {sid}", sid=str(senior_id)[:8])
         return None
 
+    _cache.move_to_end(senior_id)
+    return cached
+
+
+def _log_hit(senior_id: str, cached: dict, tier: str) -> None:
     age_min = round((time.time() - cached["cached_at"]) / 60)
-    logger.info("Cache hit for {sid} (age: {age} min)", sid=str(senior_id)[:8], age=age_min)
+    logger.info("Cache hit for {sid} (age: {age} min, {tier})", sid=str(senior_id)[:8], age=age_min, tier=tier)
+
+
+def get_cache(senior_id: str) -> dict | None:
+    """Get cached context from this process. Returns None if not cached or expired."""
+    cached = _get_local(senior_id)
+    if cached is None:
+        _stats["misses"] += 1
+        return None
+    _stats["hits"] += 1
+    _log_hit(senior_id, cached, "local")
     return cached
 
 
+async def get_cache_async(senior_id: str) -> dict | None:
+    """Get cached context from this process, then from shared state.
+
+    Shared-state entries carry only ``SHARED_FIELDS`` and are promoted into
+    the local LRU.
+    """
+    cached = _get_local(senior_id)
+    if cached is not None:
+        _stats["hits"] += 1
+        _log_hit(senior_id, cached, "local")
+        return cached
+
+    cached = await _get_shared(senior_id)
+    if cached and time.time() <= (cached.get("expires_at") or 0):
+        _put_local(senior_id, cached)
+        _stats["shared_hits"] += 1
+        _log_hit(senior_id, cached, "shared")
+        return cached
+
+    _stats["misses"] += 1
+    return None
+
+
 def clear_cache(senior_id: str) -> None:
-    """Clear cache for a senior (e.g., after call ends and new memories stored)."""
+    """Clear this process's cache for a senior (e.g., after call ends and new memories stored)."""
+    from services.memory_index import drop_index
+    drop_index(senior_id)
     if senior_id in _cache:
-        del _cache[senior_id]
+        _remove_local(senior_id)
         logger.info("Cleared cache for {sid}", sid=str(senior_id)[:8])
 
 
+async def clear_cache_async(senior_id: str) -> None:
+    """Clear a senior's cached context and memory index locally and in shared state."""
+    clear_cache(senior_id)
+    from services.memory_index import invalidate
+    await invalidate(senior_id)
+    try:
+        from lib.redis_client import get_shared_state
+
+        state = get_shared_state()
+        if getattr(state, "is_shared", False):
+            await state.delete(SHARED_KEY_PREFIX + str(senior_id))
+    except Exception as e:
+        logger.warning("Shared context cache delete failed for {sid}: {err}", sid=str(senior_id)[:8], err=str(e))
+
+
 def clear_all() -> None:
     """Clear all caches."""
+    global _total_bytes
     count = len(_cache)
     _cache.clear()
+    _sizes.clear()
+    _total_bytes = 0
+    for key in _stats:
+        _stats[key] = 0
     logger.info("Cleared all {n} cached contexts", n=count)
 
 
-async def run_daily_prefetch() -> None:
-    """Run pre-fetch for seniors whose local time is 5 AM. Called hourly by scheduler."""
+async def _prefetch_with_timeout(senior_id: str, timeout: float) -> str:
+    """Prefetch one senior, returning ``ok``, ``failed`` or ``timeout``."""
+    try:
+        result = await asyncio.wait_for(prefetch_and_cache(senior_id), timeout=timeout)
+    except asyncio.TimeoutError:
+        logger.warning("Pre-fetch timed out for senior_id={sid} after {t}s", sid=str(senior_id)[:8], t=timeout)
+        return "timeout"
+    except Exception as e:
+        logger.error("Pre-fetch failed for senior_id={sid}: {err}", sid=str(senior_id)[:8], err=str(e))
+        return "failed"
+    return "ok" if result is not None else "failed"
+
+
+async def prefetch_many(
+    senior_ids: list[str],
+    concurrency: int = PREFETCH_CONCURRENCY,
+    timeout: float = PREFETCH_TIMEOUT_SECONDS,
+    spread_seconds: float = 0,
+) -> dict:
+    """Prefetch ``senior_ids`` through a bounded worker pool.
+
+    Starts are paced evenly over ``spread_seconds`` so a large timezone bucket
+    does not hit the database and news API all at once. Returns run stats.
+    """
+    start = time.monotonic()
+    counts = {"ok": 0, "failed": 0, "timeout": 0}
+    interval = spread_seconds / len(senior_ids) if senior_ids and spread_seconds > 0 else 0
+    queue: asyncio.Queue = asyncio.Queue()
+    for i, senior_id in enumerate(senior_ids):
+        queue.put_nowait((start + i * interval, senior_id))
+
+    async def worker() -> None:
+        while True:
+            try:
+                not_before, senior_id = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            delay = not_before - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            counts[await _prefetch_with_timeout(senior_id, timeout)] += 1
+
+    workers = max(1, min(concurrency, len(senior_ids)))
+    await asyncio.gather(*(worker() for _ in range(workers)))
+
+    elapsed = time.monotonic() - start
+    return {
+        "selected": len(senior_ids),
+        "succeeded": counts["ok"],
+        "failed": counts["failed"],
+        "timed_out": counts["timeout"],
+        "elapsed_ms": round(elapsed * 1000),
+        "per_second": round(len(senior_ids) / elapsed, 2) if elapsed > 0 else 0.0,
+    }
+
+
+async def run_daily_prefetch() -> dict | None:
+    """Run pre-fetch for seniors whose local time is 5 AM. Called hourly by scheduler.
+
+    Only the matching timezone buckets are loaded, and their prefetches are
+    spread over ``PREFETCH_SPREAD_SECONDS`` so the run finishes well inside
+    the hourly interval.
+    """
+    global _last_prefetch
     from lib.growthbook import is_on
     if not is_on("context_cache_enabled", {}):
         logger.info("Context cache disabled via GrowthBook flag — skipping prefetch")
-        return
+        return None
 
     logger.info("Running daily pre-fetch check...")
 
     try:
-        from services.seniors import list_active
-        seniors = await list_active()
-        prefetched = 0
-
-        for senior in seniors:
-            local_hour = _get_local_hour(senior.get("timezone"))
-            if local_hour == PREFETCH_HOUR:
-                await prefetch_and_cache(senior["id"])
-                prefetched += 1
-
-        if prefetched > 0:
-            logger.info("Pre-fetched context for {n} seniors", n=prefetched)
+        from services.seniors import list_active_at_local_hour
+        seniors = await list_active_at_local_hour(PREFETCH_HOUR)
+        if not seniors:
+            return None
+
+        stats = await prefetch_many(
+            [s["id"] for s in seniors],
+            spread_seconds=PREFETCH_SPREAD_SECONDS if len(seniors) > PREFETCH_CONCURRENCY else 0,
+        )
+        _last_prefetch = {**stats, "finished_at": time.time()}
+        logger.info(
+            "Pre-fetched context for {ok}/{n} seniors ({fail} failed, {to} timed out) "
+            "in {ms}ms, {rate}/s",
+            ok=stats["succeeded"], n=stats["selected"], fail=stats["failed"],
+            to=stats["timed_out"], ms=stats["elapsed_ms"], rate=stats["per_second"],
+        )
+        return stats
     except Exception as e:
         logger.error("Daily pre-fetch error: {err}", err=str(e))
+        return None
 
 
 def cleanup_expired() -> int:
     """Remove expired entries from cache. Returns count removed."""
     now = time.time()
-    expired_keys = [k for k, v in _cache.items() if now > v["expires_at"]]
+    expired_keys = [k for k, v in _cache.items() if now > v.get("expires_at", 0)]
     for k in expired_keys:
-        del _cache[k]
+        _remove_local(k)
     if expired_keys:
         logger.info("Cleaned up {n} expired cache entries", n=len(expired_keys))
     return len(expired_keys)
@@ -468,4 +689,15 @@ def get_stats() -> dict:
     now = time.time()
     valid = sum(1 for c in _cache.values() if now <= c["expires_at"])
     expired = len(_cache) - valid
-    return {"total": len(_cache), "valid": valid, "expired": expired}
+    lookups = _stats["hits"] + _stats["shared_hits"] + _stats["misses"]
+    return {
+        "total": len(_cache),
+        "valid": valid,
+        "expired": expired,
+        "bytes": _total_bytes,
+        "max_entries": MAX_CACHE_SIZE,
+        "max_bytes": MAX_CACHE_BYTES,
+        **_stats,
+        "hit_rate": round((_stats["hits"] + _stats["shared_hits"]) / lookups, 4) if lookups else 0.0,
+        "last_prefetch": dict(_last_prefetch) if _last_prefetch else None,
+    }
@@ -70,6 +70,9 @@ async def complete(call_sid: str, data: dict) -> dict | None:
     )
     if row:
         logger.info("Completed conversation {id} ({dur}s)", id=row["id"], dur=data.get("duration_seconds"))
+        if transcript:
+            # The full transcript now lives on the row; drop the draft chunks.
+            await _delete_draft_transcript(call_sid)
     return row
 
 
@@ -143,40 +146,78 @@ def _parse_transcript(value):
     return value
 
 
-async def update_transcript(call_sid: str, transcript: list[dict]) -> dict | None:
-    """Persist the latest in-call transcript snapshot without completing call.
+async def append_transcript_turns(call_sid: str, turns: list[dict], first_turn: int) -> dict | None:
+    """Persist turns added since the last draft flush as one encrypted chunk.
 
-    Draft writes intentionally update encrypted transcript fields only. The
-    legacy plaintext JSON column is read-only fallback for pre-encryption rows.
+    ``first_turn`` is the index of ``turns[0]`` in the full transcript. Chunks
+    are keyed by ``(call_sid, first_turn)``, so retrying a failed flush (which
+    may now carry more turns) replaces the earlier attempt instead of
+    duplicating it. Each flush costs work proportional to the new turns only.
     """
-    if not call_sid or not transcript:
+    if not call_sid or not turns:
         return None
 
-    transcript_text = format_transcript_text(transcript)
     row = await query_one(
-        """UPDATE conversations SET
-             transcript_encrypted = $1,
-             transcript_text_encrypted = $2
-           WHERE call_sid = $3
-           RETURNING id, call_sid""",
-        encrypt_json(transcript),
-        encrypt(transcript_text),
+        """INSERT INTO conversation_transcript_chunks
+             (conversation_id, call_sid, first_turn, turn_count, turns_encrypted)
+           SELECT id, call_sid, $2, $3, $4 FROM conversations WHERE call_sid = $1
+           ON CONFLICT (call_sid, first_turn) DO UPDATE SET
+             turn_count = EXCLUDED.turn_count,
+             turns_encrypted = EXCLUDED.turns_encrypted
+           RETURNING id""",
         call_sid,
+        first_turn,
+        len(turns),
+        encrypt_json(turns),
+        name="conversations.append_transcript_chunk",
     )
     if row:
         logger.info(
-            "Updated transcript draft callSid={cs} turns={turns} text_chars={chars}",
+            "Appended transcript draft callSid={cs} turns={first}-{last}",
             cs=call_sid,
-            turns=len(transcript),
-            chars=len(transcript_text or ""),
+            first=first_turn,
+            last=first_turn + len(turns) - 1,
         )
     return row
 
 
+async def get_draft_transcript(call_sid: str) -> list[dict] | None:
+    """Reassemble a draft transcript from its append-only chunks."""
+    rows = await query_many(
+        """SELECT first_turn, turn_count, turns_encrypted
+           FROM conversation_transcript_chunks
+           WHERE call_sid = $1
+           ORDER BY first_turn""",
+        call_sid,
+        name="conversations.draft_transcript_chunks",
+    )
+    transcript: list[dict] = []
+    for row in rows:
+        turns = decrypt_json(row["turns_encrypted"])
+        if not isinstance(turns, list):
+            continue
+        # Skip any overlap with turns already assembled (defensive; chunks are contiguous).
+        skip = max(0, len(transcript) - row["first_turn"])
+        transcript.extend(turns[skip:])
+    return transcript or None
+
+
+async def _delete_draft_transcript(call_sid: str) -> None:
+    try:
+        await execute(
+            "DELETE FROM conversation_transcript_chunks WHERE call_sid = $1",
+            call_sid,
+            name="conversations.delete_transcript_chunks",
+        )
+    except Exception as e:
+        logger.warning("Draft transcript cleanup failed callSid={cs}: {err}", cs=call_sid, err=str(e))
+
+
 async def get_transcript_by_call_sid(call_sid: str):
     """Fetch a persisted transcript for post-call fallback/retrieval.
 
-    Prefers encrypted structured JSON, then legacy JSON, then encrypted text.
+    Prefers encrypted structured JSON (written at call end), then the
+    in-call draft chunks, then legacy JSON, then encrypted text.
     """
     row = await query_one(
         """SELECT transcript, transcript_encrypted, transcript_text_encrypted
@@ -192,6 +233,10 @@ async def get_transcript_by_call_sid(call_sid: str):
         if parsed:
             return parsed
 
+    draft = await get_draft_transcript(call_sid)
+    if draft:
+        return draft
+
     parsed = _parse_transcript(row.get("transcript"))
     if parsed:
         return parsed
@@ -277,7 +322,7 @@ async def get_recent_summaries(
         started_at = row["started_at"]
         time_ago = format_call_time_label(started_at, timezone_name, now=now)
         duration = f"({round(row['duration_seconds'] / 60)} min)" if row.get("duration_seconds") else ""
-        summary = decrypt(row.get("summary_encrypted")) if row.get("summary_encrypted") else row.get("summary")
+        summary = decrypt(row.get("summary_encrypted"), cache=True) if row.get("summary_encrypted") else row.get("summary")
         if summary and summary != "[encrypted]":
             lines.append(f"- {time_ago} {duration}: {summary}")
 
@@ -317,9 +362,10 @@ async def get_recent_turns(
 
     for row in rows:
         try:
-            # Prefer encrypted column, fall back to original
+            # Prefer encrypted column, fall back to original. Completed
+            # transcripts don't change, so repeat reads hit the plaintext cache.
             if row.get("transcript_encrypted"):
-                transcript = decrypt_json(row["transcript_encrypted"])
+                transcript = decrypt_json(row["transcript_encrypted"], cache=True)
             else:
                 transcript = row["transcript"]
             if isinstance(transcript, str):
@@ -34,6 +34,8 @@ TABLE_DATE_COLUMNS: dict[str, str] = {
     "notifications": "sent_at",
     "waitlist": "created_at",
     "audit_logs": "created_at",
+    "conversation_transcript_chunks": "created_at",
+    "post_call_jobs": "created_at",
 }
 
 ALLOWED_TABLES = frozenset(TABLE_DATE_COLUMNS.keys())
@@ -87,7 +89,10 @@ async def _purge_table(table: str, date_column: str, retention_days: int) -> int
 
 
 async def _redact_conversation_phi(retention_days: int) -> int:
-    """Null old conversation transcripts/summaries while retaining metadata."""
+    """Null old conversation transcripts/summaries while retaining metadata.
+
+    Also deletes draft transcript chunks older than the same retention period.
+    """
     total_redacted = 0
 
     while True:
@@ -126,6 +131,13 @@ async def _redact_conversation_phi(retention_days: int) -> int:
             break
         await asyncio.sleep(0.1)
 
+    # Draft transcript chunks are normally removed at call end; purge any
+    # left behind by calls that never completed.
+    total_redacted += await _purge_table("conversation_transcript_chunks", "created_at", retention_days)
+    # Post-call jobs are deleted when they finish; failed ones still carry an
+    # encrypted transcript snapshot.
+    total_redacted += await _purge_table("post_call_jobs", "created_at", retention_days)
+
     return total_redacted
 
 
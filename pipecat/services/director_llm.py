@@ -1,27 +1,38 @@
 """Conversation Director — Layer 2 LLM analysis.
 
 Primary: Groq (OpenAI-compatible) for ultra-fast analysis.
-Fallback: Gemini Flash when Groq is unavailable.
+Fallback: Gemini Flash when Groq is unavailable. Full analysis hedges: if
+Groq has not answered within its recent p95 latency, Gemini is fired too
+and the first valid result wins.
 
 Results are cached and injected into the LLM context by
 ConversationDirectorProcessor. Speculative analysis during silence gaps
 enables same-turn guidance injection.
 
+Provider results are also memoized per call (in session_state), keyed by
+the normalized user message and history, so continuous speculative,
+silence-timer and fallback analyses of the same words share one request.
+
 Not in the blocking path — called asynchronously from the processor.
 """
 
 from __future__ import annotations
 
 import asyncio
+import copy
+import hashlib
 import json
+import math
 import os
 import re
 import time
+from collections import OrderedDict, deque
 from datetime import datetime
 
 from loguru import logger
 
 from lib.circuit_breaker import CircuitBreaker
+from lib.json_stream import JSONStreamParser
 from services.time_context import get_timezone
 
 # ---------------------------------------------------------------------------
@@ -83,11 +94,124 @@ def groq_available() -> bool:
     return bool(os.environ.get("GROQ_API_KEY"))
 
 
+def gemini_available() -> bool:
+    """Check if Gemini is configured (has API key)."""
+    return bool(os.environ.get("GOOGLE_API_KEY"))
+
+
 def fast_provider_available() -> bool:
     """Check if any fast inference provider is configured."""
     return groq_available()
 
 
+# ---------------------------------------------------------------------------
+# Hedged requests
+# ---------------------------------------------------------------------------
+
+HEDGE_ENABLED = os.environ.get("DIRECTOR_HEDGE_ENABLED", "true").lower() not in ("0", "false", "no")
+HEDGE_DEFAULT_DELAY_S = 1.5   # until the primary has enough samples
+HEDGE_MIN_DELAY_S = 0.3
+HEDGE_MAX_DELAY_S = 3.0
+_LATENCY_WINDOW = 100
+_LATENCY_MIN_SAMPLES = 10
+
+
+class _LatencyTracker:
+    """Rolling window of response times for one provider.
+
+    Calls cancelled after losing a hedge race are recorded at their elapsed
+    time, a lower bound; dropping them would discard the slowest samples and
+    drag p95 (and so the hedge delay) down.
+    """
+
+    def __init__(self, window: int = _LATENCY_WINDOW):
+        self._samples: deque[float] = deque(maxlen=window)
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def p95(self) -> float | None:
+        if len(self._samples) < _LATENCY_MIN_SAMPLES:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[max(0, math.ceil(len(ordered) * 0.95) - 1)]
+
+
+_provider_latency = {"groq": _LatencyTracker(), "gemini": _LatencyTracker()}
+
+
+def _hedge_delay(provider: str) -> float:
+    p95 = _provider_latency[provider].p95()
+    if p95 is None:
+        return HEDGE_DEFAULT_DELAY_S
+    return min(max(p95, HEDGE_MIN_DELAY_S), HEDGE_MAX_DELAY_S)
+
+
+async def _timed(provider: str, coro) -> tuple[str, dict | None, float]:
+    """Await a provider call; record its latency when it returns a result or is cancelled."""
+    start = time.monotonic()
+    try:
+        result = await coro
+    except asyncio.CancelledError:
+        _provider_latency[provider].record(time.monotonic() - start)
+        raise
+    except Exception as e:
+        logger.warning("[Director] {p} failed: {err}", p=provider, err=str(e))
+        result = None
+    elapsed = time.monotonic() - start
+    if result is not None:
+        _provider_latency[provider].record(elapsed)
+    return provider, result, elapsed
+
+
+async def _hedged_analyze(
+    turn_content: str, on_field=None
+) -> tuple[dict | None, str | None, dict | None]:
+    """Groq first; add Gemini if Groq is still pending after its p95.
+
+    Returns ``(direction, winner, hedge)``. ``hedge`` is None when the
+    secondary was never fired, otherwise a dict describing the race for the
+    context trace. The slower provider is cancelled as soon as either one
+    returns valid JSON.
+    """
+    delay = _hedge_delay("groq")
+    start = time.monotonic()
+    pending = {asyncio.create_task(_timed("groq", _groq_analyze(turn_content, _groq_breaker, on_field)))}
+    hedge = None
+    try:
+        done, pending = await asyncio.wait(pending, timeout=delay)
+        for task in done:
+            provider, result, _ = task.result()
+            if result is not None:
+                return result, provider, None
+
+        # Groq failed fast (plain fallback) or is still running (hedge).
+        if pending:
+            hedge = {"hedge_delay_ms": round(delay * 1000)}
+        pending.add(asyncio.create_task(_timed("gemini", _gemini_analyze(turn_content))))
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                provider, result, elapsed = task.result()
+                if result is None:
+                    continue
+                if hedge is not None:
+                    # What a Gemini win saved is unknown (Groq was cancelled, not
+                    # finished), so report Gemini's own latency rather than a saving.
+                    hedge.update(
+                        winner=provider,
+                        total_ms=round((time.monotonic() - start) * 1000),
+                        gemini_ms=round(elapsed * 1000) if provider == "gemini" else None,
+                    )
+                return result, provider, hedge
+        if hedge is not None:
+            hedge.update(winner=None, total_ms=round((time.monotonic() - start) * 1000), gemini_ms=None)
+        return None, None, hedge
+    finally:
+        for task in pending:
+            task.cancel()
+
+
 # ---------------------------------------------------------------------------
 # JSON repair (ported from fast-observer.js)
 # ---------------------------------------------------------------------------
@@ -351,41 +475,193 @@ def format_director_guidance(direction: dict) -> str | None:
     return " | ".join(parts) if parts else None
 
 
+# ---------------------------------------------------------------------------
+# Per-call result cache
+# ---------------------------------------------------------------------------
+
+# Entries kept per call and kind; a call rarely revisits older turns.
+_MAX_CACHED_RESULTS = 32
+_NORMALIZE_STRIP = re.compile(r"[^\w\s']+")
+
+
+def _normalize_text(text) -> str:
+    """Lowercase, drop punctuation and collapse whitespace.
+
+    STT interim and final transcripts of the same words differ mostly in
+    casing, punctuation and spacing.
+    """
+    return " ".join(_NORMALIZE_STRIP.sub(" ", str(text or "")).lower().split())
+
+
+def _result_key(
+    user_message: str,
+    session_state: dict,
+    conversation_history: list[dict] | None,
+    history_turns: int,
+) -> str:
+    """Stable key for a Director request within one call.
+
+    Elapsed minutes are left out on purpose (they change between speculative
+    and final analysis of the same turn); reminder state is kept so a result
+    never suggests a reminder that has since been delivered.
+    """
+    history = (conversation_history or [])[-history_turns:]
+    delivered = session_state.get("reminders_delivered") or ()
+    parts = [
+        _normalize_text(user_message),
+        *(f"{m.get('role')}:{_normalize_text(m.get('content'))}" for m in history),
+        ",".join(sorted(str(d) for d in delivered)),
+        str(len(session_state.get("_pending_reminders") or [])),
+    ]
+    return hashlib.sha1("\x1f".join(parts).encode()).hexdigest()
+
+
+def _call_cache(session_state: dict) -> dict:
+    cache = session_state.get("_director_cache")
+    if cache is None:
+        cache = {
+            "results": {"turn": OrderedDict(), "query": OrderedDict()},
+            "inflight": {},
+            "stats": {"hits": 0, "coalesced": 0, "misses": 0},
+        }
+        session_state["_director_cache"] = cache
+    return cache
+
+
+async def _cached_call(session_state: dict, kind: str, key: str, compute) -> dict | None:
+    """Return a cached or in-flight result for ``key``, else run ``compute``.
+
+    Only successful (non-None) results are cached. A caller that joins an
+    in-flight request which comes back empty runs its own request, so a
+    failed speculative call never starves the fallback analysis.
+    """
+    cache = _call_cache(session_state)
+    results = cache["results"][kind]
+    stats = cache["stats"]
+    if key in results:
+        results.move_to_end(key)
+        stats["hits"] += 1
+        return copy.deepcopy(results[key])
+
+    inflight = cache["inflight"].get((kind, key))
+    if inflight is not None:
+        result = await asyncio.shield(inflight)
+        if result is not None:
+            stats["coalesced"] += 1
+            return copy.deepcopy(result)
+
+    stats["misses"] += 1
+    future = asyncio.get_running_loop().create_future()
+    cache["inflight"][(kind, key)] = future
+    result = None
+    try:
+        result = await compute()
+    finally:
+        if cache["inflight"].get((kind, key)) is future:
+            del cache["inflight"][(kind, key)]
+        if not future.done():
+            future.set_result(result)
+    if result is not None:
+        results[key] = result
+        while len(results) > _MAX_CACHED_RESULTS:
+            results.popitem(last=False)
+        return copy.deepcopy(result)
+    return None
+
+
+def get_cache_stats(session_state: dict) -> dict:
+    """Hit/coalesce/miss counters for this call's Director result cache."""
+    cache = session_state.get("_director_cache")
+    stats = dict(cache["stats"]) if cache else {"hits": 0, "coalesced": 0, "misses": 0}
+    total = stats["hits"] + stats["coalesced"] + stats["misses"]
+    stats["hit_rate"] = round((stats["hits"] + stats["coalesced"]) / total, 3) if total else 0.0
+    return stats
+
+
 # ---------------------------------------------------------------------------
 # Provider-specific analysis functions
 # ---------------------------------------------------------------------------
 
 
+async def _stream_completion(
+    client,
+    *,
+    model: str,
+    system: str,
+    content: str,
+    temperature: float,
+    max_tokens: int,
+    on_field=None,
+    field_depth: int = 1,
+) -> str:
+    """Stream a chat completion and return its full text.
+
+    With ``on_field``, each JSON value up to ``field_depth`` is passed to
+    ``on_field(path, value)`` as soon as it is complete, before the model
+    has finished generating. Callback errors are logged and ignored.
+    """
+    stream = await client.chat.completions.create(
+        model=model,
+        messages=[
+            {"role": "system", "content": system},
+            {"role": "user", "content": content},
+        ],
+        temperature=temperature,
+        max_tokens=max_tokens,
+        stream=True,
+    )
+    parser = JSONStreamParser(max_depth=field_depth) if on_field else None
+    parts: list[str] = []
+    async for chunk in stream:
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta.content
+        if not delta:
+            continue
+        parts.append(delta)
+        if parser is None:
+            continue
+        for path, value in parser.feed(delta):
+            try:
+                on_field(path, value)
+            except Exception as e:
+                logger.debug("[Director] Field callback error: {err}", err=str(e))
+    return "".join(parts)
+
+
 async def _openai_compatible_analyze(
-    client, model: str, turn_content: str, breaker: CircuitBreaker
+    client, model: str, turn_content: str, breaker: CircuitBreaker, on_field=None
 ) -> dict | None:
-    """Run analysis via any OpenAI-compatible provider. Returns parsed dict or None."""
+    """Run analysis via any OpenAI-compatible provider. Returns parsed dict or None.
+
+    Top-level sections (``analysis``, ``direction``, ...) are reported to
+    ``on_field`` as they stream in.
+    """
     if client is None:
         return None
 
-    async def _call():
-        response = await client.chat.completions.create(
+    text = await breaker.call(
+        _stream_completion(
+            client,
             model=model,
-            messages=[
-                {"role": "system", "content": DIRECTOR_SYSTEM_INSTRUCTION},
-                {"role": "user", "content": turn_content},
-            ],
+            system=DIRECTOR_SYSTEM_INSTRUCTION,
+            content=turn_content,
             temperature=0.2,
             max_tokens=500,
-        )
-        return response.choices[0].message.content or ""
-
-    text = await breaker.call(_call(), fallback=None)
+            on_field=on_field,
+        ),
+        fallback=None,
+    )
     if text is None:
         return None
 
     return _extract_and_parse_json(text)
 
 
-async def _groq_analyze(turn_content: str, breaker: CircuitBreaker) -> dict | None:
+async def _groq_analyze(turn_content: str, breaker: CircuitBreaker, on_field=None) -> dict | None:
     """Run analysis via Groq. Returns parsed dict or None."""
     return await _openai_compatible_analyze(
-        _get_groq_client(), GROQ_MODEL, turn_content, breaker
+        _get_groq_client(), GROQ_MODEL, turn_content, breaker, on_field
     )
 
 
@@ -429,40 +705,65 @@ async def analyze_turn(
     user_message: str,
     session_state: dict,
     conversation_history: list[dict] | None = None,
+    on_field=None,
 ) -> dict:
     """Run Director analysis. Groq primary, Gemini fallback.
 
     Non-blocking caller should ``await`` this in a background task.
     Returns structured direction dict, or default on failure.
+    ``on_field(path, value)`` receives each top-level section as soon as
+    Groq has streamed it (not called on cache hits or Gemini results).
     """
+    key = _result_key(user_message, session_state, conversation_history, 6)
+    direction = await _cached_call(
+        session_state,
+        "turn",
+        key,
+        lambda: _analyze_turn_uncached(user_message, session_state, conversation_history, on_field),
+    )
+    return direction if direction is not None else get_default_direction()
+
+
+async def _analyze_turn_uncached(
+    user_message: str,
+    session_state: dict,
+    conversation_history: list[dict] | None,
+    on_field=None,
+) -> dict | None:
     start = time.time()
     turn_content = _build_turn_content(user_message, session_state, conversation_history)
 
-    # Groq primary, Gemini fallback
+    # Groq primary, Gemini fallback (hedged when both are configured)
     direction = None
     source = "gemini"
 
-    if groq_available():
-        try:
-            direction = await _groq_analyze(turn_content, _groq_breaker)
-            if direction:
-                source = "groq"
-        except Exception as e:
-            logger.warning("[Director] Groq failed: {err}", err=str(e))
-
-    # Gemini fallback
-    if direction is None:
-        try:
-            direction = await _gemini_analyze(turn_content)
-            if direction:
-                source = "gemini"
-        except Exception as e:
-            logger.error("[Director] All providers failed: {err}", err=str(e))
+    if HEDGE_ENABLED and groq_available() and gemini_available():
+        direction, winner, hedge = await _hedged_analyze(turn_content, on_field)
+        source = winner or source
+        if hedge is not None:
+            _record_hedge(session_state, hedge)
+    else:
+        if groq_available():
+            try:
+                direction = await _groq_analyze(turn_content, _groq_breaker, on_field)
+                if direction:
+                    source = "groq"
+            except Exception as e:
+                logger.warning("[Director] Groq failed: {err}", err=str(e))
+
+        # Gemini fallback
+        if direction is None:
+            try:
+                direction = await _gemini_analyze(turn_content)
+                if direction:
+                    source = "gemini"
+            except Exception as e:
+                logger.error("[Director] All providers failed: {err}", err=str(e))
 
     if direction is None:
         elapsed_ms = round((time.time() - start) * 1000)
         logger.error("[Director] All providers failed ({ms}ms)", ms=elapsed_ms)
-        return get_default_direction()
+        return None
 
     elapsed_ms = round((time.time() - start) * 1000)
     logger.info(
@@ -477,19 +778,58 @@ async def analyze_turn(
     return direction
 
 
+def _record_hedge(session_state: dict, hedge: dict) -> None:
+    from services.context_trace import record_latency_event
+
+    logger.info(
+        "[Director] Hedged after {d}ms: {w} won in {t}ms (gemini {g}ms)",
+        d=hedge["hedge_delay_ms"],
+        w=hedge["winner"] or "none",
+        t=hedge["total_ms"],
+        g=hedge["gemini_ms"],
+    )
+    record_latency_event(
+        session_state,
+        stage="director.hedge",
+        source="director_guidance",
+        action="hedged",
+        label="Director hedged analysis",
+        provider=hedge["winner"],
+        latency_ms=hedge["total_ms"],
+        metadata=dict(hedge),
+    )
+
+
 async def analyze_turn_speculative(
     user_message: str,
     session_state: dict,
     conversation_history: list[dict] | None = None,
+    on_field=None,
 ) -> dict | None:
     """Run speculative analysis via the fast provider (Groq).
 
     Uses the speculative circuit breaker (shorter timeout, lower threshold).
     Does NOT fall back to Gemini - speculative uses the fast provider only.
+    ``on_field`` behaves as in :func:`analyze_turn`.
     """
     if not fast_provider_available():
         return None
 
+    key = _result_key(user_message, session_state, conversation_history, 6)
+    return await _cached_call(
+        session_state,
+        "turn",
+        key,
+        lambda: _analyze_turn_speculative_uncached(user_message, session_state, conversation_history, on_field),
+    )
+
+
+async def _analyze_turn_speculative_uncached(
+    user_message: str,
+    session_state: dict,
+    conversation_history: list[dict] | None,
+    on_field=None,
+) -> dict | None:
     start = time.time()
     turn_content = _build_turn_content(user_message, session_state, conversation_history)
 
@@ -498,9 +838,10 @@ async def analyze_turn_speculative(
 
     if groq_available():
         try:
-            direction = await _groq_analyze(turn_content, _groq_speculative_breaker)
+            direction = await _groq_analyze(turn_content, _groq_speculative_breaker, on_field)
             if direction:
                 source = "groq"
+                _provider_latency["groq"].record(time.time() - start)
         except Exception as e:
             logger.debug("[Director] Speculative Groq failed: {err}", err=str(e))
 
@@ -524,16 +865,34 @@ async def analyze_queries(
     user_message: str,
     session_state: dict,
     conversation_history: list[dict] | None = None,
+    on_field=None,
 ) -> dict | None:
     """Run query-only analysis via Groq (fast, minimal prompt).
 
     Extracts memory_queries for prefetch.
     Returns {"memory_queries": [...]} or None.
     No fallback — purely opportunistic.
+    ``on_field`` receives each query as ``(("memory_queries", i), query)``
+    the moment it has streamed, then the full list.
     """
     if not fast_provider_available():
         return None
 
+    key = _result_key(user_message, session_state, conversation_history, 2)
+    return await _cached_call(
+        session_state,
+        "query",
+        key,
+        lambda: _analyze_queries_uncached(user_message, session_state, conversation_history, on_field),
+    )
+
+
+async def _analyze_queries_uncached(
+    user_message: str,
+    session_state: dict,
+    conversation_history: list[dict] | None,
+    on_field=None,
+) -> dict | None:
     start = time.time()
     content = _build_query_content(user_message, session_state, conversation_history)
 
@@ -541,19 +900,19 @@ async def analyze_queries(
     if client is None:
         return None
 
-    async def _call():
-        response = await client.chat.completions.create(
+    text = await _groq_query_breaker.call(
+        _stream_completion(
+            client,
             model=GROQ_MODEL,
-            messages=[
-                {"role": "system", "content": QUERY_SYSTEM_INSTRUCTION},
-                {"role": "user", "content": content},
-            ],
+            system=QUERY_SYSTEM_INSTRUCTION,
+            content=content,
             temperature=0.1,
             max_tokens=150,
-        )
-        return response.choices[0].message.content or ""
-
-    text = await _groq_query_breaker.call(_call(), fallback=None)
+            on_field=on_field,
+            field_depth=2,
+        ),
+        fallback=None,
+    )
     if text is None:
         return None
 
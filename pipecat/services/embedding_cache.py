@@ -0,0 +1,176 @@
+"""Content-hash keyed cache for OpenAI embeddings.
+
+The same query text is embedded repeatedly within a call (speculative
+prefetch, Director memory queries, final-turn prefetch) and again during
+post-call extraction and dedup. Entries are keyed by a SHA-256 of the model
+plus whitespace-normalized text, held as compact float32 arrays in a bounded
+LRU with a TTL, and shared by every call in the process.
+
+When ``EMBEDDING_CACHE_SHARED`` is set, local misses also consult the shared
+state store (Redis/Upstash) so other instances benefit; payloads there are
+encrypted like other PHI-adjacent shared state.
+
+Concurrent requests for the same text share one in-flight OpenAI request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import time
+from array import array
+from collections import OrderedDict
+
+from loguru import logger
+
+MAX_ENTRIES = 4096          # ~6 KB each for 1536-dim float32 vectors
+TTL_SECONDS = 24 * 60 * 60
+SHARED_KEY_PREFIX = "embedding:"
+
+_entries: OrderedDict[str, tuple[array, float]] = OrderedDict()
+_inflight: dict[str, asyncio.Future] = {}
+_stats = {"hits": 0, "shared_hits": 0, "misses": 0, "coalesced": 0, "evictions": 0}
+
+
+def cache_key(model: str, text: str) -> str:
+    normalized = " ".join(text.split())
+    return hashlib.sha256(f"{model}\n{normalized}".encode("utf-8")).hexdigest()
+
+
+def _shared_enabled() -> bool:
+    from config import get_settings
+
+    return get_settings().embedding_cache_shared
+
+
+def get_local(key: str) -> list[float] | None:
+    entry = _entries.get(key)
+    if entry is None:
+        return None
+    vector, stored_at = entry
+    if time.time() - stored_at > TTL_SECONDS:
+        del _entries[key]
+        return None
+    _entries.move_to_end(key)
+    return vector.tolist()
+
+
+def put_local(key: str, embedding: list[float]) -> None:
+    _entries[key] = (array("f", embedding), time.time())
+    _entries.move_to_end(key)
+    while len(_entries) > MAX_ENTRIES:
+        _entries.popitem(last=False)
+        _stats["evictions"] += 1
+
+
+async def _get_shared(key: str) -> list[float] | None:
+    try:
+        from lib.redis_client import get_shared_state
+        from lib.shared_state_phi import decode_phi_payload
+
+        state = get_shared_state()
+        if not state.is_shared:
+            return None
+        payload = decode_phi_payload(await state.get(SHARED_KEY_PREFIX + key), label="embedding cache")
+        return payload.get("embedding") if payload else None
+    except Exception as e:
+        logger.debug("[EmbeddingCache] Shared lookup failed: {err}", err=str(e))
+        return None
+
+
+async def _put_shared(key: str, embedding: list[float]) -> None:
+    try:
+        from lib.redis_client import get_shared_state
+        from lib.shared_state_phi import encode_phi_payload
+
+        state = get_shared_state()
+        if not state.is_shared:
+            return
+        payload = encode_phi_payload({"embedding": embedding})
+        if payload is not None:
+            await state.set(SHARED_KEY_PREFIX + key, payload, ttl=TTL_SECONDS)
+    except Exception as e:
+        logger.debug("[EmbeddingCache] Shared store failed: {err}", err=str(e))
+
+
+async def lookup(key: str) -> list[float] | None:
+    """Return a cached embedding from the local LRU, then shared state."""
+    embedding = get_local(key)
+    if embedding is not None:
+        _stats["hits"] += 1
+        return embedding
+    if _shared_enabled():
+        embedding = await _get_shared(key)
+        if embedding is not None:
+            put_local(key, embedding)
+            _stats["shared_hits"] += 1
+            return embedding
+    _stats["misses"] += 1
+    return None
+
+
+async def store(key: str, embedding: list[float]) -> None:
+    put_local(key, embedding)
+    if _shared_enabled():
+        await _put_shared(key, embedding)
+
+
+async def get_or_compute(key: str, compute) -> list[float] | None:
+    """Cached embedding for ``key``, computing it at most once concurrently.
+
+    ``compute`` is a zero-arg coroutine function returning the embedding or
+    ``None``; ``None`` results (breaker open, no API key) are not cached.
+    """
+    embedding = await lookup(key)
+    if embedding is not None:
+        return embedding
+
+    pending = _inflight.get(key)
+    if pending is not None:
+        _stats["coalesced"] += 1
+        return await asyncio.shield(pending)
+
+    future = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        embedding = await compute()
+        if embedding is not None:
+            await store(key, embedding)
+        future.set_result(embedding)
+        return embedding
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        # Waiters re-raise; mark retrieved so a lone future doesn't warn.
+        future.exception()
+        raise
+    finally:
+        _inflight.pop(key, None)
+
+
+def cleanup_expired() -> int:
+    now = time.time()
+    expired = [k for k, (_, stored_at) in _entries.items() if now - stored_at > TTL_SECONDS]
+    for key in expired:
+        del _entries[key]
+    return len(expired)
+
+
+def clear() -> None:
+    _entries.clear()
+    _inflight.clear()
+    for key in _stats:
+        _stats[key] = 0
+
+
+def get_stats() -> dict:
+    lookups = _stats["hits"] + _stats["shared_hits"] + _stats["misses"]
+    return {
+        "entries": len(_entries),
+        "max_entries": MAX_ENTRIES,
+        "bytes": sum(v.itemsize * len(v) for v, _ in _entries.values()),
+        **_stats,
+        "hit_rate": round((_stats["hits"] + _stats["shared_hits"]) / lookups, 4) if lookups else 0.0,
+    }
@@ -51,12 +51,18 @@ async def hard_delete_senior(
                 ("call_metrics", "SELECT COUNT(*) FROM call_metrics WHERE senior_id = $1"),
                 ("memories", "SELECT COUNT(*) FROM memories WHERE senior_id = $1"),
                 ("conversations", "SELECT COUNT(*) FROM conversations WHERE senior_id = $1"),
+                ("post_call_jobs", "SELECT COUNT(*) FROM post_call_jobs WHERE senior_id = $1"),
             ]
             for table, sql in count_queries:
                 row = await conn.fetchval(sql, senior_id)
                 counts[table] = row or 0
 
             # 2. DELETE in dependency order (deepest children first)
+            # post_call_jobs hold the encrypted transcript snapshot (migration 013);
+            # removing pending ones also stops a worker running against this senior.
+            await conn.execute(
+                "DELETE FROM post_call_jobs WHERE senior_id = $1", senior_id
+            )
             # notification_preferences → caregivers(id)
             await conn.execute(
                 """DELETE FROM notification_preferences
@@ -127,6 +133,10 @@ async def hard_delete_senior(
                 json.dumps(counts),
             )
 
+    # Drops the memory index too; the shared tier holds encrypted PHI.
+    from services.context_cache import clear_cache_async
+    await clear_cache_async(senior_id)
+
     total = sum(counts.values())
     logger.info(
         "Hard-deleted senior {sid}: {total} records across {tables} tables",
@@ -6,6 +6,7 @@ Uses OpenAI text-embedding-3-small for embeddings, pgvector for similarity searc
 
 from __future__ import annotations
 
+import asyncio
 import json
 import math
 import os
@@ -14,16 +15,19 @@ from datetime import datetime, timezone
 from loguru import logger
 
 from lib.circuit_breaker import CircuitBreaker
-from lib.encryption import encrypt, decrypt
+from lib.encryption import encrypt, decrypt_many
 from services.time_context import format_call_time_label, format_local_datetime
 
 _embedding_breaker = CircuitBreaker("openai_embedding", failure_threshold=3, recovery_timeout=60.0, call_timeout=10.0)
 
 _openai_client = None
+_mark_accessed_tasks: set[asyncio.Task] = set()
 
 DECAY_HALF_LIFE_DAYS = 30
 ACCESS_BOOST = 10
 MAX_IMPORTANCE = 100
+EMBEDDING_MODEL = "text-embedding-3-small"
+EMBEDDING_BATCH_SIZE = 256
 _TEMPORAL_REFERENCE_RE = re.compile(
     r"\b(today|tomorrow|yesterday|tonight|this morning|this afternoon|this evening|"
     r"next (day|week|month|time)|last (night|week|month)|later today|upcoming)\b",
@@ -73,16 +77,69 @@ def _calculate_effective_importance(
 # ---------------------------------------------------------------------------
 
 async def generate_embedding(text: str) -> list[float] | None:
-    """Generate an embedding vector using OpenAI text-embedding-3-small."""
+    """Generate an embedding vector using OpenAI text-embedding-3-small.
+
+    Results are cached by content hash (see ``services/embedding_cache``).
+    """
     client = _get_openai()
     if client is None:
         return None
 
+    from services import embedding_cache
+
     async def _embed():
-        response = await client.embeddings.create(model="text-embedding-3-small", input=text)
+        response = await client.embeddings.create(model=EMBEDDING_MODEL, input=text)
         return response.data[0].embedding
 
-    return await _embedding_breaker.call(_embed(), fallback=None)
+    async def _compute():
+        return await _embedding_breaker.call(_embed(), fallback=None)
+
+    return await embedding_cache.get_or_compute(embedding_cache.cache_key(EMBEDDING_MODEL, text), _compute)
+
+
+async def generate_embeddings(texts: list[str]) -> list[list[float] | None]:
+    """Embed many texts with one OpenAI request per ``EMBEDDING_BATCH_SIZE``.
+
+    Returns one entry per input, in order; cached and duplicate texts are not
+    re-sent. Entries are ``None`` when embedding is unavailable.
+    """
+    if not texts:
+        return []
+    client = _get_openai()
+    if client is None:
+        return [None] * len(texts)
+
+    from services import embedding_cache
+
+    keys = [embedding_cache.cache_key(EMBEDDING_MODEL, t) for t in texts]
+    found: dict[str, list[float] | None] = {}
+    missing: dict[str, str] = {}
+    for key, text in zip(keys, texts):
+        if key in found or key in missing:
+            continue
+        cached = await embedding_cache.lookup(key)
+        if cached is not None:
+            found[key] = cached
+        else:
+            missing[key] = text
+
+    async def _embed_batch(inputs: list[str]):
+        response = await client.embeddings.create(model=EMBEDDING_MODEL, input=inputs)
+        return [item.embedding for item in sorted(response.data, key=lambda d: d.index)]
+
+    pending = list(missing.items())
+    for start in range(0, len(pending), EMBEDDING_BATCH_SIZE):
+        chunk = pending[start:start + EMBEDDING_BATCH_SIZE]
+        vectors = await _embedding_breaker.call(_embed_batch([text for _, text in chunk]), fallback=None)
+        if vectors is None or len(vectors) != len(chunk):
+            for key, _ in chunk:
+                found[key] = None
+            continue
+        for (key, _), vector in zip(chunk, vectors):
+            found[key] = vector
+            await embedding_cache.store(key, vector)
+
+    return [found.get(key) for key in keys]
 
 
 async def store(
@@ -93,10 +150,12 @@ async def store(
     importance: int = 50,
     metadata: dict | None = None,
     prospect_id: str | None = None,
+    embedding: list[float] | None = None,
 ) -> dict | None:
     """Store a memory with deduplication (cosine similarity > 0.9 = duplicate).
 
     Pass senior_id for subscriber memories, prospect_id for onboarding caller memories.
+    Pass ``embedding`` when it was already computed (e.g. by ``generate_embeddings``).
     """
     from db import query_one, query_many
 
@@ -106,7 +165,8 @@ async def store(
         logger.warning("store() called with no senior_id or prospect_id")
         return None
 
-    embedding = await generate_embedding(content)
+    if embedding is None:
+        embedding = await generate_embedding(content)
     if embedding is None:
         logger.info("Skipping store — OpenAI not configured")
         return None
@@ -139,6 +199,11 @@ async def store(
                 existing["id"],
             )
             logger.info("Updated importance {old} -> {new}", old=existing["importance"], new=importance)
+            if senior_id:
+                from services import memory_index
+
+                memory_index.update_importance(senior_id, existing["id"], importance)
+                await memory_index.publish_write(senior_id)
         return None
 
     row = await query_one(
@@ -161,9 +226,192 @@ async def store(
         type=type_,
         chars=len(content),
     )
+    if row and senior_id:
+        from services import memory_index
+
+        memory_index.add_memory(senior_id, {**row, "content": content}, embedding)
+        await memory_index.publish_write(senior_id)
     return row
 
 
+DEDUP_SIMILARITY = 0.9
+
+
+def _cosine(a: list[float], b: list[float], norm_a: float, norm_b: float) -> float:
+    if not norm_a or not norm_b:
+        return 0.0
+    return sum(x * y for x, y in zip(a, b)) / (norm_a * norm_b)
+
+
+async def store_many(
+    senior_id: str | None,
+    items: list[dict],
+    source: str | None = None,
+    prospect_id: str | None = None,
+) -> list[dict]:
+    """Store several memories with set-based deduplication.
+
+    Equivalent to calling ``store`` for each item in order, in at most four
+    round trips: one embeddings request, one dedup query covering every
+    candidate, one importance update and one multi-row INSERT. Each item is a
+    dict with ``type``, ``content`` and optional ``importance``, ``metadata``
+    and ``embedding``.
+
+    Returns one outcome per item: ``{"status": "inserted", "row": ...}``,
+    ``{"status": "duplicate", "duplicate_of": id, "similarity": ...}`` or
+    ``{"status": "skipped", "reason": ...}``.
+    """
+    from db import query_many
+
+    owner_col = "senior_id" if senior_id else "prospect_id"
+    owner_id = senior_id or prospect_id
+    outcomes: list[dict] = [{"status": "skipped", "reason": "no_content"} for _ in items]
+    if not owner_id:
+        logger.warning("store_many() called with no senior_id or prospect_id")
+        return [{"status": "skipped", "reason": "no_owner"} for _ in items]
+
+    candidates = [i for i, item in enumerate(items) if item.get("content")]
+    missing = [i for i in candidates if items[i].get("embedding") is None]
+    if missing:
+        computed = await generate_embeddings([items[i]["content"] for i in missing])
+        embeddings = {i: e for i, e in zip(missing, computed)}
+    else:
+        embeddings = {}
+    for i in candidates:
+        embeddings.setdefault(i, items[i].get("embedding"))
+    for i in candidates:
+        if embeddings[i] is None:
+            outcomes[i] = {"status": "skipped", "reason": "no_embedding"}
+    candidates = [i for i in candidates if embeddings[i] is not None]
+    if not candidates:
+        return outcomes
+
+    emb_strs = {i: json.dumps(embeddings[i]) for i in candidates}
+
+    # Best existing match above the threshold for every candidate, in one query.
+    existing_rows = await query_many(
+        f"""SELECT c.idx, m.id, m.importance, m.similarity
+           FROM unnest($1::text[], $2::int[]) AS c(emb, idx)
+           CROSS JOIN LATERAL (
+               SELECT id, importance, 1 - (embedding <=> c.emb::vector) AS similarity
+               FROM memories
+               WHERE {owner_col} = $3
+                 AND 1 - (embedding <=> c.emb::vector) > {DEDUP_SIMILARITY}
+               ORDER BY embedding <=> c.emb::vector
+               LIMIT 1
+           ) m""",
+        [emb_strs[i] for i in candidates],
+        candidates,
+        owner_id,
+    )
+    existing = {r["idx"]: r for r in existing_rows}
+
+    # Walk candidates in order so earlier survivors dedup later ones, as the
+    # sequential store() loop would see them once inserted.
+    norms = {i: math.sqrt(sum(x * x for x in embeddings[i])) for i in candidates}
+    survivors: list[int] = []
+    importance = {i: items[i].get("importance", 50) for i in candidates}
+    existing_updates: dict = {}
+    for i in candidates:
+        best_sim, best_db, best_batch = 0.0, None, None
+        if i in existing:
+            best_sim, best_db = existing[i]["similarity"], existing[i]
+        for j in survivors:
+            sim = _cosine(embeddings[i], embeddings[j], norms[i], norms[j])
+            if sim > DEDUP_SIMILARITY and sim > best_sim:
+                best_sim, best_db, best_batch = sim, None, j
+        if best_db is None and best_batch is None:
+            survivors.append(i)
+            continue
+        if best_batch is not None:
+            importance[best_batch] = max(importance[best_batch], importance[i])
+            outcomes[i] = {"status": "duplicate", "duplicate_of_item": best_batch, "similarity": best_sim}
+        else:
+            current = existing_updates.get(best_db["id"], best_db["importance"])
+            if importance[i] > current:
+                existing_updates[best_db["id"]] = importance[i]
+            outcomes[i] = {"status": "duplicate", "duplicate_of": best_db["id"], "similarity": best_sim}
+
+    if existing_updates:
+        ids = list(existing_updates)
+        await query_many(
+            """UPDATE memories m
+               SET importance = u.importance, last_accessed_at = NOW()
+               FROM unnest($1::uuid[], $2::int[]) AS u(id, importance)
+               WHERE m.id = u.id
+               RETURNING m.id""",
+            ids,
+            [existing_updates[k] for k in ids],
+        )
+        if senior_id:
+            from services import memory_index
+
+            for memory_id, new_importance in existing_updates.items():
+                memory_index.update_importance(senior_id, memory_id, new_importance)
+
+    if survivors:
+        encrypted = {i: encrypt(items[i]["content"]) for i in survivors}
+        rows = await query_many(
+            f"""INSERT INTO memories ({owner_col}, type, content, content_encrypted, source, importance, embedding, metadata)
+               SELECT $1, t.type, '[encrypted]', t.content_encrypted, $2, t.importance, t.embedding::vector, t.metadata::json
+               FROM unnest($3::text[], $4::text[], $5::int[], $6::text[], $7::text[])
+                    WITH ORDINALITY AS t(type, content_encrypted, importance, embedding, metadata, ord)
+               ORDER BY t.ord
+               RETURNING *""",
+            owner_id,
+            source,
+            [items[i].get("type", "fact") for i in survivors],
+            [encrypted[i] for i in survivors],
+            [importance[i] for i in survivors],
+            [emb_strs[i] for i in survivors],
+            [json.dumps(items[i]["metadata"]) if items[i].get("metadata") else None for i in survivors],
+        )
+        # content_encrypted is unique per row (random nonce), so it maps rows back to items.
+        by_ciphertext = {r.get("content_encrypted"): r for r in rows}
+        for i in survivors:
+            row = by_ciphertext.get(encrypted[i])
+            if row is None:
+                outcomes[i] = {"status": "skipped", "reason": "insert_failed"}
+                continue
+            outcomes[i] = {"status": "inserted", "row": row}
+            if senior_id:
+                from services import memory_index
+
+                memory_index.add_memory(senior_id, {**row, "content": items[i]["content"]}, embeddings[i])
+        for i, outcome in enumerate(outcomes):
+            if outcome.get("duplicate_of_item") is not None:
+                source_row = outcomes[outcome.pop("duplicate_of_item")].get("row")
+                outcome["duplicate_of"] = source_row["id"] if source_row else None
+
+    if senior_id and (existing_updates or survivors):
+        from services import memory_index
+
+        await memory_index.publish_write(senior_id)
+
+    inserted = sum(1 for o in outcomes if o["status"] == "inserted")
+    logger.info(
+        "Stored {n}/{total} memories for {col}={sid} ({dupes} duplicates)",
+        n=inserted,
+        total=len(items),
+        col=owner_col,
+        sid=str(owner_id)[:8],
+        dupes=sum(1 for o in outcomes if o["status"] == "duplicate"),
+    )
+    return outcomes
+
+
+def _decrypt_content(rows: list[dict]) -> None:
+    """Replace ``content`` with the decrypted ``content_encrypted`` in place.
+
+    Memory content is never updated in place, so plaintexts are cached.
+    """
+    contents = decrypt_many([r.get("content_encrypted") for r in rows], cache=True)
+    for r, content in zip(rows, contents):
+        if r.get("content_encrypted"):
+            r["content"] = content
+        r.pop("content_encrypted", None)
+
+
 async def search(
     senior_id: str | None, query: str, limit: int = 5, min_similarity: float = 0.45,
     prospect_id: str | None = None,
@@ -185,6 +433,16 @@ async def search(
     if query_embedding is None:
         return []
 
+    if senior_id:
+        from services import memory_index
+
+        await memory_index.ensure_current(senior_id)
+        indexed = memory_index.search(senior_id, query_embedding, limit, min_similarity)
+        if indexed is not None:
+            if indexed and track_access:
+                _spawn_mark_accessed([r["id"] for r in indexed])
+            return indexed
+
     emb_str = json.dumps(query_embedding)
 
     rows = await query_many(
@@ -199,20 +457,33 @@ async def search(
         owner_id,
         min_similarity,
         limit,
+        name=f"memory.search.{owner_col}",
     )
 
     if rows and track_access:
         await mark_accessed([r["id"] for r in rows])
 
     # Decrypt content: prefer encrypted column, fall back to original
-    for r in rows:
-        if r.get("content_encrypted"):
-            r["content"] = decrypt(r["content_encrypted"])
-        r.pop("content_encrypted", None)
+    _decrypt_content(rows)
 
     return rows
 
 
+def _spawn_mark_accessed(memory_ids: list[str]) -> None:
+    """Record access without blocking an index-served search on the DB."""
+
+    async def _run():
+        try:
+            await mark_accessed(memory_ids)
+        except Exception as e:
+            logger.warning("mark_accessed failed: {err}", err=str(e))
+
+    # Hold a reference so the task is not garbage-collected before it runs.
+    task = asyncio.create_task(_run())
+    _mark_accessed_tasks.add(task)
+    task.add_done_callback(_mark_accessed_tasks.discard)
+
+
 async def mark_accessed(memory_ids: list[str]) -> int:
     """Update last_accessed_at for memories that were actually used."""
     from db import execute
@@ -239,10 +510,7 @@ async def get_recent(senior_id: str, limit: int = 10) -> list[dict]:
         senior_id,
         limit,
     )
-    for r in rows:
-        if r.get("content_encrypted"):
-            r["content"] = decrypt(r["content_encrypted"])
-        r.pop("content_encrypted", None)
+    _decrypt_content(rows)
     return rows
 
 
@@ -260,10 +528,7 @@ async def get_important(senior_id: str, limit: int = 5) -> list[dict]:
         limit * 3,
     )
 
-    for r in rows:
-        if r.get("content_encrypted"):
-            r["content"] = decrypt(r["content_encrypted"])
-        r.pop("content_encrypted", None)
+    _decrypt_content(rows)
 
     with_effective = []
     for m in rows:
@@ -291,10 +556,7 @@ async def get_critical(senior_id: str, limit: int = 3) -> list[dict]:
         senior_id,
         limit,
     )
-    for r in rows:
-        if r.get("content_encrypted"):
-            r["content"] = decrypt(r["content_encrypted"])
-        r.pop("content_encrypted", None)
+    _decrypt_content(rows)
     return rows
 
 
@@ -362,10 +624,8 @@ async def build_context(
         senior_id,
     )
 
+    _decrypt_content(all_memories)
     for r in all_memories:
-        if r.get("content_encrypted"):
-            r["content"] = decrypt(r["content_encrypted"])
-        r.pop("content_encrypted", None)
         r["effective_importance"] = _calculate_effective_importance(
             r.get("importance", 50),
             r.get("created_at"),
@@ -516,23 +776,21 @@ async def extract_from_conversation(
         memories_array = result.get("memories", result) if isinstance(result, dict) else result
 
         if isinstance(memories_array, list):
-            stored = 0
-            for mem in memories_array:
-                content = mem.get("content")
-                if not content:
-                    continue
-                try:
-                    await store(
-                        senior_id,
-                        mem.get("type", "fact"),
-                        content,
-                        conversation_id,
-                        mem.get("importance", 50),
-                        prospect_id=prospect_id,
-                    )
-                    stored += 1
-                except Exception as e:
-                    logger.warning("Failed to store memory: {err}", err=str(e))
+            memories_array = [m for m in memories_array if isinstance(m, dict) and m.get("content")]
+            outcomes = await store_many(
+                senior_id,
+                [
+                    {
+                        "type": mem.get("type", "fact"),
+                        "content": mem["content"],
+                        "importance": mem.get("importance", 50),
+                    }
+                    for mem in memories_array
+                ],
+                source=conversation_id,
+                prospect_id=prospect_id,
+            )
+            stored = sum(1 for o in outcomes if o["status"] == "inserted")
             logger.info("Extracted {n} memories from conversation", n=stored)
     except Exception as e:
         logger.error("Failed to extract memories: {err}", err=str(e))
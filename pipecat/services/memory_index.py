@@ -0,0 +1,348 @@
+"""In-process vector index for per-senior memory search during live calls.
+
+Every mid-call ``memory.search`` normally costs an OpenAI embedding plus a
+pgvector round trip. When ``MEMORY_INDEX_ENABLED`` is set, the memories loaded
+by ``context_cache.prefetch_and_cache`` (or at call start) are kept here as a
+NumPy matrix of normalized embeddings, and searches become a dot-product
+top-k with no database access.
+
+Indexes are only registered when they hold every memory for the senior, so
+results match the pgvector query. ``warm_index`` rebuilds the index at every
+call start, so rows changed outside this process (Node dashboard edits,
+deletes, other instances) never outlive the previous call. Within a call,
+each index records the senior's memory version from shared state when it is
+built; memory writes bump that version through ``publish_write`` and searches
+call ``ensure_current`` first, so an index another instance has written past
+is dropped and the search falls back to pgvector. ``memory.store`` appends
+its own rows to the local index and keeps it current.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import uuid
+from collections import OrderedDict
+
+from loguru import logger
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy ships with pipecat-ai
+    np = None
+
+INDEX_TTL_SECONDS = 24 * 60 * 60
+MAX_INDEX_ROWS = 2000   # seniors with more memories fall back to pgvector
+MAX_INDEXES = 256       # LRU bound on per-senior indexes held in process
+VERSION_KEY_PREFIX = "memory_index:version:"
+
+_indexes: OrderedDict[str, "MemoryIndex"] = OrderedDict()
+_stats = {"hits": 0, "misses": 0, "builds": 0, "skipped_builds": 0, "invalidations": 0}
+
+# Columns memory.search returns; index rows carry exactly these.
+_ROW_KEYS = ("id", "type", "content", "importance", "metadata", "created_at")
+
+
+def is_enabled() -> bool:
+    from config import get_settings
+
+    return np is not None and get_settings().memory_index_enabled
+
+
+def parse_embedding(value) -> list[float] | None:
+    """Decode an embedding from pgvector text (``[0.1,...]``) or a list."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except ValueError:
+            return None
+    try:
+        return [float(v) for v in value]
+    except (TypeError, ValueError):
+        return None
+
+
+class MemoryIndex:
+    """Normalized embedding matrix plus the memory rows it was built from."""
+
+    def __init__(self, rows: list[dict], vectors: list[list[float]], version: str | None = None):
+        self.version = version
+        self.rows = [{k: r.get(k) for k in _ROW_KEYS} for r in rows]
+        if vectors:
+            self.matrix = _normalize_rows(np.asarray(vectors, dtype=np.float32))
+        else:
+            self.matrix = np.zeros((0, 0), dtype=np.float32)
+        self.built_at = time.time()
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.matrix.nbytes)
+
+    def add(self, row: dict, embedding: list[float]) -> None:
+        vector = _normalize_rows(np.asarray([embedding], dtype=np.float32))
+        if self.matrix.size and vector.shape[1] != self.matrix.shape[1]:
+            raise ValueError("embedding dimension mismatch")
+        self.matrix = np.vstack([self.matrix, vector]) if self.matrix.size else vector
+        self.rows.append({k: row.get(k) for k in _ROW_KEYS})
+
+    def update_importance(self, memory_id, importance: int) -> None:
+        for row in self.rows:
+            if row["id"] == memory_id:
+                row["importance"] = importance
+                return
+
+    def search(self, embedding: list[float], limit: int, min_similarity: float) -> list[dict]:
+        """Top-``limit`` rows by cosine similarity above ``min_similarity``.
+
+        Mirrors ``1 - (embedding <=> $1) > min_similarity ORDER BY distance``.
+        """
+        if not self.rows or limit <= 0:
+            return []
+        query = _normalize_rows(np.asarray([embedding], dtype=np.float32))[0]
+        if query.shape[0] != self.matrix.shape[1]:
+            return []
+        sims = self.matrix @ query
+        candidates = np.flatnonzero(sims > min_similarity)
+        if candidates.size == 0:
+            return []
+        if candidates.size > limit:
+            top = np.argpartition(-sims[candidates], limit - 1)[:limit]
+            candidates = candidates[top]
+        ordered = candidates[np.argsort(-sims[candidates], kind="stable")]
+        return [{**self.rows[i], "similarity": float(sims[i])} for i in ordered]
+
+
+def _normalize_rows(matrix):
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def build_index(senior_id: str, rows: list[dict], version: str | None = None) -> MemoryIndex | None:
+    """Build and register an index from memory rows carrying an ``embedding``.
+
+    ``rows`` must be the senior's complete memory set; callers pass at most
+    ``MAX_INDEX_ROWS + 1`` rows so an overflow can be detected and skipped.
+    ``version`` is the shared memory version read before ``rows`` were loaded.
+    """
+    if np is None or not senior_id:
+        return None
+    if len(rows) > MAX_INDEX_ROWS:
+        _stats["skipped_builds"] += 1
+        logger.info(
+            "[MemoryIndex] Skipping senior_id={sid}: more than {n} memories",
+            sid=str(senior_id)[:8], n=MAX_INDEX_ROWS,
+        )
+        drop_index(senior_id)
+        return None
+
+    kept_rows: list[dict] = []
+    vectors: list[list[float]] = []
+    for row in rows:
+        vector = parse_embedding(row.get("embedding"))
+        if vector is None:
+            # A memory without an embedding is invisible to pgvector too.
+            continue
+        kept_rows.append(row)
+        vectors.append(vector)
+
+    try:
+        index = MemoryIndex(kept_rows, vectors, version)
+    except ValueError as e:
+        _stats["skipped_builds"] += 1
+        logger.warning("[MemoryIndex] Build failed for senior_id={sid}: {err}", sid=str(senior_id)[:8], err=str(e))
+        return None
+
+    key = str(senior_id)
+    _indexes[key] = index
+    _indexes.move_to_end(key)
+    while len(_indexes) > MAX_INDEXES:
+        _indexes.popitem(last=False)
+    _stats["builds"] += 1
+    logger.info(
+        "[MemoryIndex] Built index for senior_id={sid}: {n} memories, {kb} KB",
+        sid=key[:8], n=len(index), kb=round(index.nbytes / 1024),
+    )
+    return index
+
+
+async def load_index(senior_id: str) -> MemoryIndex | None:
+    """Load every memory for ``senior_id`` and build its index (call start)."""
+    from db import query_many
+    from lib.encryption import decrypt_many_async
+
+    # Read the version first: a write landing mid-load bumps it again.
+    version = await shared_version(senior_id)
+    rows = await query_many(
+        """SELECT id, type, content, content_encrypted, importance, metadata, created_at,
+                  embedding::text AS embedding
+           FROM memories
+           WHERE senior_id = $1 AND embedding IS NOT NULL
+           ORDER BY importance DESC, created_at DESC
+           LIMIT $2""",
+        senior_id,
+        MAX_INDEX_ROWS + 1,
+    )
+    contents = await decrypt_many_async([row.get("content_encrypted") for row in rows], cache=True)
+    for row, content in zip(rows, contents):
+        if row.get("content_encrypted"):
+            row["content"] = content
+        row.pop("content_encrypted", None)
+    return build_index(senior_id, rows, version)
+
+
+async def warm_index(senior_id: str | None) -> None:
+    """Rebuild the senior's index from the database at call start. Never raises.
+
+    An index left by the 5 AM prefetch keeps serving until the rebuild lands.
+    """
+    if not senior_id or not is_enabled():
+        return
+    try:
+        await load_index(senior_id)
+    except Exception as e:
+        logger.warning("[MemoryIndex] Warm failed for senior_id={sid}: {err}", sid=str(senior_id)[:8], err=str(e))
+
+
+def get_index(senior_id: str | None) -> MemoryIndex | None:
+    if not senior_id:
+        return None
+    key = str(senior_id)
+    index = _indexes.get(key)
+    if index is None:
+        return None
+    if time.time() - index.built_at > INDEX_TTL_SECONDS:
+        del _indexes[key]
+        return None
+    _indexes.move_to_end(key)
+    return index
+
+
+def search(senior_id: str | None, embedding: list[float], limit: int, min_similarity: float) -> list[dict] | None:
+    """Search the in-process index. Returns ``None`` when there is no index."""
+    index = get_index(senior_id)
+    if index is None:
+        _stats["misses"] += 1
+        return None
+    _stats["hits"] += 1
+    return index.search(embedding, limit, min_similarity)
+
+
+def add_memory(senior_id: str | None, row: dict, embedding: list[float]) -> None:
+    """Append a freshly stored memory to the senior's index, if one is loaded."""
+    index = get_index(senior_id)
+    if index is None:
+        return
+    try:
+        index.add(row, embedding)
+    except ValueError:
+        drop_index(senior_id)
+
+
+def update_importance(senior_id: str | None, memory_id, importance: int) -> None:
+    index = get_index(senior_id)
+    if index is not None:
+        index.update_importance(memory_id, importance)
+
+
+def drop_index(senior_id: str | None) -> None:
+    if senior_id:
+        _indexes.pop(str(senior_id), None)
+
+
+async def _read_version(senior_id: str) -> str | None:
+    from lib.redis_client import get_shared_state
+
+    state = get_shared_state()
+    if not state.is_shared:
+        return None
+    return await state.get(VERSION_KEY_PREFIX + str(senior_id))
+
+
+async def shared_version(senior_id: str) -> str | None:
+    """The senior's memory version in shared state (None when not shared)."""
+    try:
+        return await _read_version(senior_id)
+    except Exception as e:
+        logger.debug("[MemoryIndex] Version read failed: {err}", err=str(e))
+        return None
+
+
+async def ensure_current(senior_id: str | None) -> None:
+    """Drop the local index if another process has written memories since it was built."""
+    index = get_index(senior_id)
+    if index is None:
+        return
+    try:
+        current = await _read_version(senior_id) == index.version
+    except Exception as e:
+        logger.debug("[MemoryIndex] Version check failed: {err}", err=str(e))
+        current = False
+    if not current:
+        _stats["invalidations"] += 1
+        drop_index(senior_id)
+
+
+async def publish_write(senior_id: str | None) -> None:
+    """Bump the senior's shared memory version after memories change.
+
+    A local index that was current before the bump already holds this
+    process's change (``add_memory``/``update_importance``) and adopts the new
+    version; one that was already behind is dropped. Never raises.
+    """
+    if not senior_id:
+        return
+    from lib.redis_client import get_shared_state
+
+    try:
+        state = get_shared_state()
+        if not state.is_shared:
+            return
+        key = VERSION_KEY_PREFIX + str(senior_id)
+        previous = await state.get(key)
+        version = uuid.uuid4().hex
+        await state.set(key, version, ttl=INDEX_TTL_SECONDS)
+    except Exception as e:
+        logger.warning("[MemoryIndex] Version publish failed for senior_id={sid}: {err}", sid=str(senior_id)[:8], err=str(e))
+        drop_index(senior_id)
+        return
+    index = _indexes.get(str(senior_id))
+    if index is not None:
+        if index.version == previous:
+            index.version = version
+        else:
+            drop_index(senior_id)
+
+
+async def invalidate(senior_id: str | None) -> None:
+    """Drop the senior's index here and on every other instance."""
+    drop_index(senior_id)
+    await publish_write(senior_id)
+
+
+def cleanup_expired() -> int:
+    now = time.time()
+    expired = [k for k, v in _indexes.items() if now - v.built_at > INDEX_TTL_SECONDS]
+    for key in expired:
+        del _indexes[key]
+    return len(expired)
+
+
+def clear_all() -> None:
+    _indexes.clear()
+    for key in _stats:
+        _stats[key] = 0
+
+
+def get_stats() -> dict:
+    return {
+        "indexes": len(_indexes),
+        "rows": sum(len(i) for i in _indexes.values()),
+        "bytes": sum(i.nbytes for i in _indexes.values()),
+        **_stats,
+    }
@@ -1,6 +1,11 @@
 """News service.
 
 Port of services/news.js — fetches senior-friendly news via OpenAI web search.
+
+News is searched and cached per normalized interest (in-process LRU backed by
+shared state), so prefetch cost scales with distinct interests rather than
+distinct interest combinations. A senior's digest is assembled from the
+pools of their interests.
 """
 
 from __future__ import annotations
@@ -10,6 +15,8 @@ import os
 import random
 import re
 import time
+from collections import OrderedDict
+from itertools import zip_longest
 from loguru import logger
 
 from lib.circuit_breaker import CircuitBreaker
@@ -19,9 +26,17 @@ _tavily_breaker = CircuitBreaker("tavily_search", failure_threshold=3, recovery_
 
 _openai_client = None
 _tavily_client = None
-_news_cache: dict[str, dict] = {}
-CACHE_TTL = 3600  # 1 hour in seconds
-_MAX_CACHE_ENTRIES = 50
+# Story pools keyed by normalized interest, least recently used first.
+_news_cache: OrderedDict[str, dict] = OrderedDict()
+_inflight: dict[str, asyncio.Future] = {}
+_stats = {"hits": 0, "shared_hits": 0, "misses": 0, "coalesced": 0, "evictions": 0}
+# Prefetch buckets roll through timezones an hour apart; a few hours lets the
+# later buckets reuse pools fetched for the earlier ones.
+CACHE_TTL = 4 * 3600
+_MAX_CACHE_ENTRIES = 500
+MAX_INTERESTS_PER_SENIOR = 5
+STORIES_PER_INTEREST = 4
+SHARED_KEY_PREFIX = "news:"
 
 
 def _get_openai():
@@ -54,12 +69,174 @@ def _evict_expired():
         del _news_cache[k]
 
 
-def _cache_key(interests: list[str]) -> str:
-    return "|".join(sorted(i.lower() for i in interests))
+def _cache_key(interest: str) -> str:
+    """Normalized interest used as the story-pool key."""
+    return " ".join(interest.lower().split())
+
+
+def _story_key(story: str) -> str:
+    """Dedup key for a story: its headline (text before ':'), else its words."""
+    text = story.lstrip("-*• ").lower()
+    headline, sep, _ = text.partition(":")
+    words = re.findall(r"[a-z0-9]+", headline if sep and len(headline.split()) >= 3 else text)
+    return " ".join(words)
+
+
+def _parse_stories(raw: str) -> list[str]:
+    """Split a bulleted (or numbered) list into ``- story`` lines."""
+    stories = []
+    for line in raw.splitlines():
+        line = line.strip()
+        match = re.match(r"^(?:[-*•]|\d+[.)])\s*(.+)$", line)
+        if match and match.group(1).strip():
+            stories.append(f"- {match.group(1).strip()}")
+    if not stories and raw.strip():
+        stories.append(f"- {' '.join(raw.split())}")
+    return stories
+
+
+def _get_local(key: str) -> list[str] | None:
+    entry = _news_cache.get(key)
+    if entry is None:
+        return None
+    if time.time() - entry["timestamp"] >= CACHE_TTL:
+        del _news_cache[key]
+        return None
+    _news_cache.move_to_end(key)
+    return entry["stories"]
+
+
+def _put_local(key: str, stories: list[str], timestamp: float | None = None) -> None:
+    _news_cache[key] = {"stories": stories, "timestamp": timestamp or time.time()}
+    _news_cache.move_to_end(key)
+    if len(_news_cache) > _MAX_CACHE_ENTRIES:
+        _evict_expired()
+    while len(_news_cache) > _MAX_CACHE_ENTRIES:
+        _news_cache.popitem(last=False)
+        _stats["evictions"] += 1
+
+
+async def _get_shared(key: str) -> dict | None:
+    try:
+        from lib.redis_client import get_shared_state
+        from lib.shared_state_phi import decode_phi_payload
+
+        state = get_shared_state()
+        if not getattr(state, "is_shared", False):
+            return None
+        return decode_phi_payload(await state.get(SHARED_KEY_PREFIX + key), label="news cache")
+    except Exception as e:
+        logger.debug("[News] Shared lookup failed: {err}", err=str(e))
+        return None
+
+
+async def _put_shared(key: str, stories: list[str], timestamp: float) -> None:
+    try:
+        from lib.redis_client import get_shared_state
+        from lib.shared_state_phi import encode_phi_payload
+
+        state = get_shared_state()
+        if not getattr(state, "is_shared", False):
+            return
+        payload = encode_phi_payload({"stories": stories, "timestamp": timestamp})
+        if payload is not None:
+            await state.set(SHARED_KEY_PREFIX + key, payload, ttl=CACHE_TTL)
+    except Exception as e:
+        logger.debug("[News] Shared store failed: {err}", err=str(e))
+
+
+async def _fetch_interest_stories(client, interest: str) -> list[str] | None:
+    async def _news_call():
+        return await asyncio.to_thread(
+            client.responses.create,
+            model="gpt-4o-mini",
+            tools=[{"type": "web_search_preview"}],
+            input=(
+                f"Find {STORIES_PER_INTEREST} brief, positive news stories from today about: {interest}.\n"
+                "These are for an elderly person, so:\n"
+                "- Choose uplifting or interesting stories (avoid distressing news)\n"
+                "- Keep each summary to 1-2 sentences\n"
+                "- Focus on human interest, health tips, local events, or hobby-related news\n\n"
+                "Format as a simple list with bullet points."
+            ),
+            tool_choice="required",
+        )
+
+    response = await _breaker.call(_news_call(), fallback=None)
+    if response is None:
+        return None
+    return _parse_stories((response.output_text or "").strip()) or None
+
+
+async def _stories_for_interest(client, interest: str) -> list[str] | None:
+    """Story pool for one interest: local LRU, shared state, then web search.
+
+    Concurrent requests for the same interest share one search.
+    """
+    key = _cache_key(interest)
+    stories = _get_local(key)
+    if stories is not None:
+        _stats["hits"] += 1
+        return stories
+
+    pending = _inflight.get(key)
+    if pending is not None:
+        _stats["coalesced"] += 1
+        return await asyncio.shield(pending)
+
+    future = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        shared = await _get_shared(key)
+        if shared and shared.get("stories") and time.time() - shared.get("timestamp", 0) < CACHE_TTL:
+            stories = list(shared["stories"])
+            _put_local(key, stories, shared["timestamp"])
+            _stats["shared_hits"] += 1
+        else:
+            _stats["misses"] += 1
+            stories = await _fetch_interest_stories(client, key)
+            if stories:
+                now = time.time()
+                _put_local(key, stories, now)
+                await _put_shared(key, stories, now)
+        future.set_result(stories)
+        return stories
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_result(None)
+        logger.error("Error fetching news for one interest: {err}", err=str(e))
+        return None
+    finally:
+        _inflight.pop(key, None)
+
+
+def _assemble_digest(pools: list[list[str]], limit: int) -> list[str]:
+    """Interleave per-interest pools, dropping stories already picked."""
+    picked: list[str] = []
+    seen: set[str] = set()
+    for round_stories in zip_longest(*pools):
+        for story in round_stories:
+            if story is None:
+                continue
+            key = _story_key(story)
+            if key in seen:
+                continue
+            seen.add(key)
+            picked.append(story)
+            if len(picked) >= limit:
+                return picked
+    return picked
 
 
 async def get_news_for_senior(interests: list[str], limit: int = 3) -> str | None:
-    """Fetch news relevant to a senior's interests using OpenAI web search."""
+    """News for a senior's interests, assembled from per-interest story pools.
+
+    Each distinct interest is searched at most once per TTL across every
+    senior and instance; the digest interleaves up to ``limit`` stories so
+    each interest is represented, with duplicate stories removed.
+    """
     if not interests:
         return None
 
@@ -68,48 +245,19 @@ async def get_news_for_senior(interests: list[str], limit: int = 3) -> str | Non
         logger.info("OpenAI not configured, skipping news fetch")
         return None
 
-    key = _cache_key(interests)
-    cached = _news_cache.get(key)
-    if cached and time.time() - cached["timestamp"] < CACHE_TTL:
-        logger.info("Using cached news")
-        return cached["news"]
+    keys = list(dict.fromkeys(_cache_key(i) for i in interests if i and i.strip()))
+    keys = keys[:MAX_INTERESTS_PER_SENIOR]
+    if not keys:
+        return None
 
     try:
-        interest_list = ", ".join(interests[:5])
-        logger.info("Fetching news for {n} interests", n=min(len(interests), 5))
-
-        async def _news_call():
-            return await asyncio.to_thread(
-                client.responses.create,
-                model="gpt-4o-mini",
-                tools=[{"type": "web_search_preview"}],
-                input=(
-                    f"Find 8-10 brief, positive news stories from today about: {interest_list}.\n"
-                    "These are for an elderly person, so:\n"
-                    "- Choose uplifting or interesting stories (avoid distressing news)\n"
-                    "- Keep each summary to 1-2 sentences\n"
-                    "- Focus on human interest, health tips, local events, or hobby-related news\n\n"
-                    "Format as a simple list with bullet points."
-                ),
-                tool_choice="required",
-            )
-
-        response = await _breaker.call(_news_call(), fallback=None)
-        if response is None:
-            return None
-
-        news_content = (response.output_text or "").strip()
-        if not news_content:
+        pools = await asyncio.gather(*(_stories_for_interest(client, key) for key in keys))
+        stories = _assemble_digest([p for p in pools if p], limit)
+        if not stories:
             logger.info("No news content returned")
             return None
-
-        formatted = format_news_context(news_content)
-        # Evict expired entries if cache is getting large
-        if len(_news_cache) >= _MAX_CACHE_ENTRIES:
-            _evict_expired()
-        _news_cache[key] = {"news": formatted, "timestamp": time.time()}
-        logger.info("Fetched and cached news successfully")
-        return formatted
+        logger.info("Assembled news from {n} interest pools ({s} stories)", n=sum(1 for p in pools if p), s=len(stories))
+        return format_news_context("\n".join(stories))
 
     except Exception as e:
         logger.error("Error fetching news: {err}", err=str(e))
@@ -253,4 +401,17 @@ def select_stories_for_call(
 def clear_cache():
     """Clear the news cache."""
     _news_cache.clear()
+    _inflight.clear()
+    for key in _stats:
+        _stats[key] = 0
     logger.info("News cache cleared")
+
+
+def get_stats() -> dict:
+    lookups = _stats["hits"] + _stats["shared_hits"] + _stats["misses"]
+    return {
+        "entries": len(_news_cache),
+        "max_entries": _MAX_CACHE_ENTRIES,
+        **_stats,
+        "hit_rate": round((_stats["hits"] + _stats["shared_hits"]) / lookups, 4) if lookups else 0.0,
+    }
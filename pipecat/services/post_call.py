@@ -2,6 +2,8 @@
 
 Orchestrates: conversation completion, call analysis (Gemini Flash),
 memory extraction, daily context save, reminder cleanup, and cache clearing.
+Steps run as a dependency graph (``lib.task_graph``) so independent work
+overlaps; per-step timings are stored with the call metrics.
 
 Extracted from bot.py to keep the pipeline assembly module focused.
 """
@@ -14,6 +16,36 @@ from datetime import datetime, timezone
 
 from loguru import logger
 
+# Upper bounds per post-call step, in seconds. LLM-backed steps get the most
+# room; the reminder step includes the 5s wait for an in-flight ack write.
+POST_CALL_STEP_TIMEOUTS = {
+    "complete": 15.0,
+    "caregiver_notes": 15.0,
+    "analysis": 60.0,
+    "memory": 90.0,
+    "reminder": 20.0,
+    "cache": 10.0,
+    "caregiver_notification": 30.0,
+    "interest_discovery": 15.0,
+    "interest_scores": 15.0,
+    "daily_context": 15.0,
+    "snapshot": 20.0,
+}
+
+POST_CALL_STEP_LABELS = {
+    "complete": "complete conversation",
+    "caregiver_notes": "caregiver note delivery check",
+    "analysis": "call analysis",
+    "memory": "memory extraction",
+    "reminder": "reminder cleanup",
+    "cache": "cache clearing",
+    "caregiver_notification": "caregiver notification",
+    "interest_discovery": "interest discovery",
+    "interest_scores": "interest scores",
+    "daily_context": "daily context",
+    "snapshot": "call snapshot",
+}
+
 
 def _transcript_has_content(transcript) -> bool:
     if isinstance(transcript, list):
@@ -208,11 +240,10 @@ async def run_post_call(
 
     # Collect full transcript from session, falling back to persisted Neon draft.
     transcript = await _get_post_call_transcript(session_state, conversation_tracker)
-    analysis = None
-    post_call_error_steps: list[str] = []
 
-    # Step 1: Complete conversation (must run first — prerequisite for all)
-    try:
+    analysis_holder: dict = {}
+
+    async def _complete_step():
         if conversation_id:
             from services.conversations import complete
             await complete(call_sid, {
@@ -220,20 +251,13 @@ async def run_post_call(
                 "status": "completed",
                 "transcript": transcript,
             })
-    except Exception as e:
-        post_call_error_steps.append("complete conversation")
-        logger.error("[{cs}] Post-call step 1 (complete conversation) failed: {err}", cs=call_sid, err=str(e))
 
     # Mark caregiver notes only when Donna actually appears to have delivered
     # the content. A skipped mark is safer than a false delivery receipt.
-    try:
+    async def _caregiver_notes_step():
         await _mark_delivered_caregiver_notes(session_state, transcript)
-    except Exception as e:
-        post_call_error_steps.append("caregiver note delivery check")
-        logger.error("[{cs}] Post-call caregiver note delivery check failed: {err}", cs=call_sid, err=str(e))
 
-    # --- Parallel group: independent steps (2, 3, 5, 6) ---
-    async def _step2_analysis():
+    async def _analysis_step():
         from lib.growthbook import is_on
         if not (_transcript_has_content(transcript) and senior and is_on("post_call_analysis_enabled", session_state)):
             return None
@@ -243,6 +267,7 @@ async def run_post_call(
             senior,
             call_started_at=call_started_at,
         )
+        analysis_holder["analysis"] = result
         if conversation_id and senior_id:
             await save_call_analysis(conversation_id, senior_id, result)
         summary = result.get("summary") if result else None
@@ -252,7 +277,7 @@ async def run_post_call(
             logger.info("[{cs}] Persisted call summary ({n} chars)", cs=call_sid, n=len(summary))
         return result
 
-    async def _step3_memory():
+    async def _memory_step():
         if not (_transcript_has_content(transcript) and senior_id):
             return
         from services.memory import extract_from_conversation
@@ -283,7 +308,7 @@ async def run_post_call(
             timezone_name=(senior or {}).get("timezone", "America/New_York"),
         )
 
-    async def _step5_reminder():
+    async def _reminder_step():
         reminder_delivery = session_state.get("reminder_delivery")
         if not reminder_delivery:
             return
@@ -319,124 +344,128 @@ async def run_post_call(
 
         await mark_call_ended_without_acknowledgment(delivery_id)
 
-    async def _step6_cache():
+    async def _cache_step():
         if senior_id:
-            from services.context_cache import clear_cache
-            clear_cache(senior_id)
+            from services.context_cache import clear_cache_async
+            await clear_cache_async(senior_id)
         if call_sid:
             from services.scheduler import clear_reminder_context_async
             await clear_reminder_context_async(call_sid)
 
-    results = await asyncio.gather(
-        _step2_analysis(),
-        _step3_memory(),
-        _step5_reminder(),
-        _step6_cache(),
-        return_exceptions=True,
-    )
-
-    # Extract analysis result (step 2)
-    analysis_result = results[0]
-    if isinstance(analysis_result, Exception):
-        post_call_error_steps.append("call analysis")
-        logger.error("[{cs}] Post-call step 2 (call analysis) failed: {err}", cs=call_sid, err=str(analysis_result))
-    else:
-        analysis = analysis_result
-    for i, (step_name, r) in enumerate(zip(
-        ["call analysis", "memory extraction", "reminder cleanup", "cache clearing"],
-        results,
-    )):
-        if isinstance(r, Exception) and i > 0:  # step 2 already logged above
-            post_call_error_steps.append(step_name)
-            logger.error("[{cs}] Post-call ({step}) failed: {err}", cs=call_sid, step=step_name, err=str(r))
-
-    # --- Sequential group: steps that depend on analysis ---
-
-    # 2.5 Trigger caregiver notifications
-    try:
+    async def _caregiver_notification_step():
+        analysis = analysis_holder.get("analysis")
         if analysis and senior_id:
             await _trigger_caregiver_notification(
                 senior_id, call_sid, analysis, duration_seconds
             )
-    except Exception as e:
-        post_call_error_steps.append("caregiver notification")
-        logger.error("[{cs}] Post-call step 2.5 (caregiver notification) failed: {err}", cs=call_sid, err=str(e))
 
-    # 3.5 Discover new interests from the call
-    try:
-        if senior_id and senior and analysis:
-            from services.interest_discovery import discover_new_interests, add_interests_to_senior
-            tracker_topics = (
-                conversation_tracker.state.topics_discussed
-                if conversation_tracker else []
+    async def _interest_discovery_step():
+        analysis = analysis_holder.get("analysis")
+        if not (senior_id and senior and analysis):
+            return
+        from services.interest_discovery import discover_new_interests, add_interests_to_senior
+        tracker_topics = (
+            conversation_tracker.state.topics_discussed
+            if conversation_tracker else []
+        )
+        existing_interests = senior.get("interests") or []
+        new_interests = discover_new_interests(
+            existing_interests, analysis, tracker_topics
+        )
+        if new_interests:
+            updated = await add_interests_to_senior(
+                senior_id, new_interests, existing_interests
             )
-            existing_interests = senior.get("interests") or []
-            new_interests = discover_new_interests(
-                existing_interests, analysis, tracker_topics
+            senior["interests"] = updated
+            logger.info(
+                "[{cs}] Discovered {n} new interests",
+                cs=call_sid, n=len(new_interests),
             )
-            if new_interests:
-                updated = await add_interests_to_senior(
-                    senior_id, new_interests, existing_interests
-                )
-                senior["interests"] = updated
-                logger.info(
-                    "[{cs}] Discovered {n} new interests",
-                    cs=call_sid, n=len(new_interests),
-                )
-    except Exception as e:
-        post_call_error_steps.append("interest discovery")
-        logger.error("[{cs}] Post-call step 3.5 (interest discovery) failed: {err}", cs=call_sid, err=str(e))
 
-    # 3.6 Compute and persist interest engagement scores
-    try:
-        if senior_id and senior:
-            from services.interest_discovery import compute_interest_scores, update_interest_scores
-            interests = senior.get("interests") or []
-            if interests:
-                scores = await compute_interest_scores(senior_id, interests)
-                await update_interest_scores(senior_id, scores)
-                logger.info("[{cs}] Updated interest scores", cs=call_sid)
-    except Exception as e:
-        post_call_error_steps.append("interest scores")
-        logger.error("[{cs}] Post-call step 3.6 (interest scores) failed: {err}", cs=call_sid, err=str(e))
+    async def _interest_scores_step():
+        if not (senior_id and senior):
+            return
+        from services.interest_discovery import compute_interest_scores, update_interest_scores
+        interests = senior.get("interests") or []
+        if interests:
+            scores = await compute_interest_scores(senior_id, interests)
+            await update_interest_scores(senior_id, scores)
+            logger.info("[{cs}] Updated interest scores", cs=call_sid)
+
+    async def _daily_context_step():
+        if not (senior_id and conversation_tracker):
+            return
+        from services.daily_context import save_call_context
+        analysis = analysis_holder.get("analysis")
+        await save_call_context(
+            senior_id=senior_id,
+            call_sid=call_sid,
+            data={
+                "topics_discussed": conversation_tracker.state.topics_discussed,
+                "advice_given": conversation_tracker.state.advice_given,
+                "reminders_delivered": list(
+                    session_state.get("reminders_delivered", set())
+                ),
+                "timezone": (session_state.get("senior") or {}).get("timezone", "America/New_York"),
+                "summary": analysis.get("summary") if analysis else None,
+            },
+        )
 
-    # 4. Save daily context
-    try:
-        if senior_id and conversation_tracker:
-            from services.daily_context import save_call_context
-            senior = session_state.get("senior") or {}
-            await save_call_context(
-                senior_id=senior_id,
-                call_sid=call_sid,
-                data={
-                    "topics_discussed": conversation_tracker.state.topics_discussed,
-                    "advice_given": conversation_tracker.state.advice_given,
-                    "reminders_delivered": list(
-                        session_state.get("reminders_delivered", set())
-                    ),
-                    "timezone": senior.get("timezone", "America/New_York"),
-                    "summary": analysis.get("summary") if analysis else None,
-                },
-            )
-    except Exception as e:
-        post_call_error_steps.append("daily context")
-        logger.error("[{cs}] Post-call step 4 (daily context) failed: {err}", cs=call_sid, err=str(e))
+    # Rebuild call context snapshot for next call
+    async def _snapshot_step():
+        if not senior_id:
+            return
+        from services.call_snapshot import build_snapshot, save_snapshot
+        tz = (senior or {}).get("timezone", "America/New_York")
+        snapshot = await build_snapshot(
+            senior_id,
+            tz,
+            analysis_holder.get("analysis"),
+            last_call_started_at=call_started_at,
+        )
+        await save_snapshot(senior_id, snapshot)
+
+    # complete() rewrites the conversation row, so the summary written by the
+    # analysis step must land after it. The snapshot reads the summary and
+    # today's context back from the database.
+    from lib.task_graph import Step, run_graph
+
+    timeouts = POST_CALL_STEP_TIMEOUTS
+    step_results = await run_graph([
+        Step("complete", _complete_step, timeout=timeouts["complete"]),
+        Step("caregiver_notes", _caregiver_notes_step, timeout=timeouts["caregiver_notes"]),
+        Step("analysis", _analysis_step, after=("complete",), timeout=timeouts["analysis"]),
+        Step("memory", _memory_step, timeout=timeouts["memory"]),
+        Step("reminder", _reminder_step, timeout=timeouts["reminder"]),
+        Step("cache", _cache_step, timeout=timeouts["cache"]),
+        Step("caregiver_notification", _caregiver_notification_step,
+             after=("analysis",), timeout=timeouts["caregiver_notification"]),
+        Step("interest_discovery", _interest_discovery_step,
+             after=("analysis",), timeout=timeouts["interest_discovery"]),
+        Step("interest_scores", _interest_scores_step,
+             after=("interest_discovery",), timeout=timeouts["interest_scores"]),
+        Step("daily_context", _daily_context_step,
+             after=("analysis",), timeout=timeouts["daily_context"]),
+        Step("snapshot", _snapshot_step,
+             after=("analysis", "daily_context"), timeout=timeouts["snapshot"]),
+    ])
 
-    # 7. Rebuild call context snapshot for next call
-    try:
-        if senior_id:
-            from services.call_snapshot import build_snapshot, save_snapshot
-            tz = (senior or {}).get("timezone", "America/New_York")
-            snapshot = await build_snapshot(
-                senior_id,
-                tz,
-                analysis,
-                last_call_started_at=call_started_at,
+    post_call_error_steps: list[str] = []
+    for name, result in step_results.items():
+        if result.ok:
+            continue
+        label = POST_CALL_STEP_LABELS[name]
+        post_call_error_steps.append(label)
+        if result.status == "timeout":
+            logger.error(
+                "[{cs}] Post-call ({step}) timed out after {t}s",
+                cs=call_sid, step=label, t=timeouts[name],
+            )
+        else:
+            logger.error(
+                "[{cs}] Post-call ({step}) failed: {err}",
+                cs=call_sid, step=label, err=str(result.error),
             )
-            await save_snapshot(senior_id, snapshot)
-    except Exception as e:
-        post_call_error_steps.append("call snapshot")
-        logger.error("[{cs}] Post-call step 7 (call snapshot) failed: {err}", cs=call_sid, err=str(e))
 
     # 8. Persist call metrics for observability
     try:
@@ -445,6 +474,7 @@ async def run_post_call(
             duration_seconds,
             conversation_tracker,
             error_count=len(post_call_error_steps),
+            post_call_steps=step_results,
         )
     except Exception as e:
         logger.error("[{cs}] Post-call step 8 (call metrics) failed: {err}", cs=call_sid, err=str(e))
@@ -457,8 +487,13 @@ async def _persist_call_metrics(
     duration_seconds: int,
     conversation_tracker,
     error_count: int = 0,
+    post_call_steps: dict | None = None,
 ) -> None:
-    """Write per-call metrics to call_metrics table for observability."""
+    """Write per-call metrics to call_metrics table for observability.
+
+    ``post_call_steps`` maps step name to ``lib.task_graph.StepResult``; the
+    per-step timings land in ``latency.post_call``.
+    """
     import time
     from db.client import execute
     from lib.circuit_breaker import get_breaker_states
@@ -492,6 +527,16 @@ async def _persist_call_metrics(
     stage_breakdown = summarize_stage_latencies(session_state)
     if stage_breakdown:
         latency["stage_breakdown"] = stage_breakdown
+    if cm.get("quick_observer_precompute"):
+        latency["quick_observer_precompute"] = cm["quick_observer_precompute"]
+    if post_call_steps:
+        latency["post_call"] = {
+            "total_ms": max(r.started_ms + r.duration_ms for r in post_call_steps.values()),
+            "steps": {
+                name: {"ms": r.duration_ms, "start_ms": r.started_ms, "status": r.status}
+                for name, r in post_call_steps.items()
+            },
+        }
 
     token_usage = dict(cm.get("token_usage", {}))
     if cm.get("tts_characters"):
@@ -551,6 +596,19 @@ async def _persist_call_metrics(
             "[{cs}] context_trace_encrypted column missing; call metrics persisted without context trace",
             cs=call_sid,
         )
+    try:
+        from services.call_metrics_rollup import record_call
+
+        await record_call(
+            call_type=call_type,
+            duration_seconds=duration_seconds,
+            turn_count=turn_count,
+            end_reason=end_reason,
+            error_count=error_count,
+            samples={"llm_ttfb": llm_vals, "tts_ttfb": tts_vals, "turn_latency": turn_vals},
+        )
+    except Exception as e:
+        logger.warning("[{cs}] Call metrics rollup update failed: {err}", cs=call_sid, err=str(e))
     logger.info(
         "[{cs}] Call metrics persisted (turns={t}, duration={d}s, errors={e}, context_events={c})",
         cs=call_sid,
@@ -0,0 +1,311 @@
+"""Durable post-call job queue.
+
+When ``POST_CALL_QUEUE_ENABLED`` is set, call end snapshots the session state
+run_post_call reads into an encrypted ``post_call_jobs`` row and returns.
+A small per-instance worker pool claims jobs with ``FOR UPDATE SKIP LOCKED``,
+so a burst of hang-ups queues up instead of competing with live calls for the
+event loop and DB pool. Failed jobs retry with exponential backoff; a job
+whose worker died (deploy, crash) is reclaimed once its lease lapses.
+
+With the queue disabled, or if the enqueue write fails, bot.py runs
+post-call inline in the call's process as before.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import socket
+from types import SimpleNamespace
+
+from loguru import logger
+
+from db import execute, query_many, query_one
+
+JOB_LEASE_SECONDS = 15 * 60
+MAX_ATTEMPTS = 5
+RETRY_BASE_SECONDS = 30
+RETRY_MAX_SECONDS = 30 * 60
+POLL_INTERVAL_SECONDS = 5.0
+# Keep this many pool connections free for live calls before claiming work.
+MIN_IDLE_CONNECTIONS = 2
+
+# Session keys run_post_call and _persist_call_metrics read. Live objects
+# (tasks, the tracker) are left behind; the tracker state is captured below.
+SESSION_KEYS = (
+    "call_sid", "call_type", "conversation_id", "senior_id", "senior",
+    "prospect_id", "reminder", "reminder_delivery", "reminder_prompt",
+    "reminders_delivered", "_flags", "_full_transcript", "_transcript",
+    "_call_start_time", "_trace_start_time", "_end_reason", "_call_metrics",
+    "_phase_durations", "_current_phase", "_phase_start_time",
+    "_current_turn_sequence", "_tools_used", "_context_trace_events",
+    "_caregiver_notes_content", "_reminder_ack_persisted",
+)
+
+_INSTANCE_ID = f"{socket.gethostname()}:{os.getpid()}"
+_workers: list[asyncio.Task] = []
+_wake = asyncio.Event()
+_stats = {"enqueued": 0, "completed": 0, "retried": 0, "failed": 0, "deferred": 0}
+
+
+def _enabled() -> bool:
+    from config import get_settings
+
+    return get_settings().post_call_queue_enabled
+
+
+def snapshot_session(session_state: dict, conversation_tracker) -> dict:
+    """JSON-safe copy of what post-call needs from a finished call."""
+    state = {k: session_state[k] for k in SESSION_KEYS if k in session_state}
+    if isinstance(state.get("reminders_delivered"), (set, frozenset)):
+        state["reminders_delivered"] = sorted(state["reminders_delivered"])
+    tracker_state = getattr(conversation_tracker, "state", None)
+    return {
+        "session": state,
+        "tracker": {
+            "topics_discussed": list(getattr(tracker_state, "topics_discussed", None) or []),
+            "advice_given": list(getattr(tracker_state, "advice_given", None) or []),
+        } if tracker_state is not None else None,
+    }
+
+
+class _TrackerSnapshot:
+    """Stands in for the call's ConversationTrackerProcessor in a worker."""
+
+    def __init__(self, state: dict):
+        self.state = SimpleNamespace(**state)
+
+    def flush(self) -> None:
+        pass
+
+
+def restore_session(payload: dict) -> tuple[dict, _TrackerSnapshot | None]:
+    session_state = dict(payload.get("session") or {})
+    tracker = payload.get("tracker")
+    return session_state, (_TrackerSnapshot(tracker) if tracker is not None else None)
+
+
+async def enqueue(session_state: dict, conversation_tracker, duration_seconds: int) -> bool:
+    """Persist a post-call job. Returns False when the caller should run inline."""
+    if not _enabled():
+        return False
+    call_sid = session_state.get("call_sid")
+    if not call_sid:
+        return False
+
+    from lib.encryption import encrypt_json
+    from services.post_call import _wait_for_reminder_ack_task
+
+    # Drain in-process writes the snapshot would otherwise race.
+    await _wait_for_reminder_ack_task(session_state)
+    if hasattr(conversation_tracker, "flush_pending_persistence"):
+        await conversation_tracker.flush_pending_persistence()
+
+    payload = snapshot_session(session_state, conversation_tracker)
+    payload["duration_seconds"] = duration_seconds
+    try:
+        status = await execute(
+            """INSERT INTO post_call_jobs (call_sid, payload_encrypted, senior_id)
+               VALUES ($1, $2, $3)
+               ON CONFLICT (call_sid) DO NOTHING""",
+            call_sid,
+            encrypt_json(payload),
+            session_state.get("senior_id"),
+            name="post_call_jobs.enqueue",
+        )
+    except Exception as e:
+        logger.error("[{cs}] Post-call enqueue failed, running inline: {err}", cs=call_sid, err=str(e))
+        return False
+    # The worker that runs the job may be another instance, and its cache step
+    # only clears that instance's LRU and memory index plus the shared entry.
+    # Drop this instance's copies now so the senior's next call here rebuilds.
+    if session_state.get("senior_id"):
+        from services.context_cache import clear_cache
+
+        clear_cache(session_state["senior_id"])
+    if status == "INSERT 0 0":
+        logger.info("[{cs}] Post-call job already queued", cs=call_sid)
+        return True
+    _stats["enqueued"] += 1
+    _wake.set()
+    logger.info("[{cs}] Post-call job queued", cs=call_sid)
+    return True
+
+
+async def claim_job() -> dict | None:
+    """Claim the oldest runnable job, or a running job whose lease lapsed."""
+    return await query_one(
+        """UPDATE post_call_jobs
+           SET status = 'running', attempts = attempts + 1,
+               locked_at = NOW(), locked_by = $1
+           WHERE id = (
+               SELECT id FROM post_call_jobs
+               WHERE (status = 'pending' AND run_after <= NOW())
+                  OR (status = 'running' AND locked_at < NOW() - make_interval(secs => $2))
+               ORDER BY run_after
+               LIMIT 1
+               FOR UPDATE SKIP LOCKED
+           )
+           RETURNING id, call_sid, attempts, payload_encrypted,
+                     EXTRACT(EPOCH FROM NOW() - run_after) AS lag_seconds""",
+        _INSTANCE_ID,
+        JOB_LEASE_SECONDS,
+        name="post_call_jobs.claim",
+    )
+
+
+def retry_delay_seconds(attempts: int) -> int:
+    return min(RETRY_BASE_SECONDS * 2 ** max(attempts - 1, 0), RETRY_MAX_SECONDS)
+
+
+async def run_job(job: dict) -> None:
+    """Run one claimed job, then delete it or schedule its retry."""
+    from lib.encryption import decrypt_json
+    from services.post_call import run_post_call
+
+    call_sid = job["call_sid"]
+    try:
+        payload = decrypt_json(job["payload_encrypted"])
+        if not isinstance(payload, dict):
+            raise ValueError("undecryptable post-call payload")
+        session_state, tracker = restore_session(payload)
+        await run_post_call(session_state, tracker, payload.get("duration_seconds") or 0)
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        attempts = job["attempts"]
+        if attempts >= MAX_ATTEMPTS:
+            _stats["failed"] += 1
+            logger.error(
+                "[{cs}] Post-call job failed permanently after {n} attempts: {err}",
+                cs=call_sid, n=attempts, err=str(e),
+            )
+            await execute(
+                """UPDATE post_call_jobs
+                   SET status = 'failed', locked_at = NULL, locked_by = NULL, last_error = $2
+                   WHERE id = $1""",
+                job["id"],
+                str(e)[:500],
+            )
+            return
+        delay = retry_delay_seconds(attempts)
+        _stats["retried"] += 1
+        logger.warning(
+            "[{cs}] Post-call job attempt {n} failed, retrying in {d}s: {err}",
+            cs=call_sid, n=attempts, d=delay, err=str(e),
+        )
+        await execute(
+            """UPDATE post_call_jobs
+               SET status = 'pending', locked_at = NULL, locked_by = NULL,
+                   run_after = NOW() + make_interval(secs => $2), last_error = $3
+               WHERE id = $1""",
+            job["id"],
+            delay,
+            str(e)[:500],
+        )
+        return
+    await execute("DELETE FROM post_call_jobs WHERE id = $1", job["id"], name="post_call_jobs.delete")
+    _stats["completed"] += 1
+
+
+async def _pool_has_headroom() -> bool:
+    from db.client import get_pool_stats
+
+    try:
+        stats = await get_pool_stats()
+    except Exception:
+        return False
+    free = stats.get("idle", 0) + stats.get("max", 0) - stats.get("size", 0)
+    return free > MIN_IDLE_CONNECTIONS
+
+
+async def _wait_for_work() -> None:
+    try:
+        await asyncio.wait_for(_wake.wait(), timeout=POLL_INTERVAL_SECONDS)
+    except asyncio.TimeoutError:
+        pass
+    _wake.clear()
+
+
+async def _worker(index: int) -> None:
+    while True:
+        try:
+            if not await _pool_has_headroom():
+                _stats["deferred"] += 1
+                await asyncio.sleep(POLL_INTERVAL_SECONDS)
+                continue
+            job = await claim_job()
+            if job is None:
+                await _wait_for_work()
+                continue
+            logger.info(
+                "[{cs}] Post-call worker {i} claimed job (attempt {n}, lag {lag:.1f}s)",
+                cs=job["call_sid"], i=index, n=job["attempts"], lag=float(job["lag_seconds"] or 0),
+            )
+            await run_job(job)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("Post-call worker {i} error: {err}", i=index, err=str(e))
+            await asyncio.sleep(POLL_INTERVAL_SECONDS)
+
+
+def start_workers(count: int) -> None:
+    """Start ``count`` queue workers on the running loop."""
+    while len(_workers) < count:
+        index = len(_workers)
+        _workers.append(asyncio.create_task(_worker(index), name=f"post-call-worker-{index}"))
+    logger.info("Post-call queue: {n} workers started", n=len(_workers))
+
+
+async def stop_workers() -> None:
+    """Cancel workers and hand their in-flight jobs back to the queue."""
+    workers = list(_workers)
+    _workers.clear()
+    for task in workers:
+        task.cancel()
+    if workers:
+        await asyncio.gather(*workers, return_exceptions=True)
+    try:
+        released = await query_many(
+            """UPDATE post_call_jobs
+               SET status = 'pending', locked_at = NULL, locked_by = NULL,
+                   attempts = GREATEST(attempts - 1, 0)
+               WHERE status = 'running' AND locked_by = $1
+               RETURNING id""",
+            _INSTANCE_ID,
+        )
+        if released:
+            logger.info("Post-call queue: released {n} in-flight jobs", n=len(released))
+    except Exception as e:
+        logger.warning("Post-call queue: releasing jobs failed: {err}", err=str(e))
+
+
+async def get_queue_stats() -> dict:
+    """Queue depth and lag across instances, plus this instance's counters."""
+    stats = {"enabled": _enabled(), "workers": len(_workers), **_stats}
+    if not stats["enabled"]:
+        return stats
+    row = await query_one(
+        """SELECT COUNT(*) FILTER (WHERE status = 'pending') AS pending,
+                  COUNT(*) FILTER (WHERE status = 'running') AS running,
+                  COUNT(*) FILTER (WHERE status = 'failed') AS failed_jobs,
+                  COALESCE(EXTRACT(EPOCH FROM NOW() - MIN(run_after)
+                           FILTER (WHERE status = 'pending' AND run_after <= NOW())), 0)
+                      AS lag_seconds
+           FROM post_call_jobs""",
+        name="post_call_jobs.stats",
+    )
+    row = row or {}
+    stats.update(
+        depth=int(row.get("pending") or 0),
+        running=int(row.get("running") or 0),
+        failed_jobs=int(row.get("failed_jobs") or 0),
+        lag_seconds=round(float(row.get("lag_seconds") or 0), 1),
+    )
+    return stats
+
+
+def reset_stats() -> None:
+    for key in _stats:
+        _stats[key] = 0
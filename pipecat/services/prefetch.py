@@ -78,6 +78,11 @@ class PrefetchCache:
 
     Stored in session_state so it's per-call. Uses fuzzy word-overlap
     (Jaccard similarity on word sets) for lookup — no embeddings needed.
+    Word sets are computed once on insert, and a word -> key inverted index
+    limits each lookup to entries sharing at least one word with the query.
+
+    ``wait_for_inflight`` lets a caller await a relevant in-flight search
+    instead of polling: every ``put`` and ``clear_inflight`` wakes waiters.
     """
 
     DEFAULT_TTL = 30.0  # seconds
@@ -87,25 +92,62 @@ class PrefetchCache:
         self._ttl = ttl
         self._entries: dict[str, dict[str, Any]] = {}
         self._inflight: dict[str, dict[str, Any]] = {}
+        self._entry_index: dict[str, set[str]] = {}
+        self._inflight_index: dict[str, set[str]] = {}
+        self._changed: asyncio.Event | None = None
+        self._seq = 0
         self._hits = 0
         self._misses = 0
 
     def _normalize_key(self, query: str) -> str:
         return " ".join(sorted(self._word_set(query)))
 
-    def _word_set(self, text: str) -> set[str]:
-        return {
+    def _word_set(self, text: str) -> frozenset[str]:
+        return frozenset(
             w
             for w in re.findall(r"[a-z0-9]+", text.lower())
             if w and w not in _MEMORY_CACHE_STOP_WORDS
-        }
+        )
+
+    def _index_for(self, entries: dict[str, dict[str, Any]]) -> dict[str, set[str]]:
+        return self._entry_index if entries is self._entries else self._inflight_index
+
+    def _insert(self, entries: dict[str, dict[str, Any]], key: str, entry: dict[str, Any]) -> None:
+        previous = entries.get(key)
+        if previous is not None:
+            entry["seq"] = previous["seq"]
+        else:
+            self._seq += 1
+            entry["seq"] = self._seq
+        entries[key] = entry
+        index = self._index_for(entries)
+        for word in entry["words"]:
+            index.setdefault(word, set()).add(key)
+
+    def _remove(self, entries: dict[str, dict[str, Any]], key: str) -> None:
+        entry = entries.pop(key, None)
+        if entry is None:
+            return
+        index = self._index_for(entries)
+        for word in entry["words"]:
+            keys = index.get(word)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del index[word]
+
+    def _notify(self) -> None:
+        """Wake ``wait_for_inflight`` callers; each waits on a fresh event."""
+        if self._changed is not None:
+            self._changed.set()
+            self._changed = None
 
     def _purge_expired(self, entries: dict[str, dict[str, Any]] | None = None) -> None:
         now = time.time()
         target = entries if entries is not None else self._entries
         for key, entry in list(target.items()):
             if now - entry["ts"] > self._ttl:
-                del target[key]
+                self._remove(target, key)
 
     def _best_match(
         self,
@@ -113,28 +155,38 @@ class PrefetchCache:
         entries: dict[str, dict[str, Any]],
         threshold: float,
     ) -> dict[str, Any] | None:
-        self._purge_expired(entries)
         query_words = self._word_set(query)
         if not query_words:
             return None
 
+        index = self._index_for(entries)
+        candidates: set[str] = set()
+        for word in query_words:
+            keys = index.get(word)
+            if keys:
+                candidates |= keys
+
+        now = time.time()
         best_match: dict[str, Any] | None = None
-        best_sim = 0.0
+        best_rank = (0.0, 0)
 
-        for entry in entries.values():
-            entry_words = self._word_set(entry["query"])
-            if not entry_words:
+        for key in candidates:
+            entry = entries[key]
+            if now - entry["ts"] > self._ttl:
+                self._remove(entries, key)
                 continue
 
+            entry_words = entry["words"]
             intersection = len(query_words & entry_words)
-            union = len(query_words | entry_words)
-            sim = intersection / union if union > 0 else 0.0
+            sim = intersection / (len(query_words) + len(entry_words) - intersection)
 
-            if sim > best_sim:
-                best_sim = sim
+            # Earliest-inserted entry wins ties, as in a linear scan.
+            rank = (sim, -entry["seq"])
+            if sim > 0 and rank > best_rank:
+                best_rank = rank
                 best_match = entry
 
-        if best_match and best_sim >= threshold:
+        if best_match and best_rank[0] >= threshold:
             return best_match
         return None
 
@@ -145,14 +197,15 @@ class PrefetchCache:
         # Evict oldest if at capacity
         if len(self._entries) >= self.MAX_ENTRIES and key not in self._entries:
             oldest_key = min(self._entries, key=lambda k: self._entries[k]["ts"])
-            del self._entries[oldest_key]
+            self._remove(self._entries, oldest_key)
 
-        self._entries[key] = {
+        self._insert(self._entries, key, {
             "results": results,
             "source": source,
             "ts": time.time(),
             "query": query,
-        }
+            "words": self._word_set(query),
+        })
         self.clear_inflight(query)
 
     def get(self, query: str, threshold: float = 0.3) -> list[dict] | None:
@@ -176,22 +229,53 @@ class PrefetchCache:
         """Track a memory search that is currently running for this call."""
         if not query:
             return
-        self._inflight[self._normalize_key(query)] = {
+        self._insert(self._inflight, self._normalize_key(query), {
             "source": source,
             "ts": time.time(),
             "query": query,
-        }
+            "words": self._word_set(query),
+        })
 
     def clear_inflight(self, query: str) -> None:
         """Clear in-flight tracking for a completed or skipped query."""
         if not query:
             return
-        self._inflight.pop(self._normalize_key(query), None)
+        self._remove(self._inflight, self._normalize_key(query))
+        self._notify()
 
     def has_relevant_inflight(self, query: str, threshold: float = 0.3) -> bool:
         """Return whether a relevant search is in flight without mutating stats."""
         return self._best_match(query, self._inflight, threshold) is not None
 
+    async def wait_for_inflight(
+        self,
+        query: str,
+        threshold: float = 0.3,
+        timeout: float = 0.5,
+    ) -> list[dict] | None:
+        """Wait for a relevant in-flight search to land, up to ``timeout``.
+
+        Returns the cached results as soon as a matching entry is stored, or
+        ``None`` once no relevant search is in flight or the timeout passes.
+        Counts a hit on success; the caller's initial ``get`` already counted
+        the miss.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            match = self._best_match(query, self._entries, threshold)
+            if match:
+                self._hits += 1
+                return match["results"]
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self.has_relevant_inflight(query, threshold):
+                return None
+            if self._changed is None:
+                self._changed = asyncio.Event()
+            try:
+                await asyncio.wait_for(self._changed.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                return None
+
     def get_inflight_queries(self) -> list[str]:
         """Return non-expired in-flight query strings."""
         self._purge_expired(self._inflight)
@@ -9,12 +9,14 @@ from __future__ import annotations
 import asyncio
 import os
 import re
+import time
 from datetime import datetime, timezone, timedelta
 from loguru import logger
 from db import query_one, query_many, execute
 from lib.sanitize import mask_phone
 from lib.phi import decrypt_reminder_phi, decrypt_senior_phi
 from services.reminder_delivery import mark_delivered
+from services.time_context import known_timezones
 
 # Pre-fetched context maps (shared state — same semantics as Node.js Maps)
 pending_reminder_calls: dict[str, dict] = {}
@@ -89,42 +91,8 @@ def get_scheduled_for_time(reminder: dict) -> datetime | None:
     return scheduled_time
 
 
-async def get_due_reminders() -> list[dict]:
-    """Find reminders that are due now.
-
-    Checks: non-recurring past due, recurring time-of-day match,
-    and retry-pending deliveries ready for retry (>30 min since last attempt).
-    """
-    now = datetime.now(timezone.utc)
-    one_minute = now + timedelta(minutes=1)
-    thirty_minutes_ago = now - timedelta(minutes=30)
-
-    # Non-recurring reminders due now
-    non_recurring = await query_many(
-        """SELECT r.id AS reminder_id, s.id AS senior_id,
-                  r.type, r.title, r.title_encrypted,
-                  r.description, r.description_encrypted, r.scheduled_time,
-                  r.is_recurring, r.cron_expression, r.is_active AS r_active,
-                  r.last_delivered_at,
-                  s.name, s.phone, s.timezone, s.interests,
-                  s.family_info, s.family_info_encrypted,
-                  s.medical_notes, s.medical_notes_encrypted,
-                  s.preferred_call_times, s.preferred_call_times_encrypted,
-                  s.additional_info, s.additional_info_encrypted,
-                  s.call_context_snapshot, s.call_context_snapshot_encrypted,
-                  s.is_active AS s_active
-           FROM reminders r
-           INNER JOIN seniors s ON r.senior_id = s.id
-           WHERE r.is_active = true
-             AND r.is_recurring = false
-             AND r.scheduled_time <= $1
-             AND s.is_active = true""",
-        one_minute,
-    )
-
-    # Recurring reminders (all active — filter by time-of-day in Python)
-    recurring_all = await query_many(
-        """SELECT r.id AS reminder_id, s.id AS senior_id,
+# Reminder + senior columns shared by the due and retry queries.
+_REMINDER_SENIOR_COLUMNS = """r.id AS reminder_id, s.id AS senior_id,
                   r.type, r.title, r.title_encrypted,
                   r.description, r.description_encrypted, r.scheduled_time,
                   r.is_recurring, r.cron_expression, r.is_active AS r_active,
@@ -135,113 +103,113 @@ async def get_due_reminders() -> list[dict]:
                   s.preferred_call_times, s.preferred_call_times_encrypted,
                   s.additional_info, s.additional_info_encrypted,
                   s.call_context_snapshot, s.call_context_snapshot_encrypted,
-                  s.is_active AS s_active
-           FROM reminders r
-           INNER JOIN seniors s ON r.senior_id = s.id
-           WHERE r.is_active = true
-             AND r.is_recurring = true
-             AND s.is_active = true""",
+                  s.is_active AS s_active"""
+
+# Due reminders in one set-based query ($1 = now as timestamptz, $2 = the
+# timezone names zoneinfo accepts; a zone must also be in Postgres's tzdata,
+# or AT TIME ZONE would fail the whole tick):
+# - one-time reminders scheduled up to a minute from now;
+# - recurring reminders whose time-of-day is within 5 minutes (wrapping at
+#   midnight) of now in the senior's timezone. "Now" is computed once per
+#   distinct senior timezone (unknown ones fall back to UTC), turned into
+#   minute-of-day windows, and matched through the minute-of-day expression
+#   index from migration 011, so only reminders near now are read;
+# - minus any reminder that already has an open or finished delivery within
+#   5 minutes of this occurrence (recurring occurrences are anchored to
+#   today's UTC date, as get_scheduled_for_time does).
+# Times are compared as naive UTC, matching how the columns are written.
+DUE_REMINDERS_SQL = f"""
+    WITH valid_zones AS MATERIALIZED (
+        SELECT name FROM pg_timezone_names WHERE name = ANY($2::text[])
+    ),
+    zones AS MATERIALIZED (
+        SELECT z.timezone,
+               (date_part('hour', l.local_now) * 60 + date_part('minute', l.local_now))::int AS now_minute
+        FROM (SELECT DISTINCT timezone FROM seniors WHERE is_active = true) z
+        LEFT JOIN valid_zones v ON v.name = z.timezone
+        CROSS JOIN LATERAL (
+            SELECT $1::timestamptz AT TIME ZONE COALESCE(v.name, 'UTC') AS local_now
+        ) l
+    ),
+    windows AS MATERIALIZED (
+        SELECT timezone, GREATEST(now_minute - 5, 0) AS lo, LEAST(now_minute + 5, 1439) AS hi FROM zones
+        UNION ALL
+        SELECT timezone, now_minute - 5 + 1440, 1439 FROM zones WHERE now_minute < 5
+        UNION ALL
+        SELECT timezone, 0, now_minute + 5 - 1440 FROM zones WHERE now_minute > 1434
+    ),
+    candidates AS (
+        SELECT {_REMINDER_SENIOR_COLUMNS},
+               r.scheduled_time AS due_for
+        FROM reminders r
+        INNER JOIN seniors s ON r.senior_id = s.id
+        WHERE r.is_active = true
+          AND r.is_recurring = false
+          AND r.scheduled_time <= ($1::timestamptz AT TIME ZONE 'UTC') + interval '1 minute'
+          AND s.is_active = true
+        UNION ALL
+        SELECT {_REMINDER_SENIOR_COLUMNS},
+               date_trunc('day', $1::timestamptz AT TIME ZONE 'UTC')
+                 + make_interval(hours => date_part('hour', r.scheduled_time)::int,
+                                 mins => date_part('minute', r.scheduled_time)::int) AS due_for
+        FROM windows w
+        INNER JOIN reminders r
+            ON r.is_active = true
+           AND r.is_recurring = true
+           AND (date_part('hour', r.scheduled_time) * 60 + date_part('minute', r.scheduled_time))
+               BETWEEN w.lo AND w.hi
+        INNER JOIN seniors s ON r.senior_id = s.id
+        WHERE s.is_active = true
+          AND s.timezone IS NOT DISTINCT FROM w.timezone
     )
+    SELECT c.*
+    FROM candidates c
+    WHERE NOT EXISTS (
+        SELECT 1 FROM reminder_deliveries rd
+        WHERE rd.reminder_id = c.reminder_id
+          AND rd.scheduled_for BETWEEN c.due_for - interval '5 minutes' AND c.due_for + interval '5 minutes'
+          AND rd.status IN ('acknowledged', 'confirmed', 'max_attempts', 'delivered', 'retry_pending')
+    )"""
+
+# Retry-pending deliveries whose last attempt was over 30 minutes ago.
+RETRY_DELIVERIES_SQL = f"""
+    SELECT rd.id AS delivery_id, rd.scheduled_for, rd.delivered_at,
+           rd.status AS delivery_status, rd.attempt_count, rd.call_sid,
+           {_REMINDER_SENIOR_COLUMNS}
+    FROM reminder_deliveries rd
+    INNER JOIN reminders r ON rd.reminder_id = r.id
+    INNER JOIN seniors s ON r.senior_id = s.id
+    WHERE rd.status = 'retry_pending'
+      AND rd.delivered_at < ($1::timestamptz AT TIME ZONE 'UTC') - interval '30 minutes'
+      AND r.is_active = true
+      AND s.is_active = true"""
 
-    # Filter recurring to those whose time-of-day matches now (within 5 min).
-    # scheduled_time is stored in the senior's local timezone, so convert
-    # UTC `now` to the senior's timezone before comparing.
-    recurring_due = []
-    for row in recurring_all:
-        st = row.get("scheduled_time")
-        if not st:
-            continue
-        if isinstance(st, str):
-            st = datetime.fromisoformat(st)
-        sched_minutes = st.hour * 60 + st.minute
 
-        # Convert UTC now to the senior's local timezone for comparison
-        senior_tz_name = row.get("timezone")
-        if senior_tz_name:
-            try:
-                from zoneinfo import ZoneInfo
-                local_now = now.astimezone(ZoneInfo(senior_tz_name))
-            except Exception:
-                local_now = now
-        else:
-            local_now = now
-        now_minutes = local_now.hour * 60 + local_now.minute
+async def get_due_reminders() -> list[dict]:
+    """Find reminders that are due now.
 
-        # Handle midnight wrap-around (e.g. 23:58 vs 00:02 = 4 min, not 1436)
-        diff = abs(sched_minutes - now_minutes)
-        if min(diff, 1440 - diff) <= 5:
-            recurring_due.append(row)
+    Checks: non-recurring past due, recurring time-of-day match,
+    and retry-pending deliveries ready for retry (>30 min since last attempt).
+    Both the time-of-day window and the delivery exclusion run in the
+    database, so a tick costs two queries regardless of reminder count.
+    """
+    now = datetime.now(timezone.utc)
 
-    all_candidates = non_recurring + recurring_due
+    due_rows = await query_many(DUE_REMINDERS_SQL, now, known_timezones(), name="reminders.due")
 
     due_reminders = []
-    for candidate in all_candidates:
-        reminder = _extract_reminder(candidate)
-        senior = _extract_senior(candidate)
+    for row in due_rows:
+        reminder = _extract_reminder(row)
         scheduled_for = get_scheduled_for_time(reminder)
         if not scheduled_for:
             continue
+        due_reminders.append({
+            "reminder": reminder,
+            "senior": _extract_senior(row),
+            "scheduled_for": scheduled_for,
+        })
 
-        window_start = scheduled_for - timedelta(minutes=5)
-        window_end = scheduled_for + timedelta(minutes=5)
-
-        # Check for already acknowledged/confirmed/max_attempts delivery
-        existing = await query_one(
-            """SELECT id FROM reminder_deliveries
-               WHERE reminder_id = $1
-                 AND scheduled_for BETWEEN $2 AND $3
-                 AND status IN ('acknowledged', 'confirmed', 'max_attempts')
-               LIMIT 1""",
-            reminder["id"],
-            window_start,
-            window_end,
-        )
-        if existing:
-            continue
-
-        # Check for already-delivered (pending) delivery
-        pending = await query_one(
-            """SELECT id FROM reminder_deliveries
-               WHERE reminder_id = $1
-                 AND scheduled_for BETWEEN $2 AND $3
-                 AND status IN ('delivered', 'retry_pending')
-               LIMIT 1""",
-            reminder["id"],
-            window_start,
-            window_end,
-        )
-        if not pending:
-            due_reminders.append({
-                "reminder": reminder,
-                "senior": senior,
-                "scheduled_for": scheduled_for,
-            })
-
-    # Retries: retry_pending deliveries >30 min since last attempt
-    retries = await query_many(
-        """SELECT rd.id AS delivery_id, rd.scheduled_for, rd.delivered_at,
-                  rd.status AS delivery_status, rd.attempt_count, rd.call_sid,
-                  r.id AS reminder_id, s.id AS senior_id,
-                  r.type, r.title, r.title_encrypted,
-                  r.description, r.description_encrypted, r.scheduled_time,
-                  r.is_recurring, r.cron_expression, r.is_active AS r_active,
-                  r.last_delivered_at,
-                  s.name, s.phone, s.timezone, s.interests,
-                  s.family_info, s.family_info_encrypted,
-                  s.medical_notes, s.medical_notes_encrypted,
-                  s.preferred_call_times, s.preferred_call_times_encrypted,
-                  s.additional_info, s.additional_info_encrypted,
-                  s.call_context_snapshot, s.call_context_snapshot_encrypted,
-                  s.is_active AS s_active
-           FROM reminder_deliveries rd
-           INNER JOIN reminders r ON rd.reminder_id = r.id
-           INNER JOIN seniors s ON r.senior_id = s.id
-           WHERE rd.status = 'retry_pending'
-             AND rd.delivered_at < $1
-             AND r.is_active = true
-             AND s.is_active = true""",
-        thirty_minutes_ago,
-    )
+    retries = await query_many(RETRY_DELIVERIES_SQL, now, name="reminder_deliveries.retry_due")
     for row in retries:
         due_reminders.append({
             "reminder": _extract_reminder(row),
@@ -295,8 +263,8 @@ async def prefetch_for_phone(phone_number: str, senior: dict | None) -> dict:
 
     if senior:
         try:
-            from services.context_cache import get_cache
-            cached = get_cache(senior["id"])
+            from services.context_cache import get_cache_async
+            cached = await get_cache_async(senior["id"])
         except ImportError:
             cached = None
 
@@ -419,7 +387,7 @@ def _extract_reminder(row: dict) -> dict:
         "cron_expression": row.get("cron_expression"),
         "is_active": row.get("r_active") if "r_active" in row else row.get("is_active"),
         "last_delivered_at": row.get("last_delivered_at"),
-    })
+    }, cache=True)
 
 
 def _extract_senior(row: dict) -> dict:
@@ -441,7 +409,7 @@ def _extract_senior(row: dict) -> dict:
         "call_context_snapshot": row.get("call_context_snapshot"),
         "call_context_snapshot_encrypted": row.get("call_context_snapshot_encrypted"),
         "is_active": row.get("s_active") if "s_active" in row else row.get("is_active"),
-    })
+    }, cache=True)
 
 
 def _extract_delivery(row: dict) -> dict:
@@ -541,13 +509,16 @@ async def start_scheduler(base_url: str, interval_seconds: int = 60) -> None:
 
     async def prefetch_loop():
         while True:
+            started = time.monotonic()
             try:
                 from services.context_cache import run_daily_prefetch, cleanup_expired
                 cleanup_expired()
                 await run_daily_prefetch()
             except Exception as e:
                 logger.error("Context pre-fetch error: {err}", err=str(e))
-            await asyncio.sleep(3600)  # Every hour
+            # Every hour, counted from the start of the run: prefetches are
+            # paced over part of the hour and must not push the next check back.
+            await asyncio.sleep(max(0, 3600 - (time.monotonic() - started)))
 
     # Prefetch runs on all instances (read-only, safe to duplicate)
     asyncio.create_task(prefetch_loop())
@@ -40,6 +40,7 @@ async def find_by_phone(phone: str, *, active_only: bool = True) -> dict | None:
                   interest_scores
            FROM seniors WHERE phone = $1""" + active_clause,
         normalized,
+        name="seniors.find_by_phone" + (".active" if active_only else ""),
     )
     return decrypt_senior_phi(row)
 
@@ -144,6 +145,37 @@ async def list_active() -> list[dict]:
     return rows
 
 
+async def list_active_at_local_hour(hour: int) -> list[dict]:
+    """Active seniors whose local clock currently reads ``hour``.
+
+    The hour is computed once per distinct timezone in the database, so the
+    hourly prefetch only loads the bucket it is about to warm. Missing or
+    unknown timezones (including ones Postgres's tzdata lacks) count as
+    America/New_York, matching ``get_timezone``.
+    """
+    from services.time_context import known_timezones
+
+    return await query_many(
+        """WITH valid_zones AS MATERIALIZED (
+               SELECT name FROM pg_timezone_names WHERE name = ANY($2::text[])
+           ), zones AS (
+               SELECT DISTINCT timezone FROM seniors WHERE is_active = true
+           ), due AS (
+               SELECT z.timezone FROM zones z
+               LEFT JOIN valid_zones v ON v.name = z.timezone
+               WHERE date_part('hour', NOW() AT TIME ZONE COALESCE(v.name, 'America/New_York')) = $1
+           )
+           SELECT s.id, s.timezone
+           FROM seniors s
+           JOIN due d ON s.timezone IS NOT DISTINCT FROM d.timezone
+           WHERE s.is_active = true
+           ORDER BY s.id""",
+        hour,
+        known_timezones(),
+        name="seniors.active_at_local_hour",
+    )
+
+
 async def get_by_id(senior_id: str) -> dict | None:
     """Get a senior by ID."""
     row = await query_one("SELECT * FROM seniors WHERE id = $1", senior_id)
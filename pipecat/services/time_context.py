@@ -8,7 +8,8 @@ local time before it is inserted into prompts.
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from zoneinfo import ZoneInfo
+from functools import lru_cache
+from zoneinfo import ZoneInfo, available_timezones
 
 
 def get_timezone(tz_name: str | None) -> ZoneInfo:
@@ -19,6 +20,12 @@ def get_timezone(tz_name: str | None) -> ZoneInfo:
         return ZoneInfo("America/New_York")
 
 
+@lru_cache(maxsize=1)
+def known_timezones() -> list[str]:
+    """Timezone names zoneinfo can load, for validating zones inside SQL."""
+    return sorted(available_timezones())
+
+
 def coerce_utc(value) -> datetime | None:
     """Coerce DB timestamps or epoch seconds to aware UTC datetimes."""
     if value is None:
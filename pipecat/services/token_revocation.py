@@ -2,22 +2,148 @@
 
 Provides database-backed JWT token revocation for HIPAA-compliant session management.
 Stores SHA-256 hashes of revoked tokens (never the raw tokens).
+
+Lookups are served from an in-process copy of the active ``revoked_tokens``
+hashes instead of two queries per admin request. The copy is reloaded every
+``REVOCATION_SET_TTL_SECONDS`` and whenever the revocation version in shared
+state changes; revoking bumps that version, so other instances drop their
+copy within ``VERSION_CHECK_INTERVAL_SECONDS``. The revoking instance updates
+its own copy immediately.
 """
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
+import time
+import uuid
 
 from loguru import logger
 
 from db.client import query_one, query_many, execute
 
+REVOCATION_TTL_SECONDS = 7 * 24 * 3600  # matches JWT max lifetime
+REVOCATION_SET_TTL_SECONDS = 60.0
+VERSION_CHECK_INTERVAL_SECONDS = 1.0
+LOAD_RETRY_SECONDS = 5.0
+VERSION_KEY = "auth:revocation_version"
+
+_revoked: dict[str, float] = {}  # token_hash -> expires_at (epoch seconds)
+_loaded = False
+_next_load_at = 0.0
+_version: str | None = None
+_version_checked_at = 0.0
+_load_task: asyncio.Task | None = None
+_stats = {"lookups": 0, "revoked_hits": 0, "loads": 0, "load_errors": 0, "invalidations": 0}
+
 
 def _hash_token(token: str) -> str:
     """SHA-256 hash a JWT token for storage."""
     return hashlib.sha256(token.encode()).hexdigest()
 
 
+def _admin_marker_hash(admin_id: str) -> str:
+    return hashlib.sha256(f"revoke_all:{admin_id}".encode()).hexdigest()
+
+
+async def _shared_version() -> str | None:
+    from lib.redis_client import get_shared_state
+
+    state = get_shared_state()
+    if not state.is_shared:
+        return None
+    return await state.get(VERSION_KEY)
+
+
+async def _publish_invalidation() -> None:
+    """Bump the shared revocation version so other instances reload."""
+    global _version
+    try:
+        from lib.redis_client import get_shared_state
+
+        state = get_shared_state()
+        if not state.is_shared:
+            return
+        version = uuid.uuid4().hex
+        await state.set(VERSION_KEY, version, ttl=REVOCATION_TTL_SECONDS)
+        _version = version
+    except Exception as e:
+        logger.warning("Revocation invalidation publish failed: {err}", err=str(e))
+
+
+async def _load() -> None:
+    global _revoked, _loaded, _next_load_at, _version
+    try:
+        # Read the version first: a revocation landing mid-load bumps it again.
+        try:
+            version = await _shared_version()
+        except Exception as e:
+            logger.debug("Revocation version check failed: {err}", err=str(e))
+            version = _version
+        rows = await query_many(
+            """SELECT token_hash, EXTRACT(EPOCH FROM expires_at) AS expires_at
+               FROM revoked_tokens WHERE expires_at > NOW()""",
+            name="revoked_tokens.load",
+        )
+    except Exception:
+        _stats["load_errors"] += 1
+        _next_load_at = time.monotonic() + LOAD_RETRY_SECONDS
+        raise
+    _revoked = {row["token_hash"]: float(row["expires_at"]) for row in rows}
+    _loaded = True
+    _version = version
+    _next_load_at = time.monotonic() + REVOCATION_SET_TTL_SECONDS
+    _stats["loads"] += 1
+
+
+async def _reload() -> None:
+    global _load_task
+    task = _load_task
+    if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+        task = _load_task = asyncio.create_task(_load())
+    await asyncio.shield(task)
+
+
+async def _ensure_fresh() -> None:
+    global _version_checked_at
+    now = time.monotonic()
+    stale = not _loaded or now >= _next_load_at
+    if not stale and now - _version_checked_at >= VERSION_CHECK_INTERVAL_SECONDS:
+        _version_checked_at = now
+        try:
+            version = await _shared_version()
+        except Exception as e:
+            logger.debug("Revocation version check failed: {err}", err=str(e))
+        else:
+            if version != _version:
+                _stats["invalidations"] += 1
+                stale = True
+    if not stale:
+        return
+    try:
+        await _reload()
+    except Exception as e:
+        if not _loaded:
+            raise
+        # Keep serving the last good copy until the next retry.
+        logger.warning("Revocation list reload failed, using cached copy: {err}", err=str(e))
+
+
+async def _is_revoked(token_hash: str) -> bool:
+    await _ensure_fresh()
+    _stats["lookups"] += 1
+    expires_at = _revoked.get(token_hash)
+    if expires_at is None or expires_at <= time.time():
+        return False
+    _stats["revoked_hits"] += 1
+    return True
+
+
+def _remember(token_hash: str) -> None:
+    if _loaded:
+        _revoked[token_hash] = time.time() + REVOCATION_TTL_SECONDS
+
+
 async def revoke_token(token: str, revoked_by: str, reason: str = "") -> None:
     """Revoke a specific JWT token.
 
@@ -32,6 +158,8 @@ async def revoke_token(token: str, revoked_by: str, reason: str = "") -> None:
         revoked_by,
         reason,
     )
+    _remember(token_hash)
+    await _publish_invalidation()
     logger.info(
         "Revoked token by={who} reason_chars={n}",
         who=str(revoked_by)[:8],
@@ -46,7 +174,7 @@ async def revoke_all_for_admin(admin_id: str, revoked_by: str, reason: str = "")
     marker row. The auth middleware must also check admin-level revocation.
     Returns count of newly inserted revocation rows (always 1 for the marker).
     """
-    marker_hash = hashlib.sha256(f"revoke_all:{admin_id}".encode()).hexdigest()
+    marker_hash = _admin_marker_hash(admin_id)
     await execute(
         """INSERT INTO revoked_tokens (token_hash, revoked_by, reason, expires_at)
            VALUES ($1, $2, $3, NOW() + INTERVAL '7 days')
@@ -59,28 +187,20 @@ async def revoke_all_for_admin(admin_id: str, revoked_by: str, reason: str = "")
         revoked_by,
         reason or f"revoke_all for admin {admin_id}",
     )
+    _remember(marker_hash)
+    await _publish_invalidation()
     logger.info("Revoked all tokens for admin={aid}", aid=str(admin_id)[:8])
     return 1
 
 
 async def is_token_revoked(token: str) -> bool:
-    """Check if a specific token has been revoked. Fast indexed lookup."""
-    token_hash = _hash_token(token)
-    row = await query_one(
-        "SELECT 1 FROM revoked_tokens WHERE token_hash = $1 AND expires_at > NOW()",
-        token_hash,
-    )
-    return row is not None
+    """Check if a specific token has been revoked."""
+    return await _is_revoked(_hash_token(token))
 
 
 async def is_admin_revoked(admin_id: str) -> bool:
     """Check if all tokens for an admin have been revoked (bulk revocation)."""
-    marker_hash = hashlib.sha256(f"revoke_all:{admin_id}".encode()).hexdigest()
-    row = await query_one(
-        "SELECT 1 FROM revoked_tokens WHERE token_hash = $1 AND expires_at > NOW()",
-        marker_hash,
-    )
-    return row is not None
+    return await _is_revoked(_admin_marker_hash(admin_id))
 
 
 async def cleanup_expired() -> int:
@@ -89,6 +209,30 @@ async def cleanup_expired() -> int:
         "WITH d AS (DELETE FROM revoked_tokens WHERE expires_at < NOW() RETURNING 1) SELECT count(*) AS c FROM d"
     )
     count = result["c"] if result else 0
+    now = time.time()
+    for token_hash in [h for h, expires_at in _revoked.items() if expires_at <= now]:
+        del _revoked[token_hash]
     if count > 0:
         logger.info("Cleaned up {n} expired token revocations", n=count)
     return count
+
+
+def clear() -> None:
+    """Drop the in-process copy (tests)."""
+    global _loaded, _next_load_at, _version, _version_checked_at, _load_task
+    _revoked.clear()
+    _loaded = False
+    _next_load_at = 0.0
+    _version = None
+    _version_checked_at = 0.0
+    _load_task = None
+    for key in _stats:
+        _stats[key] = 0
+
+
+def get_stats() -> dict:
+    return {
+        "entries": len(_revoked),
+        "loaded": _loaded,
+        **_stats,
+    }
@@ -0,0 +1,58 @@
+"""Senior utterance corpus drawn from the simulation scenario definitions.
+
+Used by Quick Observer equivalence tests and ``scripts/bench_quick_observer.py``
+so both exercise the same realistic call text.
+"""
+
+from __future__ import annotations
+
+import tests.scenarios as scripted
+from tests.scenarios.base import CallScenario
+from tests.simulation import scenarios as live
+
+# Edge cases the scenarios don't cover: anchors, punctuation-only turns,
+# non-ASCII text, and very long turns.
+EXTRA_UTTERANCES = [
+    "",
+    "   ",
+    "Yes.",
+    "Mhm",
+    "I don't know.",
+    "What time is it?",
+    "Did you hear about the election results?",
+    "?",
+    "Okay, bye bye now, talk to you tomorrow!",
+    "Alright, goodbye... Oh wait, I forgot to tell you something!",
+    "I took my pills already, thank you dear.",
+    "I haven't eaten since yesterday and I feel dizzy and confused.",
+    "My step-daughter and my great-grandkids came by, it was wonderful.",
+    "Ich bin müde — the café was closed and I felt so lonely.",
+    "Ｉ ＦＥＬＬ ＤＯＷＮ",
+    "I wish I could just go to sleep and not wake up.",
+    "Dr. Patel said my blood sugar was high; I need a ride to the pharmacy.",
+    "Well " + "we talked about the garden and the roses and the tomatoes " * 4,
+]
+
+
+def scenario_utterances() -> list[str]:
+    """Every senior-side line from the scripted and live simulation scenarios."""
+    texts: list[str] = []
+    for value in vars(scripted).values():
+        if isinstance(value, CallScenario):
+            texts.extend(u.text for u in value.utterances if u.speaker == "senior")
+    for factory in (
+        live.web_search_scenario,
+        live.memory_seed_scenario,
+        live.memory_recall_scenario,
+        live.reminder_scenario,
+    ):
+        scenario = factory()
+        for goal in scenario.goals:
+            texts.append(goal.description)
+            if goal.trigger_phrase:
+                texts.append(goal.trigger_phrase)
+    return texts
+
+
+def utterance_corpus() -> list[str]:
+    return scenario_utterances() + EXTRA_UTTERANCES
@@ -35,6 +35,12 @@ class FakeSharedState:
     async def get(self, key):
         return self.data.get(key)
 
+    async def set_if_absent(self, key, value, ttl=None):
+        if key in self.data:
+            return False
+        await self.set(key, value, ttl)
+        return True
+
     async def delete(self, key):
         self.deleted.append(key)
         self.data.pop(key, None)
@@ -78,6 +84,7 @@ class TestHealthEndpoint:
         assert data["database"] == "ok"
         assert "pool" in data
         assert "circuit_breakers" in data
+        assert data["post_call_queue"]["enabled"] is False
 
     @patch("db.check_health", new_callable=AsyncMock, return_value=False)
     @patch("db.client.get_pool_stats", new_callable=AsyncMock, return_value={})
@@ -170,6 +177,22 @@ class TestTelnyxAndCallContext:
         finally:
             telnyx._recent_telnyx_event_ids.clear()
 
+    @pytest.mark.asyncio
+    async def test_telnyx_event_dedupe_is_shared_across_instances(self):
+        from api.routes import telnyx
+
+        shared = FakeSharedState()
+        telnyx._recent_telnyx_event_ids.clear()
+        try:
+            with patch("lib.redis_client.get_shared_state", return_value=shared):
+                assert await telnyx._mark_telnyx_event_seen("evt-shared") is False
+                # Another instance: empty local set, same shared state.
+                telnyx._recent_telnyx_event_ids.clear()
+                assert await telnyx._mark_telnyx_event_seen("evt-shared") is True
+            assert shared.ttls["telnyx_event:evt-shared"] == telnyx.TELNYX_EVENT_DEDUPE_TTL_SECONDS
+        finally:
+            telnyx._recent_telnyx_event_ids.clear()
+
     @pytest.mark.asyncio
     async def test_bot_loads_metadata_from_local_state_first(self):
         """WebSocket setup should use local metadata before shared state."""
@@ -402,7 +425,7 @@ class TestTelnyxAndCallContext:
         }
 
         with patch("services.seniors.get_by_id", new=AsyncMock(return_value=senior)), \
-             patch.object(telnyx, "_cached_senior_context_seed", return_value=(seed, True)), \
+             patch.object(telnyx, "_cached_senior_context_seed", new=AsyncMock(return_value=(seed, True))), \
              patch.object(telnyx, "_hydrate_senior_call_context", new=AsyncMock(return_value=hydrated)):
             payload = await telnyx.prewarm_telnyx_outbound_context(
                 telnyx.TelnyxOutboundCallRequest(
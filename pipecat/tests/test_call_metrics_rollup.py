@@ -0,0 +1,136 @@
+"""Tests for hourly call-metrics rollups."""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from services import call_metrics_rollup as rollup
+
+HOUR = datetime(2026, 3, 1, 14, tzinfo=timezone.utc)
+
+
+def _row(call_type="check-in", **calls):
+    row = rollup.new_row(HOUR, call_type)
+    for call in calls.get("calls", []):
+        rollup.add_call(row, **call)
+    return row
+
+
+def _call(duration=60, turns=4, end_reason="goodbye", errors=0, llm=(), tts=(), turn=()):
+    return {
+        "duration_seconds": duration,
+        "turn_count": turns,
+        "end_reason": end_reason,
+        "error_count": errors,
+        "samples": {"llm_ttfb": list(llm), "tts_ttfb": list(tts), "turn_latency": list(turn)},
+    }
+
+
+class TestHistogram:
+    def test_percentile_reads_bucket_upper_bound(self):
+        hist = rollup.histogram([90, 150, 250, 260, 270, 900, 950, 980, 990, 20000])
+        assert rollup.percentile(hist, 0.5) == 300.0
+        assert rollup.percentile(hist, 0.95) == float(rollup.LATENCY_BUCKETS_MS[-1])
+        assert rollup.percentile(rollup.histogram([]), 0.5) is None
+
+
+class TestSummarize:
+    def test_rows_merge_into_dashboard_summary(self):
+        rows = [
+            _row(calls=[
+                _call(duration=100, turns=6, llm=[200, 400], turn=[900]),
+                _call(duration=None, turns=2, end_reason="hangup", errors=1, llm=[600]),
+            ]),
+            _row("reminder", calls=[_call(duration=50, turns=4, tts=[150, 150])]),
+        ]
+
+        result = rollup.summarize(rows)
+        summary = result["summary"]
+
+        assert summary["total_calls"] == 3
+        assert summary["successful_calls"] == 2
+        assert summary["avg_duration_seconds"] == 75
+        assert summary["avg_turn_count"] == 4
+        # Average of per-call averages (300 and 600), as the raw query computed it.
+        assert summary["avg_llm_ttfb_ms"] == 450
+        assert summary["llm_ttfb_p50_ms"] == 400.0
+        assert summary["llm_ttfb_p95_ms"] == 600.0
+        assert summary["tts_ttfb_p95_ms"] == 200.0
+        assert summary["avg_turn_latency_ms"] == 900
+        assert result["end_reasons"] == [
+            {"end_reason": "goodbye", "count": 2},
+            {"end_reason": "hangup", "count": 1},
+        ]
+        assert result["call_types"] == {"check-in": 2, "reminder": 1}
+
+    def test_null_error_count_and_end_reason_keep_raw_semantics(self):
+        result = rollup.summarize([_row(calls=[_call(errors=None, end_reason=None), _call()])])
+
+        # Raw: COUNT(*) FILTER (WHERE error_count = 0) and GROUP BY end_reason.
+        assert result["summary"]["successful_calls"] == 1
+        assert {"end_reason": None, "count": 1} in result["end_reasons"]
+
+    def test_empty_window(self):
+        summary = rollup.summarize([])["summary"]
+        assert summary["total_calls"] == 0
+        assert summary["avg_duration_seconds"] is None
+        assert summary["turn_latency_p95_ms"] is None
+
+
+class TestRecordCall:
+    @pytest.mark.asyncio
+    async def test_upserts_current_hour_row(self):
+        execute = AsyncMock(return_value="INSERT 0 1")
+        with patch.object(rollup, "execute", execute):
+            await rollup.record_call(
+                call_type=None,
+                duration_seconds=120,
+                turn_count=8,
+                end_reason=None,
+                error_count=0,
+                samples={"llm_ttfb": [250, 450], "tts_ttfb": [], "turn_latency": [800]},
+            )
+
+        args = execute.await_args.args
+        assert args[0] == rollup.UPSERT_SQL
+        assert execute.await_args.kwargs["name"] == "call_metrics_hourly.upsert"
+        hour, call_type = args[1], args[2]
+        assert (hour.minute, hour.second, hour.tzinfo) == (0, 0, timezone.utc)
+        assert call_type == "check-in"
+        assert args[14] == {rollup.NULL_END_REASON: 1}
+        assert sum(args[15]) == 2  # llm_ttfb histogram
+        assert sum(args[16]) == 0  # tts_ttfb histogram
+
+
+class TestSummaryEndpoint:
+    @pytest.mark.asyncio
+    async def test_falls_back_to_raw_table_before_migration(self):
+        from types import SimpleNamespace
+
+        from api.middleware.auth import AuthContext
+        from api.routes import metrics
+
+        class UndefinedTable(Exception):
+            sqlstate = "42P01"
+
+        raw = AsyncMock(return_value={"summary": {"total_calls": 3}, "end_reasons": []})
+        request = SimpleNamespace(client=None, headers={})
+        with patch.object(metrics, "get_summary", AsyncMock(side_effect=UndefinedTable())), \
+             patch.object(metrics, "_raw_summary", raw), \
+             patch.object(metrics, "fire_and_forget_audit"):
+            result = await metrics.get_metrics_summary(request, auth=AuthContext(is_admin=True), hours=24)
+
+        assert result["summary"] == {"total_calls": 3}
+        assert "since" in result
+        assert result["window_granularity"] == "exact"
+
+    @pytest.mark.asyncio
+    async def test_window_start_is_rounded_to_the_hour(self):
+        since = datetime(2026, 3, 1, 14, 40, tzinfo=timezone.utc)
+        with patch.object(rollup, "query_many", AsyncMock(return_value=[])) as mock_query:
+            result = await rollup.get_summary(since)
+
+        assert mock_query.await_args.args[1] == HOUR
+        assert result["window_start"] == HOUR.isoformat()
+        assert result["window_granularity"] == "hour"
@@ -6,7 +6,6 @@ from unittest.mock import patch, AsyncMock, MagicMock
 from datetime import datetime, timezone
 
 from services.context_cache import (
-    _get_local_hour,
     _select_interest,
     generate_templated_greeting,
     get_cache,
@@ -18,40 +17,7 @@ from services.context_cache import (
     GREETING_TEMPLATES,
     FALLBACK_TEMPLATES,
 )
-
-
-class TestGetLocalHour:
-    def test_valid_timezone(self):
-        result = _get_local_hour("America/New_York")
-        assert 0 <= result <= 23
-
-    def test_none_falls_back(self):
-        result = _get_local_hour(None)
-        assert 0 <= result <= 23
-
-    def test_invalid_no_crash(self):
-        result = _get_local_hour("Invalid/Timezone")
-        assert isinstance(result, int)
-
-    def test_invalid_timezone_falls_back_to_new_york_not_fixed_est(self):
-        class FakeZoneInfo:
-            def __init__(self, name):
-                if name == "Invalid/Timezone":
-                    raise ValueError("invalid timezone")
-                self.name = name
-
-        class FakeDateTime:
-            @classmethod
-            def now(cls, tz=None):
-                return datetime(2026, 7, 1, 8 if tz else 12, 0)
-
-            @classmethod
-            def utcnow(cls):
-                return datetime(2026, 7, 1, 12, 0)
-
-        with patch("services.context_cache.ZoneInfo", FakeZoneInfo), \
-             patch("services.context_cache.datetime", FakeDateTime):
-            assert _get_local_hour("Invalid/Timezone") == 8
+from tests.test_scheduler import FakeSharedState, enable_test_encryption
 
 
 class TestSelectInterest:
@@ -161,6 +127,69 @@ class TestCacheOps:
         assert stats["expired"] == 1
 
 
+class TestTwoTierCache:
+    @pytest.fixture(autouse=True)
+    def clear(self):
+        clear_all()
+        yield
+        clear_all()
+
+    @staticmethod
+    def _entry(greeting="Hi Margaret!"):
+        now = time.time()
+        return {"senior_id": "s1", "senior": {"id": "s1"}, "greeting": greeting,
+                "memory_context": "Likes roses", "cached_at": now, "expires_at": now + 3600}
+
+    def test_lru_evicts_least_recently_used(self):
+        from services import context_cache
+        with patch.object(context_cache, "MAX_CACHE_SIZE", 2):
+            context_cache._put_local("s1", self._entry())
+            context_cache._put_local("s2", self._entry())
+            get_cache("s1")
+            context_cache._put_local("s3", self._entry())
+        assert list(_cache) == ["s1", "s3"]
+        assert get_stats()["evictions"] == 1
+
+    def test_byte_budget_evicts(self):
+        from services import context_cache
+        context_cache._put_local("s1", self._entry("x" * 1000))
+        size = get_stats()["bytes"]
+        with patch.object(context_cache, "MAX_CACHE_BYTES", size + 100):
+            context_cache._put_local("s2", self._entry("y" * 1000))
+        assert list(_cache) == ["s2"]
+        assert get_stats()["bytes"] == context_cache._sizes["s2"]
+
+    @pytest.mark.asyncio
+    async def test_shared_tier_serves_other_instances(self, monkeypatch):
+        from services import context_cache
+        enable_test_encryption(monkeypatch)
+        state = FakeSharedState()
+        with patch("lib.redis_client.get_shared_state", return_value=state):
+            await context_cache._put_shared("s1", self._entry())
+            stored = state.data["context_cache:s1"]
+            assert "Margaret" not in stored
+            assert 3500 <= state.ttls["context_cache:s1"] <= 3600
+
+            result = await context_cache.get_cache_async("s1")
+        assert result["greeting"] == "Hi Margaret!"
+        assert "senior" not in result
+        assert "s1" in _cache
+        assert get_stats()["shared_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_clear_cache_async_deletes_shared_entry(self, monkeypatch):
+        from services import context_cache
+        enable_test_encryption(monkeypatch)
+        state = FakeSharedState()
+        with patch("lib.redis_client.get_shared_state", return_value=state):
+            context_cache._put_local("s1", self._entry())
+            await context_cache._put_shared("s1", self._entry())
+            await context_cache.clear_cache_async("s1")
+            assert await context_cache.get_cache_async("s1") is None
+        assert list(state.data) == ["memory_index:version:s1"]
+        assert get_stats()["misses"] == 1
+
+
 class TestPrefetchAndCache:
     @pytest.fixture(autouse=True)
     def clear(self):
@@ -201,21 +230,73 @@ class TestRunDailyPrefetch:
         _cache.clear()
 
     @pytest.mark.asyncio
-    async def test_only_prefetches_at_hour_5(self):
-        seniors = [{"id": "s1", "timezone": "America/New_York"}, {"id": "s2", "timezone": "America/Los_Angeles"}]
-        with patch("services.seniors.list_active", new_callable=AsyncMock, return_value=seniors), \
-             patch("services.context_cache._get_local_hour", side_effect=lambda tz: 5 if tz == "America/New_York" else 10), \
-             patch("services.context_cache.prefetch_and_cache", new_callable=AsyncMock) as mock_prefetch:
+    async def test_prefetches_the_hour_5_bucket(self):
+        seniors = [{"id": "s1", "timezone": "America/New_York"}]
+        with patch("services.seniors.list_active_at_local_hour", new_callable=AsyncMock, return_value=seniors) as mock_list, \
+             patch("services.context_cache.prefetch_and_cache", new_callable=AsyncMock, return_value={}) as mock_prefetch:
             from services.context_cache import run_daily_prefetch
-            await run_daily_prefetch()
+            stats = await run_daily_prefetch()
+            mock_list.assert_awaited_once_with(5)
             mock_prefetch.assert_called_once_with("s1")
+        assert stats["selected"] == 1
+        assert stats["succeeded"] == 1
+        assert get_stats()["last_prefetch"]["succeeded"] == 1
 
     @pytest.mark.asyncio
-    async def test_skips_non_hour_5(self):
-        seniors = [{"id": "s1", "timezone": "America/New_York"}]
-        with patch("services.seniors.list_active", new_callable=AsyncMock, return_value=seniors), \
-             patch("services.context_cache._get_local_hour", return_value=10), \
+    async def test_skips_when_bucket_empty(self):
+        with patch("services.seniors.list_active_at_local_hour", new_callable=AsyncMock, return_value=[]), \
              patch("services.context_cache.prefetch_and_cache", new_callable=AsyncMock) as mock_prefetch:
             from services.context_cache import run_daily_prefetch
-            await run_daily_prefetch()
+            assert await run_daily_prefetch() is None
             mock_prefetch.assert_not_called()
+
+
+class TestPrefetchMany:
+    @pytest.mark.asyncio
+    async def test_bounds_concurrency(self):
+        import asyncio
+        active = 0
+        peak = 0
+
+        async def fake_prefetch(senior_id):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return {}
+
+        with patch("services.context_cache.prefetch_and_cache", side_effect=fake_prefetch):
+            from services.context_cache import prefetch_many
+            stats = await prefetch_many([f"s{i}" for i in range(10)], concurrency=3)
+        assert peak == 3
+        assert stats["succeeded"] == 10
+
+    @pytest.mark.asyncio
+    async def test_counts_failures_and_timeouts(self):
+        import asyncio
+
+        async def fake_prefetch(senior_id):
+            if senior_id == "slow":
+                await asyncio.sleep(1)
+            if senior_id == "boom":
+                raise RuntimeError("db down")
+            return None if senior_id == "missing" else {}
+
+        with patch("services.context_cache.prefetch_and_cache", side_effect=fake_prefetch):
+            from services.context_cache import prefetch_many
+            stats = await prefetch_many(["ok", "slow", "boom", "missing"], timeout=0.05)
+        assert (stats["succeeded"], stats["failed"], stats["timed_out"]) == (1, 2, 1)
+
+    @pytest.mark.asyncio
+    async def test_spreads_starts(self):
+        started = []
+
+        async def fake_prefetch(senior_id):
+            started.append(time.monotonic())
+            return {}
+
+        with patch("services.context_cache.prefetch_and_cache", side_effect=fake_prefetch):
+            from services.context_cache import prefetch_many
+            await prefetch_many(["a", "b", "c"], concurrency=3, spread_seconds=0.15)
+        assert started[2] - started[0] >= 0.09
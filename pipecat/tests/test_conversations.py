@@ -85,21 +85,50 @@ class TestTranscriptPersistence:
         assert format_transcript_text(transcript) == "Senior: hello\nDonna: Hi there"
 
     @pytest.mark.asyncio
-    async def test_update_transcript_writes_encrypted_fields_only(self):
-        with patch("services.conversations.query_one", new_callable=AsyncMock, return_value={"id": "c1"}) as mock_q:
-            from services.conversations import update_transcript
+    async def test_append_transcript_turns_writes_one_encrypted_chunk(self):
+        with patch("services.conversations.query_one", new_callable=AsyncMock, return_value={"id": 1}) as mock_q:
+            from services.conversations import append_transcript_turns
 
-            transcript = [{"role": "user", "content": "hello"}]
-            await update_transcript("CA-1", transcript)
+            turns = [{"role": "user", "content": "hello"}, {"role": "assistant", "content": "Hi"}]
+            await append_transcript_turns("CA-1", turns, 4)
 
             args = mock_q.call_args[0]
-            sql = args[0]
-            assert "transcript_encrypted = $1" in sql
-            assert "transcript_text_encrypted = $2" in sql
-            assert "transcript = $" not in sql
-            assert json.loads(args[1]) == transcript
-            assert args[2] == "Senior: hello"
-            assert args[3] == "CA-1"
+            assert "INSERT INTO conversation_transcript_chunks" in args[0]
+            assert "ON CONFLICT (call_sid, first_turn) DO UPDATE" in args[0]
+            assert args[1:4] == ("CA-1", 4, 2)
+            assert json.loads(args[4]) == turns
+
+    @pytest.mark.asyncio
+    async def test_draft_transcript_reassembles_chunks_in_order(self):
+        chunks = [
+            {"first_turn": 0, "turn_count": 2, "turns_encrypted": json.dumps([{"content": "a"}, {"content": "b"}])},
+            {"first_turn": 2, "turn_count": 1, "turns_encrypted": json.dumps([{"content": "c"}])},
+        ]
+        with patch("services.conversations.query_many", new_callable=AsyncMock, return_value=chunks):
+            from services.conversations import get_draft_transcript
+
+            assert [t["content"] for t in await get_draft_transcript("CA-1")] == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_get_transcript_falls_back_to_draft_chunks(self):
+        row = {"transcript": None, "transcript_encrypted": None, "transcript_text_encrypted": None}
+        chunks = [{"first_turn": 0, "turn_count": 1, "turns_encrypted": json.dumps([{"role": "user", "content": "hello"}])}]
+        with patch("services.conversations.query_one", new_callable=AsyncMock, return_value=row), \
+             patch("services.conversations.query_many", new_callable=AsyncMock, return_value=chunks):
+            from services.conversations import get_transcript_by_call_sid
+
+            assert await get_transcript_by_call_sid("CA-1") == [{"role": "user", "content": "hello"}]
+
+    @pytest.mark.asyncio
+    async def test_complete_removes_draft_chunks(self):
+        with patch("services.conversations.query_one", new_callable=AsyncMock, return_value={"id": "c1"}), \
+             patch("services.conversations.execute", new_callable=AsyncMock) as mock_exec:
+            from services.conversations import complete
+
+            await complete("CA-1", {"transcript": [{"role": "user", "content": "hello"}]})
+
+        assert "DELETE FROM conversation_transcript_chunks" in mock_exec.call_args[0][0]
+        assert mock_exec.call_args[0][1] == "CA-1"
 
     @pytest.mark.asyncio
     async def test_get_transcript_prefers_encrypted_json(self):
@@ -121,7 +150,8 @@ class TestTranscriptPersistence:
             "transcript_encrypted": None,
             "transcript_text_encrypted": "Senior: hello",
         }
-        with patch("services.conversations.query_one", new_callable=AsyncMock, return_value=row):
+        with patch("services.conversations.query_one", new_callable=AsyncMock, return_value=row), \
+             patch("services.conversations.query_many", new_callable=AsyncMock, return_value=[]):
             from services.conversations import get_transcript_by_call_sid
 
             assert await get_transcript_by_call_sid("CA-1") == "Senior: hello"
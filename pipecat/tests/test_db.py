@@ -52,3 +52,129 @@ async def test_query_many_returns_list():
     assert len(result) == 3
     assert result[0] == {"val": 1}
     await close_pool()
+
+
+class _FakeConnection:
+    def __init__(self):
+        self.calls = []
+
+    async def fetch(self, sql, *args):
+        self.calls.append(sql)
+        return [{"val": a} for a in args] or [{"val": 1}, {"val": 2}, {"val": 3}]
+
+    async def fetchrow(self, sql, *args):
+        self.calls.append(sql)
+        return {"val": args[0]} if args else None
+
+    async def execute(self, sql, *args):
+        self.calls.append(sql)
+        return "UPDATE 2" if sql.startswith("UPDATE") else "DELETE 4"
+
+
+class _FakePool:
+    def __init__(self):
+        self.conn = _FakeConnection()
+
+    def acquire(self):
+        pool = self
+
+        class _Ctx:
+            async def __aenter__(self):
+                return pool.conn
+
+            async def __aexit__(self, *exc):
+                return False
+
+        return _Ctx()
+
+
+class TestQueryInstrumentation:
+    @pytest.fixture(autouse=True)
+    def _fake_pool(self, monkeypatch):
+        from db import client
+
+        client.reset_query_stats()
+        self.pool = _FakePool()
+
+        async def fake_get_pool():
+            return self.pool
+
+        monkeypatch.setattr(client, "get_pool", fake_get_pool)
+        yield
+        client.reset_query_stats()
+
+    @pytest.mark.asyncio
+    async def test_named_query_stats(self):
+        from db.client import get_query_stats
+
+        for _ in range(3):
+            rows = await query_many("SELECT $1 AS val", 7, name="test.select")
+        assert rows == [{"val": 7}]
+        # Same SQL text every time, so asyncpg's statement cache reuses the plan.
+        assert set(self.pool.conn.calls) == {"SELECT $1 AS val"}
+        stats = get_query_stats()["test.select"]
+        assert stats["calls"] == 3
+        assert stats["rows"] == 3
+        assert sum(stats["histogram"].values()) == 3
+        assert stats["p50_ms"] is not None
+
+    @pytest.mark.asyncio
+    async def test_query_one_counts_rows(self):
+        from db.client import get_query_stats
+
+        assert await query_one("SELECT $1 AS val", 3, name="test.one") == {"val": 3}
+        assert await query_one("SELECT 1 WHERE false", name="test.none") is None
+        stats = get_query_stats()
+        assert stats["test.one"]["rows"] == 1
+        assert stats["test.none"]["rows"] == 0
+
+    @pytest.mark.asyncio
+    async def test_execute_rows_from_status(self):
+        from db.client import get_query_stats
+
+        assert await execute("UPDATE t SET x = 1", name="test.update") == "UPDATE 2"
+        assert get_query_stats()["test.update"]["rows"] == 2
+
+    @pytest.mark.asyncio
+    async def test_unnamed_queries_grouped_by_fingerprint(self):
+        from db.client import get_query_stats
+
+        await query_many("SELECT val\n   FROM t")
+        await query_many("SELECT val FROM t")
+        await execute("DELETE FROM t")
+        stats = get_query_stats()
+        assert stats["sql:SELECT val FROM t"]["calls"] == 2
+        assert stats["sql:SELECT val FROM t"]["rows"] == 6
+        assert stats["sql:DELETE FROM t"]["rows"] == 4
+
+    @pytest.mark.asyncio
+    async def test_errors_are_counted(self):
+        from db.client import get_query_stats
+
+        async def boom(sql, *args):
+            raise RuntimeError("db down")
+
+        self.pool.conn.fetch = boom
+        with pytest.raises(RuntimeError):
+            await query_many("SELECT 1")
+        assert get_query_stats()["sql:SELECT 1"]["errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_label_cardinality_is_bounded(self, monkeypatch):
+        from db import client
+
+        monkeypatch.setattr(client, "_MAX_QUERY_LABELS", 2)
+        for i in range(4):
+            await query_many(f"SELECT {i}")
+        stats = client.get_query_stats()
+        assert set(stats) == {"sql:SELECT 0", "sql:SELECT 1", "other"}
+        assert stats["other"]["calls"] == 2
+
+    @pytest.mark.asyncio
+    async def test_stats_ordered_by_total_time(self):
+        from db import client
+
+        client._record("fast", 0.0, 1.0, 1)
+        client._record("slow", 0.0, 300.0, 1)
+        assert list(client.get_query_stats())[:2] == ["slow", "fast"]
+        assert client.get_query_stats()["slow"]["p95_ms"] == 500.0
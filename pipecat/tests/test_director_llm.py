@@ -1,11 +1,27 @@
 """Tests for services/director_llm.py - Director LLM analysis (Groq + Gemini)."""
 
+import asyncio
 import json
 import time
 import pytest
 from unittest.mock import patch, AsyncMock, MagicMock
 
 
+def _streaming_client(text: str, chunk_size: int = 8):
+    """OpenAI-style client whose create(stream=True) yields ``text`` in chunks."""
+    client = MagicMock()
+    client.streamed = []
+
+    async def _stream():
+        for i in range(0, len(text), chunk_size):
+            piece = text[i:i + chunk_size]
+            client.streamed.append(piece)
+            yield MagicMock(choices=[MagicMock(delta=MagicMock(content=piece))])
+
+    client.chat.completions.create = AsyncMock(side_effect=lambda **kwargs: _stream())
+    return client
+
+
 class TestRepairJson:
     def test_removes_trailing_commas(self):
         from services.director_llm import _repair_json
@@ -273,17 +289,36 @@ class TestGroqAnalyze:
             "guidance": {},
         }
 
-        mock_choice = MagicMock()
-        mock_choice.message.content = json.dumps(direction)
-        mock_response = MagicMock()
-        mock_response.choices = [mock_choice]
-
-        mock_client = MagicMock()
-        mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
+        mock_client = _streaming_client(json.dumps(direction))
 
         with patch("services.director_llm._get_groq_client", return_value=mock_client):
             result = await _groq_analyze("test", _groq_breaker)
             assert result["analysis"]["call_phase"] == "main"
+        assert mock_client.chat.completions.create.call_args.kwargs["stream"] is True
+
+    @pytest.mark.asyncio
+    async def test_streams_sections_before_completion(self):
+        from services.director_llm import _groq_analyze, _groq_breaker
+        direction = {
+            "analysis": {"call_phase": "main"},
+            "direction": {"stay_or_shift": "stay"},
+            "reminder": {},
+            "guidance": {"tone": "warm"},
+        }
+        text = json.dumps(direction)
+        seen = []
+        mock_client = _streaming_client(text, chunk_size=5)
+
+        def on_field(path, value):
+            # Record how much had streamed when each field arrived.
+            seen.append((path, value, len("".join(mock_client.streamed))))
+
+        with patch("services.director_llm._get_groq_client", return_value=mock_client):
+            result = await _groq_analyze("test", _groq_breaker, on_field)
+        assert result == direction
+        assert [p for p, _, _ in seen] == [("analysis",), ("direction",), ("reminder",), ("guidance",)]
+        assert seen[0][1] == {"call_phase": "main"}
+        assert seen[0][2] < len(text)
 
 
 class TestAnalyzeTurn:
@@ -370,3 +405,218 @@ class TestAnalyzeTurnSpeculative:
              patch("services.director_llm._groq_analyze", new_callable=AsyncMock, side_effect=Exception("fail")):
             result = await analyze_turn_speculative("hello", {"senior": {"name": "Test"}, "_call_start_time": time.time()})
             assert result is None
+
+
+class TestDirectorResultCache:
+    DIRECTION = {
+        "analysis": {"call_phase": "main", "engagement_level": "high"},
+        "direction": {},
+        "reminder": {},
+        "guidance": {},
+    }
+
+    @staticmethod
+    def _state():
+        return {"senior": {"name": "Test"}, "_call_start_time": time.time()}
+
+    @pytest.mark.asyncio
+    async def test_normalized_repeat_is_served_from_cache(self):
+        from services.director_llm import analyze_turn, get_cache_stats
+        state = self._state()
+        history = [{"role": "assistant", "content": "How was your day?"}]
+        with patch("services.director_llm.groq_available", return_value=True), \
+             patch("services.director_llm._groq_analyze", new_callable=AsyncMock, return_value=self.DIRECTION) as mock_groq:
+            first = await analyze_turn("I went to the garden today.", state, history)
+            second = await analyze_turn("i went to the  garden today", state, history)
+        assert first == second == self.DIRECTION
+        assert mock_groq.await_count == 1
+        assert get_cache_stats(state) == {"hits": 1, "coalesced": 0, "misses": 1, "hit_rate": 0.5}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_provider_call(self):
+        from services.director_llm import analyze_turn, analyze_turn_speculative, get_cache_stats
+        state = self._state()
+        release = asyncio.Event()
+
+        async def slow_groq(content, breaker, on_field=None):
+            await release.wait()
+            return self.DIRECTION
+
+        with patch("services.director_llm.groq_available", return_value=True), \
+             patch("services.director_llm._groq_analyze", side_effect=slow_groq) as mock_groq:
+            tasks = [
+                asyncio.create_task(analyze_turn_speculative("hello there", state)),
+                asyncio.create_task(analyze_turn_speculative("Hello there!", state)),
+                asyncio.create_task(analyze_turn("hello there", state)),
+            ]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*tasks)
+        assert all(r == self.DIRECTION for r in results)
+        assert mock_groq.call_count == 1
+        assert get_cache_stats(state)["coalesced"] == 2
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_cached(self):
+        from services.director_llm import analyze_turn_speculative
+        state = self._state()
+        with patch("services.director_llm.groq_available", return_value=True), \
+             patch("services.director_llm._groq_analyze", new_callable=AsyncMock,
+                   side_effect=[None, self.DIRECTION]) as mock_groq:
+            assert await analyze_turn_speculative("hello", state) is None
+            assert await analyze_turn_speculative("hello", state) == self.DIRECTION
+        assert mock_groq.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_delivered_reminder_changes_key(self):
+        from services.director_llm import analyze_turn
+        state = self._state()
+        with patch("services.director_llm.groq_available", return_value=True), \
+             patch("services.director_llm._groq_analyze", new_callable=AsyncMock, return_value=self.DIRECTION) as mock_groq:
+            await analyze_turn("okay", state)
+            state["reminders_delivered"] = {"Take medication"}
+            await analyze_turn("okay", state)
+        assert mock_groq.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cached_result_is_isolated_from_caller_mutation(self):
+        from services.director_llm import analyze_turn
+        state = self._state()
+        with patch("services.director_llm.groq_available", return_value=True), \
+             patch("services.director_llm._groq_analyze", new_callable=AsyncMock, return_value=self.DIRECTION):
+            first = await analyze_turn("hello", state)
+            first["analysis"]["call_phase"] = "winding_down"
+            second = await analyze_turn("hello", state)
+        assert second["analysis"]["call_phase"] == "main"
+
+    @pytest.mark.asyncio
+    async def test_query_results_cached_separately(self):
+        from services.director_llm import analyze_queries
+        state = self._state()
+        client = _streaming_client('{"memory_queries": ["garden"]}')
+        with patch("services.director_llm.fast_provider_available", return_value=True), \
+             patch("services.director_llm._get_groq_client", return_value=client):
+            first = await analyze_queries("my garden", state)
+            second = await analyze_queries("My garden.", state)
+        assert first == second == {"memory_queries": ["garden"]}
+        assert client.chat.completions.create.await_count == 1
+
+
+class TestHedgedAnalyze:
+    DIRECTION = {
+        "analysis": {"call_phase": "main", "engagement_level": "high"},
+        "direction": {},
+        "reminder": {},
+        "guidance": {},
+    }
+
+    @staticmethod
+    def _state():
+        return {"senior": {"name": "Test"}, "_call_start_time": time.time()}
+
+    @pytest.fixture(autouse=True)
+    def _hedge_env(self, monkeypatch):
+        import services.director_llm as dl
+        monkeypatch.setenv("GROQ_API_KEY", "test")
+        monkeypatch.setenv("GOOGLE_API_KEY", "test")
+        monkeypatch.setattr(dl, "HEDGE_ENABLED", True)
+        monkeypatch.setattr(dl, "HEDGE_DEFAULT_DELAY_S", 0.05)
+        monkeypatch.setattr(dl, "_provider_latency", {"groq": dl._LatencyTracker(), "gemini": dl._LatencyTracker()})
+
+    @pytest.mark.asyncio
+    async def test_fast_primary_never_fires_secondary(self):
+        from services.director_llm import analyze_turn
+        with patch("services.director_llm._groq_analyze", new_callable=AsyncMock, return_value=self.DIRECTION), \
+             patch("services.director_llm._gemini_analyze", new_callable=AsyncMock) as mock_gemini:
+            state = self._state()
+            result = await analyze_turn("hello", state)
+        assert result == self.DIRECTION
+        mock_gemini.assert_not_called()
+        assert "_context_trace_events" not in state
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_is_hedged_and_cancelled(self):
+        from services.director_llm import analyze_turn
+        groq_cancelled = asyncio.Event()
+
+        async def slow_groq(content, breaker, on_field=None):
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                groq_cancelled.set()
+                raise
+
+        gemini_direction = {**self.DIRECTION, "analysis": {"call_phase": "main", "engagement_level": "low"}}
+        state = self._state()
+        with patch("services.director_llm._groq_analyze", side_effect=slow_groq), \
+             patch("services.director_llm._gemini_analyze", new_callable=AsyncMock, return_value=gemini_direction):
+            result = await analyze_turn("hello", state)
+            await asyncio.wait_for(groq_cancelled.wait(), timeout=1)
+        assert result["analysis"]["engagement_level"] == "low"
+        event = state["_context_trace_events"][-1]
+        assert event["action"] == "hedged"
+        assert event["provider"] == "gemini"
+        assert event["metadata"]["winner"] == "gemini"
+        assert event["metadata"]["hedge_delay_ms"] == 50
+        assert event["metadata"]["gemini_ms"] is not None
+        # The cancelled Groq call still counts, at no less than the hedge delay.
+        import services.director_llm as dl
+        assert min(dl._provider_latency["groq"]._samples) >= 0.05
+
+    @pytest.mark.asyncio
+    async def test_primary_can_still_win_after_hedge(self):
+        from services.director_llm import analyze_turn
+
+        async def groq(content, breaker, on_field=None):
+            await asyncio.sleep(0.1)
+            return self.DIRECTION
+
+        async def slow_gemini(content):
+            await asyncio.sleep(5)
+
+        state = self._state()
+        with patch("services.director_llm._groq_analyze", side_effect=groq), \
+             patch("services.director_llm._gemini_analyze", side_effect=slow_gemini):
+            result = await analyze_turn("hello", state)
+        assert result == self.DIRECTION
+        assert state["_context_trace_events"][-1]["metadata"]["winner"] == "groq"
+        assert state["_context_trace_events"][-1]["metadata"]["gemini_ms"] is None
+
+    @pytest.mark.asyncio
+    async def test_invalid_primary_falls_back_without_hedge(self):
+        from services.director_llm import analyze_turn
+        state = self._state()
+        with patch("services.director_llm._groq_analyze", new_callable=AsyncMock, return_value=None), \
+             patch("services.director_llm._gemini_analyze", new_callable=AsyncMock, return_value=self.DIRECTION):
+            result = await analyze_turn("hello", state)
+        assert result == self.DIRECTION
+        assert "_context_trace_events" not in state
+
+    def test_hedge_delay_tracks_primary_p95(self):
+        import services.director_llm as dl
+        assert dl._hedge_delay("groq") == dl.HEDGE_DEFAULT_DELAY_S
+        for ms in range(1, 101):
+            dl._provider_latency["groq"].record(ms / 100)
+        assert dl._hedge_delay("groq") == 0.95
+        for _ in range(100):
+            dl._provider_latency["groq"].record(10.0)
+        assert dl._hedge_delay("groq") == dl.HEDGE_MAX_DELAY_S
+
+
+class TestStreamedQueries:
+    @pytest.mark.asyncio
+    async def test_queries_reported_as_they_complete(self):
+        from services.director_llm import analyze_queries
+        text = '{"memory_queries": ["grandson Jake", "Torchy\'s Tacos"]}'
+        client = _streaming_client(text, chunk_size=4)
+        seen = []
+        with patch("services.director_llm.fast_provider_available", return_value=True), \
+             patch("services.director_llm._get_groq_client", return_value=client):
+            result = await analyze_queries(
+                "Jake took me to Torchy's", {"senior": {}},
+                on_field=lambda path, value: seen.append((path, value, len("".join(client.streamed)))),
+            )
+        assert result == {"memory_queries": ["grandson Jake", "Torchy's Tacos"]}
+        assert seen[0][:2] == (("memory_queries", 0), "grandson Jake")
+        assert seen[0][2] < len(text)
+        assert seen[-1][0] == ("memory_queries",)
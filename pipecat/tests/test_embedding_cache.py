@@ -0,0 +1,154 @@
+"""Tests for services/embedding_cache.py and the memory embedding entry points."""
+
+import asyncio
+import pytest
+from unittest.mock import patch, AsyncMock, MagicMock
+
+from services import embedding_cache
+
+
+@pytest.fixture(autouse=True)
+def _clean_cache():
+    embedding_cache.clear()
+    yield
+    embedding_cache.clear()
+
+
+def _client(vectors_for):
+    """Mock OpenAI client whose embeddings.create returns one vector per input."""
+    async def create(model, input):
+        inputs = [input] if isinstance(input, str) else list(input)
+        response = MagicMock()
+        response.data = [MagicMock(embedding=vectors_for(t), index=i) for i, t in enumerate(inputs)]
+        return response
+
+    client = MagicMock()
+    client.embeddings.create = AsyncMock(side_effect=create)
+    return client
+
+
+def _vec(text):
+    return [float(len(text)), 0.5]
+
+
+class TestEmbeddingCache:
+    def test_key_ignores_whitespace_differences(self):
+        assert embedding_cache.cache_key("m", "likes  roses\n") == embedding_cache.cache_key("m", "likes roses")
+        assert embedding_cache.cache_key("m", "roses") != embedding_cache.cache_key("other", "roses")
+
+    def test_lru_eviction(self):
+        with patch.object(embedding_cache, "MAX_ENTRIES", 2):
+            embedding_cache.put_local("a", [1.0])
+            embedding_cache.put_local("b", [2.0])
+            embedding_cache.get_local("a")
+            embedding_cache.put_local("c", [3.0])
+        assert embedding_cache.get_local("b") is None
+        assert embedding_cache.get_local("a") == [1.0]
+        assert embedding_cache.get_stats()["evictions"] == 1
+
+    def test_ttl_expiry(self):
+        embedding_cache.put_local("a", [1.0])
+        vector, stored_at = embedding_cache._entries["a"]
+        embedding_cache._entries["a"] = (vector, stored_at - embedding_cache.TTL_SECONDS - 1)
+        assert embedding_cache.cleanup_expired() == 1
+        assert embedding_cache.get_local("a") is None
+
+    @pytest.mark.asyncio
+    async def test_none_results_are_not_cached(self):
+        compute = AsyncMock(return_value=None)
+        assert await embedding_cache.get_or_compute("k", compute) is None
+        assert await embedding_cache.get_or_compute("k", compute) is None
+        assert compute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_computation(self):
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return [1.0, 2.0]
+
+        results = await asyncio.gather(*(embedding_cache.get_or_compute("k", compute) for _ in range(5)))
+        assert calls == 1
+        assert all(r == [1.0, 2.0] for r in results)
+        assert embedding_cache.get_stats()["coalesced"] == 4
+
+    @pytest.mark.asyncio
+    async def test_shared_state_backfills_local_cache(self):
+        from lib.redis_client import InMemoryState
+
+        state = InMemoryState()
+        state.is_shared = True
+        with patch.object(embedding_cache, "_shared_enabled", return_value=True), \
+             patch("lib.redis_client.get_shared_state", return_value=state):
+            await embedding_cache.store("k", [0.25, 0.5])
+            embedding_cache._entries.clear()
+            assert await embedding_cache.lookup("k") == [0.25, 0.5]
+        assert embedding_cache.get_stats()["shared_hits"] == 1
+        assert embedding_cache.get_local("k") == [0.25, 0.5]
+
+
+class TestGenerateEmbeddingCached:
+    @pytest.mark.asyncio
+    async def test_repeat_query_hits_cache(self):
+        client = _client(_vec)
+        with patch("services.memory._get_openai", return_value=client):
+            from services.memory import generate_embedding
+            first = await generate_embedding("how is your garden")
+            second = await generate_embedding("how is your  garden")
+        assert first == second
+        assert client.embeddings.create.await_count == 1
+        stats = embedding_cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["hit_rate"] == 0.5
+
+
+class TestGenerateEmbeddings:
+    @pytest.mark.asyncio
+    async def test_batches_misses_into_one_request(self):
+        client = _client(_vec)
+        with patch("services.memory._get_openai", return_value=client):
+            from services.memory import generate_embedding, generate_embeddings
+            await generate_embedding("cached")
+            result = await generate_embeddings(["a", "cached", "bb", "a"])
+        assert result == [_vec("a"), _vec("cached"), _vec("bb"), _vec("a")]
+        assert client.embeddings.create.await_count == 2
+        assert client.embeddings.create.await_args.kwargs["input"] == ["a", "bb"]
+
+    @pytest.mark.asyncio
+    async def test_chunks_large_batches(self):
+        client = _client(_vec)
+        with patch("services.memory._get_openai", return_value=client), \
+             patch("services.memory.EMBEDDING_BATCH_SIZE", 2):
+            from services.memory import generate_embeddings
+            result = await generate_embeddings(["a", "bb", "ccc"])
+        assert result == [_vec("a"), _vec("bb"), _vec("ccc")]
+        assert client.embeddings.create.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_without_client_returns_nones(self):
+        with patch("services.memory._get_openai", return_value=None):
+            from services.memory import generate_embeddings
+            assert await generate_embeddings(["a", "b"]) == [None, None]
+
+    @pytest.mark.asyncio
+    async def test_extraction_embeds_all_memories_in_one_call(self):
+        memories = {"memories": [
+            {"type": "fact", "content": "Likes roses", "importance": 60},
+            {"type": "fact", "content": "Has a cat named Whiskers", "importance": 50},
+        ]}
+        import json
+        chat_response = MagicMock()
+        chat_response.choices = [MagicMock(message=MagicMock(content=json.dumps(memories)))]
+        client = _client(lambda t: [1.0, 0.0] if "roses" in t else [0.0, 1.0])
+        client.chat.completions.create = AsyncMock(return_value=chat_response)
+        with patch("services.memory._get_openai", return_value=client), \
+             patch("db.query_many", new_callable=AsyncMock, return_value=[]) as mock_q:
+            from services.memory import extract_from_conversation
+            await extract_from_conversation("s1", "User: I love roses", "conv-1")
+        assert client.embeddings.create.await_count == 1
+        insert_args = mock_q.await_args_list[-1].args
+        assert "INSERT INTO memories" in insert_args[0]
+        assert insert_args[6] == [json.dumps([1.0, 0.0]), json.dumps([0.0, 1.0])]
@@ -167,6 +167,82 @@ class TestGracefulDegradation:
         assert decrypt(encrypted) == "[encrypted]"
 
 
+class TestBulkDecrypt:
+    """decrypt_many / decrypt_many_async and the plaintext cache."""
+
+    @pytest.fixture(autouse=True)
+    def _clean_cache(self):
+        import lib.encryption as enc
+        enc.clear_plaintext_cache()
+        for key in enc._cache_stats:
+            enc._cache_stats[key] = 0
+        yield
+        enc.clear_plaintext_cache()
+
+    def test_decrypt_many_preserves_order_and_passthroughs(self, encryption_key):
+        from lib.encryption import decrypt_json_many, decrypt_many, encrypt, encrypt_json
+
+        values = [encrypt("one"), None, "legacy plain", encrypt("two"), "enc:bad"]
+        assert decrypt_many(values) == ["one", None, "legacy plain", "two", "enc:bad"]
+        assert decrypt_json_many([encrypt_json({"a": 1}), {"b": 2}, None]) == [{"a": 1}, {"b": 2}, None]
+
+    def test_decrypt_many_without_key_returns_markers(self):
+        from lib.encryption import decrypt_many
+
+        assert decrypt_many(["enc:AAAA:BBBB:CCCC", "plain"]) == ["[encrypted]", "plain"]
+
+    def test_cache_serves_repeat_reads(self, encryption_key):
+        from lib.encryption import decrypt, decrypt_many, encrypt, get_cache_stats
+
+        ct = encrypt("memory content")
+        assert decrypt(ct, cache=True) == "memory content"
+        assert decrypt_many([ct, ct], cache=True) == ["memory content", "memory content"]
+        stats = get_cache_stats()
+        assert (stats["misses"], stats["hits"], stats["entries"]) == (1, 2, 1)
+        # Uncached reads neither consult nor fill the cache.
+        decrypt(encrypt("other"))
+        assert get_cache_stats()["entries"] == 1
+
+    def test_cache_is_bounded_and_dropped_on_key_change(self, encryption_key, monkeypatch):
+        import lib.encryption as enc
+
+        monkeypatch.setattr(enc, "PLAINTEXT_CACHE_MAX_ENTRIES", 2)
+        cts = [enc.encrypt(f"value {i}") for i in range(3)]
+        enc.decrypt_many(cts, cache=True)
+        assert list(enc._plaintext_cache) == cts[1:]
+        assert enc.get_cache_stats()["evictions"] == 1
+
+        monkeypatch.setenv("FIELD_ENCRYPTION_KEY", base64.urlsafe_b64encode(os.urandom(32)).decode())
+        enc._aes = None
+        assert enc.decrypt(cts[2], cache=True) == "[encrypted]"
+        assert enc.get_cache_stats()["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_async_offloads_only_cache_misses(self, encryption_key, monkeypatch):
+        import asyncio
+        import lib.encryption as enc
+
+        cts = [enc.encrypt(f"row {i}") for i in range(6)]
+        enc.decrypt_many(cts[:3], cache=True)
+
+        offloaded = []
+        real_to_thread = asyncio.to_thread
+
+        async def to_thread(fn, *args):
+            offloaded.append(True)
+            return await real_to_thread(fn, *args)
+
+        monkeypatch.setattr(enc.asyncio, "to_thread", to_thread)
+        result = await enc.decrypt_many_async(cts + [None], cache=True, offload_threshold=3)
+
+        assert result == [f"row {i}" for i in range(6)] + [None]
+        assert offloaded == [True]
+        assert enc.get_cache_stats()["entries"] == 6
+
+        assert await enc.decrypt_many_async(cts[:2], offload_threshold=3) == ["row 0", "row 1"]
+        assert offloaded == [True]
+
+
 class TestInvalidKey:
     """Tests with an invalid encryption key."""
 
@@ -0,0 +1,154 @@
+"""Tests for the HIPAA data export route, buffered and streaming."""
+
+import json
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from api.middleware.auth import AuthContext
+from api.routes import export
+
+SENIOR_ID = "11111111-1111-1111-1111-111111111111"
+SENIOR = {"id": SENIOR_ID, "name": "Ann", "created_at": datetime(2026, 1, 1, tzinfo=timezone.utc)}
+
+ROWS = {
+    "conversations": [
+        {"id": f"c{i}", "senior_id": SENIOR_ID, "summary": f"call {i}", "call_metrics": {"turns": i}}
+        for i in range(5)
+    ],
+    "memories": [{"id": f"m{i}", "content": f"memory {i}", "embedding": [0.1]} for i in range(3)],
+    "reminders": [],
+    "call_analyses": [{"id": "a1", "engagement_score": Decimal("7.5"), "summary": "ok"}],
+    "daily_context": [{"id": "d1", "summary": "today"}],
+    "caregiver_links": [{"id": "g1", "clerk_user_id": "user_1", "role": "caregiver"}],
+}
+
+
+def _section_for(sql: str) -> str:
+    for section, section_sql, _, _ in export._SECTIONS:
+        if sql == section_sql:
+            return section
+    raise AssertionError(f"unexpected SQL: {sql}")
+
+
+async def _fake_query_one(sql, *args, name=None):
+    if sql == export._AUDIT_COUNTS_SQL:
+        return {section: len(ROWS[section]) for section in ("conversations", "memories", "reminders")}
+    return dict(SENIOR)
+
+
+async def _fake_query_many(sql, *args, name=None):
+    return [dict(row) for row in ROWS[_section_for(sql)]]
+
+
+@asynccontextmanager
+async def _fake_snapshot():
+    yield SimpleNamespace()
+
+
+async def _fake_iter_batches(conn, sql, *args, batch_size=500, name=None):
+    rows = ROWS[_section_for(sql)]
+    for start in range(0, len(rows), 2):
+        yield [dict(row) for row in rows[start:start + 2]]
+
+
+def _request():
+    return SimpleNamespace(client=SimpleNamespace(host="127.0.0.1"), headers={"user-agent": "pytest"})
+
+
+async def _export(**params):
+    audit = AsyncMock()
+    with patch.object(export, "_can_access_senior", AsyncMock(return_value=True)), \
+         patch.object(export, "query_one", _fake_query_one), \
+         patch.object(export, "query_many", _fake_query_many), \
+         patch.object(export, "read_snapshot", _fake_snapshot), \
+         patch.object(export, "iter_batches", _fake_iter_batches), \
+         patch.object(export, "write_audit", audit):
+        response = await export.export_senior_data(
+            SENIOR_ID,
+            _request(),
+            auth=AuthContext(is_admin=True, user_id="admin-1"),
+            format=params.get("format", "json"),
+            stream=params.get("stream", False),
+        )
+        if hasattr(response, "body_iterator"):
+            chunks = [chunk async for chunk in response.body_iterator]
+            response = (response.media_type, "".join(chunks))
+    return response, audit
+
+
+class TestStreamingExport:
+    @pytest.mark.asyncio
+    async def test_stream_json_matches_buffered_bundle(self):
+        bundle, buffered_audit = await _export()
+        (media_type, text), streamed_audit = await _export(stream=True)
+
+        streamed = json.loads(text)
+        assert media_type == "application/json"
+        assert list(streamed) == list(bundle)
+        bundle = json.loads(json.dumps(bundle, default=export._serialize))
+        streamed.pop("exported_at")
+        bundle.pop("exported_at")
+        assert streamed == bundle
+        assert streamed["call_analyses"][0]["engagement_score"] == 7.5
+        assert "embedding" not in streamed["memories"][0]
+        assert buffered_audit.await_args.kwargs == streamed_audit.await_args.kwargs
+
+    @pytest.mark.asyncio
+    async def test_ndjson_emits_one_line_per_record_and_end_counts(self):
+        (media_type, text), audit = await _export(format="ndjson")
+
+        lines = [json.loads(line) for line in text.splitlines()]
+        assert media_type == "application/x-ndjson"
+        assert lines[0]["section"] == "senior"
+        assert lines[0]["data"]["name"] == "Ann"
+        assert [line["data"]["id"] for line in lines if line["section"] == "conversations"] == [
+            f"c{i}" for i in range(5)
+        ]
+        assert lines[-1] == {
+            "section": "end",
+            "counts": {section: len(rows) for section, rows in ROWS.items()},
+        }
+        assert audit.await_args.kwargs["action"] == "export"
+        assert audit.await_args.kwargs["metadata"] == {
+            "conversations": 5,
+            "memories": 3,
+            "reminders": 0,
+            "surface": "pipecat_export",
+        }
+
+
+class _FakeCursor:
+    def __init__(self, rows):
+        self.rows = rows
+        self.fetches = []
+
+    async def fetch(self, n):
+        self.fetches.append(n)
+        batch, self.rows = self.rows[:n], self.rows[n:]
+        return batch
+
+
+class TestIterBatches:
+    @pytest.mark.asyncio
+    async def test_yields_bounded_batches_and_records_one_call(self):
+        from db import client
+
+        cursor = _FakeCursor([{"id": i} for i in range(7)])
+        conn = SimpleNamespace(cursor=AsyncMock(return_value=cursor))
+        client.reset_query_stats()
+
+        batches = [
+            batch async for batch in client.iter_batches(conn, "SELECT id FROM t", batch_size=3, name="test.iter")
+        ]
+
+        assert [len(batch) for batch in batches] == [3, 3, 1]
+        assert cursor.fetches == [3, 3, 3, 3]
+        stats = client.get_query_stats()["test.iter"]
+        assert stats["calls"] == 1
+        assert stats["rows"] == 7
+        client.reset_query_stats()
@@ -160,6 +160,75 @@ class TestDirectorFallbackAnalysis:
         assert returned["direction"]["pacing_note"] == "time_to_close"
 
 
+    @pytest.mark.asyncio
+    async def test_streamed_sections_start_prefetch_before_guidance(self, session_state):
+        processor = ConversationDirectorProcessor(session_state=session_state)
+        result = get_default_direction()
+        prefetched_before_return = []
+
+        async def streaming_analyze(user_message, state, conversation_history=None, on_field=None):
+            for section in ("analysis", "direction", "reminder"):
+                on_field((section,), result[section])
+            await asyncio.sleep(0)
+            prefetched_before_return.append(mock_prefetch.call_count)
+            on_field(("guidance",), result["guidance"])
+            return result
+
+        with patch("processors.conversation_director.analyze_turn", side_effect=streaming_analyze), \
+             patch.object(processor, "_run_director_prefetch", new_callable=AsyncMock) as mock_prefetch:
+            await processor._run_fallback_analysis("I had lunch", [])
+            await asyncio.sleep(0)
+
+        assert prefetched_before_return == [1]
+        # The streamed sections already prefetched; the result does not repeat it.
+        assert mock_prefetch.call_count == 1
+        early = mock_prefetch.call_args_list[0].args[0]
+        assert set(early) == {"analysis", "direction", "reminder"}
+        stages = session_state["_call_metrics"]["stage_latency_values"]
+        assert "director.fallback.first_field" in stages
+
+    @pytest.mark.asyncio
+    async def test_streamed_queries_prefetch_individually(self, session_state):
+        processor = ConversationDirectorProcessor(session_state=session_state)
+
+        async def streaming_queries(user_message, state, conversation_history=None, on_field=None):
+            on_field(("memory_queries", 0), "grandson jake")
+            on_field(("memory_queries", 1), "garden")
+            on_field(("memory_queries",), ["grandson jake", "garden"])
+            return {"memory_queries": ["grandson jake", "garden"]}
+
+        with patch("processors.conversation_director.analyze_queries", side_effect=streaming_queries), \
+             patch.object(processor, "_run_director_prefetch", new_callable=AsyncMock) as mock_prefetch:
+            await processor._run_query_analysis("Jake helped in the garden", [])
+            await asyncio.sleep(0)
+
+        # One prefetch per streamed query and no repeat once the result lands.
+        calls = [c.args[0] for c in mock_prefetch.call_args_list]
+        assert calls == [
+            {"prefetch": {"memory_queries": ["grandson jake"]}},
+            {"prefetch": {"memory_queries": ["garden"]}},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_unstreamed_queries_prefetch_after_result(self, session_state):
+        processor = ConversationDirectorProcessor(session_state=session_state)
+
+        async def partly_streamed(user_message, state, conversation_history=None, on_field=None):
+            on_field(("memory_queries", 0), "grandson jake")
+            return {"memory_queries": ["grandson jake", "garden"]}
+
+        with patch("processors.conversation_director.analyze_queries", side_effect=partly_streamed), \
+             patch.object(processor, "_run_director_prefetch", new_callable=AsyncMock) as mock_prefetch:
+            await processor._run_query_analysis("Jake helped in the garden", [])
+            await asyncio.sleep(0)
+
+        calls = [c.args[0] for c in mock_prefetch.call_args_list]
+        assert calls == [
+            {"prefetch": {"memory_queries": ["grandson jake"]}},
+            {"prefetch": {"memory_queries": ["garden"]}},
+        ]
+
+
 class TestDirectorContextInjection:
     """Verify non-guidance context is injected ephemerally and deduplicated."""
 
@@ -331,6 +400,31 @@ class TestDirectorContextInjection:
 
         mock_sleep.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_memory_gate_wakes_when_prefetch_lands(self, session_state):
+        from services.prefetch import PrefetchCache
+
+        frames = []
+
+        async def capture_frame(frame, direction=None):
+            frames.append(frame)
+
+        cache = PrefetchCache()
+        cache.mark_inflight("gardening roses")
+        session_state["_prefetch_cache"] = cache
+
+        processor = ConversationDirectorProcessor(session_state=session_state)
+        processor.push_frame = capture_frame
+
+        asyncio.get_running_loop().call_later(
+            0.01, cache.put, "gardening roses", [{"id": "memory-1", "content": "Loves growing roses."}],
+        )
+        start = time.monotonic()
+        await processor._inject_prefetched_memories("gardening roses")
+
+        assert time.monotonic() - start < processor.MEMORY_GATE_TIMEOUT_SECONDS
+        assert len(frames) == 1
+
     @pytest.mark.asyncio
     async def test_injected_memory_marks_accessed_after_push(self, session_state):
         from services.prefetch import PrefetchCache
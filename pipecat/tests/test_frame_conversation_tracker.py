@@ -55,7 +55,7 @@ class TestTrackerUserMessage:
         session_state["_transcript_persistence_enabled"] = True
         tracker = ConversationTrackerProcessor(session_state=session_state)
 
-        with patch("services.conversations.update_transcript", new_callable=AsyncMock) as mock_update:
+        with patch("services.conversations.append_transcript_turns", new_callable=AsyncMock, return_value={"id": 1}) as mock_update:
             await run_processor_test(
                 processors=[tracker],
                 frames_to_inject=[make_transcription("Hello Donna")],
@@ -63,16 +63,17 @@ class TestTrackerUserMessage:
             await tracker.flush_pending_persistence()
 
         assert mock_update.await_count >= 1
-        call_sid, transcript = mock_update.await_args.args
+        call_sid, turns, first_turn = mock_update.await_args.args
         assert call_sid == "CA-draft-001"
-        assert transcript[-1]["content"] == "Hello Donna"
+        assert first_turn == 0
+        assert turns[-1]["content"] == "Hello Donna"
 
     @pytest.mark.asyncio
     async def test_does_not_persist_transcript_draft_unless_enabled(self, session_state):
         session_state["call_sid"] = "CA-draft-002"
         tracker = ConversationTrackerProcessor(session_state=session_state)
 
-        with patch("services.conversations.update_transcript", new_callable=AsyncMock) as mock_update:
+        with patch("services.conversations.append_transcript_turns", new_callable=AsyncMock, return_value={"id": 1}) as mock_update:
             await run_processor_test(
                 processors=[tracker],
                 frames_to_inject=[make_transcription("Hello Donna")],
@@ -82,6 +83,53 @@ class TestTrackerUserMessage:
         mock_update.assert_not_awaited()
 
 
+class TestTranscriptDraftFlush:
+    """Verify append-only draft persistence coalesces and retries."""
+
+    @pytest.fixture
+    def tracker(self, session_state):
+        session_state["call_sid"] = "CA-append-001"
+        session_state["_transcript_persistence_enabled"] = True
+        return ConversationTrackerProcessor(session_state=session_state)
+
+    @pytest.mark.asyncio
+    async def test_burst_of_turns_is_one_write(self, tracker):
+        with patch("services.conversations.append_transcript_turns", new_callable=AsyncMock, return_value={"id": 1}) as mock_append:
+            for i in range(5):
+                tracker._record_turn("user", f"turn {i}")
+            await tracker.flush_pending_persistence()
+
+        mock_append.assert_awaited_once()
+        _, turns, first_turn = mock_append.await_args.args
+        assert first_turn == 0
+        assert [t["content"] for t in turns] == [f"turn {i}" for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_later_flush_writes_only_new_turns(self, tracker):
+        with patch("services.conversations.append_transcript_turns", new_callable=AsyncMock, return_value={"id": 1}) as mock_append:
+            tracker._record_turn("user", "first")
+            await tracker.flush_pending_persistence()
+            tracker._record_turn("assistant", "second")
+            await tracker.flush_pending_persistence()
+
+        _, turns, first_turn = mock_append.await_args.args
+        assert first_turn == 1
+        assert [t["content"] for t in turns] == ["second"]
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_is_retried_from_same_turn(self, tracker):
+        append = AsyncMock(side_effect=[Exception("db down"), {"id": 1}])
+        with patch("services.conversations.append_transcript_turns", append):
+            tracker._record_turn("user", "first")
+            await tracker.flush_pending_persistence()
+            tracker._record_turn("assistant", "second")
+            await tracker.flush_pending_persistence()
+
+        _, turns, first_turn = append.await_args.args
+        assert first_turn == 0
+        assert [t["content"] for t in turns] == ["first", "second"]
+
+
 class TestTrackerAssistantMessage:
     """Verify question/advice extraction from LLM TextFrames."""
 
@@ -123,7 +171,7 @@ class TestSplitPipelineTracking:
             track_user=False,
         )
 
-        with patch("services.conversations.update_transcript", new_callable=AsyncMock) as mock_update:
+        with patch("services.conversations.append_transcript_turns", new_callable=AsyncMock, return_value={"id": 1}) as mock_update:
             await run_processor_test(
                 processors=[user_tracker, assistant_tracker],
                 frames_to_inject=[
@@ -146,9 +194,8 @@ class TestSplitPipelineTracking:
         assert [turn["sequence"] for turn in full_transcript] == [0, 1]
         assert all("timestamp" in turn for turn in full_transcript)
 
-        assert mock_update.await_count >= 1
-        call_sid, persisted = mock_update.await_args.args
-        assert call_sid == "CA-split-001"
+        persisted = [turn for call in mock_update.await_args_list for turn in call.args[1]]
+        assert mock_update.await_args.args[0] == "CA-split-001"
         assert [turn["role"] for turn in persisted] == ["user", "assistant"]
 
     @pytest.mark.asyncio
@@ -167,7 +214,7 @@ class TestSplitPipelineTracking:
             track_user=False,
         )
 
-        with patch("services.conversations.update_transcript", new_callable=AsyncMock):
+        with patch("services.conversations.append_transcript_turns", new_callable=AsyncMock, return_value={"id": 1}):
             await run_processor_test(
                 processors=[user_tracker, assistant_tracker],
                 frames_to_inject=[
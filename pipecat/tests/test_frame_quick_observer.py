@@ -10,6 +10,7 @@ import pytest
 
 from pipecat.frames.frames import (
     EndFrame,
+    InterimTranscriptionFrame,
     LLMMessagesAppendFrame,
     TextFrame,
     TranscriptionFrame,
@@ -190,3 +191,52 @@ class TestQuickObserverGoodbyeEndFrame:
         await asyncio.wait_for(runner.run(task), timeout=5.0)
 
         assert session_state.get("_goodbye_in_progress") is not True
+
+
+def _interim(text: str) -> InterimTranscriptionFrame:
+    return InterimTranscriptionFrame(text=text, user_id="senior-test-001", timestamp="", language="en")
+
+
+class TestQuickObserverInterimPrecompute:
+    """Verify interim transcripts are analyzed ahead of the final frame."""
+
+    @pytest.mark.asyncio
+    async def test_final_matching_interim_reuses_precomputed(self, session_state):
+        processor = QuickObserverProcessor(session_state=session_state)
+        capture = await run_processor_test(
+            processors=[processor],
+            frames_to_inject=[
+                _interim("I fell"),
+                _interim("I fell in the bathroom"),
+                make_transcription("I fell in the bathroom"),
+            ],
+        )
+        assert session_state["_call_metrics"]["quick_observer_precompute"] == {"hits": 1, "misses": 0}
+        assert any(s["signal"] == "fall" for s in processor.last_analysis.health_signals)
+        assert capture.get_frames_of_type(LLMMessagesAppendFrame)
+        assert "_interim_quick_analysis" not in session_state
+
+    @pytest.mark.asyncio
+    async def test_final_differing_from_interim_counts_miss(self, session_state):
+        processor = QuickObserverProcessor(session_state=session_state)
+        await run_processor_test(
+            processors=[processor],
+            frames_to_inject=[
+                _interim("I feel fine"),
+                make_transcription("I feel fine, I just had breakfast"),
+            ],
+        )
+        assert session_state["_call_metrics"]["quick_observer_precompute"] == {"hits": 0, "misses": 1}
+        assert any(s["signal"] == "eating" for s in processor.last_analysis.health_signals)
+
+    @pytest.mark.asyncio
+    async def test_interim_analysis_exposed_before_final(self, session_state):
+        processor = QuickObserverProcessor(session_state=session_state)
+        capture = await run_processor_test(
+            processors=[processor],
+            frames_to_inject=[_interim("I fell down the stairs")],
+        )
+        analysis = session_state["_interim_quick_analysis"]
+        assert any(s["signal"] == "fall" for s in analysis.health_signals)
+        # Interim analysis never injects guidance on its own.
+        assert not capture.get_frames_of_type(LLMMessagesAppendFrame)
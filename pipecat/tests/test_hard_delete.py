@@ -0,0 +1,84 @@
+"""Tests for the hard-delete cascade."""
+
+import time
+from contextlib import asynccontextmanager
+from unittest.mock import patch
+
+import pytest
+
+from services import context_cache
+from services.hard_delete import hard_delete_senior
+from tests.test_scheduler import FakeSharedState, enable_test_encryption
+
+
+class _FakeConn:
+    def __init__(self):
+        self.executed = []
+
+    async def fetchval(self, sql, *args):
+        return 0
+
+    async def execute(self, sql, *args):
+        self.executed.append(" ".join(sql.split()))
+        return "DELETE 1"
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+
+
+class _FakePool:
+    def __init__(self, conn):
+        self.conn = conn
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield self.conn
+
+
+async def _run_delete(conn, senior_id="s1"):
+    async def get_pool():
+        return _FakePool(conn)
+
+    with patch("services.hard_delete.get_pool", get_pool):
+        return await hard_delete_senior(senior_id, deleted_by="admin")
+
+
+@pytest.fixture(autouse=True)
+def clear_context_cache():
+    context_cache.clear_all()
+    yield
+    context_cache.clear_all()
+
+
+@pytest.mark.asyncio
+async def test_hard_delete_clears_local_and_shared_context(monkeypatch):
+    enable_test_encryption(monkeypatch)
+    state = FakeSharedState()
+    now = time.time()
+    entry = {"senior_id": "s1", "senior": {"id": "s1"}, "greeting": "Hi Margaret!",
+             "memory_context": "Likes roses", "cached_at": now, "expires_at": now + 3600}
+    with patch("lib.redis_client.get_shared_state", return_value=state):
+        context_cache._put_local("s1", dict(entry))
+        await context_cache._put_shared("s1", dict(entry))
+        assert "context_cache:s1" in state.data
+
+        counts = await _run_delete(_FakeConn())
+
+        assert await context_cache.get_cache_async("s1") is None
+    assert counts["seniors"] == 1
+    assert "context_cache:s1" not in state.data
+    assert "memory_index:version:s1" in state.data
+
+
+@pytest.mark.asyncio
+async def test_hard_delete_removes_queued_post_call_jobs():
+    conn = _FakeConn()
+    counts = await _run_delete(conn)
+
+    assert "post_call_jobs" in counts
+    assert "DELETE FROM post_call_jobs WHERE senior_id = $1" in conn.executed
+    # Jobs go before the senior row, inside the same transaction.
+    assert conn.executed.index("DELETE FROM post_call_jobs WHERE senior_id = $1") < conn.executed.index(
+        "DELETE FROM seniors WHERE id = $1"
+    )
@@ -0,0 +1,26 @@
+"""Tests for the shared fixed-bucket latency histogram helpers."""
+
+import json
+
+from lib import histogram
+
+BOUNDS = (10, 50, 100)
+
+
+class TestHistogram:
+    def test_percentile_reads_bucket_upper_bound(self):
+        buckets = histogram.histogram(BOUNDS, [5, 10, 40, 60, 90])
+        assert buckets == [2, 1, 2, 0]
+        assert histogram.percentile(BOUNDS, buckets, 0.5) == 50.0
+        assert histogram.percentile(BOUNDS, buckets, 0.95) == 100.0
+        assert histogram.percentile(BOUNDS, histogram.empty(BOUNDS), 0.5) is None
+
+    def test_overflow_reports_last_bound_and_stays_json_safe(self):
+        buckets = histogram.empty(BOUNDS)
+        for _ in range(3):
+            histogram.observe(buckets, BOUNDS, 5000)
+
+        p95 = histogram.percentile(BOUNDS, buckets, 0.95)
+        assert p95 == 100.0
+        json.dumps({"p95_ms": p95}, allow_nan=False)
+        assert histogram.labelled(BOUNDS, buckets) == {"10": 0, "50": 0, "100": 0, "inf": 3}
@@ -0,0 +1,59 @@
+"""Tests for lib/json_stream.py incremental JSON parsing."""
+
+import json
+
+from lib.json_stream import JSONStreamParser
+
+
+def _feed_all(text: str, chunk_size: int, max_depth: int = 1):
+    parser = JSONStreamParser(max_depth=max_depth)
+    events = []
+    for i in range(0, len(text), chunk_size):
+        events.extend(parser.feed(text[i:i + chunk_size]))
+    return parser, events
+
+
+DOC = {
+    "analysis": {"call_phase": "main", "turns": [1, 2]},
+    "memory_queries": ['grandson "Jake"', "Torchy's Tacos"],
+    "score": -1.5e3,
+    "flag": True,
+    "missing": None,
+}
+
+
+class TestJSONStreamParser:
+    def test_top_level_fields_any_chunking(self):
+        text = json.dumps(DOC)
+        for size in (1, 2, 5, len(text)):
+            parser, events = _feed_all(text, size)
+            assert events == [((k,), v) for k, v in DOC.items()]
+            assert parser.done
+
+    def test_nested_values_up_to_depth(self):
+        _, events = _feed_all(json.dumps(DOC), 3, max_depth=2)
+        paths = [p for p, _ in events]
+        assert paths[:3] == [("analysis", "call_phase"), ("analysis", "turns"), ("analysis",)]
+        assert (("memory_queries", 0), 'grandson "Jake"') in events
+        assert paths.index(("memory_queries", 1)) < paths.index(("memory_queries",))
+
+    def test_field_reported_before_document_ends(self):
+        parser = JSONStreamParser()
+        assert parser.feed('{"analysis": {"call_phase": "main"}, "guid') == [
+            (("analysis",), {"call_phase": "main"}),
+        ]
+        assert not parser.done
+
+    def test_ignores_markdown_fence_and_trailing_text(self):
+        parser, events = _feed_all('```json\n{"a": 1, "b": "x"}\n```\n{"c": 2}', 4)
+        assert events == [(("a",), 1), (("b",), "x")]
+        assert parser.done
+
+    def test_scalar_waits_for_delimiter(self):
+        parser = JSONStreamParser()
+        assert parser.feed('{"n": 12') == []
+        assert parser.feed("3}") == [(("n",), 123)]
+
+    def test_braces_inside_strings(self):
+        _, events = _feed_all('{"a": "x}y{\\"", "b": [1]}', 2)
+        assert events == [(("a",), 'x}y{"'), (("b",), [1])]
@@ -310,10 +310,12 @@ class TestExtractFromConversation:
         mock_client = MagicMock()
         mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
         with patch("services.memory._get_openai", return_value=mock_client), \
-             patch("services.memory.store", new_callable=AsyncMock) as mock_store:
+             patch("services.memory.store_many", new_callable=AsyncMock, return_value=[{"status": "inserted"}]) as mock_store:
             from services.memory import extract_from_conversation
             await extract_from_conversation("s1", "User: I love roses", "conv-1")
             mock_store.assert_called_once()
+            assert mock_store.call_args[0][1] == [{"type": "fact", "content": "Likes roses", "importance": 60}]
+            assert mock_store.call_args.kwargs["source"] == "conv-1"
 
     @pytest.mark.asyncio
     async def test_handles_json_dict_response(self):
@@ -323,7 +325,7 @@ class TestExtractFromConversation:
         mock_client = MagicMock()
         mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
         with patch("services.memory._get_openai", return_value=mock_client), \
-             patch("services.memory.store", new_callable=AsyncMock) as mock_store:
+             patch("services.memory.store_many", new_callable=AsyncMock, return_value=[{"status": "inserted"}]) as mock_store:
             from services.memory import extract_from_conversation
             await extract_from_conversation("s1", "User: My cat is named Whiskers", "conv-1")
             mock_store.assert_called_once()
@@ -338,7 +340,7 @@ class TestExtractFromConversation:
         call_started_at = datetime(2026, 4, 14, 20, 30, tzinfo=timezone.utc)
 
         with patch("services.memory._get_openai", return_value=mock_client), \
-             patch("services.memory.store", new_callable=AsyncMock):
+             patch("services.memory.store_many", new_callable=AsyncMock, return_value=[{"status": "inserted"}]):
             from services.memory import extract_from_conversation
             await extract_from_conversation(
                 "s1",
@@ -360,3 +362,78 @@ class TestExtractFromConversation:
         with patch("services.memory._get_openai", return_value=mock_client):
             from services.memory import extract_from_conversation
             await extract_from_conversation("s1", "transcript", "conv-1")
+
+
+class TestStoreMany:
+    @staticmethod
+    def _insert_rows(sql, *args):
+        if "INSERT INTO memories" in sql:
+            return [{"id": f"new-{n}", "content_encrypted": ct, "importance": imp}
+                    for n, (ct, imp) in enumerate(zip(args[3], args[4]))]
+        return []
+
+    @pytest.mark.asyncio
+    async def test_inserts_all_in_one_statement(self):
+        items = [{"type": "fact", "content": "Likes roses"}, {"type": "event", "content": "Visited Ohio"}]
+        with patch("services.memory.generate_embeddings", new_callable=AsyncMock, return_value=[[1.0, 0.0], [0.0, 1.0]]), \
+             patch("db.query_many", new_callable=AsyncMock, side_effect=self._insert_rows) as mock_q:
+            from services.memory import store_many
+            outcomes = await store_many("s1", items, source="conv-1")
+
+        assert [o["status"] for o in outcomes] == ["inserted", "inserted"]
+        assert mock_q.await_count == 2  # dedup query + multi-row insert
+        dedup_sql = mock_q.await_args_list[0].args[0]
+        assert "CROSS JOIN LATERAL" in dedup_sql and "> 0.9" in dedup_sql
+        insert_args = mock_q.await_args_list[1].args
+        assert insert_args[3] == ["fact", "event"]
+
+    @pytest.mark.asyncio
+    async def test_dedups_within_batch_and_keeps_higher_importance(self):
+        items = [
+            {"type": "fact", "content": "Likes roses", "importance": 50},
+            {"type": "fact", "content": "Loves roses", "importance": 80},
+        ]
+        with patch("services.memory.generate_embeddings", new_callable=AsyncMock, return_value=[[1.0, 0.0], [0.99, 0.01]]), \
+             patch("db.query_many", new_callable=AsyncMock, side_effect=self._insert_rows) as mock_q:
+            from services.memory import store_many
+            outcomes = await store_many("s1", items)
+
+        assert outcomes[0]["status"] == "inserted"
+        assert outcomes[1]["status"] == "duplicate"
+        assert outcomes[1]["duplicate_of"] == outcomes[0]["row"]["id"]
+        assert mock_q.await_args_list[-1].args[5] == [80]
+
+    @pytest.mark.asyncio
+    async def test_dedups_against_existing_rows(self):
+        items = [
+            {"type": "fact", "content": "Likes roses", "importance": 90},
+            {"type": "fact", "content": "Has a cat", "importance": 50},
+        ]
+
+        async def fake_query(sql, *args):
+            if "CROSS JOIN LATERAL" in sql:
+                return [{"idx": 0, "id": "m-old", "importance": 60, "similarity": 0.95}]
+            return self._insert_rows(sql, *args)
+
+        with patch("services.memory.generate_embeddings", new_callable=AsyncMock, return_value=[[1.0, 0.0], [0.0, 1.0]]), \
+             patch("db.query_many", new_callable=AsyncMock, side_effect=fake_query) as mock_q:
+            from services.memory import store_many
+            outcomes = await store_many("s1", items)
+
+        assert outcomes[0] == {"status": "duplicate", "duplicate_of": "m-old", "similarity": 0.95}
+        assert outcomes[1]["status"] == "inserted"
+        update_call = next(c for c in mock_q.await_args_list if "UPDATE memories" in c.args[0])
+        assert update_call.args[1:] == (["m-old"], [90])
+
+    @pytest.mark.asyncio
+    async def test_skips_items_without_embedding(self):
+        with patch("services.memory.generate_embeddings", new_callable=AsyncMock, return_value=[None]), \
+             patch("db.query_many", new_callable=AsyncMock) as mock_q:
+            from services.memory import store_many
+            outcomes = await store_many("s1", [{"type": "fact", "content": "x"}, {"type": "fact", "content": ""}])
+
+        assert outcomes == [
+            {"status": "skipped", "reason": "no_embedding"},
+            {"status": "skipped", "reason": "no_content"},
+        ]
+        mock_q.assert_not_called()
@@ -0,0 +1,215 @@
+"""Tests for services/memory_index.py — in-process per-senior vector index."""
+
+import json
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import patch, AsyncMock
+
+from services import memory_index
+from tests.test_scheduler import FakeSharedState
+
+
+@pytest.fixture(autouse=True)
+def _clean_indexes():
+    memory_index.clear_all()
+    yield
+    memory_index.clear_all()
+
+
+def _row(mid, vector, importance=50, content=None):
+    return {
+        "id": mid,
+        "type": "fact",
+        "content": content or f"memory {mid}",
+        "importance": importance,
+        "metadata": None,
+        "created_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
+        "embedding": json.dumps(vector),
+    }
+
+
+class TestMemoryIndex:
+    def test_orders_by_similarity(self):
+        index = memory_index.build_index("s1", [
+            _row("far", [0.0, 1.0]),
+            _row("near", [1.0, 0.1]),
+            _row("mid", [1.0, 1.0]),
+        ])
+        results = index.search([1.0, 0.0], limit=5, min_similarity=0.1)
+        assert [r["id"] for r in results] == ["near", "mid"]
+        assert results[0]["similarity"] == pytest.approx(0.995, abs=1e-3)
+        assert "embedding" not in results[0]
+
+    def test_threshold_is_exclusive(self):
+        index = memory_index.build_index("s1", [_row("a", [1.0, 0.0]), _row("b", [0.0, 1.0])])
+        assert [r["id"] for r in index.search([1.0, 0.0], 5, 0.0)] == ["a"]
+
+    def test_limit(self):
+        rows = [_row(f"m{i}", [1.0, i / 10]) for i in range(10)]
+        index = memory_index.build_index("s1", rows)
+        results = index.search([1.0, 0.0], limit=3, min_similarity=0.0)
+        assert [r["id"] for r in results] == ["m0", "m1", "m2"]
+
+    def test_rows_without_embedding_are_skipped(self):
+        rows = [_row("a", [1.0, 0.0]), {**_row("b", [1.0, 0.0]), "embedding": None}]
+        index = memory_index.build_index("s1", rows)
+        assert len(index) == 1
+
+    def test_skips_seniors_over_row_cap(self):
+        with patch.object(memory_index, "MAX_INDEX_ROWS", 2):
+            result = memory_index.build_index("s1", [_row(f"m{i}", [1.0, 0.0]) for i in range(3)])
+        assert result is None
+        assert memory_index.get_index("s1") is None
+        assert memory_index.get_stats()["skipped_builds"] == 1
+
+    def test_add_memory_appends_to_loaded_index(self):
+        memory_index.build_index("s1", [_row("a", [0.0, 1.0])])
+        memory_index.add_memory("s1", _row("b", [1.0, 0.0]), [1.0, 0.0])
+        results = memory_index.search("s1", [1.0, 0.0], 5, 0.5)
+        assert [r["id"] for r in results] == ["b"]
+
+    def test_add_memory_to_empty_index(self):
+        memory_index.build_index("s1", [])
+        memory_index.add_memory("s1", _row("a", [1.0, 0.0]), [1.0, 0.0])
+        assert [r["id"] for r in memory_index.search("s1", [1.0, 0.0], 5, 0.5)] == ["a"]
+
+    def test_dimension_mismatch_drops_index(self):
+        memory_index.build_index("s1", [_row("a", [0.0, 1.0])])
+        memory_index.add_memory("s1", _row("b", [1.0, 0.0, 0.0]), [1.0, 0.0, 0.0])
+        assert memory_index.get_index("s1") is None
+
+    def test_search_without_index_returns_none(self):
+        assert memory_index.search("missing", [1.0], 5, 0.5) is None
+        assert memory_index.get_stats()["misses"] == 1
+
+    def test_expired_indexes_are_cleaned_up(self):
+        index = memory_index.build_index("s1", [_row("a", [1.0, 0.0])])
+        index.built_at -= memory_index.INDEX_TTL_SECONDS + 1
+        assert memory_index.cleanup_expired() == 1
+        assert memory_index.get_index("s1") is None
+
+    def test_lru_bound(self):
+        with patch.object(memory_index, "MAX_INDEXES", 2):
+            for sid in ("s1", "s2", "s3"):
+                memory_index.build_index(sid, [_row("a", [1.0, 0.0])])
+        assert memory_index.get_index("s1") is None
+        assert memory_index.get_index("s3") is not None
+
+    @pytest.mark.asyncio
+    async def test_warm_index_loads_rows(self):
+        rows = [_row("a", [1.0, 0.0])]
+        with patch.object(memory_index, "is_enabled", return_value=True), \
+             patch("db.query_many", new_callable=AsyncMock, return_value=rows) as mock_q:
+            await memory_index.warm_index("s1")
+        assert "embedding::text" in mock_q.call_args[0][0]
+        assert len(memory_index.get_index("s1")) == 1
+
+    @pytest.mark.asyncio
+    async def test_warm_index_rebuilds_existing_index(self):
+        memory_index.build_index("s1", [_row("deleted", [1.0, 0.0])])
+        with patch.object(memory_index, "is_enabled", return_value=True), \
+             patch("db.query_many", new_callable=AsyncMock, return_value=[_row("a", [0.0, 1.0])]):
+            await memory_index.warm_index("s1")
+        assert [r["id"] for r in memory_index.get_index("s1").rows] == ["a"]
+
+    @pytest.mark.asyncio
+    async def test_warm_index_disabled_is_noop(self):
+        with patch.object(memory_index, "is_enabled", return_value=False), \
+             patch("db.query_many", new_callable=AsyncMock) as mock_q:
+            await memory_index.warm_index("s1")
+        mock_q.assert_not_called()
+
+
+class TestSharedVersion:
+    @pytest.mark.asyncio
+    async def test_write_elsewhere_drops_index(self):
+        state = FakeSharedState()
+        with patch("lib.redis_client.get_shared_state", return_value=state):
+            memory_index.build_index("s1", [_row("a", [1.0, 0.0])], await memory_index.shared_version("s1"))
+            await memory_index.ensure_current("s1")
+            assert memory_index.get_index("s1") is not None
+
+            state.data[memory_index.VERSION_KEY_PREFIX + "s1"] = "other-instance"
+            await memory_index.ensure_current("s1")
+        assert memory_index.get_index("s1") is None
+        assert memory_index.get_stats()["invalidations"] == 1
+
+    @pytest.mark.asyncio
+    async def test_publish_write_keeps_current_index(self):
+        state = FakeSharedState()
+        with patch("lib.redis_client.get_shared_state", return_value=state):
+            memory_index.build_index("s1", [_row("a", [1.0, 0.0])])
+            await memory_index.publish_write("s1")
+            version = state.data[memory_index.VERSION_KEY_PREFIX + "s1"]
+            assert memory_index.get_index("s1").version == version
+            await memory_index.ensure_current("s1")
+        assert memory_index.get_index("s1") is not None
+        assert state.ttls[memory_index.VERSION_KEY_PREFIX + "s1"] == memory_index.INDEX_TTL_SECONDS
+
+    @pytest.mark.asyncio
+    async def test_publish_write_drops_index_that_was_behind(self):
+        state = FakeSharedState()
+        state.data[memory_index.VERSION_KEY_PREFIX + "s1"] = "newer"
+        with patch("lib.redis_client.get_shared_state", return_value=state):
+            memory_index.build_index("s1", [_row("a", [1.0, 0.0])], "older")
+            await memory_index.publish_write("s1")
+        assert memory_index.get_index("s1") is None
+
+    @pytest.mark.asyncio
+    async def test_invalidate_drops_local_and_bumps_version(self):
+        state = FakeSharedState()
+        with patch("lib.redis_client.get_shared_state", return_value=state):
+            memory_index.build_index("s1", [_row("a", [1.0, 0.0])])
+            await memory_index.invalidate("s1")
+        assert memory_index.get_index("s1") is None
+        assert memory_index.VERSION_KEY_PREFIX + "s1" in state.data
+
+
+class TestMemoryServiceIntegration:
+    @pytest.mark.asyncio
+    async def test_search_uses_index_without_db(self):
+        memory_index.build_index("s1", [_row("a", [1.0, 0.0], content="Likes roses")])
+        with patch("services.memory.generate_embedding", new_callable=AsyncMock, return_value=[1.0, 0.0]), \
+             patch("db.query_many", new_callable=AsyncMock) as mock_q, \
+             patch("db.execute", new_callable=AsyncMock):
+            from services.memory import search
+            result = await search("s1", "roses", track_access=False)
+        mock_q.assert_not_called()
+        assert result[0]["content"] == "Likes roses"
+
+    @pytest.mark.asyncio
+    async def test_indexed_search_tracks_access_in_held_task(self):
+        import asyncio
+        from services import memory
+
+        memory_index.build_index("s1", [_row("a", [1.0, 0.0])])
+        with patch("services.memory.generate_embedding", new_callable=AsyncMock, return_value=[1.0, 0.0]), \
+             patch("db.execute", new_callable=AsyncMock) as mock_exec:
+            await memory.search("s1", "roses")
+            assert len(memory._mark_accessed_tasks) == 1
+            await asyncio.gather(*memory._mark_accessed_tasks)
+        assert mock_exec.call_args[0][1] == "a"
+        assert not memory._mark_accessed_tasks
+
+    @pytest.mark.asyncio
+    async def test_store_appends_to_index(self):
+        memory_index.build_index("s1", [])
+        inserted = {"id": "m-new", "type": "fact", "content": "[encrypted]", "importance": 50,
+                    "metadata": None, "created_at": datetime.now(timezone.utc)}
+        with patch("services.memory.generate_embedding", new_callable=AsyncMock, return_value=[0.0, 1.0]), \
+             patch("db.query_many", new_callable=AsyncMock, return_value=[]), \
+             patch("db.query_one", new_callable=AsyncMock, return_value=inserted):
+            from services.memory import store
+            await store("s1", "fact", "Grandson visits Sunday")
+        results = memory_index.search("s1", [0.0, 1.0], 5, 0.5)
+        assert results[0]["content"] == "Grandson visits Sunday"
+
+    @pytest.mark.asyncio
+    async def test_consolidated_fetch_builds_index(self):
+        rows = [_row(f"m{i}", [1.0, i / 100]) for i in range(40)]
+        with patch.object(memory_index, "is_enabled", return_value=True), \
+             patch("db.query_many", new_callable=AsyncMock, return_value=rows):
+            from services.context_cache import _fetch_memories_consolidated
+            critical, important, recent = await _fetch_memories_consolidated("s1")
+        assert len(memory_index.get_index("s1")) == 40
+        assert all("embedding" not in r for r in critical + important + recent)
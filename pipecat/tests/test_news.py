@@ -1,4 +1,9 @@
-"""Tests for services/news.py — select_stories_for_call."""
+"""Tests for services/news.py — select_stories_for_call and the per-interest cache."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
 
 from services.news import select_stories_for_call, format_news_context
 
@@ -67,3 +72,101 @@ class TestSelectStoriesForCall:
         full = "- Story A\n- Story B\n- Story C"
         result = select_stories_for_call(full, interests=["cooking"])
         assert result is not None
+
+
+class TestPerInterestNewsCache:
+    @pytest.fixture(autouse=True)
+    def _clean(self):
+        from services import news
+        news.clear_cache()
+        yield
+        news.clear_cache()
+
+    def _client(self, stories_for):
+        def create(**kwargs):
+            interest = kwargs["input"].split("about: ", 1)[1].split(".\n", 1)[0]
+            return MagicMock(output_text="\n".join(f"- {s}" for s in stories_for(interest)))
+
+        client = MagicMock()
+        client.responses.create.side_effect = create
+        return client
+
+    @pytest.mark.asyncio
+    async def test_shared_interest_is_searched_once_across_seniors(self):
+        from services.news import get_news_for_senior
+
+        client = self._client(lambda i: [f"{i} story {n}" for n in range(3)])
+        with patch("services.news._get_openai", return_value=client):
+            first = await get_news_for_senior(["Gardening", "baseball"], limit=8)
+            second = await get_news_for_senior(["gardening ", "knitting"], limit=8)
+
+        searched = sorted(c.kwargs["input"].split("about: ")[1].split(".")[0] for c in client.responses.create.call_args_list)
+        assert searched == ["baseball", "gardening", "knitting"]
+        assert "baseball story 0" in first and "gardening story 0" in first
+        assert "knitting story 0" in second and "gardening story 2" in second
+
+    @pytest.mark.asyncio
+    async def test_digest_interleaves_interests_and_drops_duplicate_stories(self):
+        from services.news import get_news_for_senior
+
+        pools = {
+            "gardening": ["Town garden show opens: Roses win big this year", "Mulch early for spring"],
+            "flowers": ["Town garden show opens: roses win big this year!", "Tulip festival returns"],
+        }
+        client = self._client(lambda i: pools[i])
+        with patch("services.news._get_openai", return_value=client):
+            digest = await get_news_for_senior(["gardening", "flowers"], limit=3)
+
+        stories = [line for line in digest.splitlines() if line.startswith("- ")]
+        assert stories == [
+            "- Town garden show opens: Roses win big this year",
+            "- Mulch early for spring",
+            "- Tulip festival returns",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_search(self):
+        from services.news import get_news_for_senior
+
+        client = self._client(lambda i: [f"{i} story"])
+        with patch("services.news._get_openai", return_value=client):
+            results = await asyncio.gather(*(get_news_for_senior(["chess"]) for _ in range(4)))
+
+        assert client.responses.create.call_count == 1
+        assert all("chess story" in r for r in results)
+
+    @pytest.mark.asyncio
+    async def test_pools_are_read_from_and_written_to_shared_state(self, monkeypatch):
+        from services import news
+        from tests.test_scheduler import FakeSharedState, enable_test_encryption
+
+        enable_test_encryption(monkeypatch)
+        state = FakeSharedState()
+        client = self._client(lambda i: [f"{i} story"])
+        with patch("lib.redis_client.get_shared_state", return_value=state), \
+             patch("services.news._get_openai", return_value=client):
+            await news.get_news_for_senior(["golf"])
+            news._news_cache.clear()
+            digest = await news.get_news_for_senior(["golf"])
+
+        assert client.responses.create.call_count == 1
+        assert "golf story" in digest
+        assert news.get_stats()["shared_hits"] == 1
+
+    def test_lru_is_bounded(self, monkeypatch):
+        from services import news
+
+        monkeypatch.setattr(news, "_MAX_CACHE_ENTRIES", 2)
+        for interest in ("a", "b", "c"):
+            news._put_local(interest, [f"- {interest}"])
+
+        assert list(news._news_cache) == ["b", "c"]
+        assert news.get_stats()["evictions"] == 1
+
+    def test_parses_numbered_lists(self):
+        from services.news import _parse_stories
+
+        assert _parse_stories("Here you go:\n1. First story\n2) Second story") == [
+            "- First story",
+            "- Second story",
+        ]
@@ -0,0 +1,120 @@
+"""Tests for the compiled Quick Observer matcher engine."""
+
+import re
+
+import pytest
+
+from processors import quick_observer
+from processors.pattern_matcher import CompiledMatcher, literal_prefixes
+from processors.patterns import Pattern
+from processors.quick_observer import PATTERN_CATEGORIES, quick_analyze
+from tests.helpers.utterance_corpus import utterance_corpus
+
+
+def _naive_match(text: str) -> dict[str, list[Pattern]]:
+    """Reference implementation: search every pattern independently."""
+    return {
+        name: [p for p in patterns if p.pattern.search(text)]
+        for name, patterns in PATTERN_CATEGORIES.items()
+    }
+
+
+class _NaiveMatcher:
+    def match(self, text):
+        return _naive_match(text)
+
+
+CORPUS = utterance_corpus()
+
+
+class TestLiteralPrefixes:
+    def test_word_alternation(self):
+        assert literal_prefixes(re.compile(r"\b(fell|fall)\b", re.I)) == {"fell", "fall"}
+
+    def test_optional_suffix_stops_prefix(self):
+        assert literal_prefixes(re.compile(r"\b(step-?(son|daughter))\b", re.I)) == {"step"}
+
+    def test_char_class_expands(self):
+        assert literal_prefixes(re.compile(r"[ab]c", re.I)) == {"ac", "bc"}
+
+    def test_prefixes_are_lowercased(self):
+        assert literal_prefixes(re.compile(r"\bDr\.", re.I)) == {"dr."}
+
+    def test_unbounded_pattern_is_not_prefiltered(self):
+        assert literal_prefixes(re.compile(r"^.{1,10}$")) is None
+
+    def test_optional_leading_group_is_not_prefiltered(self):
+        assert literal_prefixes(re.compile(r"(very )?sad", re.I)) is None
+
+
+class TestCompiledMatcher:
+    def test_covers_every_pattern(self):
+        total = sum(len(p) for p in PATTERN_CATEGORIES.values())
+        assert quick_observer._MATCHER.pattern_count == total
+        # Nearly every table entry should be prefilterable.
+        assert quick_observer._MATCHER.prefiltered_count >= total - 5
+
+    def test_non_ascii_disables_prefilter(self):
+        matcher = CompiledMatcher({"x": [Pattern(pattern=re.compile(r"\bstop\b", re.I), signal="s")]})
+        assert matcher.candidates("ſtop") is None
+        assert matcher.match("ſtop")["x"]
+
+    @pytest.mark.parametrize("text", CORPUS)
+    def test_match_equivalent_to_naive_scan(self, text):
+        assert quick_observer._MATCHER.match(text.strip()) == _naive_match(text.strip())
+
+    @pytest.mark.parametrize("text", CORPUS)
+    def test_analysis_result_equivalent(self, text, monkeypatch):
+        compiled = quick_analyze(text)
+        monkeypatch.setattr(quick_observer, "_MATCHER", _NaiveMatcher())
+        assert compiled == quick_analyze(text)
+
+
+def _growing_prefixes(text: str) -> list[str]:
+    """Word-by-word interim transcripts, the way STT grows an utterance."""
+    words = text.split()
+    return [" ".join(words[:i]) for i in range(1, len(words) + 1)]
+
+
+class TestIncrementalScan:
+    def test_match_width_bounds(self):
+        from processors.pattern_matcher import max_match_width
+
+        assert max_match_width(re.compile(r"\b(fell|fallen)\b", re.I)) == 6
+        assert max_match_width(re.compile(r"^.{1,10}$")) is None
+        assert max_match_width(re.compile(r"\bwait\b.*\?", re.I)) is None
+
+    def test_identical_text_reuses_state(self):
+        matcher = quick_observer._MATCHER
+        state = matcher.scan("I fell down")
+        assert matcher.scan("I fell down", state) is state
+
+    def test_extension_skips_unchanged_prefix(self):
+        matcher = quick_observer._MATCHER
+        base = "I was out in the garden this morning with my daughter"
+        first = matcher.scan(base)
+        grown = matcher.scan(base + " and then I fell", first)
+        assert grown.searches < matcher.scan(base + " and then I fell").searches
+
+    def test_revised_word_drops_stale_match(self):
+        matcher = quick_observer._MATCHER
+        first = matcher.scan("I fell")
+        revised = matcher.scan("I fellow", first)
+        assert matcher.group(revised) == _naive_match("I fellow")
+
+    @pytest.mark.parametrize("text", [t for t in CORPUS if t.strip()])
+    def test_incremental_equivalent_to_full_scan(self, text):
+        matcher = quick_observer._MATCHER
+        state = None
+        for interim in _growing_prefixes(text) + [text.strip()]:
+            state = matcher.scan(interim, state)
+            assert matcher.group(state) == _naive_match(interim)
+
+    @pytest.mark.parametrize("text", [t for t in CORPUS if t.strip()])
+    def test_incremental_analysis_equivalent(self, text):
+        from processors.quick_observer import quick_analyze_incremental
+
+        state = None
+        for interim in _growing_prefixes(text):
+            result, state = quick_analyze_incremental(interim, None, state)
+            assert result == quick_analyze(interim)
@@ -292,6 +292,84 @@ class TestPostCallProcessing:
         assert latency_json["stage_breakdown"]["director.query"]["avg_ms"] == 150
         assert latency_json["stage_breakdown"]["tool.web_search"]["max_ms"] == 640
 
+    @pytest.mark.asyncio
+    async def test_persist_call_metrics_includes_post_call_step_timings(self, session_state):
+        from lib.task_graph import StepResult
+        from services.post_call import _persist_call_metrics
+
+        session_state["_call_metrics"] = {"token_usage": {}, "turn_count": 2}
+        steps = {
+            "complete": StepResult("complete", duration_ms=40),
+            "analysis": StepResult("analysis", status="timeout", duration_ms=900, started_ms=40),
+        }
+
+        with patch("db.client.execute", new_callable=AsyncMock) as mock_execute:
+            await _persist_call_metrics(session_state, 60, None, error_count=1, post_call_steps=steps)
+
+        post_call = json.loads(mock_execute.await_args.args[8])["post_call"]
+        assert post_call["total_ms"] == 940
+        assert post_call["steps"]["analysis"] == {"ms": 900, "start_ms": 40, "status": "timeout"}
+
+    @pytest.mark.asyncio
+    async def test_post_call_overlaps_independent_steps_and_records_timings(self, session_state):
+        """Memory extraction should not wait for analysis, and timings reach metrics."""
+        session_state["_transcript"] = [{"role": "user", "content": "Hello Donna"}]
+        tracker = ConversationTrackerProcessor(session_state=session_state)
+        events = []
+
+        async def analyze(*args, **kwargs):
+            events.append("analysis start")
+            await asyncio.sleep(0.05)
+            events.append("analysis end")
+            return {"summary": "Good call"}
+
+        async def extract(*args, **kwargs):
+            events.append("memory")
+
+        with patch("services.conversations.complete", new_callable=AsyncMock), \
+             patch("services.conversations.update_summary", new_callable=AsyncMock), \
+             patch("services.call_analysis.analyze_completed_call", side_effect=analyze), \
+             patch("services.call_analysis.save_call_analysis", new_callable=AsyncMock), \
+             patch("services.memory.extract_from_conversation", side_effect=extract), \
+             patch("services.interest_discovery.compute_interest_scores", new_callable=AsyncMock, return_value={}), \
+             patch("services.interest_discovery.update_interest_scores", new_callable=AsyncMock), \
+             patch("services.daily_context.save_call_context", new_callable=AsyncMock) as mock_daily, \
+             patch("services.call_snapshot.build_snapshot", new_callable=AsyncMock, return_value={}), \
+             patch("services.call_snapshot.save_snapshot", new_callable=AsyncMock), \
+             patch("services.context_cache.clear_cache_async", new_callable=AsyncMock), \
+             patch("services.scheduler.clear_reminder_context_async", new_callable=AsyncMock), \
+             patch("services.post_call._trigger_caregiver_notification", new_callable=AsyncMock), \
+             patch("services.post_call._persist_call_metrics", new_callable=AsyncMock) as mock_metrics:
+            from services.post_call import run_post_call
+            await run_post_call(session_state, tracker, duration_seconds=60)
+
+        assert events.index("memory") < events.index("analysis end")
+        assert mock_daily.await_args.kwargs["data"]["summary"] == "Good call"
+        kwargs = mock_metrics.await_args.kwargs
+        assert kwargs["error_count"] == 0
+        steps = kwargs["post_call_steps"]
+        assert steps["analysis"].duration_ms >= 40
+        assert steps["snapshot"].started_ms >= steps["analysis"].started_ms + steps["analysis"].duration_ms
+
+    @pytest.mark.asyncio
+    async def test_post_call_step_timeout_counts_as_error(self, session_state):
+        session_state["_transcript"] = [{"role": "user", "content": "Hello"}]
+        tracker = ConversationTrackerProcessor(session_state=session_state)
+
+        async def hang(*args, **kwargs):
+            await asyncio.sleep(5)
+
+        with patch.dict("services.post_call.POST_CALL_STEP_TIMEOUTS", {"memory": 0.01}), \
+             patch("services.conversations.complete", new_callable=AsyncMock), \
+             patch("services.memory.extract_from_conversation", side_effect=hang), \
+             patch("services.post_call._persist_call_metrics", new_callable=AsyncMock) as mock_metrics:
+            from services.post_call import run_post_call
+            await run_post_call(session_state, tracker, duration_seconds=10)
+
+        steps = mock_metrics.await_args.kwargs["post_call_steps"]
+        assert steps["memory"].status == "timeout"
+        assert mock_metrics.await_args.kwargs["error_count"] >= 1
+
     @pytest.mark.asyncio
     async def test_persist_call_metrics_prefers_conversation_turn_count_and_tracks_llm_invocations(self, session_state):
         from services.post_call import _persist_call_metrics
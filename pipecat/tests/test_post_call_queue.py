@@ -0,0 +1,197 @@
+"""Tests for services/post_call_queue.py (durable post-call jobs)."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from services import post_call_queue
+from tests.test_scheduler import enable_test_encryption
+
+
+@pytest.fixture(autouse=True)
+def _reset():
+    post_call_queue.reset_stats()
+    yield
+    post_call_queue.reset_stats()
+
+
+@pytest.fixture
+def queue_enabled():
+    with patch.object(post_call_queue, "_enabled", return_value=True):
+        yield
+
+
+def _tracker():
+    tracker = SimpleNamespace(
+        state=SimpleNamespace(topics_discussed=["garden"], advice_given=["drink water"]),
+        flush_pending_persistence=AsyncMock(),
+    )
+    return tracker
+
+
+class TestSnapshot:
+    def test_round_trip_keeps_post_call_inputs_and_drops_live_objects(self):
+        session_state = {
+            "call_sid": "CA1",
+            "senior_id": "s1",
+            "senior": {"id": "s1", "timezone": "America/Chicago"},
+            "reminders_delivered": {"pills", "call Sue"},
+            "_full_transcript": [{"role": "user", "content": "hi"}],
+            "_reminder_ack_task": object(),
+            "_transcript_persist_tasks": {object()},
+        }
+        payload = post_call_queue.snapshot_session(session_state, _tracker())
+
+        restored, tracker = post_call_queue.restore_session(payload)
+        assert restored["reminders_delivered"] == ["call Sue", "pills"]
+        assert restored["_full_transcript"] == [{"role": "user", "content": "hi"}]
+        assert "_reminder_ack_task" not in restored
+        assert "_transcript_persist_tasks" not in restored
+        assert tracker.state.topics_discussed == ["garden"]
+        assert tracker.state.advice_given == ["drink water"]
+        tracker.flush()
+
+
+class TestEnqueue:
+    @pytest.mark.asyncio
+    async def test_disabled_queue_runs_inline(self):
+        with patch.object(post_call_queue, "_enabled", return_value=False), \
+             patch.object(post_call_queue, "execute", new_callable=AsyncMock) as mock_execute:
+            assert await post_call_queue.enqueue({"call_sid": "CA1"}, _tracker(), 30) is False
+        mock_execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_enqueue_encrypts_payload_after_draining_writes(self, monkeypatch, queue_enabled):
+        enable_test_encryption(monkeypatch)
+        from lib.encryption import decrypt_json
+
+        tracker = _tracker()
+        with patch.object(post_call_queue, "execute", new_callable=AsyncMock, return_value="INSERT 0 1") as mock_execute:
+            assert await post_call_queue.enqueue({"call_sid": "CA1", "senior_id": "s1"}, tracker, 30)
+
+        tracker.flush_pending_persistence.assert_awaited_once()
+        call_sid, encrypted, senior_id = mock_execute.await_args.args[1:]
+        assert call_sid == "CA1"
+        assert senior_id == "s1"
+        assert '"s1"' not in encrypted  # quotes never appear in base64 ciphertext
+        payload = decrypt_json(encrypted)
+        assert payload["duration_seconds"] == 30
+        assert payload["session"]["senior_id"] == "s1"
+        assert post_call_queue._stats["enqueued"] == 1
+
+    @pytest.mark.asyncio
+    async def test_enqueue_failure_falls_back_inline(self, queue_enabled):
+        with patch.object(post_call_queue, "execute", new_callable=AsyncMock, side_effect=OSError("db down")):
+            assert await post_call_queue.enqueue({"call_sid": "CA1"}, _tracker(), 30) is False
+
+    @pytest.mark.asyncio
+    async def test_enqueue_clears_call_instance_cache_for_remote_worker(self, queue_enabled):
+        from collections import OrderedDict
+
+        from services import context_cache
+
+        def instance_cache():
+            return (
+                patch.object(context_cache, "_cache", OrderedDict()),
+                patch.object(context_cache, "_sizes", {}),
+                patch.object(context_cache, "_total_bytes", 0),
+            )
+
+        entry = {"senior_id": "s1", "greeting": "Hi!", "memory_context": "Likes roses",
+                 "cached_at": 0, "expires_at": float("inf")}
+        call_patches, worker_patches = instance_cache(), instance_cache()
+        with call_patches[0] as call_cache, call_patches[1], call_patches[2]:
+            context_cache._put_local("s1", dict(entry))
+            with worker_patches[0] as worker_cache, worker_patches[1], worker_patches[2]:
+                context_cache._put_local("s1", dict(entry))
+                assert "s1" in worker_cache
+
+            with patch.object(post_call_queue, "execute", new_callable=AsyncMock, return_value="INSERT 0 1"):
+                assert await post_call_queue.enqueue({"call_sid": "CA1", "senior_id": "s1"}, _tracker(), 30)
+
+        # The call's instance dropped its copy; the worker's is left to its cache step.
+        assert "s1" not in call_cache
+        assert "s1" in worker_cache
+
+
+class TestRunJob:
+    def _job(self, attempts=1):
+        from lib.encryption import encrypt_json
+
+        payload = post_call_queue.snapshot_session({"call_sid": "CA1", "senior_id": "s1"}, _tracker())
+        payload["duration_seconds"] = 45
+        return {"id": 7, "call_sid": "CA1", "attempts": attempts, "payload_encrypted": encrypt_json(payload)}
+
+    @pytest.mark.asyncio
+    async def test_success_deletes_job(self):
+        job = self._job()
+        with patch("services.post_call.run_post_call", new_callable=AsyncMock) as mock_run, \
+             patch.object(post_call_queue, "execute", new_callable=AsyncMock) as mock_execute:
+            await post_call_queue.run_job(job)
+
+        session_state, tracker, duration = mock_run.await_args.args
+        assert session_state["senior_id"] == "s1"
+        assert tracker.state.topics_discussed == ["garden"]
+        assert duration == 45
+        assert mock_execute.await_args.args[0].startswith("DELETE FROM post_call_jobs")
+
+    @pytest.mark.asyncio
+    async def test_failure_schedules_backoff_retry(self):
+        with patch("services.post_call.run_post_call", new_callable=AsyncMock, side_effect=RuntimeError("boom")), \
+             patch.object(post_call_queue, "execute", new_callable=AsyncMock) as mock_execute:
+            await post_call_queue.run_job(self._job(attempts=2))
+
+        sql, job_id, delay, error = mock_execute.await_args.args
+        assert "status = 'pending'" in sql
+        assert (job_id, delay, error) == (7, 60, "boom")
+
+    @pytest.mark.asyncio
+    async def test_last_attempt_marks_failed(self):
+        with patch("services.post_call.run_post_call", new_callable=AsyncMock, side_effect=RuntimeError("boom")), \
+             patch.object(post_call_queue, "execute", new_callable=AsyncMock) as mock_execute:
+            await post_call_queue.run_job(self._job(attempts=post_call_queue.MAX_ATTEMPTS))
+
+        assert "status = 'failed'" in mock_execute.await_args.args[0]
+
+    def test_retry_delay_is_capped(self):
+        assert post_call_queue.retry_delay_seconds(1) == post_call_queue.RETRY_BASE_SECONDS
+        assert post_call_queue.retry_delay_seconds(20) == post_call_queue.RETRY_MAX_SECONDS
+
+
+class TestWorkers:
+    @pytest.mark.asyncio
+    async def test_workers_defer_when_pool_is_saturated(self, monkeypatch):
+        monkeypatch.setattr(post_call_queue, "POLL_INTERVAL_SECONDS", 0.01)
+        with patch("db.client.get_pool_stats", new_callable=AsyncMock,
+                   return_value={"size": 50, "idle": 1, "max": 50}), \
+             patch.object(post_call_queue, "claim_job", new_callable=AsyncMock) as mock_claim, \
+             patch.object(post_call_queue, "query_many", new_callable=AsyncMock, return_value=[]):
+            post_call_queue.start_workers(1)
+            await asyncio.sleep(0.05)
+            await post_call_queue.stop_workers()
+
+        mock_claim.assert_not_awaited()
+        assert post_call_queue._stats["deferred"] > 0
+
+    @pytest.mark.asyncio
+    async def test_workers_run_claimed_jobs_and_release_on_stop(self, monkeypatch):
+        monkeypatch.setattr(post_call_queue, "POLL_INTERVAL_SECONDS", 0.01)
+        jobs = [{"id": 1, "call_sid": "CA1", "attempts": 1, "lag_seconds": 0.5}]
+
+        async def claim():
+            return jobs.pop() if jobs else None
+
+        with patch("db.client.get_pool_stats", new_callable=AsyncMock,
+                   return_value={"size": 5, "idle": 5, "max": 50}), \
+             patch.object(post_call_queue, "claim_job", side_effect=claim), \
+             patch.object(post_call_queue, "run_job", new_callable=AsyncMock) as mock_run, \
+             patch.object(post_call_queue, "query_many", new_callable=AsyncMock, return_value=[]) as mock_release:
+            post_call_queue.start_workers(2)
+            await asyncio.sleep(0.05)
+            await post_call_queue.stop_workers()
+
+        mock_run.assert_awaited_once()
+        assert "locked_by = $1" in mock_release.await_args.args[0]
+        assert post_call_queue._workers == []
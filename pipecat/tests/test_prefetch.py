@@ -150,6 +150,70 @@ class TestPrefetchCache:
         cache.clear_inflight("grandson Jake baseball")
         assert not cache.has_relevant_inflight("Jake played baseball", threshold=0.3)
 
+    def test_inverted_index_tracks_eviction_and_expiry(self):
+        cache = PrefetchCache(ttl=0.05)
+        cache.MAX_ENTRIES = 1
+        cache.put("grandson Jake", [{"content": "1"}])
+        cache.put("garden roses", [{"content": "2"}])
+        assert "jake" not in cache._entry_index
+        assert cache._entry_index["roses"] == {"garden roses"}
+
+        time.sleep(0.06)
+        assert cache.get("roses") is None
+        assert cache._entry_index == {}
+
+    def test_ties_prefer_earliest_entry(self):
+        cache = PrefetchCache()
+        cache.put("jake baseball", [{"content": "first"}])
+        cache.put("jake tennis", [{"content": "second"}])
+        assert cache.get("jake")[0]["content"] == "first"
+
+    @pytest.mark.asyncio
+    async def test_wait_for_inflight_wakes_on_put(self):
+        import asyncio
+
+        cache = PrefetchCache()
+        cache.mark_inflight("grandson Jake baseball")
+
+        async def land():
+            await asyncio.sleep(0.02)
+            cache.put("grandson Jake baseball", [{"content": "Jake plays shortstop"}])
+
+        task = asyncio.create_task(land())
+        start = time.monotonic()
+        results = await cache.wait_for_inflight("Jake baseball", timeout=1.0)
+        await task
+
+        assert results[0]["content"] == "Jake plays shortstop"
+        assert time.monotonic() - start < 0.5
+        assert cache.stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_wait_for_inflight_returns_when_search_comes_up_empty(self):
+        import asyncio
+
+        cache = PrefetchCache()
+        cache.mark_inflight("grandson Jake baseball")
+        asyncio.get_running_loop().call_later(0.02, cache.clear_inflight, "grandson Jake baseball")
+
+        start = time.monotonic()
+        assert await cache.wait_for_inflight("Jake baseball", timeout=1.0) is None
+        assert time.monotonic() - start < 0.5
+
+    @pytest.mark.asyncio
+    async def test_wait_for_inflight_times_out(self):
+        cache = PrefetchCache()
+        cache.mark_inflight("grandson Jake baseball")
+        assert await cache.wait_for_inflight("Jake baseball", timeout=0.02) is None
+
+    @pytest.mark.asyncio
+    async def test_wait_for_inflight_skips_unrelated(self):
+        cache = PrefetchCache()
+        cache.mark_inflight("grandson Jake baseball")
+        start = time.monotonic()
+        assert await cache.wait_for_inflight("weather forecast", timeout=1.0) is None
+        assert time.monotonic() - start < 0.1
+
 
 # ===========================================================================
 # extract_prefetch_queries
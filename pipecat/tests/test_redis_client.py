@@ -125,3 +125,59 @@ async def test_upstash_rest_state_temporarily_disables_after_http_failure():
 
     assert state.is_shared is False
     assert state._disabled_until > time.monotonic()
+
+
+@pytest.mark.asyncio
+async def test_in_memory_set_if_absent_respects_expiry():
+    state = InMemoryState()
+
+    assert await state.set_if_absent("telnyx_event:e1", 1, ttl=60) is True
+    assert await state.set_if_absent("telnyx_event:e1", 1, ttl=60) is False
+    state._expiry["telnyx_event:e1"] = time.time() - 1
+    assert await state.set_if_absent("telnyx_event:e1", 1, ttl=60) is True
+
+
+@pytest.mark.asyncio
+async def test_upstash_rest_state_set_if_absent_uses_nx():
+    client = _FakeClient([{"result": "OK"}, {"result": None}])
+    state = UpstashRestState("https://example.upstash.io/", "token")
+    state._client = client
+
+    assert await state.set_if_absent("telnyx_event:e1", 1, ttl=600) is True
+    assert await state.set_if_absent("telnyx_event:e1", 1, ttl=600) is False
+    assert client.commands[0][1] == ["SET", "telnyx_event:e1", "1", "EX", 600, "NX"]
+
+
+class _FakePubSub:
+    def __init__(self, messages):
+        self._messages = messages
+        self.channels = []
+        self.closed = False
+
+    async def subscribe(self, channel):
+        self.channels.append(channel)
+
+    async def listen(self):
+        for message in self._messages:
+            yield message
+
+    async def aclose(self):
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_redis_state_subscribe_decodes_messages_and_closes():
+    pubsub = _FakePubSub([
+        {"type": "message", "data": '"CA123"'},
+        {"type": "pmessage", "data": '"ignored"'},
+        {"type": "message", "data": "not-json"},
+    ])
+    state = RedisState("redis://localhost")
+    state._redis = type("R", (), {"pubsub": lambda self, **kw: pubsub})()
+
+    messages = await state.subscribe("call_metadata_ready")
+    received = [message async for message in messages]
+
+    assert pubsub.channels == ["call_metadata_ready"]
+    assert received == ["CA123", "not-json"]
+    assert pubsub.closed is True
@@ -242,3 +242,34 @@ class TestTriggerReminderCall:
             from services.scheduler import trigger_reminder_call
             result = await trigger_reminder_call({"id": "r1"}, {"id": "s1", "name": "Test", "phone": "+15551234567"}, "https://example.com")
             assert result is None
+
+
+class TestGetDueReminders:
+    @pytest.mark.asyncio
+    async def test_two_queries_regardless_of_reminder_count(self):
+        due_row = {
+            "reminder_id": "r1", "title": "Take pills", "type": "medication", "description": None,
+            "scheduled_time": datetime(2026, 1, 1, 9, 0), "is_recurring": False, "cron_expression": None,
+            "r_active": True, "senior_id": "s1", "last_delivered_at": None, "name": "Margaret",
+            "phone": "+15551234567", "timezone": "America/New_York", "interests": None,
+            "family_info": None, "medical_notes": None, "s_active": True,
+        }
+        retry_row = {
+            **due_row, "reminder_id": "r2", "delivery_id": "d1",
+            "scheduled_for": datetime(2026, 1, 1, 8, 0, tzinfo=timezone.utc),
+            "delivered_at": None, "delivery_status": "retry_pending", "attempt_count": 1, "call_sid": None,
+        }
+        mock_q = AsyncMock(side_effect=[[due_row] * 50, [retry_row]])
+        with patch("services.scheduler.query_many", mock_q):
+            from services.scheduler import get_due_reminders
+            due = await get_due_reminders()
+
+        assert mock_q.await_count == 2
+        assert [c.kwargs["name"] for c in mock_q.await_args_list] == ["reminders.due", "reminder_deliveries.retry_due"]
+        assert "America/New_York" in mock_q.await_args_list[0].args[2]
+        # Zones must also exist in Postgres's tzdata, or AT TIME ZONE aborts the tick.
+        assert "pg_timezone_names" in mock_q.await_args_list[0].args[0]
+        assert len(due) == 51
+        assert due[0]["senior"]["id"] == "s1"
+        assert due[0]["scheduled_for"] == datetime(2026, 1, 1, 9, 0)
+        assert due[-1]["existing_delivery"]["id"] == "d1"
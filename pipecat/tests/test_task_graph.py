@@ -0,0 +1,93 @@
+"""Tests for lib/task_graph.py."""
+
+import asyncio
+import pytest
+
+from lib.task_graph import Step, run_graph
+
+
+class TestRunGraph:
+    @pytest.mark.asyncio
+    async def test_independent_steps_overlap(self):
+        async def slow():
+            await asyncio.sleep(0.05)
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        results = await run_graph([Step(f"s{i}", slow) for i in range(5)])
+        assert loop.time() - start < 0.2
+        assert all(r.ok for r in results.values())
+
+    @pytest.mark.asyncio
+    async def test_dependencies_run_first(self):
+        order = []
+
+        def step(name):
+            async def run():
+                await asyncio.sleep(0.01 if name == "a" else 0)
+                order.append(name)
+                return name.upper()
+            return run
+
+        results = await run_graph([
+            Step("c", step("c"), after=("b",)),
+            Step("b", step("b"), after=("a",)),
+            Step("a", step("a")),
+        ])
+        assert order == ["a", "b", "c"]
+        assert list(results) == ["c", "b", "a"]
+        assert results["b"].value == "B"
+        assert results["c"].started_ms >= results["a"].duration_ms
+
+    @pytest.mark.asyncio
+    async def test_failure_and_timeout_are_recorded_and_dependents_still_run(self):
+        async def boom():
+            raise RuntimeError("db down")
+
+        async def hang():
+            await asyncio.sleep(5)
+
+        ran = []
+
+        async def after():
+            ran.append(True)
+
+        results = await run_graph([
+            Step("boom", boom),
+            Step("hang", hang, timeout=0.01),
+            Step("after", after, after=("boom", "hang")),
+        ])
+        assert results["boom"].status == "error"
+        assert str(results["boom"].error) == "db down"
+        assert results["hang"].status == "timeout"
+        assert results["after"].ok and ran == [True]
+
+    @pytest.mark.asyncio
+    async def test_invalid_graphs_raise(self):
+        async def noop():
+            pass
+
+        with pytest.raises(ValueError, match="unknown step"):
+            await run_graph([Step("a", noop, after=("missing",))])
+        with pytest.raises(ValueError, match="Duplicate"):
+            await run_graph([Step("a", noop), Step("a", noop)])
+        with pytest.raises(ValueError, match="cycle"):
+            await run_graph([Step("a", noop, after=("b",)), Step("b", noop, after=("a",))])
+
+    @pytest.mark.asyncio
+    async def test_cancellation_cancels_pending_steps(self):
+        cancelled = asyncio.Event()
+
+        async def hang():
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        task = asyncio.create_task(run_graph([Step("hang", hang)]))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert cancelled.is_set()
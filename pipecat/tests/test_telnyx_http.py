@@ -0,0 +1,156 @@
+"""Tests for lib/telnyx_http.py pooled Telnyx client."""
+
+import asyncio
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from lib import telnyx_http
+
+HEADERS = {"Authorization": "Bearer test", "Content-Type": "application/json"}
+
+
+@pytest.fixture(autouse=True)
+def _fresh_stats(monkeypatch):
+    monkeypatch.setattr(telnyx_http, "RETRY_BACKOFF_SECONDS", 0)
+    telnyx_http.reset_stats()
+    yield
+    telnyx_http.reset_stats()
+
+
+async def _server(handler):
+    app = web.Application()
+    app.router.add_post("/v2/calls/{cid}/actions/{action}", handler)
+    app.router.add_post("/v2/calls", handler)
+    server = TestServer(app)
+    await server.start_server()
+    return server
+
+
+class TestTelnyxHttp:
+    @pytest.mark.asyncio
+    async def test_reuses_connection_across_commands(self):
+        peers = []
+
+        async def handler(request):
+            peers.append(request.transport.get_extra_info("peername"))
+            return web.json_response({"data": {"ok": True}})
+
+        server = await _server(handler)
+        try:
+            for action in ("answer", "streaming_start", "hangup"):
+                url = str(server.make_url(f"/v2/calls/v3:abc/actions/{action}"))
+                payload = {"command_id": telnyx_http.command_id("v3:abc", action)}
+                response = await telnyx_http.post(url, payload, headers=HEADERS)
+                assert response.ok
+                assert response.json() == {"data": {"ok": True}}
+        finally:
+            await telnyx_http.close()
+            await server.close()
+        assert len(set(peers)) == 1
+        assert set(telnyx_http.get_stats()) == {"answer", "streaming_start", "hangup"}
+
+    @pytest.mark.asyncio
+    async def test_retries_idempotent_command_on_5xx(self):
+        seen_ids = []
+
+        async def handler(request):
+            seen_ids.append((await request.json())["command_id"])
+            if len(seen_ids) < 3:
+                return web.json_response({"errors": []}, status=503)
+            return web.json_response({})
+
+        server = await _server(handler)
+        try:
+            url = str(server.make_url("/v2/calls/v3:abc/actions/answer"))
+            response = await telnyx_http.post(
+                url, {"command_id": telnyx_http.command_id("v3:abc", "answer")}, headers=HEADERS
+            )
+        finally:
+            await telnyx_http.close()
+            await server.close()
+        assert response.ok and response.attempts == 3
+        assert len(set(seen_ids)) == 1
+        stats = telnyx_http.get_stats()["answer"]
+        assert stats["calls"] == 1 and stats["retries"] == 2 and stats["errors"] == 0
+
+    @pytest.mark.asyncio
+    async def test_commands_without_command_id_are_not_retried(self):
+        calls = 0
+
+        async def handler(request):
+            nonlocal calls
+            calls += 1
+            return web.json_response({}, status=500)
+
+        server = await _server(handler)
+        try:
+            response = await telnyx_http.post(
+                str(server.make_url("/v2/calls")), {"to": "+15550000000"}, headers=HEADERS
+            )
+        finally:
+            await telnyx_http.close()
+            await server.close()
+        assert response.status == 500 and calls == 1
+        assert telnyx_http.get_stats()["dial"]["errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_client_errors_are_not_retried(self):
+        calls = 0
+
+        async def handler(request):
+            nonlocal calls
+            calls += 1
+            return web.json_response({"errors": [{"code": "90018"}]}, status=422)
+
+        server = await _server(handler)
+        try:
+            url = str(server.make_url("/v2/calls/v3:abc/actions/hangup"))
+            response = await telnyx_http.post(url, {"command_id": "x"}, headers=HEADERS)
+        finally:
+            await telnyx_http.close()
+            await server.close()
+        assert response.status == 422 and calls == 1
+
+    @pytest.mark.asyncio
+    async def test_connection_errors_raise_after_retries(self, monkeypatch):
+        attempts = 0
+
+        class FailingSession:
+            closed = False
+
+            def post(self, *args, **kwargs):
+                nonlocal attempts
+                attempts += 1
+                raise aiohttp.ClientConnectionError("refused")
+
+        monkeypatch.setattr(telnyx_http, "_get_session", lambda: FailingSession())
+        with pytest.raises(aiohttp.ClientConnectionError):
+            await telnyx_http.post("/calls/v3:abc/actions/answer", {"command_id": "x"}, headers=HEADERS)
+        assert attempts == 1 + telnyx_http.MAX_RETRIES
+        assert telnyx_http.get_stats()["answer"]["errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_dial_timeout_is_not_resent(self, monkeypatch):
+        attempts = 0
+
+        class TimingOutSession:
+            closed = False
+
+            def post(self, *args, **kwargs):
+                nonlocal attempts
+                attempts += 1
+                raise asyncio.TimeoutError()
+
+        monkeypatch.setattr(telnyx_http, "_get_session", lambda: TimingOutSession())
+        # The Dial may have reached Telnyx; command_id does not dedupe new calls.
+        with pytest.raises(asyncio.TimeoutError):
+            await telnyx_http.post("/calls", {"to": "+15550000000", "command_id": "dial-1"}, headers=HEADERS)
+        assert attempts == 1
+        assert telnyx_http.get_stats()["dial"]["errors"] == 1
+
+    def test_command_id_is_deterministic(self):
+        assert telnyx_http.command_id("v3:abc", "hangup") == telnyx_http.command_id("v3:abc", "hangup")
+        assert telnyx_http.command_id("v3:abc", "hangup") != telnyx_http.command_id("v3:abc", "answer")
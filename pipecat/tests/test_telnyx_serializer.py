@@ -144,3 +144,82 @@ async def test_telnyx_l16_deserializer_can_accept_little_endian_payload():
 
     assert frame.audio == b"\x01\x02\x03\x04"
     assert frame.sample_rate == 16000
+
+
+def _l16_serializer(**params):
+    return DonnaTelnyxFrameSerializer(
+        stream_id="stream-1",
+        call_control_id="v2:test",
+        outbound_encoding="L16",
+        inbound_encoding="L16",
+        api_key="test-key",
+        params=DonnaTelnyxFrameSerializer.InputParams(telnyx_sample_rate=16000, **params),
+    )
+
+
+@pytest.mark.asyncio
+async def test_telnyx_fast_path_skips_resampler_when_rates_match():
+    serializer = _l16_serializer()
+    await serializer.setup(StartFrame(audio_in_sample_rate=16000, audio_out_sample_rate=16000))
+    serializer._input_resampler = None  # would raise if touched
+    serializer._output_resampler = None
+
+    serialized = await serializer.serialize(
+        OutputAudioRawFrame(audio=b"\x01\x02" * 320, sample_rate=16000, num_channels=1)
+    )
+    assert json.loads(serialized) == {
+        "event": "media",
+        "media": {"payload": base64.b64encode(b"\x01\x02" * 320).decode()},
+    }
+
+    frame = await serializer.deserialize(serialized)
+    assert frame.audio == b"\x01\x02" * 320
+
+
+@pytest.mark.asyncio
+async def test_telnyx_serializer_still_resamples_other_rates():
+    serializer = _l16_serializer()
+    await serializer.setup(StartFrame(audio_in_sample_rate=16000, audio_out_sample_rate=24000))
+
+    wire_bytes = 0
+    for _ in range(10):
+        serialized = await serializer.serialize(
+            OutputAudioRawFrame(audio=b"\x00\x00" * 480, sample_rate=24000, num_channels=1)
+        )
+        if serialized:
+            wire_bytes += len(base64.b64decode(json.loads(serialized)["media"]["payload"]))
+    # 10 x 20ms at 24 kHz in, 16 kHz out (less whatever the stream buffers).
+    assert 0 < wire_bytes <= 10 * 640
+
+
+@pytest.mark.parametrize("separators", [(",", ":"), (", ", ": ")])
+@pytest.mark.asyncio
+async def test_telnyx_deserializer_accepts_compact_and_spaced_media(separators):
+    serializer = _l16_serializer()
+    await serializer.setup(StartFrame(audio_in_sample_rate=16000, audio_out_sample_rate=16000))
+    message = json.dumps(
+        {
+            "event": "media",
+            "sequence_number": "4",
+            "media": {"track": "inbound", "chunk": "2", "payload": base64.b64encode(b"\x05\x06").decode()},
+            "stream_id": "abc",
+        },
+        separators=separators,
+    )
+
+    frame = await serializer.deserialize(message)
+    frame_from_bytes = await serializer.deserialize(message.encode())
+
+    assert frame.audio == frame_from_bytes.audio == b"\x05\x06"
+
+
+@pytest.mark.asyncio
+async def test_telnyx_deserializer_handles_dtmf_and_interruption():
+    from pipecat.frames.frames import InputDTMFFrame, InterruptionFrame
+
+    serializer = _l16_serializer()
+    await serializer.setup(StartFrame(audio_in_sample_rate=16000, audio_out_sample_rate=16000))
+
+    frame = await serializer.deserialize(json.dumps({"event": "dtmf", "dtmf": {"digit": "5"}}))
+    assert isinstance(frame, InputDTMFFrame)
+    assert json.loads(await serializer.serialize(InterruptionFrame())) == {"event": "clear"}
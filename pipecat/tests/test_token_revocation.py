@@ -0,0 +1,218 @@
+"""Tests for the cached token revocation lookups and Clerk JWKS key cache."""
+
+import time
+from collections import OrderedDict
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import jwt
+import pytest
+
+from services import token_revocation
+
+
+class FakeSharedState:
+    is_shared = True
+
+    def __init__(self):
+        self.data = {}
+
+    async def set(self, key, value, ttl=None):
+        self.data[key] = value
+
+    async def get(self, key):
+        return self.data.get(key)
+
+
+def _rows(*tokens):
+    expires_at = time.time() + 3600
+    return [
+        {"token_hash": token_revocation._hash_token(token), "expires_at": expires_at}
+        for token in tokens
+    ]
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    token_revocation.clear()
+    yield
+    token_revocation.clear()
+
+
+@pytest.fixture
+def shared():
+    state = FakeSharedState()
+    with patch("lib.redis_client.get_shared_state", return_value=state):
+        yield state
+
+
+class TestRevocationCache:
+    @pytest.mark.asyncio
+    async def test_lookups_are_served_from_one_load(self, shared):
+        load = AsyncMock(return_value=_rows("bad-token"))
+        with patch.object(token_revocation, "query_many", load):
+            for _ in range(5):
+                assert await token_revocation.is_token_revoked("bad-token") is True
+                assert await token_revocation.is_token_revoked("good-token") is False
+                assert await token_revocation.is_admin_revoked("admin-1") is False
+
+        assert load.await_count == 1
+        stats = token_revocation.get_stats()
+        assert stats["lookups"] == 15
+        assert stats["revoked_hits"] == 5
+
+    @pytest.mark.asyncio
+    async def test_shared_version_change_reloads(self, shared, monkeypatch):
+        monkeypatch.setattr(token_revocation, "VERSION_CHECK_INTERVAL_SECONDS", 0.0)
+        load = AsyncMock(side_effect=[_rows(), _rows("token-a")])
+        with patch.object(token_revocation, "query_many", load):
+            assert await token_revocation.is_token_revoked("token-a") is False
+            # Another instance revokes and bumps the version.
+            shared.data[token_revocation.VERSION_KEY] = "v2"
+            assert await token_revocation.is_token_revoked("token-a") is True
+
+        assert load.await_count == 2
+        assert token_revocation.get_stats()["invalidations"] == 1
+
+    @pytest.mark.asyncio
+    async def test_revoke_updates_local_copy_and_publishes(self, shared, monkeypatch):
+        monkeypatch.setattr(token_revocation, "VERSION_CHECK_INTERVAL_SECONDS", 0.0)
+        load = AsyncMock(return_value=_rows())
+        with patch.object(token_revocation, "query_many", load), \
+             patch.object(token_revocation, "execute", AsyncMock(return_value="INSERT 0 1")):
+            assert await token_revocation.is_admin_revoked("admin-1") is False
+            await token_revocation.revoke_all_for_admin("admin-1", "admin-2")
+            assert await token_revocation.is_admin_revoked("admin-1") is True
+
+        assert shared.data[token_revocation.VERSION_KEY]
+        # The revoking instance applied its own change without reloading.
+        assert load.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_reload_keeps_last_copy(self, shared, monkeypatch):
+        load = AsyncMock(side_effect=[_rows("token-a"), RuntimeError("db down")])
+        with patch.object(token_revocation, "query_many", load):
+            assert await token_revocation.is_token_revoked("token-a") is True
+            monkeypatch.setattr(token_revocation, "_next_load_at", 0.0)
+            assert await token_revocation.is_token_revoked("token-a") is True
+
+        assert token_revocation.get_stats()["load_errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_first_load_failure_raises(self, shared):
+        with patch.object(token_revocation, "query_many", AsyncMock(side_effect=RuntimeError("no table"))):
+            with pytest.raises(RuntimeError):
+                await token_revocation.is_token_revoked("token-a")
+
+
+class TestClerkSigningKeyCache:
+    @pytest.fixture(autouse=True)
+    def _reset(self, monkeypatch):
+        from api.middleware import auth
+
+        monkeypatch.setattr(auth, "_clerk_signing_keys", {})
+        monkeypatch.setattr(auth, "_clerk_unknown_kids", OrderedDict())
+        monkeypatch.setattr(auth, "_jwks_last_refresh", float("-inf"))
+        monkeypatch.setattr(auth, "_jwks_stats", dict.fromkeys(auth._jwks_stats, 0))
+
+    @staticmethod
+    def _token(kid):
+        return jwt.encode({"sub": "user_1"}, "s" * 32, algorithm="HS256", headers={"kid": kid})
+
+    @staticmethod
+    def _client(monkeypatch, remote_kids, cached_kids=None):
+        """Fake PyJWKClient: ``fetch_data`` serves ``remote_kids`` and fills the cache."""
+        from api.middleware import auth
+
+        def jwks(kids):
+            return {"keys": [{"kty": "oct", "k": "c2VjcmV0", "kid": kid, "use": "sig"} for kid in kids]}
+
+        client = SimpleNamespace(fetches=0, cached=jwks(cached_kids) if cached_kids else None)
+        client.jwk_set_cache = SimpleNamespace(get=lambda: client.cached)
+
+        def fetch_data():
+            client.fetches += 1
+            client.cached = jwks(remote_kids)
+            return client.cached
+
+        client.fetch_data = fetch_data
+        monkeypatch.setattr(auth, "_clerk_jwk_client", client)
+        return client
+
+    @pytest.mark.asyncio
+    async def test_known_kid_is_fetched_once(self, monkeypatch):
+        from api.middleware import auth
+
+        client = self._client(monkeypatch, ["k1"])
+        for _ in range(3):
+            assert await auth._get_clerk_signing_key(self._token("k1")) == b"secret"
+
+        assert client.fetches == 1
+        stats = auth.get_jwks_stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_kid_in_cached_jwk_set_needs_no_fetch(self, monkeypatch):
+        from api.middleware import auth
+
+        client = self._client(monkeypatch, ["k1"], cached_kids=["k1"])
+        monkeypatch.setattr(auth, "_jwks_last_refresh", time.monotonic())
+        assert await auth._get_clerk_signing_key(self._token("k1")) == b"secret"
+        assert client.fetches == 0
+        assert auth.get_jwks_stats()["rate_limited"] == 0
+
+    @pytest.mark.asyncio
+    async def test_unknown_kid_is_negatively_cached(self, monkeypatch):
+        from api.middleware import auth
+
+        client = self._client(monkeypatch, ["k1"])
+        for _ in range(3):
+            with pytest.raises(jwt.InvalidTokenError):
+                await auth._get_clerk_signing_key(self._token("forged"))
+
+        assert client.fetches == 1
+        assert auth.get_jwks_stats()["unknown_kid"] == 3
+
+    @pytest.mark.asyncio
+    async def test_new_kids_refresh_jwks_at_most_once_per_interval(self, monkeypatch):
+        from api.middleware import auth
+
+        client = self._client(monkeypatch, ["k1"])
+        for i in range(5):
+            with pytest.raises(jwt.InvalidTokenError):
+                await auth._get_clerk_signing_key(self._token(f"forged-{i}"))
+
+        assert client.fetches == 1
+        assert auth.get_jwks_stats()["rate_limited"] == 4
+
+    @pytest.mark.asyncio
+    async def test_forged_kid_refresh_does_not_starve_rotated_kid(self, monkeypatch):
+        from api.middleware import auth
+
+        client = self._client(monkeypatch, ["k1", "k2"], cached_kids=["k1"])
+        with pytest.raises(jwt.InvalidTokenError):
+            await auth._get_clerk_signing_key(self._token("forged"))
+        assert await auth._get_clerk_signing_key(self._token("k2")) == b"secret"
+        assert client.fetches == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_key_is_served_while_refresh_is_rate_limited(self, monkeypatch):
+        from api.middleware import auth
+
+        client = self._client(monkeypatch, ["k1"])
+        monkeypatch.setattr(auth, "_clerk_signing_keys", {"k1": ("old-key", time.monotonic() - 1)})
+        monkeypatch.setattr(auth, "_jwks_last_refresh", time.monotonic())
+        assert await auth._get_clerk_signing_key(self._token("k1")) == "old-key"
+        assert client.fetches == 0
+
+    def test_unknown_kid_map_is_bounded_and_pruned(self, monkeypatch):
+        from api.middleware import auth
+
+        monkeypatch.setattr(auth, "JWKS_UNKNOWN_KID_MAX", 3)
+        for i in range(5):
+            auth._remember_unknown_kid(f"k{i}", now=100.0)
+        assert list(auth._clerk_unknown_kids) == ["k2", "k3", "k4"]
+
+        auth._remember_unknown_kid("late", now=100.0 + auth.JWKS_UNKNOWN_KID_TTL_SECONDS)
+        assert list(auth._clerk_unknown_kids) == ["late"]
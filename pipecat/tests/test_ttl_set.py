@@ -0,0 +1,46 @@
+"""Tests for the time-bucketed TTL set used for webhook dedupe."""
+
+from lib.ttl_set import TTLSet
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTTLSet:
+    def test_duplicates_are_rejected_until_expiry(self):
+        clock = _Clock()
+        seen = TTLSet(ttl_seconds=60, bucket_seconds=10, clock=clock)
+
+        assert seen.add("evt-1") is True
+        assert seen.add("evt-1") is False
+        clock.now += 59
+        assert "evt-1" in seen
+        clock.now += 20  # past ttl + one bucket
+        assert "evt-1" not in seen
+        assert seen.add("evt-1") is True
+
+    def test_expired_buckets_are_dropped_whole(self):
+        clock = _Clock()
+        seen = TTLSet(ttl_seconds=30, bucket_seconds=10, clock=clock)
+        for i in range(100):
+            seen.add(f"old-{i}")
+        clock.now += 45
+        seen.add("new")
+
+        assert len(seen) == 1
+        assert len(seen._buckets) == 1
+
+    def test_discarded_key_can_be_readded(self):
+        clock = _Clock()
+        seen = TTLSet(ttl_seconds=30, bucket_seconds=10, clock=clock)
+        seen.add("evt")
+        seen.discard("evt")
+        clock.now += 15
+        assert seen.add("evt") is True
+        clock.now += 30  # first bucket expires; the re-added key lives on
+        assert "evt" in seen
@@ -1,11 +1,13 @@
 """Tests for telephony media WebSocket admission."""
 
+import asyncio
 import time
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
 import bot as bot_module
+from api.routes import call_context
 from api.routes.call_context import call_metadata
 from bot import WebSocketAuthError, authenticate_websocket_call
 
@@ -13,8 +15,10 @@ from bot import WebSocketAuthError, authenticate_websocket_call
 @pytest.fixture(autouse=True)
 def clear_call_metadata():
     call_metadata.clear()
+    call_context._announced_calls.clear()
     yield
     call_metadata.clear()
+    call_context._announced_calls.clear()
 
 
 @pytest.mark.asyncio
@@ -27,23 +31,56 @@ async def test_websocket_auth_rejects_unknown_call_sid():
             )
 
 
-@pytest.mark.asyncio
-async def test_websocket_auth_waits_briefly_for_metadata_to_appear(monkeypatch):
-    metadata = {
+def _fresh_metadata():
+    return {
         "ws_token": "expected-token",
         "ws_token_expires_at": time.time() + 300,
         "ws_token_consumed": False,
     }
-    mock_get = AsyncMock(side_effect=[None, None, metadata])
+
+
+@pytest.mark.asyncio
+async def test_websocket_auth_resumes_when_metadata_is_stored(monkeypatch):
+    metadata = _fresh_metadata()
+    mock_get = AsyncMock(side_effect=[None, metadata])
     mock_consume = AsyncMock()
-    mock_sleep = AsyncMock()
+    call_context.reset_metadata_wait_stats()
+    # A backstop longer than the test proves the wake-up came from the event.
+    monkeypatch.setattr(bot_module, "WS_METADATA_LOOKUP_BACKSTOP_SECONDS", 5.0)
+
+    async def store_later():
+        await asyncio.sleep(0.01)
+        await call_context._persist_metadata("CA123", metadata)
+
+    started = time.monotonic()
+    with patch("api.routes.call_context.get_call_metadata", mock_get), \
+         patch("api.routes.call_context.mark_ws_token_consumed", mock_consume):
+        writer = asyncio.create_task(store_later())
+        loaded = await authenticate_websocket_call(
+            {"call_id": "CA123", "body": {"ws_token": "expected-token"}},
+            {},
+        )
+        await writer
+
+    assert loaded is metadata
+    assert time.monotonic() - started < 1.0
+    assert mock_get.await_count == 2
+    assert call_context.get_metadata_wait_stats()["waited"] == 1
+    assert "CA123" not in call_context._metadata_waiters
+    mock_consume.assert_awaited_once_with("CA123", metadata)
 
-    monkeypatch.setattr(bot_module, "WS_METADATA_LOOKUP_TIMEOUT_SECONDS", 0.2)
+
+@pytest.mark.asyncio
+async def test_websocket_auth_polls_when_writes_are_not_pushed(monkeypatch):
+    metadata = _fresh_metadata()
+    mock_get = AsyncMock(side_effect=[None, None, metadata])
+
+    monkeypatch.setattr(bot_module, "WS_METADATA_LOOKUP_TIMEOUT_SECONDS", 0.5)
     monkeypatch.setattr(bot_module, "WS_METADATA_LOOKUP_POLL_INTERVAL_SECONDS", 0.01)
 
     with patch("api.routes.call_context.get_call_metadata", mock_get), \
-         patch("api.routes.call_context.mark_ws_token_consumed", mock_consume), \
-         patch("bot.asyncio.sleep", mock_sleep):
+         patch("api.routes.call_context.metadata_ready_is_pushed", return_value=False), \
+         patch("api.routes.call_context.mark_ws_token_consumed", AsyncMock()):
         loaded = await authenticate_websocket_call(
             {"call_id": "CA123", "body": {"ws_token": "expected-token"}},
             {},
@@ -51,8 +88,48 @@ async def test_websocket_auth_waits_briefly_for_metadata_to_appear(monkeypatch):
 
     assert loaded is metadata
     assert mock_get.await_count == 3
-    assert mock_sleep.await_count == 2
-    mock_consume.assert_awaited_once_with("CA123", metadata)
+
+
+class _PubSubState:
+    is_shared = True
+
+    def __init__(self):
+        self.data = {}
+        self.published = []
+        self.queue = asyncio.Queue()
+
+    async def set(self, key, value, ttl=None):
+        self.data[key] = value
+
+    async def publish(self, channel, message):
+        self.published.append((channel, message))
+
+    async def subscribe(self, channel):
+        async def messages():
+            while True:
+                yield await self.queue.get()
+
+        return messages()
+
+
+@pytest.mark.asyncio
+async def test_metadata_ready_announced_once_and_wakes_remote_waiters():
+    state = _PubSubState()
+    with patch("lib.redis_client.get_shared_state", return_value=state):
+        await call_context._persist_metadata("CApub", _fresh_metadata())
+        await call_context._persist_metadata("CApub", _fresh_metadata())
+    assert state.published == [(call_context.METADATA_READY_CHANNEL, "CApub")]
+
+    listener = asyncio.create_task(call_context._listen_for_ready(state))
+    try:
+        with call_context.metadata_waiter("CAremote") as ready:
+            state.queue.put_nowait("CAremote")
+            await asyncio.wait_for(ready.wait(), timeout=1.0)
+        assert call_context._ready_listener_subscribed is True
+    finally:
+        listener.cancel()
+        await asyncio.gather(listener, return_exceptions=True)
+    assert call_context._ready_listener_subscribed is False
 
 
 @pytest.mark.asyncio
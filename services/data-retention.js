@@ -53,6 +53,8 @@ const TABLE_DATE_COLUMNS = {
   notifications:        'sent_at',
   waitlist:             'created_at',
   audit_logs:           'created_at',
+  conversation_transcript_chunks: 'created_at',
+  post_call_jobs:       'created_at',
 };
 
 const ALLOWED_TABLES = new Set(Object.keys(TABLE_DATE_COLUMNS));
@@ -111,6 +113,8 @@ async function purgeTable(table, dateColumn, days) {
 /**
  * Null PHI-bearing conversation fields older than the transcript retention
  * period while preserving non-PHI metadata for longer analytics/compliance.
+ * Also deletes draft transcript chunks and post-call jobs older than the same
+ * retention period.
  */
 async function redactConversationPhi(days) {
   let totalRedacted = 0;
@@ -153,6 +157,13 @@ async function redactConversationPhi(days) {
     await new Promise(resolve => setTimeout(resolve, 100));
   }
 
+  // Draft transcript chunks are normally removed at call end; purge any
+  // left behind by calls that never completed.
+  totalRedacted += await purgeTable('conversation_transcript_chunks', 'created_at', days);
+  // Post-call jobs are deleted when they finish; failed ones still carry an
+  // encrypted transcript snapshot.
+  totalRedacted += await purgeTable('post_call_jobs', 'created_at', days);
+
   return totalRedacted;
 }
 
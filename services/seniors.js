@@ -168,7 +168,12 @@ export const seniorService = {
       const [cnCount] = (await tx.execute(sql`SELECT COUNT(*)::int AS count FROM caregiver_notes WHERE senior_id = ${id}`)).rows;
       counts.caregiver_notes = cnCount?.count || 0;
 
+      const [pcjCount] = (await tx.execute(sql`SELECT COUNT(*)::int AS count FROM post_call_jobs WHERE senior_id = ${id}`)).rows;
+      counts.post_call_jobs = pcjCount?.count || 0;
+
       // 2. DELETE in dependency order (deepest children first)
+      // post_call_jobs hold an encrypted transcript snapshot (pipecat migration 013)
+      await tx.execute(sql`DELETE FROM post_call_jobs WHERE senior_id = ${id}`);
       await tx.delete(notificationPreferences)
         .where(inArray(notificationPreferences.caregiverId,
           tx.select({ id: caregivers.id }).from(caregivers).where(eq(caregivers.seniorId, id))
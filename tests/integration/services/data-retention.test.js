@@ -26,6 +26,16 @@ describe('data retention purge SQL', () => {
     expect(source).toContain('transcript_encrypted = NULL');
   });
 
+  it('purges draft transcript chunks left by calls that never completed', () => {
+    expect(source).toContain("conversation_transcript_chunks: 'created_at'");
+    expect(source).toContain("purgeTable('conversation_transcript_chunks', 'created_at', days)");
+  });
+
+  it('purges failed post-call jobs that still hold a transcript snapshot', () => {
+    expect(source).toContain("post_call_jobs:       'created_at'");
+    expect(source).toContain("purgeTable('post_call_jobs', 'created_at', days)");
+  });
+
   it('purges expired idempotency replay cache rows by expires_at', () => {
     expect(source).toContain('idempotency_keys');
     expect(source).toContain('purgeExpiredIdempotencyKeys');